@@ -1,17 +1,17 @@
 from django.contrib import admin
 from django.urls import reverse
 from .models import (
-    Chat, UploadedJobListing, UploadedResume,
+    Chat, ChatMessage, UploadedJobListing, UploadedResume,
     ExportableReport, UserProfile, RoleChangeRequest,
     DataExportRequest, DeletionRequest,
     Tag, QuestionBank, Question, InterviewTemplate, InvitedInterview,
     RateLimitViolation, AuditLog,
-    BiasTermLibrary, BiasAnalysisResult
+    BiasTermLibrary, BiasAnalysisResult, ParseResultCache
 )
 from .token_usage_models import TokenUsage
 from .merge_stats_models import MergeTokenStats
 from .observability_models import (
-    RequestMetric, DailyMetricsSummary,
+    RequestMetric, RequestMetricRollup, DailyMetricsSummary,
     ProviderCostDaily, ErrorLog
 )
 from .spending_tracker_models import (
@@ -20,9 +20,25 @@ from .spending_tracker_models import (
 from .api_key_rotation_models import (
     APIKeyPool, KeyRotationSchedule, KeyRotationLog
 )
+from .parse_cache import get_parse_cache_stats
+from .job_queue_models import Job
+from .email_outbox_models import OutboundEmail
+
 
 # Register your models here.
-admin.site.register(Chat)
+class ChatMessageInline(admin.TabularInline):
+    model = ChatMessage
+    extra = 0
+    fields = ('seq', 'role', 'content', 'token_count', 'created_at')
+    readonly_fields = ('token_count', 'created_at')
+
+
+@admin.register(Chat)
+class ChatAdmin(admin.ModelAdmin):
+    inlines = [ChatMessageInline]
+    readonly_fields = Chat.TURN_COUNTER_FIELDS
+
+
 admin.site.register(UploadedJobListing)
 admin.site.register(UploadedResume)
 admin.site.register(ExportableReport)
@@ -296,14 +312,80 @@ class InterviewTemplateAdmin(admin.ModelAdmin):
     status.short_description = 'Status'
 
 
+# Parse Result Cache Admin
+@admin.register(ParseResultCache)
+class ParseResultCacheAdmin(admin.ModelAdmin):
+    list_display = (
+        'content_hash_short', 'kind', 'prompt_version', 'hit_count',
+        'created_at', 'last_hit_at'
+    )
+    list_filter = ('kind', 'prompt_version', 'created_at')
+    search_fields = ('content_hash',)
+    readonly_fields = (
+        'kind', 'content_hash', 'prompt_version', 'result', 'hit_count',
+        'created_at', 'last_hit_at'
+    )
+    ordering = ('-last_hit_at',)
+    change_list_template = 'admin/parse_cache_change_list.html'
+
+    def content_hash_short(self, obj):
+        return obj.content_hash[:12]
+    content_hash_short.short_description = 'Hash'
+
+    def has_add_permission(self, request):
+        """Entries are only created by the parsers."""
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        """Add the per-kind hit-rate report above the changelist."""
+        extra_context = extra_context or {}
+        extra_context['parse_cache_stats'] = get_parse_cache_stats()
+        return super().changelist_view(request, extra_context=extra_context)
+
+
+# Background Job Admin
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 'task', 'status', 'priority', 'attempts', 'max_attempts',
+        'created_at', 'finished_at', 'locked_by'
+    )
+    list_filter = ('status', 'task', 'created_at')
+    search_fields = ('task', 'last_error', 'locked_by')
+    readonly_fields = (
+        'created_at', 'started_at', 'finished_at', 'lease_expires_at',
+        'locked_by', 'last_error'
+    )
+    ordering = ('-created_at',)
+
+
+# Email Outbox Admin - Issues #8, #139
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        'created_at', 'subject', 'recipients', 'status', 'attempts',
+        'sent_at'
+    )
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject', 'last_error')
+    readonly_fields = ('created_at', 'sent_at', 'locked_until', 'last_error')
+    ordering = ('-created_at',)
+
+    def recipients(self, obj):
+        return ', '.join(obj.to)
+    recipients.short_description = 'To'
+
+
 # Token Tracking Admin
 @admin.register(TokenUsage)
 class TokenUsageAdmin(admin.ModelAdmin):
     list_display = (
         'created_at', 'user', 'git_branch', 'model_name', 'endpoint',
-        'total_tokens', 'estimated_cost'
+        'total_tokens', 'cached_prompt_tokens', 'prompt_version',
+        'estimated_cost'
     )
-    list_filter = ('git_branch', 'model_name', 'endpoint', 'created_at')
+    list_filter = ('git_branch', 'model_name', 'endpoint', 'prompt_version',
+                   'created_at')
     search_fields = ('user__username', 'git_branch', 'endpoint')
     readonly_fields = ('created_at',)
     date_hierarchy = 'created_at'
@@ -482,6 +564,8 @@ class RequestMetricAdmin(admin.ModelAdmin):
         'method',
         'status_code',
         'response_time_ms',
+        'query_count',
+        'queries_saved',
         'user_id',
         'is_error'
     )
@@ -497,6 +581,25 @@ class RequestMetricAdmin(admin.ModelAdmin):
     is_error.short_description = 'Error?'
 
 
+@admin.register(RequestMetricRollup)
+class RequestMetricRollupAdmin(admin.ModelAdmin):
+    list_display = (
+        'minute',
+        'resolution',
+        'endpoint',
+        'method',
+        'count',
+        'error_4xx',
+        'error_5xx',
+        'mean_ms',
+        'max_ms'
+    )
+    list_filter = ('resolution', 'method', 'minute')
+    search_fields = ('endpoint',)
+    date_hierarchy = 'minute'
+    ordering = ('-minute',)
+
+
 @admin.register(DailyMetricsSummary)
 class DailyMetricsSummaryAdmin(admin.ModelAdmin):
     list_display = (
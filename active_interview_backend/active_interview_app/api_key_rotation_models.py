@@ -10,6 +10,7 @@ This module provides functionality for:
 - Security best practices (encryption, masking)
 """
 from django.db import models
+from django.db.models import F
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.conf import settings
@@ -243,10 +244,34 @@ class APIKeyPool(models.Model):
         self.save()
 
     def increment_usage(self):
-        """Increment usage count and update last used timestamp."""
+        """
+        Increment usage count and update last used timestamp.
+
+        The database write is buffered (see api_key_usage); this instance
+        is updated immediately.
+        """
+        from .api_key_usage import record_key_usage
+
+        record_key_usage(self.pk)
         self.usage_count += 1
         self.last_used_at = timezone.now()
-        self.save(update_fields=['usage_count', 'last_used_at'])
+
+    @classmethod
+    def record_usage(cls, key_id, count=1, last_used_at=None):
+        """
+        Add ``count`` uses to a key without loading it.
+
+        Atomic, so concurrent workers never lose increments.
+
+        Args:
+            key_id (int): Primary key of the APIKeyPool entry
+            count (int): Number of uses to add
+            last_used_at (datetime): Time of the latest use (default: now)
+        """
+        cls.objects.filter(pk=key_id).update(
+            usage_count=F('usage_count') + count,
+            last_used_at=last_used_at or timezone.now()
+        )
 
     @classmethod
     def get_active_key(cls, provider=OPENAI, model_tier=PREMIUM):
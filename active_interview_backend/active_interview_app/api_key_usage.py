@@ -0,0 +1,146 @@
+"""
+Write-behind usage counters for API keys in the key pool.
+
+Related to Issue #13 (API Key Rotation).
+
+Every LLM request used to bump ``APIKeyPool.usage_count`` with its own
+read-modify-write save, so concurrent workers serialized on the same row
+and lost increments. Uses are now added up in memory and written with a
+single ``F('usage_count') + n`` update per key:
+
+- at most ``API_KEY_USAGE_FLUSH_INTERVAL`` seconds after the first pending use
+- when the process exits
+
+Counts read from the database (admin, ``rotate_api_keys``) therefore lag
+by at most one flush interval. An interval of 0 writes every use
+immediately.
+"""
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between flushes of pending usage counts
+DEFAULT_FLUSH_INTERVAL = 10
+
+_pending_counts = Counter()
+_pending_last_used = {}
+_flush_timer = None
+_lock = threading.Lock()
+
+
+def get_flush_interval():
+    """
+    Get the configured flush interval from settings.
+
+    Returns:
+        float: Seconds between flushes (0 disables buffering)
+    """
+    return getattr(settings, 'API_KEY_USAGE_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+
+
+def record_key_usage(key_id, count=1):
+    """
+    Count uses of a pooled API key.
+
+    Args:
+        key_id (int): Primary key of the APIKeyPool entry
+        count (int): Number of uses to add
+    """
+    global _flush_timer
+
+    interval = get_flush_interval()
+    if interval <= 0:
+        from .api_key_rotation_models import APIKeyPool
+        APIKeyPool.record_usage(key_id, count=count)
+        return
+
+    with _lock:
+        _pending_counts[key_id] += count
+        _pending_last_used[key_id] = timezone.now()
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(interval, _flush_in_background)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def get_pending_usage(key_id):
+    """
+    Get the uses of a key counted in this process but not yet written.
+
+    Args:
+        key_id (int): Primary key of the APIKeyPool entry
+
+    Returns:
+        int: Pending use count
+    """
+    with _lock:
+        return _pending_counts.get(key_id, 0)
+
+
+def flush_key_usage():
+    """
+    Write all pending usage counts, one UPDATE per key.
+
+    Counts that fail to write are put back and retried on the next flush.
+
+    Returns:
+        int: Number of keys updated
+    """
+    global _flush_timer
+
+    from .api_key_rotation_models import APIKeyPool
+
+    with _lock:
+        pending = dict(_pending_counts)
+        last_used = dict(_pending_last_used)
+        _pending_counts.clear()
+        _pending_last_used.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+
+    flushed = 0
+    for key_id, count in pending.items():
+        try:
+            APIKeyPool.record_usage(key_id, count=count,
+                                    last_used_at=last_used.get(key_id))
+            flushed += 1
+        except Exception as e:
+            logger.warning(
+                f"Failed to flush usage for API key {key_id}: "
+                f"{type(e).__name__}: {e}"
+            )
+            with _lock:
+                _pending_counts[key_id] += count
+                _pending_last_used.setdefault(key_id, last_used.get(key_id))
+    return flushed
+
+
+def _flush_in_background():
+    """Timer target for record_key_usage."""
+    global _flush_timer
+
+    with _lock:
+        _flush_timer = None
+    try:
+        flush_key_usage()
+    finally:
+        close_old_connections()
+
+
+def _flush_at_exit():
+    """Write pending counts when the worker shuts down."""
+    try:
+        flush_key_usage()
+    except Exception as e:
+        logger.warning(f"Failed to flush API key usage at exit: {type(e).__name__}: {e}")
+
+
+atexit.register(_flush_at_exit)
@@ -10,3 +10,5 @@ class ActiveInterviewAppConfig(AppConfig):
         import active_interview_app.signals  # noqa
         # import spending signals for automatic tracking and rotation (Issue #11, #15.10)
         import active_interview_app.spending_signals  # noqa
+        # import background job tasks so the workers can find them
+        import active_interview_app.jobs  # noqa
@@ -0,0 +1,489 @@
+"""
+Async versions of the AI-bound interview views for ASGI deployments.
+
+Under an ASGI server these views await OpenAI through the process-wide
+AsyncOpenAI client instead of holding a worker thread for the whole call,
+so one worker process can serve many in-flight interview turns. ORM access,
+form validation and template rendering run through sync_to_async.
+
+Prompts and post-reply bookkeeping are shared with the sync views in
+views.py. urls.py routes these views in place of their sync counterparts
+when settings.ASYNC_VIEWS is enabled (see start.sh).
+"""
+import os
+from datetime import timedelta
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import PermissionDenied
+from django.http import (
+    Http404, HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+)
+from django.shortcuts import redirect, render
+from django.utils import timezone
+
+from . import views
+from .context_utils import build_context_messages
+from .forms import CreateChatForm
+from .latency_utils import LatencyTracker
+from .models import Chat, InvitedInterview
+from .openai_utils import (
+    acreate_completion, aget_client_and_model, ai_available,
+    arun_completions_concurrently
+)
+from .response_cache import acached_completion
+from .token_tracking import record_openai_usage
+from .views import (
+    _FALLBACK_INVITED_GREETING,
+    _RESULTS_FEEDBACK_PROMPT,
+    _TIME_EXPIRED_PAYLOAD,
+    _ai_service_error_json,
+    _ai_unavailable_json,
+    _build_interview_prompt,
+    _build_invited_interview_prompts,
+    _build_key_questions_prompt,
+    _build_question_feedback_prompt,
+    _complete_chat_turn,
+    _complete_invitation,
+    _end_interview_gracefully,
+    _extract_key_questions,
+    _finalized_report,
+    _placeholder_key_questions,
+    _should_end_interview,
+    _sse_event,
+    _wants_event_stream,
+)
+
+
+# Sync views that handle the non-AI methods of the async endpoints
+_sync_create_chat = sync_to_async(views.CreateChat.as_view())
+_sync_chat_view = sync_to_async(views.ChatView.as_view())
+_sync_key_questions = sync_to_async(views.KeyQuestionsView.as_view())
+
+
+def async_login_required(view_func):
+    """
+    Async equivalent of ``login_required``.
+
+    Django 4.2's decorator is sync-only, and ``request.user`` is a lazy
+    object that queries the session, so it is resolved in a thread.
+    """
+    @wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        is_authenticated = await sync_to_async(
+            lambda: request.user.is_authenticated)()
+        if not is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view_func(request, *args, **kwargs)
+    return wrapper
+
+
+async def _aget_owned_chat(request, chat_id, *related, with_messages=False):
+    """
+    Fetch a chat owned by the requesting user.
+
+    Related objects used by the prompt builders must be listed in
+    ``related`` so they are loaded up front instead of lazily. Likewise
+    pass ``with_messages=True`` to prefetch the transcript read through
+    ``chat.messages``.
+
+    Raises:
+        Http404: If the chat does not exist
+        PermissionDenied: If the chat belongs to another user
+    """
+    queryset = Chat.objects.all()
+    if related:
+        queryset = queryset.select_related(*related)
+    if with_messages:
+        queryset = queryset.prefetch_related('chat_messages')
+    chat = await queryset.filter(id=chat_id).afirst()
+    if chat is None:
+        raise Http404("Chat not found")
+    if chat.owner_id != request.user.id:
+        raise PermissionDenied
+    return chat
+
+
+async def _acomplete(user, endpoint, input_messages, chat=None):
+    """
+    Run one chat completion and record its token usage.
+
+    When ``chat`` is given, long message lists are windowed with
+    ``build_context_messages`` first.
+
+    Returns:
+        str: Content of the first choice
+    """
+    # Auto-select model tier based on spending cap (Issue #14)
+    client, model, tier_info = await aget_client_and_model(profile=endpoint)
+    if chat is not None:
+        input_messages = await sync_to_async(build_context_messages)(
+            chat, input_messages, tier_info.get('active_tier'))
+    response = await acreate_completion(
+        client, model, input_messages, endpoint
+    )
+    # Track token usage for spending cap (Issue #15.10)
+    await sync_to_async(record_openai_usage)(user, endpoint, response)
+    return response.choices[0].message.content
+
+
+async def _agenerate_concurrently(request, chat, requests):
+    """
+    Async counterpart of ``views._generate_concurrently``.
+
+    Returns:
+        list: Reply content per (endpoint, messages) request, or None where
+            the call failed
+    """
+    # Track latency for initial greeting (Issues #20, #54)
+    async with LatencyTracker(chat, question_number=0):
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = await aget_client_and_model()
+        results = await arun_completions_concurrently(
+            client, model, [messages for _, messages in requests],
+            profiles=[endpoint for endpoint, _ in requests])
+
+    contents = []
+    for (endpoint, _), (response, error) in zip(requests, results):
+        if error is not None:
+            print(f"Failed to generate {endpoint}: {error}")
+            contents.append(None)
+            continue
+        # Track token usage for spending cap (Issue #15.10)
+        await sync_to_async(record_openai_usage)(
+            request.user, endpoint, response)
+        contents.append(response.choices[0].message.content)
+    return contents
+
+
+@async_login_required
+async def create_chat(request):
+    """Async version of ``CreateChat``; GET is served by the sync view."""
+    if request.method != 'POST':
+        return await _sync_create_chat(request)
+
+    if 'create' not in request.POST:
+        # 'create' not in POST, redirect to chat list
+        return redirect('chat-list')
+
+    form = CreateChatForm(request.POST, user=request.user)
+    if not await sync_to_async(form.is_valid)():
+        # Form is invalid, render the form again with errors
+        return await sync_to_async(render)(
+            request, os.path.join('chat', 'chat-create.html'), {
+                'form': form
+            })
+
+    chat = form.save(commit=False)
+    chat.job_listing = form.cleaned_data['listing_choice']
+    chat.resume = form.cleaned_data['resume_choice']
+    chat.difficulty = form.cleaned_data["difficulty"]
+    chat.type = form.cleaned_data["type"]
+    chat.owner = request.user
+
+    chat.messages = [
+        {
+            "role": "system",
+            "content": _build_interview_prompt(chat)
+        },
+    ]
+    timed_question_messages = [
+        {
+            "role": "system",
+            "content": _build_key_questions_prompt(chat)
+        },
+    ]
+
+    # Make ai speak first
+    if not await sync_to_async(ai_available)():
+        messages.error(request, "AI features are disabled on this server.")
+        ai_message = ""
+        key_questions_message = "[]"
+    else:
+        ai_message, key_questions_message = await _agenerate_concurrently(
+            request, chat, [
+                ('create_chat', chat.messages),
+                ('create_chat_timed_questions', timed_question_messages),
+            ])
+        if ai_message is None:
+            messages.error(
+                request, "Failed to generate the interviewer greeting.")
+            ai_message = ""
+
+    chat.messages.append({"role": "assistant", "content": ai_message})
+
+    key_questions = _extract_key_questions(key_questions_message or "")
+    if key_questions is not None:
+        chat.key_questions = key_questions
+    else:
+        messages.error(
+            request, "Failed to generate key questions. Please try again.")
+        chat.key_questions = []
+
+    await chat.asave()
+
+    return redirect("chat-view", chat_id=chat.id)
+
+
+@async_login_required
+async def chat_view(request, chat_id):
+    """Async version of ``ChatView``; GET is served by the sync view."""
+    if request.method != 'POST':
+        return await _sync_chat_view(request, chat_id=chat_id)
+
+    chat = await _aget_owned_chat(request, chat_id, with_messages=True)
+
+    # Check if invited interview time has expired (Issue #138)
+    if chat.interview_type == Chat.INVITED and chat.is_time_expired():
+        await sync_to_async(_complete_invitation)(chat)
+        return JsonResponse(_TIME_EXPIRED_PAYLOAD, status=403)
+
+    user_message = request.POST.get('message', '')
+
+    new_messages = chat.messages
+    new_messages.append({"role": "user", "content": user_message})
+
+    if not await sync_to_async(ai_available)():
+        return _ai_unavailable_json()
+
+    # Phase 6-7: No new questions after T-5 minutes (graceful ending)
+    if _should_end_interview(chat):
+        return JsonResponse(await sync_to_async(_end_interview_gracefully)(
+            request, chat, new_messages))
+
+    if _wants_event_stream(request):
+        response = StreamingHttpResponse(
+            _astream_reply(request, chat, new_messages),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Disable nginx buffering
+        return response
+
+    # Track latency for this response (Issues #20, #54)
+    async with LatencyTracker(chat):
+        try:
+            ai_message = await _acomplete(
+                request.user, 'chat_view', new_messages, chat=chat)
+            payload = await sync_to_async(_complete_chat_turn)(
+                request, chat, new_messages, ai_message)
+            return JsonResponse(payload)
+        except Exception as e:
+            # Handle AI service exceptions gracefully
+            return _ai_service_error_json(e)
+
+
+async def _astream_reply(request, chat, new_messages):
+    """
+    Async generator of Server-Sent Events for a streamed reply.
+
+    Mirrors ``ChatView._stream_reply``: ``delta`` events, then one ``done``
+    event with the JSON payload, or an ``error`` event on failure.
+    """
+    async with LatencyTracker(chat) as tracker:
+        try:
+            client, model, tier_info = await aget_client_and_model(
+                profile='chat_view')
+            # Long interviews: system prompt + summary + recent turns
+            context_messages = await sync_to_async(build_context_messages)(
+                chat, new_messages, tier_info.get('active_tier'))
+            stream = await acreate_completion(
+                client, model, context_messages, 'chat_view',
+                stream=True, stream_options={'include_usage': True}
+            )
+
+            parts = []
+            usage_chunk = None
+            async for chunk in stream:
+                # The final chunk carries usage and has no choices
+                if getattr(chunk, 'usage', None):
+                    usage_chunk = chunk
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                tracker.mark_first_token()
+                parts.append(delta)
+                yield _sse_event('delta', {'content': delta})
+
+            # Track token usage for spending cap (Issue #15.10)
+            if usage_chunk is not None:
+                await sync_to_async(record_openai_usage)(
+                    request.user, 'chat_view', usage_chunk)
+
+            payload = await sync_to_async(_complete_chat_turn)(
+                request, chat, new_messages, ''.join(parts))
+            yield _sse_event('done', payload)
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            yield _sse_event('error', {
+                'error': 'AI service unavailable',
+                'message': str(e)
+            })
+
+
+@async_login_required
+async def key_questions_view(request, chat_id, question_id):
+    """Async version of ``KeyQuestionsView``; GET is served by the sync view."""
+    if request.method != 'POST':
+        return await _sync_key_questions(
+            request, chat_id=chat_id, question_id=question_id)
+
+    chat = await _aget_owned_chat(request, chat_id, 'job_listing', 'resume')
+    question = chat.key_questions[question_id]
+    user_message = request.POST.get('message', '')
+
+    ai_input = [
+        {
+            "role": "system",
+            "content": _build_question_feedback_prompt(
+                chat, question, user_message)
+        }
+    ]
+
+    if not await sync_to_async(ai_available)():
+        return _ai_unavailable_json()
+
+    ai_message = await _acomplete(request.user, 'single_question', ai_input)
+
+    return JsonResponse({'message': ai_message})
+
+
+@async_login_required
+async def results_chat(request, chat_id):
+    """Async version of ``ResultsChat.get``."""
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    chat = await _aget_owned_chat(request, chat_id, with_messages=True)
+
+    input_messages = chat.messages
+    input_messages.append(
+        {"role": "user", "content": _RESULTS_FEEDBACK_PROMPT})
+
+    report = await sync_to_async(_finalized_report)(chat)
+    if report is not None and report.feedback_text:
+        # Finalized: reuse the persisted report instead of the model
+        ai_message = report.feedback_text
+    elif not await sync_to_async(ai_available)():
+        ai_message = "AI features are currently unavailable."
+    else:
+        # Unchanged transcript: served from the response cache
+        ai_message = await acached_completion(
+            request.user, chat, 'results_chat', input_messages)
+
+    # Check if this is an invited interview and get invitation details
+    invitation = None
+    if chat.interview_type == Chat.INVITED:
+        invitation = await InvitedInterview.objects.filter(chat=chat).afirst()
+
+    context = {}
+    context['chat'] = chat
+    context['feedback'] = ai_message
+    context['invitation'] = invitation
+
+    return await sync_to_async(render)(
+        request, os.path.join('chat', 'chat-results.html'), context)
+
+
+@async_login_required
+async def start_invited_interview(request, invitation_id):
+    """
+    Async version of ``start_invited_interview``.
+
+    Related to Issue #136 (Time-Gated Access).
+    """
+    invitation = await InvitedInterview.objects.select_related(
+        'template', 'chat'
+    ).filter(id=invitation_id).afirst()
+    if invitation is None:
+        raise Http404("Invitation not found")
+
+    # Verify user is the invited candidate
+    if request.user.email.lower() != invitation.candidate_email.lower():
+        messages.error(
+            request, 'You do not have permission to start this interview.')
+        return redirect('index')
+
+    # Check if already started
+    if invitation.chat:
+        messages.info(request, 'This interview has already been started.')
+        return redirect('chat-view', chat_id=invitation.chat.id)
+
+    # Check if can start (time window validation)
+    if not invitation.can_start():
+        if invitation.is_expired():
+            messages.error(
+                request,
+                'This interview time has passed and you can no longer take it.'
+            )
+        else:
+            messages.error(
+                request,
+                f'This interview cannot be started until {invitation.scheduled_time.strftime("%B %d, %Y at %I:%M %p")}.'
+            )
+        return redirect(
+            'invited_interview_detail',
+            invitation_id=invitation.id)
+
+    # Create Chat session with time tracking (Issue #138)
+    now = timezone.now()
+    template = invitation.template
+    sections = template.sections if template.sections else []
+
+    chat = await Chat.objects.acreate(
+        owner=request.user,
+        title=f"{template.name} - Invited Interview",
+        interview_type=Chat.INVITED,
+        type=Chat.GENERAL,
+        started_at=now,
+        scheduled_end_at=now + timedelta(minutes=invitation.duration_minutes),
+    )
+
+    system_prompt, key_questions_prompt = _build_invited_interview_prompts(
+        invitation)
+    chat.messages = [
+        {
+            "role": "system",
+            "content": system_prompt
+        },
+    ]
+
+    if not await sync_to_async(ai_available)():
+        messages.error(request, "AI features are disabled on this server.")
+        ai_message = (
+            "Hello! I'm your interviewer today. Unfortunately, AI "
+            "features are currently disabled. Please contact support."
+        )
+        chat.key_questions = _placeholder_key_questions(sections)
+    else:
+        ai_message, ai_response = await _agenerate_concurrently(
+            request, chat, [
+                ('start_invited_interview', chat.messages),
+                ('generate_key_questions',
+                 [{"role": "user", "content": key_questions_prompt}]),
+            ])
+        if ai_message is None:
+            ai_message = _FALLBACK_INVITED_GREETING
+
+        try:
+            key_questions = _extract_key_questions(ai_response or "")
+            chat.key_questions = (
+                key_questions if key_questions is not None
+                else _placeholder_key_questions(sections))
+        except Exception as e:
+            print(f"Failed to generate key questions: {e}")
+            chat.key_questions = _placeholder_key_questions(sections)
+
+    chat.messages.append({"role": "assistant", "content": ai_message})
+    await chat.asave()
+
+    # Link chat to invitation
+    invitation.chat = chat
+    await invitation.asave()
+
+    messages.success(request, 'Interview started! Good luck!')
+    return redirect('chat-view', chat_id=chat.id)
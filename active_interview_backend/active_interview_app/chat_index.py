@@ -0,0 +1,87 @@
+"""
+Sidebar index of a user's chats.
+
+Every page with the chat sidebar used to build
+``Chat.objects.filter(owner=...)`` itself and load full Chat rows (key
+questions included) just to show titles. The sidebar now reads a
+projection of the few fields it renders, ordered by the
+(owner, modified_date) index and shared through the ``sidebar_chats``
+context processor.
+
+The projection is cached per user in the default cache under a key that
+includes UserProfile.sidebar_version. The Chat and InvitedInterview
+signals (see signals.py) bump that version in the database rather than
+deleting a cache entry, so a change saved by one worker is seen by every
+worker even when each has its own process-local cache.
+settings.SIDEBAR_CACHE_TTL overrides the TTL; 0 disables caching.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, OuterRef, Subquery
+
+from .models import Chat, InvitedInterview, UserProfile
+
+SIDEBAR_CACHE_TTL = 300  # seconds
+
+# Chat fields rendered by components/sidebar.html
+SIDEBAR_FIELDS = (
+    'id', 'title', 'type', 'interview_type', 'is_finalized', 'modified_date'
+)
+
+
+def _cache_key(user_id, version):
+    return f'sidebar_chats:{user_id}:{version}'
+
+
+def _sidebar_version(user_id):
+    """Current sidebar version of a user, or None without a profile."""
+    return UserProfile.objects.filter(user_id=user_id).values_list(
+        'sidebar_version', flat=True).first()
+
+
+def _cache_ttl():
+    return getattr(settings, 'SIDEBAR_CACHE_TTL', SIDEBAR_CACHE_TTL)
+
+
+def get_sidebar_chats(user):
+    """
+    List the user's chats for the sidebar, most recently modified first.
+
+    Only SIDEBAR_FIELDS are loaded. Each chat also carries
+    ``review_status``, the interviewer review status of its invitation
+    (None for practice chats).
+
+    Args:
+        user: Owner of the chats
+
+    Returns:
+        list: Chat instances with deferred transcript fields
+    """
+    # Read the version before the chats, so a change committed in between
+    # is cached under the old (already superseded) key
+    ttl = _cache_ttl()
+    version = _sidebar_version(user.id) if ttl else None
+    if version is not None:
+        chats = cache.get(_cache_key(user.id, version))
+        if chats is not None:
+            return chats
+
+    review_status = InvitedInterview.objects.filter(
+        chat=OuterRef('pk')
+    ).values('interviewer_review_status')[:1]
+    chats = list(
+        Chat.objects.filter(owner=user)
+        .only(*SIDEBAR_FIELDS)
+        .annotate(review_status=Subquery(review_status))
+        .order_by('-modified_date')
+    )
+
+    if version is not None:
+        cache.set(_cache_key(user.id, version), chats, ttl)
+    return chats
+
+
+def invalidate_sidebar_chats(user_id):
+    """Retire the cached sidebar index for a user on every worker."""
+    UserProfile.objects.filter(user_id=user_id).update(
+        sidebar_version=F('sidebar_version') + 1)
@@ -0,0 +1,192 @@
+"""
+Circuit breakers for the upstream AI provider.
+
+A slow or failing upstream used to tie up every worker: each request
+waited for its own timeout. One breaker per (tier, API key) now counts
+consecutive upstream failures (timeouts, connection errors, 429s and
+5xx, see openai_utils.is_upstream_failure):
+
+- closed: requests flow; ``failure_threshold`` failures in a row trip it
+- open: requests are refused (get_client_and_model fails over to the
+  next tier) until ``reset_timeout`` seconds have passed
+- half-open: one probe request is let through; success closes the
+  breaker, failure opens it again
+
+settings.OPENAI_BREAKER_FAILURE_THRESHOLD and
+settings.OPENAI_BREAKER_RESET_TIMEOUT override the defaults. State is
+per worker process, like the client pool counters, and is shown on the
+observability dashboard.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30  # seconds
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised when every candidate tier's breaker is open."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one (tier, API key)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error = ''
+        self._opened_at = None
+        self._probe_started_at = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def failure_threshold():
+        return getattr(settings, 'OPENAI_BREAKER_FAILURE_THRESHOLD',
+                       FAILURE_THRESHOLD)
+
+    @staticmethod
+    def reset_timeout():
+        return getattr(settings, 'OPENAI_BREAKER_RESET_TIMEOUT',
+                       RESET_TIMEOUT)
+
+    def allow_request(self):
+        """
+        Return True if a request may be sent now.
+
+        An open breaker past its reset timeout turns half-open and lets
+        one probe through; a probe that never reports back is replaced
+        after another reset timeout.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self._opened_at < self.reset_timeout():
+                    return False
+                self.state = HALF_OPEN
+            elif (self._probe_started_at is not None
+                  and now - self._probe_started_at < self.reset_timeout()):
+                return False
+            self._probe_started_at = now
+            return True
+
+    def retry_after(self):
+        """Seconds until an open breaker lets a probe through (0 if not open)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0
+            elapsed = time.monotonic() - self._opened_at
+            return max(0, round(self.reset_timeout() - elapsed))
+
+    def record_success(self):
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._opened_at = self._probe_started_at = None
+
+    def record_failure(self, error=None):
+        """Count an upstream failure, tripping the breaker at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if error is not None:
+                self.last_error = type(error).__name__
+            if self.state == HALF_OPEN or (
+                    self.state == CLOSED
+                    and self.failures >= self.failure_threshold()):
+                self.state = OPEN
+                self.trips += 1
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    def stats(self):
+        """
+        Return the breaker state for monitoring.
+
+        Returns:
+            dict: state, failures (consecutive), trips, retry_after and
+                last_error
+        """
+        retry_after = self.retry_after()
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'trips': self.trips,
+                'retry_after': retry_after,
+                'last_error': self.last_error,
+            }
+
+
+class _BreakerRegistry:
+    """Thread-safe map of breaker name -> CircuitBreaker."""
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name)
+                self._breakers[name] = breaker
+            return breaker
+
+    def stats(self):
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
+
+    def clear(self):
+        with self._lock:
+            self._breakers.clear()
+
+
+_registry = _BreakerRegistry()
+
+
+def get_breaker(tier, key_fingerprint):
+    """
+    Get the breaker for a tier and API key.
+
+    Args:
+        tier (str): Model tier ('premium', 'standard', 'fallback')
+        key_fingerprint (str): Non-reversible key identifier
+
+    Returns:
+        CircuitBreaker: The shared breaker (created on first use)
+    """
+    return _registry.get(f'{tier}:{key_fingerprint[:8]}')
+
+
+def get_breaker_stats():
+    """
+    Get the state of every breaker in this process.
+
+    Returns:
+        dict: {'tier:key': CircuitBreaker.stats()}
+    """
+    return _registry.stats()
+
+
+def reset_breakers():
+    """
+    Forget all breakers.
+
+    Used by tests; in production breakers close on their own.
+    """
+    _registry.clear()
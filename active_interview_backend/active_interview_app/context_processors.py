@@ -0,0 +1,35 @@
+"""
+Template context processors for Active Interview App.
+"""
+from django.utils.functional import SimpleLazyObject
+
+from .chat_index import get_sidebar_chats
+from .models import Chat
+
+
+def sidebar_chats(request):
+    """
+    Provide the chat sidebar to every template.
+
+    The index is only loaded when a template actually renders it, so pages
+    without the sidebar cost nothing.
+
+    Context:
+        owner_chats: The user's chats, most recently modified first
+        sidebar_practice_chats: The practice chats among them
+        sidebar_invited_chats: The invited chats among them
+    """
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return {}
+
+    chats = SimpleLazyObject(lambda: get_sidebar_chats(user))
+    return {
+        'owner_chats': chats,
+        'sidebar_practice_chats': SimpleLazyObject(lambda: [
+            chat for chat in chats if chat.interview_type == Chat.PRACTICE
+        ]),
+        'sidebar_invited_chats': SimpleLazyObject(lambda: [
+            chat for chat in chats if chat.interview_type == Chat.INVITED
+        ]),
+    }
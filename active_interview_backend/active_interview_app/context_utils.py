@@ -0,0 +1,196 @@
+"""
+Context windowing for long interview chats.
+
+Every interview turn used to send the whole ``Chat.messages`` list, so
+prompt tokens (and cost and latency) grew with each answer. Once a chat
+exceeds its tier's budget, the model instead receives:
+
+- the system prompt (job listing, resume, interview instructions)
+- a rolling summary of the older turns
+- the most recent turns, verbatim
+
+``Chat.messages`` itself is never trimmed. The summary is stored in
+``ChatContextSummary`` and refreshed in a background thread after the
+request's transaction commits, using the fallback (cheapest) tier.
+"""
+import logging
+import textwrap
+import threading
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .model_tier_manager import get_context_budget
+from .models import Chat, ChatContextSummary
+from .openai_utils import create_completion, get_client_and_model
+from .token_tracking import record_openai_usage
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimate: ~4 characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Chats with a summary refresh already queued in this process
+_pending_refreshes = set()
+_pending_lock = threading.Lock()
+
+
+def estimate_tokens(messages):
+    """
+    Estimate the prompt tokens for a list of chat messages.
+
+    Args:
+        messages: List of {"role": str, "content": str} dicts
+
+    Returns:
+        int: Estimated token count
+    """
+    chars = sum(len(message.get('content') or '') for message in messages)
+    # Each message carries a few tokens of role/formatting overhead
+    return chars // CHARS_PER_TOKEN + 4 * len(messages)
+
+
+def build_context_messages(chat, messages, tier='premium'):
+    """
+    Build the messages to send to the model for the next interview turn.
+
+    Returns ``messages`` unchanged while it fits the tier's budget.
+    Otherwise returns the system prompt, the stored summary and the recent
+    turns. Turns that fell out of the window but are not summarized yet
+    are still sent verbatim, and a summary refresh is scheduled.
+
+    Args:
+        chat: Chat instance the messages belong to
+        messages: Full message list, including the new user message
+        tier: Active model tier (see model_tier_manager)
+
+    Returns:
+        list: Messages for the chat completion call
+    """
+    budget = get_context_budget(tier)
+    if estimate_tokens(messages) <= budget['max_context_tokens']:
+        return messages
+
+    window_start = max(1, len(messages) - 2 * budget['recent_turns'])
+
+    summary = ChatContextSummary.objects.filter(chat=chat).first()
+    if summary and summary.summarized_through > len(messages):
+        # Chat was restarted or edited since the summary was written
+        summary = None
+
+    summarized_through = summary.summarized_through if summary else 1
+    if summarized_through < window_start:
+        schedule_summary_refresh(chat.id, window_start)
+
+    context = [messages[0]]
+    if summary and summary.summary:
+        context.append({
+            "role": "system",
+            "content": "Summary of the earlier part of this interview:\n"
+                       + summary.summary
+        })
+    context.extend(messages[min(summarized_through, window_start):])
+    return context
+
+
+def schedule_summary_refresh(chat_id, through):
+    """
+    Refresh a chat's summary in a background thread.
+
+    The thread starts once the current transaction commits, and at most
+    one refresh per chat runs at a time in this process.
+
+    Args:
+        chat_id: ID of the chat to summarize
+        through: Summarize messages up to this index (exclusive)
+    """
+    def start():
+        with _pending_lock:
+            if chat_id in _pending_refreshes:
+                return
+            _pending_refreshes.add(chat_id)
+        threading.Thread(
+            target=_run_summary_refresh,
+            args=(chat_id, through),
+            daemon=True
+        ).start()
+
+    transaction.on_commit(start)
+
+
+def _run_summary_refresh(chat_id, through):
+    """Thread target for schedule_summary_refresh."""
+    try:
+        refresh_context_summary(chat_id, through)
+    except Exception as e:
+        logger.warning(
+            f"Context summary refresh failed for chat {chat_id}: "
+            f"{type(e).__name__}: {e}"
+        )
+    finally:
+        with _pending_lock:
+            _pending_refreshes.discard(chat_id)
+        close_old_connections()
+
+
+def refresh_context_summary(chat_id, through):
+    """
+    Fold the messages up to ``through`` into the chat's rolling summary.
+
+    Only the messages not yet covered are sent, together with the previous
+    summary, so each refresh costs a bounded number of tokens.
+
+    Args:
+        chat_id: ID of the chat to summarize
+        through: Summarize messages up to this index (exclusive)
+
+    Returns:
+        ChatContextSummary: The updated (or already current) summary
+    """
+    chat = Chat.objects.select_related('owner').get(id=chat_id)
+    summary, _ = ChatContextSummary.objects.get_or_create(chat=chat)
+    if summary.summarized_through > chat.message_count():
+        # Stale summary from before a restart
+        summary.summary = ''
+        summary.summarized_through = 1
+        summary.save()
+    if summary.summarized_through >= through:
+        return summary
+
+    transcript = "\n\n".join(
+        f"{message['role']}: {message.get('content') or ''}"
+        for message in chat.get_messages(summary.summarized_through, through)
+    )
+    summary_prompt = textwrap.dedent("""\
+        You are summarizing a job interview so the interviewer can continue
+        it without the full transcript. Update the summary below with the
+        new transcript excerpt. Keep every question asked, the key points
+        of each answer, and any strengths or concerns noted. Be concise and
+        factual. Respond with the updated summary only.
+
+        Current summary:
+        {summary}
+
+        New transcript excerpt:
+        {transcript}
+    """).format(summary=summary.summary or "(none)", transcript=transcript)
+
+    # Summaries use the cheapest tier (Issue #14)
+    client, model, tier_info = get_client_and_model(force_tier='fallback')
+    response = create_completion(
+        client, model, [{"role": "user", "content": summary_prompt}],
+        'context_summary'
+    )
+    # Track token usage for spending cap (Issue #15.10)
+    record_openai_usage(chat.owner, 'context_summary', response)
+
+    # Conditional update so an older, slower refresh never wins
+    ChatContextSummary.objects.filter(
+        pk=summary.pk, summarized_through__lt=through
+    ).update(
+        summary=response.choices[0].message.content.strip(),
+        summarized_through=through,
+        updated_at=timezone.now()
+    )
+    summary.refresh_from_db()
+    return summary
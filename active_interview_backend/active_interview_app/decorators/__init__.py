@@ -6,6 +6,7 @@ from .ratelimit_decorators import (
     ratelimit_lenient,
     ratelimit_api
 )
+from .request_cache_decorators import with_request_cache
 
 # Import RBAC decorators from the decorators.py module file
 # Note: There's both a decorators.py file AND a decorators/ package in the same directory.
@@ -37,6 +38,7 @@ __all__ = [
     'ratelimit_strict',
     'ratelimit_lenient',
     'ratelimit_api',
+    'with_request_cache',
     'admin_required',
     'admin_or_interviewer_required',
     'role_required',
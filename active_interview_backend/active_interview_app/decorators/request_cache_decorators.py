@@ -0,0 +1,24 @@
+"""
+Request-scoped object cache decorator for function-based views.
+
+See request_cache.py for the cache itself.
+"""
+
+from functools import wraps
+from ..request_cache import get_request_cache
+
+
+def with_request_cache(view_func):
+    """
+    Attach a RequestObjectCache to the request before the view runs.
+
+    Usage:
+        @with_request_cache
+        def my_view(request, chat_id):
+            chat = request.object_cache.get(Chat, id=chat_id)
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        get_request_cache(request)
+        return view_func(request, *args, **kwargs)
+    return wrapper
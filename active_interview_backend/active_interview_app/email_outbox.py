@@ -0,0 +1,208 @@
+"""
+Outbox for outgoing email.
+
+Related to Issues #8, #139 (Email notifications).
+
+Invitation, completion, review, data export and rate limit alert emails
+used to talk to SMTP inside the request (``ChatView.get`` could block on it
+just because it noticed an expired invitation). Call sites now
+``queue_email()`` an ``OutboundEmail`` row and return at once;
+``manage.py send_outbound_email`` drains the outbox:
+
+- each batch is sent over one ``get_connection()``
+- a failed send is retried with exponential backoff until ``max_attempts``
+- if the connection cannot be opened, the whole batch backs off
+
+With ``EMAIL_OUTBOX_EAGER = True`` (used by the test settings) the outbox
+is drained at queue time, so ``mail.outbox`` behaves as before.
+"""
+import base64
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .email_outbox_models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+# Emails sent per connection
+DEFAULT_BATCH_SIZE = 50
+
+# Retry delay is RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+RETRY_BACKOFF_SECONDS = 60
+
+# Seconds a claimed batch may take before another sender can reclaim it
+CLAIM_SECONDS = 300
+
+
+def is_eager():
+    """Whether the outbox is drained at queue time."""
+    return getattr(settings, 'EMAIL_OUTBOX_EAGER', False)
+
+
+def queue_email(subject, body, to, html_body='', from_email=None,
+                attachments=None):
+    """
+    Queue an email for the sender.
+
+    Args:
+        subject (str): Subject line
+        body (str): Plain text body
+        to (list): Recipient addresses
+        html_body (str): Optional HTML alternative
+        from_email (str): Sender (defaults to DEFAULT_FROM_EMAIL)
+        attachments (list): (filename, content, mimetype) tuples
+
+    Returns:
+        OutboundEmail: The queued email
+    """
+    encoded = []
+    for filename, content, mimetype in attachments or []:
+        if isinstance(content, str):
+            content = content.encode()
+        encoded.append({
+            'filename': filename,
+            'content': base64.b64encode(content).decode('ascii'),
+            'mimetype': mimetype,
+        })
+
+    email = OutboundEmail.objects.create(
+        subject=subject[:255],
+        body=body,
+        html_body=html_body or '',
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(to),
+        attachments=encoded
+    )
+    if is_eager():
+        send_pending_emails()
+    return email
+
+
+def queue_mail_admins(subject, message):
+    """
+    Queue an email to settings.ADMINS, like django.core.mail.mail_admins.
+
+    Returns:
+        OutboundEmail: The queued email, or None when ADMINS is empty
+    """
+    if not settings.ADMINS:
+        return None
+    return queue_email(
+        f"{settings.EMAIL_SUBJECT_PREFIX}{subject}",
+        message,
+        [address for _, address in settings.ADMINS],
+        from_email=settings.SERVER_EMAIL
+    )
+
+
+def _claim_batch(batch_size):
+    """Mark up to ``batch_size`` due emails as sending and return them."""
+    now = timezone.now()
+    due = (
+        Q(status=OutboundEmail.PENDING, next_attempt_at__lte=now)
+        | Q(status=OutboundEmail.SENDING, locked_until__lt=now)
+    )
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(due)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        OutboundEmail.objects.filter(pk__in=[e.pk for e in batch]).update(
+            status=OutboundEmail.SENDING,
+            locked_until=now + timedelta(seconds=CLAIM_SECONDS)
+        )
+    return batch
+
+
+def _build_message(email, connection):
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=email.to,
+        connection=connection
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    for attachment in email.attachments:
+        message.attach(
+            attachment['filename'],
+            base64.b64decode(attachment['content']),
+            attachment['mimetype']
+        )
+    return message
+
+
+def _record_failure(email, error):
+    """Back off a failed email, or give up after max_attempts."""
+    email.attempts += 1
+    email.last_error = error
+    email.locked_until = None
+    if email.attempts >= email.max_attempts:
+        email.status = OutboundEmail.FAILED
+        logger.error(
+            f"Giving up on email {email.pk} to {email.to} after "
+            f"{email.attempts} attempts: {error}"
+        )
+    else:
+        email.status = OutboundEmail.PENDING
+        delay = RETRY_BACKOFF_SECONDS * 2 ** (email.attempts - 1)
+        email.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+    email.save(update_fields=[
+        'attempts', 'last_error', 'locked_until', 'status', 'next_attempt_at'
+    ])
+
+
+def send_pending_emails(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Send one batch of due emails over a single connection.
+
+    Returns:
+        tuple: (sent, failed) counts for this batch
+    """
+    batch = _claim_batch(batch_size)
+    if not batch:
+        return 0, 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        logger.warning(f"Could not open email connection: {error}")
+        for email in batch:
+            _record_failure(email, error)
+        return 0, len(batch)
+
+    sent = failed = 0
+    try:
+        for email in batch:
+            try:
+                _build_message(email, connection).send()
+            except Exception as e:
+                _record_failure(email, f"{type(e).__name__}: {e}")
+                failed += 1
+                continue
+            email.attempts += 1
+            email.status = OutboundEmail.SENT
+            email.sent_at = timezone.now()
+            email.locked_until = None
+            email.save(update_fields=[
+                'attempts', 'status', 'sent_at', 'locked_until'
+            ])
+            sent += 1
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    logger.info(f"Email outbox batch: {sent} sent, {failed} failed")
+    return sent, failed
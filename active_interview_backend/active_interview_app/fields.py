@@ -0,0 +1,161 @@
+"""
+Compressed model fields for large text and JSON columns.
+
+Resumes, job listings, chat transcripts (whose system prompt embeds the
+resume and job listing), report question breakdowns and audit metadata
+are large, repetitive markdown/JSON. These fields store them
+zlib-compressed in a binary column and hand back plain ``str`` /
+JSON values, so model code, forms and serializers are unchanged.
+
+Stored format: one header byte followed by the payload.
+
+- ``HEADER_RAW``: UTF-8 text, used below ``MIN_COMPRESS_LENGTH`` bytes
+  or when compression would not make the value smaller
+- ``HEADER_ZLIB``: zlib-compressed UTF-8 text
+
+Decompression is memoized (``DECOMPRESS_CACHE_SIZE`` payloads), so
+reloading the same row - e.g. a transcript re-read on every turn -
+does not inflate it again. The compressed columns cannot be searched or
+filtered on their contents.
+"""
+import functools
+import json
+import zlib
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+# Values shorter than this (in bytes) are stored uncompressed
+MIN_COMPRESS_LENGTH = 256
+
+# zlib level: 6 is zlib's default speed/size trade-off
+COMPRESSION_LEVEL = 6
+
+# Number of decompressed payloads kept in memory per process
+DECOMPRESS_CACHE_SIZE = 256
+
+HEADER_RAW = b'\x00'
+HEADER_ZLIB = b'\x01'
+
+
+def compress_text(text):
+    """
+    Encode text for a compressed column.
+
+    Args:
+        text: The string to store
+
+    Returns:
+        bytes: Header byte followed by the (possibly compressed) payload
+    """
+    data = text.encode('utf-8')
+    if len(data) >= MIN_COMPRESS_LENGTH:
+        compressed = zlib.compress(data, COMPRESSION_LEVEL)
+        if len(compressed) < len(data):
+            return HEADER_ZLIB + compressed
+    return HEADER_RAW + data
+
+
+@functools.lru_cache(maxsize=DECOMPRESS_CACHE_SIZE)
+def _inflate(payload):
+    return zlib.decompress(payload).decode('utf-8')
+
+
+def clear_decompress_cache():
+    """Drop every memoized decompressed payload."""
+    _inflate.cache_clear()
+
+
+def decompress_text(data):
+    """
+    Decode a value read from a compressed column.
+
+    Plain strings are returned unchanged, so rows written before the
+    column was compressed still load.
+
+    Args:
+        data: bytes, memoryview or str from the database
+
+    Returns:
+        str: The stored text
+
+    Raises:
+        ValueError: If the header byte is unknown
+    """
+    if isinstance(data, str):
+        return data
+    data = bytes(data)
+    if not data:
+        return ''
+    header, payload = data[:1], data[1:]
+    if header == HEADER_ZLIB:
+        return _inflate(payload)
+    if header == HEADER_RAW:
+        return payload.decode('utf-8')
+    raise ValueError(f'Unknown compressed field header {header!r}')
+
+
+class CompressedTextField(models.TextField):
+    """
+    TextField stored zlib-compressed in a binary column.
+
+    Behaves like a TextField in Python (forms, admin, serializers) but
+    does not support database lookups on its contents.
+    """
+
+    def get_internal_type(self):
+        return 'BinaryField'
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return decompress_text(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return decompress_text(value)
+        return super().to_python(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None or hasattr(value, 'as_sql'):
+            return value
+        return connection.Database.Binary(compress_text(value))
+
+
+class CompressedJSONField(models.JSONField):
+    """
+    JSONField stored as zlib-compressed JSON text in a binary column.
+
+    Decoded values are fresh objects on every load; only the
+    decompressed text is cached. Key and containment lookups are not
+    supported.
+    """
+
+    def get_internal_type(self):
+        return 'BinaryField'
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        try:
+            return json.loads(decompress_text(value), cls=self.decoder)
+        except json.JSONDecodeError:
+            return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if hasattr(value, 'as_sql'):
+            return value
+        if value is None and self.null:
+            return None
+        try:
+            text = json.dumps(value, cls=self.encoder)
+        except TypeError as e:
+            raise ValidationError(str(e)) from e
+        return connection.Database.Binary(compress_text(text))
+
+    def get_db_prep_save(self, value, connection):
+        return self.get_db_prep_value(value, connection)
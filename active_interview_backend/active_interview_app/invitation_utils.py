@@ -2,11 +2,12 @@
 Utility functions for interview invitation workflow.
 Handles email sending and calendar invitation generation.
 
+Emails are queued in the outbox (see email_outbox) rather than sent inline.
+
 Related to Issues #8, #139 (Email notifications).
 """
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.utils import timezone
@@ -15,6 +16,8 @@ from datetime import timedelta
 from urllib.parse import urlencode
 import logging
 
+from .email_outbox import queue_email
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +29,7 @@ def send_invitation_email(invited_interview):
         invited_interview: InvitedInterview instance
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email queued successfully, False otherwise
 
     Related to Issue #8 (Send Interview Invitation).
     """
@@ -52,37 +55,29 @@ def send_invitation_email(invited_interview):
         # Create plain text version
         plain_message = strip_tags(html_message)
 
-        # Create email message
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[candidate_email],
-        )
-
-        # Attach HTML version
-        email.attach_alternative(html_message, "text/html")
-
-        # Generate and attach calendar invite
+        # Generate calendar invite
+        attachments = []
         ics_content = generate_calendar_invite(invited_interview)
         if ics_content:
-            email.attach(
-                'interview.ics',
-                ics_content,
-                'text/calendar'
-            )
+            attachments.append(('interview.ics', ics_content, 'text/calendar'))
 
-        # Send email
-        email.send(fail_silently=False)
+        # Queue email with HTML version and calendar invite
+        queue_email(
+            subject,
+            plain_message,
+            [candidate_email],
+            html_body=html_message,
+            attachments=attachments
+        )
 
         logger.info(
-            f"Invitation email sent to {candidate_email} "
+            f"Invitation email queued for {candidate_email} "
             f"for interview {invited_interview.id}"
         )
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send invitation email: {e}")
+        logger.error(f"Failed to queue invitation email: {e}")
         # In development, email will be printed to console anyway
         return False
 
@@ -95,7 +90,7 @@ def send_completion_notification_email(invited_interview):
         invited_interview: InvitedInterview instance
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email queued successfully, False otherwise
 
     Related to Issue #139 (Email Notifications - Completion).
     """
@@ -121,25 +116,22 @@ def send_completion_notification_email(invited_interview):
         # Create plain text version
         plain_message = strip_tags(html_message)
 
-        # Send email
-        from django.core.mail import send_mail
-        send_mail(
+        # Queue email
+        queue_email(
             subject,
             plain_message,
-            settings.DEFAULT_FROM_EMAIL,
             [interviewer_email],
-            html_message=html_message,
-            fail_silently=True,
+            html_body=html_message
         )
 
         logger.info(
-            f"Completion notification sent to {interviewer_email} "
+            f"Completion notification queued for {interviewer_email} "
             f"for interview {invited_interview.id}"
         )
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send completion notification: {e}")
+        logger.error(f"Failed to queue completion notification: {e}")
         return False
 
 
@@ -151,7 +143,7 @@ def send_review_notification_email(invited_interview):
         invited_interview: InvitedInterview instance
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email queued successfully, False otherwise
 
     Related to Issue #139 (Email Notifications - Review).
     """
@@ -176,25 +168,22 @@ def send_review_notification_email(invited_interview):
         # Create plain text version
         plain_message = strip_tags(html_message)
 
-        # Send email
-        from django.core.mail import send_mail
-        send_mail(
+        # Queue email
+        queue_email(
             subject,
             plain_message,
-            settings.DEFAULT_FROM_EMAIL,
             [candidate_email],
-            html_message=html_message,
-            fail_silently=True,
+            html_body=html_message
         )
 
         logger.info(
-            f"Review notification sent to {candidate_email} "
+            f"Review notification queued for {candidate_email} "
             f"for interview {invited_interview.id}"
         )
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send review notification: {e}")
+        logger.error(f"Failed to queue review notification: {e}")
         return False
 
 
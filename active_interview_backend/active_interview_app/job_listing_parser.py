@@ -9,13 +9,13 @@ Issues: #21, #51, #52, #53
 """
 
 import json
-import textwrap
 from typing import Dict, Any
 
 # Import the OpenAI client utilities from openai_utils
 # This ensures consistent error handling and configuration
 # Updated for Issue #14: Multi-tier model selection with automatic fallback
-from .openai_utils import get_client_and_model, ai_available, MAX_TOKENS
+from .openai_utils import get_client_and_model, ai_available, create_completion
+from .token_tracking import record_openai_usage
 
 # Import seniority constants from models
 from .models import (
@@ -23,14 +23,21 @@ from .models import (
     SENIORITY_MID,
     SENIORITY_SENIOR,
     SENIORITY_LEAD,
-    SENIORITY_EXECUTIVE
+    SENIORITY_EXECUTIVE,
+    ParseResultCache
 )
+from . import prompts
+from .parse_cache import cached_parse
 
 # Maximum characters for job description content before truncation
 # Keep first 15,000 characters (roughly 3,750 tokens)
 # to prevent token limit issues
 JOB_DESCRIPTION_LIMIT = 15000
 
+# Changes whenever the parse prompts change, so stored parses are not reused
+PROMPT_VERSION = prompts.combined_version(
+    prompts.JOB_PARSE_SYSTEM, prompts.JOB_PARSE_USER)
+
 
 def parse_job_listing_with_ai(job_description: str) -> Dict[str, Any]:
     """
@@ -42,6 +49,9 @@ def parse_job_listing_with_ai(job_description: str) -> Dict[str, Any]:
     - Seniority Level: Entry, Mid, Senior, Lead, Executive
     - Requirements: Education, experience, certifications
 
+    Results are stored by content hash (see parse_cache), so identical
+    job descriptions return without an API call.
+
     Args:
         job_description (str): The job description text
 
@@ -66,6 +76,12 @@ def parse_job_listing_with_ai(job_description: str) -> Dict[str, Any]:
         >>> print(result['required_skills'])
         ['Python', 'Django']
     """
+    return cached_parse(ParseResultCache.KIND_JOB_LISTING, PROMPT_VERSION,
+                        job_description, _parse_job_listing)
+
+
+def _parse_job_listing(job_description: str) -> Dict[str, Any]:
+    """Uncached job listing parse; see parse_job_listing_with_ai()."""
     # Check if OpenAI is available (same pattern as resume_parser.py)
     if not ai_available():
         raise ValueError(
@@ -80,90 +96,26 @@ def parse_job_listing_with_ai(job_description: str) -> Dict[str, Any]:
         job_description = truncated + "\n... (truncated)"
 
     # System prompt for structured extraction
-    system_prompt = textwrap.dedent("""
-        You are a professional job description parser.
-        Your task is to extract structured information from job postings
-        and return it as valid JSON.
-
-        Extract the following information:
-
-        1. Required Skills: Extract ALL skills mentioned including:
-           - Technical skills (programming languages, frameworks, tools)
-           - Soft skills (leadership, communication, teamwork)
-           - Domain knowledge (industry-specific expertise)
-           - Years of experience requirements (e.g., "5+ years Python")
-
-        2. Seniority Level: Infer the seniority level based on:
-           - Job title (Junior, Senior, Lead, Principal, Director, etc.)
-           - Years of experience required
-           - Level of responsibility described
-           - Team leadership expectations
-
-           Return ONE of these exact values:
-           - "entry" - Entry level, junior positions, 0-2 years
-           - "mid" - Mid-level, 2-5 years experience
-           - "senior" - Senior positions, 5+ years, technical expertise
-           - "lead" - Lead/Principal, 7+ years, team leadership
-           - "executive" - Executive, Director, VP, C-level positions
-
-        3. Requirements: Extract structured requirements:
-           - Education: Degree requirements (if mentioned)
-           - Years of experience: Extract as string (e.g., "5+", "3-5")
-           - Certifications: Professional certifications (if mentioned)
-           - Responsibilities: Key job responsibilities and duties
-
-        Return ONLY a valid JSON object with this exact structure
-        (no markdown, no code blocks, just pure JSON):
-        {
-            "required_skills": ["skill1", "skill2", "skill3"],
-            "seniority_level": "senior",
-            "requirements": {
-                "education": ["Bachelor's in CS", "Master's pref"],
-                "years_experience": "5+",
-                "certifications": ["AWS Certified", "PMP"],
-                "responsibilities": [
-                    "Lead engineering team",
-                    "Design scalable systems",
-                    "Mentor junior developers"
-                ]
-            }
-        }
-
-        Important guidelines:
-        - If section not found, return empty array [] or empty string ""
-        - For seniority_level, MUST return: entry/mid/senior/lead/exec
-        - Extract ALL skills (combine technical and soft skills)
-        - For years_experience, extract number or use "" if not specified
-        - Keep responsibilities concise (1-2 sentences max per item)
-        - Return pure JSON only - no markdown, no ```json blocks
-    """).strip()
+    system_prompt = prompts.JOB_PARSE_SYSTEM.render()
 
     # User prompt with the job description content
-    user_prompt = textwrap.dedent(f"""
-        Please parse the following job description and extract
-        required skills, seniority level, and requirements.
-
-        Job Description:
-        \"\"\"
-        {job_description}
-        \"\"\"
-
-        Return the structured data as JSON following specified format.
-    """).strip()
+    user_prompt = prompts.JOB_PARSE_USER.render(job_description=job_description)
 
     try:
         # Call OpenAI API with automatic tier selection (Issue #14)
-        client, model, tier_info = get_client_and_model()
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
+        client, model, tier_info = get_client_and_model(
+            profile='job_parse')
+        response = create_completion(
+            client, model,
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=MAX_TOKENS,
-            temperature=0.3,  # Lower temp for consistent parsing
-            response_format={"type": "json_object"}  # Force JSON
+            # Low temperature and JSON mode for consistent parsing
+            'job_parse'
         )
+        # Parses are cached per document, not billed to a user
+        record_openai_usage(None, 'job_parse', response)
 
         # Extract the response content
         response_content = response.choices[0].message.content.strip()
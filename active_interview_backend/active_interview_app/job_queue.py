@@ -0,0 +1,188 @@
+"""
+Database-backed background job queue.
+
+Heavy work (resume parsing, data exports, report generation) used to run
+inside the HTTP request. Views now ``enqueue()`` a ``Job`` row and return
+at once; ``manage.py run_workers`` claims jobs and runs them in a thread
+pool. Progress stays visible through the models the work updates
+(``UploadedResume.parsing_status``, ``DataExportRequest.status``,
+``ExportableReport``).
+
+Claiming uses ``select_for_update(skip_locked=True)`` so several workers can
+poll the same table without blocking each other or double-claiming. A claim
+is a lease: if a worker dies, the job is claimed again once
+``lease_expires_at`` passes. Failed jobs are retried with exponential
+backoff until ``max_attempts``, then the task's ``on_failure`` hook runs.
+
+With ``JOB_QUEUE_EAGER = True`` (used by the test settings) jobs run inline
+at enqueue time, once, with no retries.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .job_queue_models import Job
+
+logger = logging.getLogger(__name__)
+
+# Seconds a claimed job may run before another worker can reclaim it
+DEFAULT_LEASE_SECONDS = 300
+
+# Priority for jobs a user is waiting on (parsing, reports)
+PRIORITY_INTERACTIVE = 10
+
+# Retry delay is RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+RETRY_BACKOFF_SECONDS = 30
+
+_tasks = {}
+
+
+def task(name, on_failure=None):
+    """
+    Register a function as a job task.
+
+    Args:
+        name (str): Task name stored on Job.task
+        on_failure (callable): Called with the payload as keyword arguments
+            plus ``error`` (str) when the job fails for the last time
+
+    Example:
+        >>> @task('parse_resume')
+        ... def parse_resume(resume_id):
+        ...     ...
+    """
+    def decorator(func):
+        _tasks[name] = (func, on_failure)
+        return func
+    return decorator
+
+
+def is_eager():
+    """Whether jobs run inline at enqueue time."""
+    return getattr(settings, 'JOB_QUEUE_EAGER', False)
+
+
+def enqueue(task_name, payload=None, priority=0, max_attempts=3):
+    """
+    Queue a job for the workers.
+
+    Args:
+        task_name (str): Registered task name
+        payload (dict): JSON-serializable keyword arguments for the task
+        priority (int): Higher runs first
+        max_attempts (int): Attempts before the job is marked failed
+
+    Returns:
+        Job: The created job (already finished in eager mode)
+    """
+    if task_name not in _tasks:
+        raise ValueError(f"Unknown job task: {task_name}")
+
+    job = Job.objects.create(
+        task=task_name,
+        payload=payload or {},
+        priority=priority,
+        max_attempts=max_attempts
+    )
+    if is_eager():
+        job.status = Job.RUNNING
+        job.attempts = 1
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'attempts', 'started_at'])
+        run_job(job, retry=False)
+    return job
+
+
+def claim_jobs(worker_id, limit=1, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    Claim up to ``limit`` runnable jobs for a worker.
+
+    Runnable jobs are pending jobs whose ``run_after`` has passed and
+    running jobs whose lease has expired.
+
+    Args:
+        worker_id (str): Identifies the claiming worker
+        limit (int): Maximum jobs to claim
+        lease_seconds (int): Lease length
+
+    Returns:
+        list: Claimed Job instances, marked running
+    """
+    now = timezone.now()
+    runnable = (
+        Q(status=Job.PENDING, run_after__lte=now)
+        | Q(status=Job.RUNNING, lease_expires_at__lt=now)
+    )
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(runnable)
+            .order_by('-priority', 'run_after', 'id')[:limit]
+        )
+        for job in jobs:
+            job.status = Job.RUNNING
+            job.attempts += 1
+            job.locked_by = worker_id
+            job.started_at = now
+            job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            job.save(update_fields=[
+                'status', 'attempts', 'locked_by', 'started_at',
+                'lease_expires_at'
+            ])
+    return jobs
+
+
+def run_job(job, retry=True):
+    """
+    Run a claimed job and record the outcome.
+
+    Args:
+        job (Job): A job in the running state
+        retry (bool): Requeue on failure while attempts remain
+
+    Returns:
+        bool: True if the task succeeded
+    """
+    func, on_failure = _tasks.get(job.task, (None, None))
+    try:
+        if func is None:
+            raise LookupError(f"Unknown job task: {job.task}")
+        func(**job.payload)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        logger.warning(
+            f"Job {job.pk} ({job.task}) failed on attempt {job.attempts}: "
+            f"{error}"
+        )
+        job.last_error = error
+        job.lease_expires_at = None
+        if retry and job.attempts < job.max_attempts:
+            delay = RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+            job.status = Job.PENDING
+            job.run_after = timezone.now() + timedelta(seconds=delay)
+        else:
+            job.status = Job.FAILED
+            job.finished_at = timezone.now()
+        job.save(update_fields=[
+            'status', 'last_error', 'lease_expires_at', 'run_after',
+            'finished_at'
+        ])
+        if job.status == Job.FAILED and on_failure is not None:
+            try:
+                on_failure(error=str(e), **job.payload)
+            except Exception as hook_error:
+                logger.error(
+                    f"on_failure for job {job.pk} ({job.task}) raised: "
+                    f"{hook_error}"
+                )
+        return False
+
+    job.status = Job.SUCCEEDED
+    job.finished_at = timezone.now()
+    job.lease_expires_at = None
+    job.save(update_fields=['status', 'finished_at', 'lease_expires_at'])
+    return True
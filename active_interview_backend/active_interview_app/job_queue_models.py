@@ -0,0 +1,68 @@
+"""
+Background job model for the database-backed job queue.
+
+Jobs are rows in this table: web requests insert them (see job_queue) and
+``manage.py run_workers`` claims and runs them. No external broker is
+needed; PostgreSQL row locks keep two workers from claiming the same job.
+"""
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A unit of background work.
+
+    ``task`` names a handler registered in job_queue, called with
+    ``payload`` as keyword arguments. A claimed job holds a lease until
+    ``lease_expires_at``; a worker that dies mid-job leaves an expired
+    lease and the job is claimed again.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+
+    task = models.CharField(
+        max_length=100,
+        help_text="Registered task name (e.g., 'parse_resume')"
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=PENDING
+    )
+    priority = models.IntegerField(
+        default=0,
+        help_text="Higher priority jobs are claimed first"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        help_text="Not claimed before this time (retry backoff)"
+    )
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-priority', 'created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+            models.Index(fields=['status', 'lease_expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
@@ -0,0 +1,85 @@
+"""
+Background job tasks run by ``manage.py run_workers``.
+
+Each task takes primary keys (not model instances) so the payload stays
+JSON-serializable and the worker always loads the current row.
+Imported from ActiveInterviewAppConfig.ready() to register the tasks.
+"""
+import logging
+
+from django.utils import timezone
+
+from .job_queue import task
+from .models import Chat, DataExportRequest, InvitedInterview, UploadedResume
+
+logger = logging.getLogger(__name__)
+
+
+def _resume_parse_failed(resume_id, error):
+    """Record a resume parse that failed on its last attempt."""
+    # Sanitize any potential API key references
+    if "api" in error.lower() and "key" in error.lower():
+        error = "OpenAI authentication error"
+    UploadedResume.objects.filter(pk=resume_id).update(
+        parsing_status='error',
+        parsing_error=error
+    )
+
+
+@task('parse_resume', on_failure=_resume_parse_failed)
+def parse_resume(resume_id):
+    """
+    Extract skills, experience and education from an uploaded resume.
+
+    Related to Issue #48 ("upload triggers parsing").
+    """
+    from .resume_parser import parse_resume_with_ai
+
+    resume = UploadedResume.objects.get(pk=resume_id)
+    resume.parsing_status = 'in_progress'
+    resume.save(update_fields=['parsing_status'])
+
+    parsed_data = parse_resume_with_ai(resume.content)
+
+    resume.skills = parsed_data.get('skills', [])
+    resume.experience = parsed_data.get('experience', [])
+    resume.education = parsed_data.get('education', [])
+    resume.parsing_status = 'success'
+    resume.parsing_error = None
+    resume.parsed_at = timezone.now()
+    resume.save()
+
+
+@task('process_data_export')
+def process_data_export(export_request_id):
+    """
+    Build a user's data export ZIP and email them when it is ready.
+
+    process_export_request() records failures on the request itself.
+    Related to Issue #64 (Data Export Functionality).
+    """
+    from .user_data_utils import process_export_request
+
+    export_request = DataExportRequest.objects.get(pk=export_request_id)
+    process_export_request(export_request)
+
+
+@task('generate_interview_report')
+def generate_interview_report(chat_id, notify_interviewer=False):
+    """
+    Generate the ExportableReport for a finalized interview.
+
+    With ``notify_interviewer``, the interviewer of an invited interview is
+    emailed once the report exists.
+    Related to: Report Generation Refactor (Phase 3)
+    """
+    from .invitation_utils import send_completion_notification_email
+    from .report_utils import generate_and_save_report
+
+    chat = Chat.objects.get(pk=chat_id)
+    generate_and_save_report(chat)
+
+    if notify_interviewer:
+        invitation = InvitedInterview.objects.filter(chat=chat).first()
+        if invitation is not None:
+            send_completion_notification_email(invitation)
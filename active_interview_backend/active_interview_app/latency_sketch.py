@@ -0,0 +1,205 @@
+"""
+Mergeable latency sketches.
+
+Percentiles used to be computed by loading every response time into a
+list, sorting it and calling statistics.quantiles. A LatencySketch
+instead counts each value into a logarithmic bucket (the DDSketch
+scheme): bucket ``i`` holds values in (GAMMA ** (i - 1), GAMMA ** i], so
+any quantile read back is within RELATIVE_ACCURACY (1%) of the true
+value. Memory depends on the spread of latencies, not on how many were
+counted (about 550 buckets cover 1 ms to 60 s), and two sketches merge
+by adding bucket counts, so percentiles over any range come from
+merging stored sketches (RequestMetricRollup.histogram).
+
+Count, sum, min and max are tracked exactly alongside the buckets.
+"""
+import math
+from bisect import bisect_right
+
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+# Values at or below this (ms) are counted in the zero bucket
+MIN_VALUE = 0.001
+# Upper bound on buckets; the lowest are folded together past it
+MAX_BINS = 2048
+
+
+class LatencySketch:
+    """Log-bucketed quantile sketch of latencies in milliseconds."""
+
+    __slots__ = ('bins', 'zero_count', 'count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def from_values(cls, values):
+        """Build a sketch from an iterable of latencies."""
+        sketch = cls()
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    @staticmethod
+    def _index(value):
+        return math.ceil(math.log(value) / _LOG_GAMMA)
+
+    @staticmethod
+    def _value(index):
+        # Midpoint (in relative terms) of (GAMMA ** (i - 1), GAMMA ** i]
+        return 2 * GAMMA ** index / (GAMMA + 1)
+
+    def add(self, value, count=1):
+        """Count ``value`` (ms) ``count`` times."""
+        if value > MIN_VALUE:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0) + count
+            if len(self.bins) > MAX_BINS:
+                self._collapse()
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add the counts of ``other`` into this sketch."""
+        if not other.count:
+            return
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > MAX_BINS:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def _collapse(self):
+        """Fold the lowest buckets so at most MAX_BINS remain."""
+        indexes = sorted(self.bins)
+        keep = indexes[-MAX_BINS]
+        for index in indexes[:-MAX_BINS]:
+            self.bins[keep] += self.bins.pop(index)
+
+    def quantiles(self, qs):
+        """
+        Estimate several quantiles with one walk over the buckets.
+
+        Like statistics.quantiles(method='inclusive'), a quantile
+        between two ranks is interpolated linearly between them.
+
+        Args:
+            qs: Quantiles in [0, 1]
+
+        Returns:
+            list: Latency estimates in milliseconds (0.0 when empty)
+        """
+        if not self.count:
+            return [0.0] * len(qs)
+
+        values = []
+        cumulative = []
+        seen = 0
+        if self.zero_count:
+            seen = self.zero_count
+            values.append(0.0)
+            cumulative.append(seen)
+        for index, count in sorted(self.bins.items()):
+            seen += count
+            values.append(self._value(index))
+            cumulative.append(seen)
+
+        def value_at(rank):
+            return values[bisect_right(cumulative, rank)]
+
+        results = []
+        for q in qs:
+            rank = q * (self.count - 1)
+            lower = math.floor(rank)
+            value = value_at(lower)
+            if rank > lower:
+                value += (value_at(lower + 1) - value) * (rank - lower)
+            # Estimates never leave the observed range
+            results.append(min(max(value, self.min), self.max))
+        return results
+
+    def quantile(self, q):
+        """Estimate one quantile (see quantiles)."""
+        return self.quantiles([q])[0]
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def summary(self):
+        """
+        Summarize the sketch.
+
+        Returns:
+            dict: count, p50, p90, p95, p99, min, max and mean (all 0.0
+                when empty)
+        """
+        p50, p90, p95, p99 = self.quantiles([0.50, 0.90, 0.95, 0.99])
+        return {
+            'count': self.count,
+            'p50': p50,
+            'p90': p90,
+            'p95': p95,
+            'p99': p99,
+            'min': self.min if self.count else 0.0,
+            'max': self.max if self.count else 0.0,
+            'mean': self.mean
+        }
+
+    def to_dict(self):
+        """
+        Serialize compactly for a JSONField.
+
+        Buckets are stored as one list of counts starting at index
+        ``o``, so a typical minute of one endpoint is a few dozen ints.
+        """
+        if not self.count:
+            return {}
+        data = {
+            'z': self.zero_count,
+            's': self.sum,
+            'lo': self.min,
+            'hi': self.max,
+        }
+        if self.bins:
+            offset = min(self.bins)
+            data['o'] = offset
+            data['c'] = [
+                self.bins.get(index, 0)
+                for index in range(offset, max(self.bins) + 1)
+            ]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Load a sketch saved with to_dict ({} or None is empty)."""
+        sketch = cls()
+        if not data:
+            return sketch
+        offset = data.get('o', 0)
+        sketch.bins = {
+            offset + position: count
+            for position, count in enumerate(data.get('c', []))
+            if count
+        }
+        sketch.zero_count = data.get('z', 0)
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        sketch.sum = data.get('s', 0.0)
+        sketch.min = data.get('lo')
+        sketch.max = data.get('hi')
+        return sketch
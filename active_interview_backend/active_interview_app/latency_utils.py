@@ -4,6 +4,7 @@ Supports the latency budget feature (Issues #20, #54).
 """
 import time
 import logging
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from .observability_models import InterviewResponseLatency, ErrorLog
 
@@ -27,7 +28,8 @@ def track_interview_response_latency(
     chat,
     response_time_ms,
     ai_processing_time_ms=None,
-    question_number=None
+    question_number=None,
+    time_to_first_token_ms=None
 ):
     """
     Track and log interview response latency.
@@ -36,7 +38,10 @@ def track_interview_response_latency(
         chat: Chat instance for the interview session
         response_time_ms: Total response time in milliseconds
         ai_processing_time_ms: OpenAI API call duration (optional)
-        question_number: Question sequence number (optional, auto-calculated if None)
+        question_number: Question sequence number (optional, defaults to the
+            chat's candidate turn count)
+        time_to_first_token_ms: Time until the first streamed token (optional,
+            streaming responses only)
 
     Returns:
         InterviewResponseLatency: Created latency record
@@ -45,8 +50,8 @@ def track_interview_response_latency(
 
     # Calculate question number if not provided
     if question_number is None:
-        # Count existing latency records for this chat + 1
-        question_number = InterviewResponseLatency.objects.filter(chat=chat).count() + 1
+        # The reply follows the candidate's latest answer
+        question_number = chat.user_turn_count
 
     # Determine if threshold was exceeded
     exceeded_threshold = response_time_ms > threshold_ms
@@ -57,6 +62,7 @@ def track_interview_response_latency(
         user=chat.owner,
         response_time_ms=response_time_ms,
         ai_processing_time_ms=ai_processing_time_ms,
+        time_to_first_token_ms=time_to_first_token_ms,
         question_number=question_number,
         interview_type=chat.interview_type,
         exceeded_threshold=exceeded_threshold,
@@ -104,6 +110,7 @@ def trigger_latency_alert(latency_record):
                 'question_number': latency_record.question_number,
                 'response_time_ms': latency_record.response_time_ms,
                 'ai_processing_time_ms': latency_record.ai_processing_time_ms,
+                'time_to_first_token_ms': latency_record.time_to_first_token_ms,
                 'threshold_ms': latency_record.threshold_ms,
                 'interview_type': latency_record.interview_type
             }
@@ -123,6 +130,13 @@ class LatencyTracker:
                 response = openai_client.chat.completions.create(...)
 
         # Latency is automatically recorded when exiting context
+
+    Async views use ``async with LatencyTracker(chat)``; the record is then
+    saved from a worker thread.
+
+    For streamed responses, call tracker.mark_first_token() when the first
+    delta is sent to the client so time-to-first-token is recorded
+    alongside the total response time.
     """
 
     def __init__(self, chat, question_number=None):
@@ -139,6 +153,7 @@ class LatencyTracker:
         self.ai_start_time = None
         self.ai_processing_time_ms = None
         self.response_time_ms = None
+        self.time_to_first_token_ms = None
         self.latency_record = None
 
     def __enter__(self):
@@ -164,7 +179,8 @@ class LatencyTracker:
                     chat=self.chat,
                     response_time_ms=self.response_time_ms,
                     ai_processing_time_ms=self.ai_processing_time_ms,
-                    question_number=self.question_number
+                    question_number=self.question_number,
+                    time_to_first_token_ms=self.time_to_first_token_ms
                 )
             else:
                 logger.debug(
@@ -175,6 +191,26 @@ class LatencyTracker:
         # Don't suppress exceptions
         return False
 
+    async def __aenter__(self):
+        """Start tracking total response time (async views)."""
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Stop tracking and record latency without blocking the event loop."""
+        return await sync_to_async(self.__exit__)(exc_type, exc_val, exc_tb)
+
+    def mark_first_token(self):
+        """
+        Record time-to-first-token for a streamed response.
+
+        Only the first call has an effect, so it is safe to call for
+        every delta.
+        """
+        if self.start_time is not None and self.time_to_first_token_ms is None:
+            self.time_to_first_token_ms = (
+                (time.perf_counter() - self.start_time) * 1000
+            )
+
     def track_ai_processing(self):
         """
         Context manager for tracking AI processing time specifically.
@@ -2,6 +2,9 @@
 Management command to aggregate daily metrics from raw request data.
 Creates DailyMetricsSummary and ProviderCostDaily records.
 
+Days with request rollups (RequestMetricRollup) are summarized from the
+rollups, so days whose raw rows were cleaned up can still be rebuilt.
+
 Related to Issues #14, #15 (Observability Dashboard).
 
 Usage:
@@ -15,8 +18,10 @@ from django.db.models import Avg, Max, Sum
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from active_interview_app.latency_sketch import LatencySketch
 from active_interview_app.observability_models import (
     RequestMetric,
+    RequestMetricRollup,
     DailyMetricsSummary,
     ProviderCostDaily
 )
@@ -80,6 +85,11 @@ class Command(BaseCommand):
         """
         self.stdout.write(f"\nProcessing request metrics for {date}...")
 
+        rollups = RequestMetricRollup.objects.filter(minute__date=date)
+        if rollups.exists():
+            self.aggregate_request_rollups(date, rollups)
+            return
+
         # Get all requests for this date using date filtering
         # This works correctly with both timezone-aware and naive datetimes
         requests = RequestMetric.objects.filter(
@@ -107,14 +117,12 @@ class Command(BaseCommand):
             max=Max('response_time_ms')
         )
 
-        # Calculate percentiles (p50, p95)
-        response_times = sorted(
-            requests.values_list('response_time_ms', flat=True)
-        )
-        p50_index = int(len(response_times) * 0.50)
-        p95_index = int(len(response_times) * 0.95)
-        p50 = response_times[p50_index] if response_times else 0.0
-        p95 = response_times[p95_index] if response_times else 0.0
+        # Calculate percentiles (p50, p95) from a sketch, without
+        # holding the day's response times in memory
+        response_times = requests.order_by().values_list(
+            'response_time_ms', flat=True)
+        p50, p95 = LatencySketch.from_values(
+            response_times.iterator()).quantiles([0.50, 0.95])
 
         # Calculate per-endpoint statistics
         endpoint_stats = {}
@@ -135,28 +143,77 @@ class Command(BaseCommand):
                 'avg_latency': float(endpoint_latency['avg'] or 0.0)
             }
 
-        # Create or update DailyMetricsSummary
+        self.save_summary(date, {
+            'total_requests': total_requests,
+            'total_errors': errors.count(),
+            'client_errors': client_errors.count(),
+            'server_errors': server_errors.count(),
+            'avg_response_time': float(latency_stats['avg'] or 0.0),
+            'p50_response_time': float(p50),
+            'p95_response_time': float(p95),
+            'max_response_time': float(latency_stats['max'] or 0.0),
+            'endpoint_stats': endpoint_stats
+        })
+
+    def aggregate_request_rollups(self, date, rollups):
+        """
+        Aggregate request metrics for a date from its rollups.
+
+        Percentiles come from the merged latency sketches.
+
+        Args:
+            date: Date object to aggregate
+            rollups: RequestMetricRollup queryset for the date
+        """
+        day = RequestMetricRollup()
+        endpoints = {}
+        for rollup in rollups.iterator():
+            day.merge(rollup)
+            endpoints.setdefault(
+                rollup.endpoint, RequestMetricRollup()).merge(rollup)
+
+        endpoint_stats = {
+            endpoint: {
+                'requests': merged.count,
+                'errors': merged.errors,
+                'avg_latency': merged.mean_ms
+            }
+            for endpoint, merged in endpoints.items()
+        }
+
+        self.save_summary(date, {
+            'total_requests': day.count,
+            'total_errors': day.errors,
+            'client_errors': day.error_4xx,
+            'server_errors': day.error_5xx,
+            'avg_response_time': day.mean_ms,
+            'p50_response_time': day.sketch.quantile(0.50),
+            'p95_response_time': day.sketch.quantile(0.95),
+            'max_response_time': day.max_ms,
+            'endpoint_stats': endpoint_stats
+        })
+
+    def save_summary(self, date, defaults):
+        """
+        Create or update the DailyMetricsSummary for a date.
+
+        Args:
+            date: Date object the summary covers
+            defaults: DailyMetricsSummary field values
+        """
         summary, created = DailyMetricsSummary.objects.update_or_create(
             date=date,
-            defaults={
-                'total_requests': total_requests,
-                'total_errors': errors.count(),
-                'client_errors': client_errors.count(),
-                'server_errors': server_errors.count(),
-                'avg_response_time': float(latency_stats['avg'] or 0.0),
-                'p50_response_time': float(p50),
-                'p95_response_time': float(p95),
-                'max_response_time': float(latency_stats['max'] or 0.0),
-                'endpoint_stats': endpoint_stats
-            }
+            defaults=defaults
         )
 
         action = "Created" if created else "Updated"
         self.stdout.write(
             self.style.SUCCESS(
                 f"  ✓ {action} DailyMetricsSummary: "
-                f"{total_requests:,} requests, {errors.count()} errors, "
-                f"p50={p50:.2f}ms, p95={p95:.2f}ms"
+                f"{summary.total_requests:,} requests, "
+                f"{summary.total_errors} errors, "
+                f"p50={summary.p50_response_time:.2f}ms, "
+                f"p95={summary.p95_response_time:.2f}ms"
             )
         )
 
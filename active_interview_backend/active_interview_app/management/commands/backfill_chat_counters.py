@@ -0,0 +1,87 @@
+"""
+Management command to recalculate the transcript counters on Chat.
+
+The counters (user_turn_count, assistant_turn_count, prompt_token_count,
+last_question_index) are maintained on every ChatMessage write made
+through Chat.save(). Run this once after migrating existing chats, or
+after editing ChatMessage rows directly (e.g. in the admin).
+
+Usage:
+    python manage.py backfill_chat_counters
+    python manage.py backfill_chat_counters --batch-size 1000
+    python manage.py backfill_chat_counters --dry-run
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max, Q, Sum
+
+from active_interview_app.models import Chat, ChatMessage
+
+
+class Command(BaseCommand):
+    help = 'Recalculate the transcript counters on Chat from ChatMessage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Chats updated per query (default: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many chats would change without saving'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        dry_run = options['dry_run']
+
+        chat_ids = list(
+            Chat.objects.order_by('id').values_list('id', flat=True))
+        updated = 0
+        for start in range(0, len(chat_ids), batch_size):
+            batch = chat_ids[start:start + batch_size]
+            updated += self._backfill(batch, dry_run)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'DRY RUN: ' if dry_run else ''}"
+            f"{updated} of {len(chat_ids)} chat(s) "
+            f"{'would be ' if dry_run else ''}updated"
+        ))
+
+    def _backfill(self, chat_ids, dry_run):
+        """Recalculate the counters for one batch of chats."""
+        stats = {
+            row['chat']: row
+            for row in ChatMessage.objects.filter(chat_id__in=chat_ids)
+            .values('chat')
+            .annotate(
+                user=Count('id', filter=Q(role='user')),
+                assistant=Count('id', filter=Q(role='assistant')),
+                tokens=Sum('token_count'),
+                last_question=Max('seq', filter=Q(role='assistant'))
+            )
+        }
+
+        changed = []
+        chats = Chat.objects.filter(id__in=chat_ids).only(
+            'id', *Chat.TURN_COUNTER_FIELDS)
+        for chat in chats:
+            row = stats.get(chat.id, {})
+            counters = (
+                row.get('user', 0),
+                row.get('assistant', 0),
+                row.get('tokens') or 0,
+                row.get('last_question'),
+            )
+            current = tuple(
+                getattr(chat, field) for field in Chat.TURN_COUNTER_FIELDS)
+            if counters != current:
+                for field, value in zip(Chat.TURN_COUNTER_FIELDS, counters):
+                    setattr(chat, field, value)
+                changed.append(chat)
+
+        if changed and not dry_run:
+            Chat.objects.bulk_update(changed, Chat.TURN_COUNTER_FIELDS)
+        return len(changed)
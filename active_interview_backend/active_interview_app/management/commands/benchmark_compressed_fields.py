@@ -0,0 +1,115 @@
+"""
+Management command to benchmark the compressed model fields.
+
+For a sample of existing rows of each compressed field (see fields.py),
+reports the plain vs stored size and the per-value cost of writing
+(encode + compress), reading (decompress + decode) and re-reading
+through the decompression cache, against the plain text / JSON encoding
+the field replaced.
+
+Usage:
+    python manage.py benchmark_compressed_fields
+    python manage.py benchmark_compressed_fields --sample 1000
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from active_interview_app.fields import (
+    CompressedJSONField,
+    clear_decompress_cache,
+    compress_text,
+    decompress_text,
+)
+from active_interview_app.models import (
+    AuditLog,
+    ChatMessage,
+    ExportableReport,
+    UploadedJobListing,
+    UploadedResume,
+)
+
+BENCHMARKED_FIELDS = [
+    (UploadedResume, 'content'),
+    (UploadedJobListing, 'content'),
+    (ChatMessage, 'content'),
+    (ExportableReport, 'question_responses'),
+    (AuditLog, 'extra_data'),
+]
+
+
+def _timed(func, values):
+    """Run func over values; return (results, microseconds per value)."""
+    start = time.perf_counter()
+    results = [func(value) for value in values]
+    elapsed = time.perf_counter() - start
+    return results, elapsed * 1e6 / max(len(values), 1)
+
+
+class Command(BaseCommand):
+    help = 'Compare storage and read/write cost of the compressed fields'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=500,
+            help='Most recent rows measured per field (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        sample = max(1, options['sample'])
+
+        self.stdout.write(
+            f"{'Field':<36}{'Rows':>6}{'Plain KB':>11}{'Stored KB':>11}"
+            f"{'Ratio':>7}{'Write us':>10}{'Read us':>9}{'Cached us':>11}"
+            f"{'Plain r/w us':>14}"
+        )
+        for model, name in BENCHMARKED_FIELDS:
+            label = f'{model.__name__}.{name}'
+            values = list(
+                model.objects.order_by('-pk')
+                .values_list(name, flat=True)[:sample]
+            )
+            if not values:
+                self.stdout.write(f'{label:<36}{0:>6}  (no rows)')
+                continue
+            self._report(label, model._meta.get_field(name), values)
+
+    def _report(self, label, field, values):
+        """Benchmark one field's sampled values and print a row."""
+        if isinstance(field, CompressedJSONField):
+            texts = [json.dumps(value) for value in values]
+
+            def plain_read(text):
+                return json.loads(text)
+
+            def read(data):
+                return json.loads(decompress_text(data))
+        else:
+            texts = values
+
+            def plain_read(text):
+                return text
+
+            read = decompress_text
+
+        encoded = [text.encode('utf-8') for text in texts]
+        stored, write_us = _timed(compress_text, texts)
+        clear_decompress_cache()
+        _, read_us = _timed(read, stored)
+        _, cached_us = _timed(read, stored)
+        _, plain_write_us = _timed(lambda text: text.encode('utf-8'), texts)
+        _, plain_read_us = _timed(
+            lambda data: plain_read(data.decode('utf-8')), encoded)
+
+        plain_bytes = sum(len(data) for data in encoded)
+        stored_bytes = sum(len(data) for data in stored)
+        self.stdout.write(
+            f'{label:<36}{len(values):>6}'
+            f'{plain_bytes / 1024:>11.1f}{stored_bytes / 1024:>11.1f}'
+            f'{stored_bytes / max(plain_bytes, 1):>7.2f}'
+            f'{write_us:>10.1f}{read_us:>9.1f}{cached_us:>11.1f}'
+            f'{plain_write_us + plain_read_us:>14.1f}'
+        )
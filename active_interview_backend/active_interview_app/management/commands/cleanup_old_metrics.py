@@ -1,6 +1,7 @@
 """
 Management command to clean up old metrics data.
 Retains data for the configured retention period (default: 30 days).
+Request rollups are kept longer (default: 365 days) for trends.
 
 Related to Issues #14, #15 (Observability Dashboard).
 
@@ -8,12 +9,15 @@ Usage:
     python manage.py cleanup_old_metrics
     python manage.py cleanup_old_metrics --days 60
     python manage.py cleanup_old_metrics --dry-run
+    python manage.py cleanup_old_metrics --days 7 --rollup-days 365
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
+from active_interview_app.metric_rollups import ROLLUP_RETENTION_DAYS
 from active_interview_app.observability_models import (
     RequestMetric,
+    RequestMetricRollup,
     DailyMetricsSummary,
     ProviderCostDaily,
     ErrorLog
@@ -30,6 +34,15 @@ class Command(BaseCommand):
             default=30,
             help='Number of days to retain (default: 30)'
         )
+        parser.add_argument(
+            '--rollup-days',
+            type=int,
+            default=ROLLUP_RETENTION_DAYS,
+            help=(
+                'Number of days of request rollups to retain '
+                f'(default: {ROLLUP_RETENTION_DAYS})'
+            )
+        )
         parser.add_argument(
             '--dry-run',
             action='store_true',
@@ -71,6 +84,24 @@ class Command(BaseCommand):
             )
             total_deleted += deleted[0]
 
+        # Clean up RequestMetricRollup records (longer retention)
+        rollup_cutoff = timezone.now() - timedelta(days=options['rollup_days'])
+        rollups = RequestMetricRollup.objects.filter(
+            minute__lt=rollup_cutoff
+        )
+        rollup_count = rollups.count()
+        self.stdout.write(
+            f"  RequestMetricRollup: {rollup_count:,} records to delete"
+        )
+        if not dry_run and rollup_count > 0:
+            deleted = rollups.delete()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"    ✓ Deleted {deleted[0]:,} RequestMetricRollup records"
+                )
+            )
+            total_deleted += deleted[0]
+
         # Clean up ErrorLog records
         error_logs = ErrorLog.objects.filter(
             timestamp__lt=cutoff_date
@@ -125,7 +156,10 @@ class Command(BaseCommand):
         # Summary
         self.stdout.write("\n" + "=" * 60)
         if dry_run:
-            total_to_delete = request_count + error_count + daily_count + cost_count
+            total_to_delete = (
+                request_count + rollup_count + error_count +
+                daily_count + cost_count
+            )
             self.stdout.write(
                 self.style.WARNING(
                     f"DRY RUN: Would delete {total_to_delete:,} total records"
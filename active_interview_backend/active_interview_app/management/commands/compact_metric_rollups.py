@@ -0,0 +1,33 @@
+"""
+Management command to compact request metric rollups.
+
+Folds minute rollups older than 8 days into hourly rows, and hourly
+rows older than 32 days into daily rows (see metric_rollups.py). Only
+whole periods are folded, so it is safe to run repeatedly; run it
+hourly (e.g. via cron).
+
+Related to Issues #14, #15 (Observability Dashboard).
+
+Usage:
+    python manage.py compact_metric_rollups
+"""
+from django.core.management.base import BaseCommand
+
+from active_interview_app.metric_rollups import compact_rollups
+
+
+class Command(BaseCommand):
+    help = 'Compact minute request rollups into hourly and daily rows'
+
+    def handle(self, *args, **options):
+        folded = compact_rollups()
+
+        for resolution, count in folded.items():
+            self.stdout.write(
+                f"  Folded {count:,} rows into {resolution} rollups"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✓ Compacted {sum(folded.values()):,} rollup rows\n"
+            )
+        )
@@ -25,6 +25,9 @@ Usage:
 
     # Dry run (don't actually rotate)
     python manage.py rotate_api_keys --dry-run --tier premium
+
+Usage counts are written by web workers every API_KEY_USAGE_FLUSH_INTERVAL
+seconds (see api_key_usage), so the counts shown here lag by at most that.
 """
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
@@ -33,6 +36,7 @@ from active_interview_app.api_key_rotation_models import (
     KeyRotationSchedule,
     KeyRotationLog
 )
+from active_interview_app.api_key_usage import flush_key_usage
 
 
 class Command(BaseCommand):
@@ -75,6 +79,9 @@ class Command(BaseCommand):
         force = options.get('force', False)
         dry_run = options.get('dry-run', False)
 
+        # Write this process's buffered usage counts before reading them
+        flush_key_usage()
+
         # Determine which tiers to rotate
         if rotate_all:
             tiers_to_rotate = ['premium', 'standard', 'fallback']
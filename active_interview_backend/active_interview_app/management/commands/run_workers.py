@@ -0,0 +1,139 @@
+"""
+Management command to run background jobs from the database job queue.
+
+Claims runnable jobs (see job_queue) and runs them in a thread pool. The
+queued work is mostly waiting on OpenAI and the database, so threads keep
+several jobs in flight without a process per job. Start one worker per
+host; several workers can share the same database safely.
+
+Usage:
+    # Run until stopped (SIGTERM/SIGINT finish in-flight jobs first)
+    python manage.py run_workers
+
+    # Four jobs at a time, polling every 2 seconds when idle
+    python manage.py run_workers --threads 4 --poll-interval 2
+
+    # Drain the queue and exit (cron or one-off use)
+    python manage.py run_workers --once
+"""
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from active_interview_app.job_queue import (
+    DEFAULT_LEASE_SECONDS,
+    claim_jobs,
+    run_job
+)
+
+
+def _run_in_thread(job):
+    """Pool target: run one job, then release this thread's connection."""
+    try:
+        return run_job(job)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = 'Run background jobs from the database job queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='Jobs to run at the same time (default: 4)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when no job is runnable (default: 1)'
+        )
+        parser.add_argument(
+            '--lease',
+            type=int,
+            default=DEFAULT_LEASE_SECONDS,
+            help='Seconds before an unfinished job can be reclaimed '
+                 f'(default: {DEFAULT_LEASE_SECONDS})'
+        )
+        parser.add_argument(
+            '--worker-id',
+            type=str,
+            default='',
+            help='Name recorded on claimed jobs (default: host:pid)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when no job is runnable'
+        )
+
+    def handle(self, *args, **options):
+        threads = max(1, options['threads'])
+        poll_interval = options['poll_interval']
+        lease = options['lease']
+        once = options['once']
+        worker_id = (options['worker_id']
+                     or f"{socket.gethostname()}:{os.getpid()}")
+
+        self._stopping = False
+        previous_handlers = self._install_signal_handlers()
+
+        self.stdout.write(f"Worker {worker_id} started with {threads} threads")
+        processed = 0
+        in_flight = set()
+        try:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                while not self._stopping:
+                    in_flight = {f for f in in_flight if not f.done()}
+                    free = threads - len(in_flight)
+
+                    jobs = []
+                    if free > 0:
+                        jobs = claim_jobs(worker_id, limit=free,
+                                          lease_seconds=lease)
+                    for job in jobs:
+                        in_flight.add(pool.submit(_run_in_thread, job))
+                    processed += len(jobs)
+
+                    if jobs:
+                        continue
+                    if in_flight:
+                        wait(in_flight, timeout=poll_interval,
+                             return_when=FIRST_COMPLETED)
+                    elif once:
+                        break
+                    else:
+                        time.sleep(poll_interval)
+        finally:
+            self._restore_signal_handlers(previous_handlers)
+            close_old_connections()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Worker {worker_id} stopped after {processed} job(s)"
+        ))
+
+    def _install_signal_handlers(self):
+        """Finish in-flight jobs on SIGTERM/SIGINT instead of dying."""
+        def stop(signum, frame):
+            self._stopping = True
+
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                previous[signum] = signal.signal(signum, stop)
+            except ValueError:
+                # Not the main thread (e.g. called from a test runner thread)
+                pass
+        return previous
+
+    def _restore_signal_handlers(self, previous):
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
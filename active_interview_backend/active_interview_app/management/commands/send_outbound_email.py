@@ -0,0 +1,76 @@
+"""
+Management command to send queued email from the outbox.
+
+Related to Issues #8, #139 (Email notifications).
+
+Drains OutboundEmail rows in batches, one SMTP connection per batch (see
+email_outbox). Failed sends are retried with exponential backoff.
+
+Usage:
+    # Run until stopped
+    python manage.py send_outbound_email
+
+    # Larger batches, polling every 10 seconds when idle
+    python manage.py send_outbound_email --batch-size 100 --poll-interval 10
+
+    # Send everything that is due and exit (cron or one-off use)
+    python manage.py send_outbound_email --once
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from active_interview_app.email_outbox import (
+    DEFAULT_BATCH_SIZE,
+    send_pending_emails
+)
+
+
+class Command(BaseCommand):
+    help = 'Send queued email from the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Emails sent per connection (default: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait when nothing is due (default: 5)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when nothing is due'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        poll_interval = options['poll_interval']
+        once = options['once']
+
+        total_sent = total_failed = 0
+        try:
+            while True:
+                sent, failed = send_pending_emails(batch_size=batch_size)
+                total_sent += sent
+                total_failed += failed
+
+                if sent + failed >= batch_size:
+                    # Full batch; more may be waiting
+                    continue
+                if once:
+                    break
+                close_old_connections()
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {total_sent} email(s), {total_failed} failed"
+        ))
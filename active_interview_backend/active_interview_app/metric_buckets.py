@@ -0,0 +1,246 @@
+"""
+Time-bucketed aggregation for the observability metric APIs.
+
+The RPS, latency and error APIs used to loop over their time buckets and
+query each one (288 COUNT queries for the 24h RPS chart). A
+``BucketWindow`` now assigns every row its bucket index in SQL
+(``BucketIndex``), so a whole chart is one grouped query:
+
+- ``request_counts``: request and error counts per bucket (one query)
+- ``latency_buckets``: a LatencySketch of response times per bucket
+  (one query, counted into the sketches in a single pass)
+- ``iter_bucket_stats``: counts, errors and a LatencySketch per bucket,
+  streamed from one query ordered by time (CSV export)
+
+Buckets are counted from the window start, so they line up with the
+chart timestamps whatever the bucket size. SQLite and PostgreSQL are
+supported.
+"""
+import itertools
+import math
+from datetime import timedelta
+
+from django.db import NotSupportedError
+from django.db.models import (
+    Count, DateTimeField, Func, IntegerField, Q, Value
+)
+from django.utils import timezone
+
+from .latency_sketch import LatencySketch
+
+# time_range -> (window length, bucket size in minutes)
+TIME_RANGES = {
+    '1h': (timedelta(hours=1), 1),
+    '24h': (timedelta(hours=24), 5),
+    '7d': (timedelta(days=7), 60),
+    '30d': (timedelta(days=30), 360),
+}
+DEFAULT_TIME_RANGE = '24h'
+
+# CSV export: the finest bucket size (minutes) that keeps the export
+# under MAX_EXPORT_BUCKETS rows; whole hours past 5 minutes, matching
+# the hourly rollup rows (metric_rollups.py)
+EXPORT_BUCKET_MINUTES = (5, 60, 360, 1440)
+MAX_EXPORT_BUCKETS = 2016  # one week of 5-minute buckets
+EXPORT_CHUNK_SIZE = 2000
+
+
+class BucketIndex(Func):
+    """
+    Index of the fixed-size bucket a timestamp falls in, counted from
+    ``start`` (0 for the first bucket).
+    """
+    output_field = IntegerField()
+
+    def __init__(self, expression, start, bucket_seconds, **extra):
+        self.bucket_seconds = int(bucket_seconds)
+        super().__init__(
+            expression, Value(start, output_field=DateTimeField()), **extra)
+
+    def _compile_sources(self, compiler):
+        timestamp_sql, timestamp_params = compiler.compile(
+            self.source_expressions[0])
+        start_sql, start_params = compiler.compile(self.source_expressions[1])
+        return timestamp_sql, start_sql, [*timestamp_params, *start_params]
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        timestamp_sql, start_sql, params = self._compile_sources(compiler)
+        # julianday() differences carry float error, so round to whole
+        # milliseconds first; a row exactly on a boundary then divides
+        # evenly. Rows are never before start, so integer division floors
+        return (
+            f"CAST(ROUND((julianday({timestamp_sql}) - julianday({start_sql}))"
+            f" * 86400000.0) AS INTEGER) / {self.bucket_seconds * 1000}",
+            params
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        timestamp_sql, start_sql, params = self._compile_sources(compiler)
+        return (
+            f"FLOOR(EXTRACT(EPOCH FROM ({timestamp_sql} - {start_sql}))"
+            f" / {self.bucket_seconds})::integer",
+            params
+        )
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            f"BucketIndex is not implemented for {connection.vendor}")
+
+
+class BucketWindow:
+    """A time window split into equal buckets starting at ``start``."""
+
+    def __init__(self, start, end, bucket_minutes):
+        self.start = start
+        self.end = end
+        self.bucket_minutes = bucket_minutes
+        self.bucket_size = timedelta(minutes=bucket_minutes)
+        self.count = max(math.ceil((end - start) / self.bucket_size), 0)
+
+    @classmethod
+    def for_time_range(cls, time_range, end_time=None):
+        """
+        Build the window for a dashboard time range.
+
+        Args:
+            time_range (str): '1h', '24h', '7d' or '30d' (anything else
+                is treated as '24h')
+            end_time: End of the window (default: now)
+
+        Returns:
+            BucketWindow
+        """
+        if end_time is None:
+            end_time = timezone.now()
+        length, bucket_minutes = TIME_RANGES.get(
+            time_range, TIME_RANGES[DEFAULT_TIME_RANGE])
+        return cls(end_time - length, end_time, bucket_minutes)
+
+    @classmethod
+    def for_export(cls, time_range, end_time=None):
+        """
+        Build the CSV export window for a dashboard time range.
+
+        Exports use 5-minute buckets, widened for long ranges so the
+        file stays under MAX_EXPORT_BUCKETS rows (30d -> 1 hour).
+
+        Args:
+            time_range (str): '1h', '24h', '7d' or '30d'
+            end_time: End of the window (default: now)
+
+        Returns:
+            BucketWindow
+        """
+        if end_time is None:
+            end_time = timezone.now()
+        length, _ = TIME_RANGES.get(time_range, TIME_RANGES[DEFAULT_TIME_RANGE])
+        for bucket_minutes in EXPORT_BUCKET_MINUTES:
+            if length / timedelta(minutes=bucket_minutes) <= MAX_EXPORT_BUCKETS:
+                break
+        return cls(end_time - length, end_time, bucket_minutes)
+
+    @property
+    def bucket_seconds(self):
+        return self.bucket_minutes * 60
+
+    def bucket_start(self, index):
+        """Start time of bucket ``index``."""
+        return self.start + self.bucket_size * index
+
+    def bucket_starts(self):
+        """Start time of every bucket, oldest first."""
+        return [self.bucket_start(index) for index in range(self.count)]
+
+    def annotate(self, queryset, field='timestamp'):
+        """
+        Restrict ``queryset`` to the window and annotate ``bucket``.
+
+        The last bucket may end after ``end``; it is kept whole, like
+        the first.
+        """
+        return queryset.filter(**{
+            f'{field}__gte': self.start,
+            f'{field}__lt': self.bucket_start(self.count),
+        }).annotate(
+            bucket=BucketIndex(field, self.start, self.bucket_seconds))
+
+
+def request_counts(window, queryset):
+    """
+    Count requests and errors (status >= 400) per bucket in one query.
+
+    Args:
+        window (BucketWindow): Buckets to count
+        queryset: RequestMetric queryset (already filtered by endpoint)
+
+    Returns:
+        list: (total, errors) per bucket, oldest first
+    """
+    counts = [(0, 0)] * window.count
+    rows = window.annotate(queryset).values('bucket').annotate(
+        total=Count('pk'),
+        errors=Count('pk', filter=Q(status_code__gte=400)),
+    ).order_by()
+    for row in rows:
+        if 0 <= row['bucket'] < window.count:
+            counts[row['bucket']] = (row['total'], row['errors'])
+    return counts
+
+
+def latency_buckets(window, queryset, field='response_time_ms'):
+    """
+    Sketch response times per bucket in one query.
+
+    Response times are counted into each bucket's LatencySketch as rows
+    stream in, so memory does not grow with the number of requests.
+
+    Args:
+        window (BucketWindow): Buckets to fill
+        queryset: RequestMetric queryset (already filtered by endpoint)
+        field (str): Latency column
+
+    Returns:
+        list: LatencySketch per bucket, oldest first
+    """
+    buckets = [LatencySketch() for _ in range(window.count)]
+    rows = window.annotate(queryset).order_by().values_list('bucket', field)
+    for bucket, value in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        if 0 <= bucket < window.count:
+            buckets[bucket].add(value)
+    return buckets
+
+
+def iter_bucket_stats(window, queryset, field='response_time_ms'):
+    """
+    Stream per-bucket request stats from one query.
+
+    Rows are read once, ordered by time, in chunks; response times are
+    counted into one LatencySketch per bucket.
+
+    Args:
+        window (BucketWindow): Buckets to fill
+        queryset: RequestMetric queryset (already filtered by endpoint)
+        field (str): Latency column
+
+    Yields:
+        tuple: (bucket start, total, errors, LatencySketch) for
+            every bucket, oldest first, empty buckets included
+    """
+    rows = window.annotate(queryset).order_by('timestamp').values_list(
+        'bucket', 'status_code', field)
+    groups = itertools.groupby(
+        rows.iterator(chunk_size=EXPORT_CHUNK_SIZE), key=lambda row: row[0])
+    group = next(groups, None)
+
+    for index in range(window.count):
+        total = errors = 0
+        sketch = LatencySketch()
+        while group is not None and group[0] <= index:
+            if group[0] == index:
+                for _, status_code, value in group[1]:
+                    total += 1
+                    if status_code >= 400:
+                        errors += 1
+                    sketch.add(value)
+            group = next(groups, None)
+        yield window.bucket_start(index), total, errors, sketch
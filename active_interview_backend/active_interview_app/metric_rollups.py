@@ -0,0 +1,226 @@
+"""
+Incrementally maintained RequestMetric rollups.
+
+Raw RequestMetric rows only need to live for days; RequestMetricRollup
+keeps per-minute request counts and latency sketches for a year:
+
+- ``record_samples``: merge a batch of requests into their minute rows
+  (called by MetricsMiddleware)
+- ``compact_rollups``: fold minute rows older than MINUTE_RETENTION into
+  hourly rows, and hourly rows older than HOUR_RETENTION into daily
+  rows (compact_metric_rollups command, run hourly)
+- ``rollup_request_counts`` / ``rollup_bucket_stats``: per-bucket counts
+  and latency summaries for a BucketWindow, read by the observability
+  APIs for ranges longer than RAW_METRICS_RANGE
+
+Compaction keeps minute rows for long enough to serve the 7 day charts
+at 5-minute resolution and hourly rows for the 30 day charts.
+"""
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .observability_models import RequestMetricRollup
+
+MINUTE_RETENTION = timedelta(days=8)
+HOUR_RETENTION = timedelta(days=32)
+ROLLUP_RETENTION_DAYS = 365
+
+# Longer dashboard ranges read rollups instead of raw rows
+RAW_METRICS_RANGE = timedelta(hours=1)
+
+_PERIODS = {
+    RequestMetricRollup.MINUTE: timedelta(minutes=1),
+    RequestMetricRollup.HOUR: timedelta(hours=1),
+    RequestMetricRollup.DAY: timedelta(days=1),
+}
+
+# (source resolution, target resolution, age before folding)
+_COMPACTIONS = (
+    (RequestMetricRollup.MINUTE, RequestMetricRollup.HOUR, MINUTE_RETENTION),
+    (RequestMetricRollup.HOUR, RequestMetricRollup.DAY, HOUR_RETENTION),
+)
+
+
+def truncate(timestamp, resolution):
+    """Start of the UTC minute, hour or day containing ``timestamp``."""
+    if timezone.is_aware(timestamp):
+        timestamp = timestamp.astimezone(dt_timezone.utc)
+    timestamp = timestamp.replace(second=0, microsecond=0)
+    if resolution in (RequestMetricRollup.HOUR, RequestMetricRollup.DAY):
+        timestamp = timestamp.replace(minute=0)
+    if resolution == RequestMetricRollup.DAY:
+        timestamp = timestamp.replace(hour=0)
+    return timestamp
+
+
+def uses_rollups(window):
+    """Return True if ``window`` should be read from rollups."""
+    return window.end - window.start > RAW_METRICS_RANGE
+
+
+def _merge_into_stored(rollup):
+    """Add ``rollup`` into its stored row; False if there is none."""
+    stored = RequestMetricRollup.objects.select_for_update().filter(
+        minute=rollup.minute,
+        resolution=rollup.resolution,
+        endpoint=rollup.endpoint,
+        method=rollup.method
+    ).first()
+    if stored is None:
+        return False
+    stored.merge(rollup)
+    stored.save()
+    return True
+
+
+def _save_rollup(rollup):
+    """Add an unsaved rollup into its stored row, creating it if needed."""
+    try:
+        with transaction.atomic():
+            if not _merge_into_stored(rollup):
+                rollup.save(force_insert=True)
+    except IntegrityError:
+        # Another worker created the row first
+        with transaction.atomic():
+            _merge_into_stored(rollup)
+
+
+def record_samples(samples):
+    """
+    Merge requests into their minute rollups.
+
+    Samples are grouped in memory first, so a batch costs one upsert
+    per (minute, endpoint, method) rather than one per request.
+
+    Args:
+        samples: Iterable of (timestamp, endpoint, method, status_code,
+            response_time_ms)
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    pending = {}
+    for timestamp, endpoint, method, status_code, response_time_ms in samples:
+        key = (truncate(timestamp, RequestMetricRollup.MINUTE),
+               endpoint[:255], method)
+        rollup = pending.get(key)
+        if rollup is None:
+            rollup = pending[key] = RequestMetricRollup(
+                minute=key[0], endpoint=key[1], method=key[2])
+        rollup.add(status_code, response_time_ms)
+
+    for rollup in pending.values():
+        _save_rollup(rollup)
+    return len(pending)
+
+
+def _compact(source, target, cutoff):
+    """Fold ``source`` rows before ``cutoff`` into ``target`` rows."""
+    rows = RequestMetricRollup.objects.filter(
+        resolution=source, minute__lt=cutoff)
+    folded = 0
+
+    # One target period at a time keeps memory bounded
+    while True:
+        oldest = rows.order_by('minute').values_list(
+            'minute', flat=True).first()
+        if oldest is None:
+            return folded
+
+        start = truncate(oldest, target)
+        period_rows = rows.filter(
+            minute__gte=start, minute__lt=start + _PERIODS[target])
+        pending = {}
+        for row in period_rows:
+            rollup = pending.get((row.endpoint, row.method))
+            if rollup is None:
+                rollup = pending[(row.endpoint, row.method)] = \
+                    RequestMetricRollup(
+                        minute=start, resolution=target,
+                        endpoint=row.endpoint, method=row.method)
+            rollup.merge(row)
+            folded += 1
+
+        with transaction.atomic():
+            period_rows.delete()
+            for rollup in pending.values():
+                _save_rollup(rollup)
+
+
+def compact_rollups(now=None):
+    """
+    Fold aged minute rows into hourly rows and aged hourly rows into
+    daily rows.
+
+    Only whole periods are folded, so running this repeatedly is safe.
+
+    Args:
+        now: Reference time (default: now)
+
+    Returns:
+        dict: Source rows folded, by target resolution
+    """
+    if now is None:
+        now = timezone.now()
+
+    folded = {}
+    for source, target, retention in _COMPACTIONS:
+        cutoff = truncate(now - retention, target)
+        folded[target] = _compact(source, target, cutoff)
+    return folded
+
+
+def rollup_request_counts(window, queryset):
+    """
+    Count requests and errors per bucket from rollups in one query.
+
+    Args:
+        window (BucketWindow): Buckets to count
+        queryset: RequestMetricRollup queryset (already filtered by
+            endpoint)
+
+    Returns:
+        list: (total, errors) per bucket, oldest first
+    """
+    counts = [(0, 0)] * window.count
+    rows = window.annotate(queryset, field='minute').values(
+        'bucket').annotate(
+        total=Sum('count'),
+        errors=Sum(F('error_4xx') + F('error_5xx')),
+    ).order_by()
+    for row in rows:
+        if 0 <= row['bucket'] < window.count:
+            counts[row['bucket']] = (row['total'], row['errors'])
+    return counts
+
+
+def rollup_bucket_stats(window, queryset):
+    """
+    Merge rollups per bucket in one query.
+
+    Args:
+        window (BucketWindow): Buckets to fill
+        queryset: RequestMetricRollup queryset (already filtered by
+            endpoint)
+
+    Returns:
+        list: (total, errors, LatencySketch.summary()) per bucket, oldest
+            first
+    """
+    merged = [RequestMetricRollup() for _ in range(window.count)]
+    rows = window.annotate(queryset, field='minute').order_by()
+    for row in rows.iterator():
+        if 0 <= row.bucket < window.count:
+            merged[row.bucket].merge(row)
+
+    return [
+        (
+            rollup.count,
+            rollup.errors,
+            rollup.sketch.summary()
+        )
+        for rollup in merged
+    ]
@@ -0,0 +1,222 @@
+"""
+Write-behind buffer for request metrics.
+
+Related to Issues #14, #15 (Observability Dashboard).
+
+MetricsMiddleware used to insert a RequestMetric row (and an ErrorLog
+row for 4xx/5xx) while the response waited. Requests now only append
+unsaved rows to a bounded per-process buffer; a background flusher
+thread drains it with ``bulk_create`` in batches and folds each batch
+into the minute rollups (metric_rollups.record_samples):
+
+- every ``METRICS_FLUSH_INTERVAL`` seconds, or as soon as a full batch
+  (``METRICS_FLUSH_BATCH_SIZE``) is waiting
+- when the process exits
+
+The buffer holds at most ``METRICS_BUFFER_SIZE`` requests; when the
+database cannot keep up the oldest samples are dropped and counted.
+Dashboards therefore lag by up to one flush interval. An interval of 0
+writes every request immediately (used by tests).
+"""
+import atexit
+import logging
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between flushes
+DEFAULT_FLUSH_INTERVAL = 2
+# Default maximum number of requests waiting to be written
+DEFAULT_BUFFER_SIZE = 10000
+# Default rows per bulk_create
+DEFAULT_BATCH_SIZE = 500
+
+_buffer = deque()
+_lock = threading.Lock()
+_wakeup = threading.Event()
+_flusher = None
+_counters = {
+    'recorded': 0,
+    'flushed': 0,
+    'dropped': 0,
+    'failed': 0,
+}
+
+
+def get_flush_interval():
+    """
+    Get the configured flush interval from settings.
+
+    Returns:
+        float: Seconds between flushes (0 disables buffering)
+    """
+    return getattr(settings, 'METRICS_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+
+
+def _buffer_size():
+    return getattr(settings, 'METRICS_BUFFER_SIZE', DEFAULT_BUFFER_SIZE)
+
+
+def _batch_size():
+    return getattr(settings, 'METRICS_FLUSH_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+
+
+def record_request(metric, error_log=None):
+    """
+    Queue a request's metrics for writing.
+
+    Args:
+        metric: Unsaved RequestMetric
+        error_log: Unsaved ErrorLog for failed requests, or None
+    """
+    if get_flush_interval() <= 0:
+        written = _write_batch([(metric, error_log)])
+        with _lock:
+            _counters['recorded'] += 1
+            _counters['flushed' if written else 'failed'] += 1
+        return
+
+    with _lock:
+        if len(_buffer) >= _buffer_size():
+            _buffer.popleft()
+            _counters['dropped'] += 1
+        _buffer.append((metric, error_log))
+        _counters['recorded'] += 1
+        full = len(_buffer) >= _batch_size()
+        _ensure_flusher()
+    if full:
+        _wakeup.set()
+
+
+def _ensure_flusher():
+    """Start the flusher thread if it is not running (call with _lock)."""
+    global _flusher
+
+    # Also covers a worker forked after the parent started its thread
+    if _flusher is None or not _flusher.is_alive():
+        _flusher = threading.Thread(
+            target=_flush_loop, name='metrics-flusher', daemon=True)
+        _flusher.start()
+
+
+def _flush_loop():
+    """Flusher thread: drain the buffer every flush interval."""
+    while True:
+        _wakeup.wait(get_flush_interval())
+        _wakeup.clear()
+        try:
+            flush_metrics()
+        except Exception as e:
+            logger.warning(
+                f"Failed to flush request metrics: {type(e).__name__}: {e}")
+        finally:
+            close_old_connections()
+
+
+def _write_batch(batch):
+    """
+    Write one batch of buffered requests.
+
+    Raw rows, error logs and rollups are written separately so a
+    failure in one does not lose the others.
+    """
+    from .metric_rollups import record_samples
+    from .observability_models import ErrorLog, RequestMetric
+
+    metrics = [metric for metric, _ in batch]
+    error_logs = [error_log for _, error_log in batch if error_log is not None]
+    written = True
+
+    try:
+        RequestMetric.objects.bulk_create(metrics)
+    except Exception as e:
+        written = False
+        logger.error(f"Failed to write RequestMetric batch: {e}")
+
+    if error_logs:
+        try:
+            ErrorLog.objects.bulk_create(error_logs)
+        except Exception as e:
+            logger.error(f"Failed to write ErrorLog batch: {e}")
+
+    try:
+        record_samples(
+            (metric.timestamp, metric.endpoint, metric.method,
+             metric.status_code, metric.response_time_ms)
+            for metric in metrics
+        )
+    except Exception as e:
+        logger.error(f"Failed to update RequestMetricRollup: {e}")
+
+    return written
+
+
+def flush_metrics():
+    """
+    Write every buffered request, ``METRICS_FLUSH_BATCH_SIZE`` at a time.
+
+    A batch that fails to write is counted as failed and not retried,
+    so a database outage cannot grow the buffer past its bound.
+
+    Returns:
+        int: Number of requests written
+    """
+    flushed = 0
+    while True:
+        with _lock:
+            batch = [_buffer.popleft()
+                     for _ in range(min(_batch_size(), len(_buffer)))]
+        if not batch:
+            return flushed
+
+        if _write_batch(batch):
+            flushed += len(batch)
+            key = 'flushed'
+        else:
+            key = 'failed'
+        with _lock:
+            _counters[key] += len(batch)
+
+
+def get_metrics_buffer_stats():
+    """
+    Get buffer counters for monitoring.
+
+    Counters are per worker process and reset on restart.
+
+    Returns:
+        dict: pending, capacity, recorded, flushed, dropped and failed
+    """
+    with _lock:
+        return {
+            'pending': len(_buffer),
+            'capacity': _buffer_size(),
+            **_counters,
+        }
+
+
+def reset_metrics_buffer():
+    """
+    Discard buffered requests and zero the counters.
+
+    Used by tests.
+    """
+    with _lock:
+        _buffer.clear()
+        for key in _counters:
+            _counters[key] = 0
+
+
+def _flush_at_exit():
+    """Write buffered requests when the worker shuts down."""
+    try:
+        flush_metrics()
+    except Exception as e:
+        logger.warning(f"Failed to flush request metrics at exit: {type(e).__name__}: {e}")
+
+
+atexit.register(_flush_at_exit)
@@ -7,13 +7,21 @@ Related to Issues #14, #15 (Observability Dashboard) and #66, #67, #68 (Audit Lo
 import time
 import traceback
 import logging
-import threading
+from asgiref.local import Local
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.db import connection
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for request context (audit logging)
-_thread_locals = threading.local()
+# Request context storage (audit logging). asgiref's Local behaves like
+# threading.local under WSGI and follows the request through
+# sync_to_async under ASGI.
+_thread_locals = Local()
 
 
 def get_current_request():
@@ -64,6 +72,23 @@ def get_user_agent():
     return request.META.get('HTTP_USER_AGENT', '')
 
 
+class _QueryCounter:
+    """``connection.execute_wrapper`` hook counting executed queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self):
+        connection.execute_wrappers.append(self)
+
+    def uninstall(self):
+        connection.execute_wrappers.remove(self)
+
+
 class MetricsMiddleware:
     """
     Middleware to collect request/response metrics for observability.
@@ -73,26 +98,42 @@ class MetricsMiddleware:
     - Response times (latency)
     - HTTP status codes
     - Error details
+    - Database queries per request, and the lookups the request object
+      cache (request_cache.py) answered without a query
 
     Performance considerations:
-    - Uses async database writes to minimize impact
+    - No database writes on the request path: rows are queued in a
+      bounded buffer and bulk-written by a background thread
+      (metrics_buffer.py)
     - Gracefully handles exceptions
     - Minimal overhead (< 5ms per request)
+    - Runs natively under ASGI, so async views are not pushed onto a
+      worker thread
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         # Record start time with high-resolution timer
         start_time = time.perf_counter()
 
         # Process request
         response = None
         exception_occurred = None
+        queries = _QueryCounter()
 
         try:
-            response = self.get_response(request)
+            with connection.execute_wrapper(queries):
+                response = self.get_response(request)
             return response
         except Exception as e:
             exception_occurred = e
@@ -103,30 +144,69 @@ class MetricsMiddleware:
             response_time_ms = (end_time - start_time) * 1000
 
             # Record metrics (non-blocking)
-            try:
-                self._record_metrics(
-                    request,
-                    response,
-                    response_time_ms,
-                    exception_occurred
-                )
-            except Exception as e:
-                # Never let metrics collection break the application
-                logger.error(
-                    f"Failed to record metrics: {e}",
-                    exc_info=True
-                )
+            self._safe_record_metrics(
+                request,
+                response,
+                response_time_ms,
+                exception_occurred,
+                queries.count
+            )
+
+    async def __acall__(self, request):
+        start_time = time.perf_counter()
+
+        response = None
+        exception_occurred = None
+        queries = _QueryCounter()
+
+        # Async views reach the database through sync_to_async, which runs
+        # on the request's thread-sensitive worker thread, so the counter
+        # goes on that thread's connection
+        await sync_to_async(queries.install)()
+        try:
+            response = await self.get_response(request)
+            return response
+        except Exception as e:
+            exception_occurred = e
+            raise
+        finally:
+            end_time = time.perf_counter()
+            response_time_ms = (end_time - start_time) * 1000
 
-    def _record_metrics(self, request, response, response_time_ms, exception):
+            await sync_to_async(queries.uninstall)()
+            # request.user may still need a session/user query
+            await sync_to_async(self._safe_record_metrics)(
+                request,
+                response,
+                response_time_ms,
+                exception_occurred,
+                queries.count
+            )
+
+    def _safe_record_metrics(self, *args):
+        """Record metrics, logging instead of raising on failure."""
+        try:
+            self._record_metrics(*args)
+        except Exception as e:
+            # Never let metrics collection break the application
+            logger.error(
+                f"Failed to record metrics: {e}",
+                exc_info=True
+            )
+
+    def _record_metrics(self, request, response, response_time_ms, exception,
+                        query_count=None):
         """
-        Record request metrics to database.
+        Queue request metrics for writing (see metrics_buffer).
 
         Args:
             request: Django request object
             response: Django response object (None if exception occurred)
             response_time_ms: Response time in milliseconds
             exception: Exception object if one occurred
+            query_count: Database queries run by the view
         """
+        from active_interview_app.metrics_buffer import record_request
         from active_interview_app.observability_models import RequestMetric
 
         # Determine status code
@@ -143,23 +223,26 @@ class MetricsMiddleware:
         # Get endpoint path (strip query string)
         endpoint = request.path
 
-        # Create RequestMetric record
-        try:
-            RequestMetric.objects.create(
-                timestamp=timezone.now(),
-                endpoint=endpoint,
-                method=request.method,
-                status_code=status_code,
-                response_time_ms=response_time_ms,
-                user_id=user_id
-            )
-        except Exception as e:
-            logger.error(f"Failed to create RequestMetric: {e}")
+        # Lookups served by the request object cache instead of a query
+        object_cache = getattr(request, 'object_cache', None)
+        queries_saved = object_cache.hits if object_cache else 0
+
+        metric = RequestMetric(
+            timestamp=timezone.now(),
+            endpoint=endpoint,
+            method=request.method,
+            status_code=status_code,
+            response_time_ms=response_time_ms,
+            user_id=user_id,
+            query_count=query_count,
+            queries_saved=queries_saved
+        )
 
         # If error occurred, log detailed error information
+        error_log = None
         if status_code >= 400 or exception:
             try:
-                self._record_error(
+                error_log = self._build_error_log(
                     request,
                     endpoint,
                     status_code,
@@ -167,11 +250,14 @@ class MetricsMiddleware:
                     user_id
                 )
             except Exception as e:
-                logger.error(f"Failed to create ErrorLog: {e}")
+                logger.error(f"Failed to build ErrorLog: {e}")
+
+        record_request(metric, error_log)
 
-    def _record_error(self, request, endpoint, status_code, exception, user_id):
+    def _build_error_log(self, request, endpoint, status_code, exception,
+                         user_id):
         """
-        Record detailed error information.
+        Build an unsaved ErrorLog with detailed error information.
 
         Args:
             request: Django request object
@@ -179,6 +265,9 @@ class MetricsMiddleware:
             status_code: HTTP status code
             exception: Exception object (None for HTTP errors without exceptions)
             user_id: Authenticated user ID
+
+        Returns:
+            ErrorLog: Unsaved error log entry
         """
         from active_interview_app.observability_models import ErrorLog
 
@@ -206,8 +295,7 @@ class MetricsMiddleware:
             request_data['has_post_data'] = bool(request.POST)
             # Don't include actual POST data as it may contain passwords, etc.
 
-        # Create ErrorLog record
-        ErrorLog.objects.create(
+        return ErrorLog(
             timestamp=timezone.now(),
             endpoint=endpoint,
             method=request.method,
@@ -263,10 +351,18 @@ class AuditLogMiddleware:
     Related to Issues #66, #67, #68 (Audit Logging).
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         # Store request in thread-local storage
         _thread_locals.request = request
 
@@ -279,3 +375,14 @@ class AuditLogMiddleware:
                 del _thread_locals.request
 
         return response
+
+    async def __acall__(self, request):
+        _thread_locals.request = request
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            if hasattr(_thread_locals, 'request'):
+                del _thread_locals.request
+
+        return response
@@ -8,6 +8,7 @@ for monitoring and analysis.
 
 import time
 import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import JsonResponse, HttpResponse
 from django.shortcuts import render
 from django_ratelimit.exceptions import Ratelimited
@@ -23,15 +24,27 @@ class RateLimitMiddleware:
 
     Catches Ratelimited exceptions, logs violations, and returns
     a properly formatted HTTP 429 response with Retry-After header.
+    Under ASGI, Django runs process_exception in a worker thread.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         response = self.get_response(request)
         return response
 
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return response
+
     def _log_violation(self, request, rate_limit_type='default', limit_value=60):
         """
         Log rate limit violation to database.
@@ -121,8 +134,8 @@ class RateLimitMiddleware:
             violators: List of violator identifiers
             window_minutes: Time window in minutes
         """
-        from django.core.mail import mail_admins
         from django.conf import settings
+        from ..email_outbox import queue_mail_admins
 
         try:
             subject = f"⚠️ Rate Limit Alert: {count} violations in {window_minutes} minutes"
@@ -143,13 +156,12 @@ Please review the rate limit violations in the admin dashboard:
 This is an automated alert from the rate limiting system.
             """
 
-            mail_admins(
+            queue_mail_admins(
                 subject=subject,
-                message=message,
-                fail_silently=True
+                message=message
             )
 
-            logger.info(f"Rate limit alert sent: {count} violations")
+            logger.info(f"Rate limit alert queued: {count} violations")
 
         except Exception as e:
             logger.error(f"Error sending rate limit alert: {e}")
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.19 on 2026-10-16 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0020_biastermlibrary_biasanalysisresult'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewresponselatency',
+            name='time_to_first_token_ms',
+            field=models.FloatField(blank=True, help_text='Time until the first streamed token was sent (streaming responses only)', null=True),
+        ),
+    ]
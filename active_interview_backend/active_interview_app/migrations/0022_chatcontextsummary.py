@@ -0,0 +1,24 @@
+# Generated by Django 4.2.19 on 2026-10-16 20:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0021_interviewresponselatency_time_to_first_token_ms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChatContextSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('summary', models.TextField(blank=True)),
+                ('summarized_through', models.IntegerField(default=1, help_text='Index into Chat.messages up to which (exclusive) messages are covered by the summary')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('chat', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='context_summary', to='active_interview_app.chat')),
+            ],
+        ),
+    ]
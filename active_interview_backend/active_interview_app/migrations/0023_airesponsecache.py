@@ -0,0 +1,29 @@
+# Generated by Django 4.2.19 on 2026-10-16 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0022_chatcontextsummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIResponseCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('endpoint', models.CharField(max_length=50)),
+                ('cache_key', models.CharField(max_length=64, unique=True)),
+                ('model_name', models.CharField(max_length=100)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('chat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='response_cache', to='active_interview_app.chat')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['chat', 'endpoint'], name='active_inte_chat_id_9f86a3_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.19 on 2026-10-16 22:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0023_airesponsecache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParseResultCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('resume', 'Resume'), ('job_listing', 'Job Listing')], max_length=20)),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('prompt_version', models.CharField(max_length=20)),
+                ('result', models.JSONField()),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_hit_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Parse Result Cache Entry',
+                'verbose_name_plural': 'Parse Result Cache',
+            },
+        ),
+    ]
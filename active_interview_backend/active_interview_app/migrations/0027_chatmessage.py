@@ -0,0 +1,71 @@
+# Generated by Django 4.2.19 on 2026-10-16 23:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def copy_messages_to_rows(apps, schema_editor):
+    """Split each Chat.messages JSON list into ChatMessage rows."""
+    Chat = apps.get_model('active_interview_app', 'Chat')
+    ChatMessage = apps.get_model('active_interview_app', 'ChatMessage')
+
+    for chat in Chat.objects.only('id', 'messages', 'modified_date').iterator():
+        rows = []
+        for seq, message in enumerate(chat.messages or []):
+            content = message.get('content') or ''
+            rows.append(ChatMessage(
+                chat_id=chat.id,
+                seq=seq,
+                role=message.get('role') or '',
+                content=content,
+                # Same estimate as context_utils.estimate_tokens
+                token_count=len(content) // 4 + 4,
+                created_at=chat.modified_date,
+            ))
+        ChatMessage.objects.bulk_create(rows, batch_size=500)
+
+
+def copy_rows_to_messages(apps, schema_editor):
+    """Rebuild the Chat.messages JSON lists from ChatMessage rows."""
+    Chat = apps.get_model('active_interview_app', 'Chat')
+    ChatMessage = apps.get_model('active_interview_app', 'ChatMessage')
+
+    for chat in Chat.objects.only('id').iterator():
+        chat.messages = [
+            {"role": role, "content": content}
+            for role, content in ChatMessage.objects.filter(
+                chat_id=chat.id).order_by('seq').values_list('role', 'content')
+        ]
+        chat.save(update_fields=['messages'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0026_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChatMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveIntegerField(help_text='Position of the message in the transcript')),
+                ('role', models.CharField(max_length=20)),
+                ('content', models.TextField(blank=True)),
+                ('token_count', models.PositiveIntegerField(default=0, help_text='Estimated prompt tokens (see context_utils)')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('chat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chat_messages', to='active_interview_app.chat')),
+            ],
+            options={
+                'ordering': ['chat', 'seq'],
+                'unique_together': {('chat', 'seq')},
+            },
+        ),
+        migrations.RunPython(copy_messages_to_rows, copy_rows_to_messages),
+        migrations.RemoveField(
+            model_name='chat',
+            name='messages',
+        ),
+    ]
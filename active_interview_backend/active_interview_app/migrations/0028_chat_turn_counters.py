@@ -0,0 +1,33 @@
+# Generated by Django 4.2.19 on 2026-10-17 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0027_chatmessage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chat',
+            name='assistant_turn_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of interviewer messages'),
+        ),
+        migrations.AddField(
+            model_name='chat',
+            name='last_question_index',
+            field=models.PositiveIntegerField(blank=True, help_text='Sequence number of the latest interviewer message', null=True),
+        ),
+        migrations.AddField(
+            model_name='chat',
+            name='prompt_token_count',
+            field=models.PositiveIntegerField(default=0, help_text='Estimated prompt tokens of the whole transcript'),
+        ),
+        migrations.AddField(
+            model_name='chat',
+            name='user_turn_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of candidate messages'),
+        ),
+    ]
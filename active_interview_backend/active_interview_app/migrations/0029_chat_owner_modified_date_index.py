@@ -0,0 +1,17 @@
+# Generated by Django 4.2.19 on 2026-10-17 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0028_chat_turn_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chat',
+            index=models.Index(fields=['owner', '-modified_date'], name='active_inte_owner_i_ca76ed_idx'),
+        ),
+    ]
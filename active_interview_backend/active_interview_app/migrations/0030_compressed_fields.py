@@ -0,0 +1,148 @@
+# Generated by Django 4.2.19 on 2026-10-17 02:10
+
+import active_interview_app.fields
+from django.db import migrations
+
+# (model, field) pairs moved to compressed binary columns
+COMPRESSED_FIELDS = [
+    ('uploadedresume', 'content'),
+    ('uploadedjoblisting', 'content'),
+    ('chatmessage', 'content'),
+    ('exportablereport', 'question_responses'),
+    ('auditlog', 'extra_data'),
+]
+
+BATCH_SIZE = 500
+
+
+def _copy_fields(apps, source, target):
+    """Copy every field from the ``source`` to the ``target`` column name."""
+    for model_name, name in COMPRESSED_FIELDS:
+        Model = apps.get_model('active_interview_app', model_name)
+        from_field = source.format(name)
+        to_field = target.format(name)
+
+        batch = []
+        rows = Model.objects.only('pk', from_field).order_by('pk')
+        for row in rows.iterator(chunk_size=BATCH_SIZE):
+            setattr(row, to_field, getattr(row, from_field))
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                Model.objects.bulk_update(batch, [to_field])
+                batch = []
+        if batch:
+            Model.objects.bulk_update(batch, [to_field])
+
+
+def compress_existing(apps, schema_editor):
+    _copy_fields(apps, '{}', '{}_compressed')
+
+
+def decompress_existing(apps, schema_editor):
+    _copy_fields(apps, '{}_compressed', '{}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0029_chat_owner_modified_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadedresume',
+            name='content_compressed',
+            field=active_interview_app.fields.CompressedTextField(null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadedjoblisting',
+            name='content_compressed',
+            field=active_interview_app.fields.CompressedTextField(null=True),
+        ),
+        migrations.AddField(
+            model_name='chatmessage',
+            name='content_compressed',
+            field=active_interview_app.fields.CompressedTextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='exportablereport',
+            name='question_responses_compressed',
+            field=active_interview_app.fields.CompressedJSONField(null=True),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='extra_data_compressed',
+            field=active_interview_app.fields.CompressedJSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(compress_existing, decompress_existing),
+        migrations.RemoveField(
+            model_name='uploadedresume',
+            name='content',
+        ),
+        migrations.RemoveField(
+            model_name='uploadedjoblisting',
+            name='content',
+        ),
+        migrations.RemoveField(
+            model_name='chatmessage',
+            name='content',
+        ),
+        migrations.RemoveField(
+            model_name='exportablereport',
+            name='question_responses',
+        ),
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='extra_data',
+        ),
+        migrations.RenameField(
+            model_name='uploadedresume',
+            old_name='content_compressed',
+            new_name='content',
+        ),
+        migrations.RenameField(
+            model_name='uploadedjoblisting',
+            old_name='content_compressed',
+            new_name='content',
+        ),
+        migrations.RenameField(
+            model_name='chatmessage',
+            old_name='content_compressed',
+            new_name='content',
+        ),
+        migrations.RenameField(
+            model_name='exportablereport',
+            old_name='question_responses_compressed',
+            new_name='question_responses',
+        ),
+        migrations.RenameField(
+            model_name='auditlog',
+            old_name='extra_data_compressed',
+            new_name='extra_data',
+        ),
+        migrations.AlterField(
+            model_name='uploadedresume',
+            name='content',
+            field=active_interview_app.fields.CompressedTextField(),
+        ),
+        migrations.AlterField(
+            model_name='uploadedjoblisting',
+            name='content',
+            field=active_interview_app.fields.CompressedTextField(),
+        ),
+        migrations.AlterField(
+            model_name='chatmessage',
+            name='content',
+            field=active_interview_app.fields.CompressedTextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='exportablereport',
+            name='question_responses',
+            field=active_interview_app.fields.CompressedJSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='extra_data',
+            field=active_interview_app.fields.CompressedJSONField(blank=True, default=dict, help_text='Additional action-specific metadata'),
+        ),
+    ]
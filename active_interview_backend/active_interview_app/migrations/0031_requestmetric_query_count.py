@@ -0,0 +1,23 @@
+# Generated by Django 4.2.19 on 2026-10-17 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0030_compressed_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requestmetric',
+            name='query_count',
+            field=models.PositiveIntegerField(blank=True, help_text='Database queries run while handling the request', null=True),
+        ),
+        migrations.AddField(
+            model_name='requestmetric',
+            name='queries_saved',
+            field=models.PositiveIntegerField(default=0, help_text='Lookups answered by the request object cache; query_count + queries_saved is the count without it'),
+        ),
+    ]
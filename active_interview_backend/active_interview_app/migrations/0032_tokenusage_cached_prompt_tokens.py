@@ -0,0 +1,23 @@
+# Generated by Django 4.2.19 on 2026-10-17 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0031_requestmetric_query_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tokenusage',
+            name='cached_prompt_tokens',
+            field=models.IntegerField(default=0, help_text="Prompt tokens served from the provider's prompt cache"),
+        ),
+        migrations.AddField(
+            model_name='tokenusage',
+            name='prompt_version',
+            field=models.CharField(blank=True, default='', help_text='Version of the registered prompt sent (see prompts.py)', max_length=20),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.19 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0032_tokenusage_cached_prompt_tokens'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestMetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('minute', models.DateTimeField(db_index=True, help_text='Start of the period covered by this row')),
+                ('resolution', models.CharField(choices=[('minute', 'Minute'), ('hour', 'Hour'), ('day', 'Day')], default='minute', max_length=10)),
+                ('endpoint', models.CharField(max_length=255)),
+                ('method', models.CharField(max_length=10)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('error_4xx', models.PositiveIntegerField(default=0)),
+                ('error_5xx', models.PositiveIntegerField(default=0)),
+                ('sum_ms', models.FloatField(default=0.0, help_text='Sum of response times in milliseconds')),
+                ('max_ms', models.FloatField(default=0.0, help_text='Slowest response time in milliseconds')),
+                ('histogram', models.JSONField(default=list, help_text='Request counts per latency bucket (latency_histogram.py)')),
+            ],
+            options={
+                'verbose_name': 'Request Metric Rollup',
+                'verbose_name_plural': 'Request Metric Rollups',
+                'ordering': ['-minute'],
+                'indexes': [models.Index(fields=['resolution', 'minute'], name='active_inte_resolut_ddaed5_idx'), models.Index(fields=['endpoint', 'minute'], name='active_inte_endpoin_3b4120_idx')],
+                'unique_together': {('minute', 'resolution', 'endpoint', 'method')},
+            },
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.19 on 2026-10-17 07:40
+
+from bisect import bisect_left
+
+from django.db import migrations, models
+
+from active_interview_app.latency_sketch import LatencySketch
+
+# Upper bounds (ms) of the fixed histogram buckets used before 0034
+LEGACY_BOUNDS = (
+    5, 10, 25, 50, 75, 100, 150, 200, 300, 400, 500, 750,
+    1000, 1500, 2000, 3000, 5000, 7500, 10000, 20000, 30000, 60000,
+)
+
+BATCH_SIZE = 500
+
+
+def _legacy_to_sketch(row):
+    """Sketch a fixed-bucket histogram, counting each bucket at its midpoint."""
+    sketch = LatencySketch()
+    for index, count in enumerate(row.histogram):
+        if not count:
+            continue
+        lower = LEGACY_BOUNDS[index - 1] if index else 0.0
+        if index < len(LEGACY_BOUNDS):
+            upper = LEGACY_BOUNDS[index]
+        else:
+            upper = max(row.max_ms, lower)
+        sketch.add(min((lower + upper) / 2, row.max_ms), count)
+    if sketch.count:
+        # The row's exact totals
+        sketch.sum = row.sum_ms
+        sketch.max = row.max_ms
+    return sketch.to_dict()
+
+
+def _sketch_to_legacy(row):
+    """Re-bucket a sketch into the fixed histogram buckets."""
+    sketch = LatencySketch.from_dict(row.histogram)
+    histogram = [0] * (len(LEGACY_BOUNDS) + 1)
+    histogram[0] += sketch.zero_count
+    for index, count in sketch.bins.items():
+        value = LatencySketch._value(index)
+        histogram[bisect_left(LEGACY_BOUNDS, value)] += count
+    return histogram
+
+
+def _convert(apps, convert, legacy):
+    RequestMetricRollup = apps.get_model(
+        'active_interview_app', 'requestmetricrollup')
+
+    batch = []
+    rows = RequestMetricRollup.objects.only(
+        'pk', 'histogram', 'sum_ms', 'max_ms').order_by('pk')
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        if isinstance(row.histogram, list) != legacy:
+            continue
+        row.histogram = convert(row)
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            RequestMetricRollup.objects.bulk_update(batch, ['histogram'])
+            batch = []
+    if batch:
+        RequestMetricRollup.objects.bulk_update(batch, ['histogram'])
+
+
+def histograms_to_sketches(apps, schema_editor):
+    _convert(apps, _legacy_to_sketch, legacy=True)
+
+
+def sketches_to_histograms(apps, schema_editor):
+    _convert(apps, _sketch_to_legacy, legacy=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0033_requestmetricrollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='requestmetricrollup',
+            name='histogram',
+            field=models.JSONField(default=dict, help_text='Serialized LatencySketch of response times (latency_sketch.py)'),
+        ),
+        migrations.RunPython(histograms_to_sketches, sketches_to_histograms),
+    ]
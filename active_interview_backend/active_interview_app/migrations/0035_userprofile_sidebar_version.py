@@ -0,0 +1,18 @@
+# Generated by Django 4.2.19 on 2026-10-17 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('active_interview_app', '0034_requestmetricrollup_sketch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='sidebar_version',
+            field=models.PositiveIntegerField(default=0, help_text='Version stamp of the cached chat sidebar'),
+        ),
+    ]
@@ -5,9 +5,11 @@ from .ratelimit_mixins import (
     StrictRateLimitMixin,
     LenientRateLimitMixin
 )
+from .request_cache_mixins import RequestCacheMixin
 
 __all__ = [
     'RateLimitMixin',
     'StrictRateLimitMixin',
-    'LenientRateLimitMixin'
+    'LenientRateLimitMixin',
+    'RequestCacheMixin'
 ]
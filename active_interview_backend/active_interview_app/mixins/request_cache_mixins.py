@@ -0,0 +1,24 @@
+"""
+Request-scoped object cache mixin for class-based views.
+
+See request_cache.py for the cache itself.
+"""
+
+from ..request_cache import get_request_cache
+
+
+class RequestCacheMixin:
+    """
+    Mixin giving a view memoized model lookups for the current request.
+
+    ``test_func`` and the handler can both call
+    ``self.get_cached_object(Chat, id=chat_id)``; the chat is loaded once.
+    """
+
+    def get_cached_object(self, model, **lookup):
+        """Return ``model.objects.get(**lookup)``, loaded once per request."""
+        return get_request_cache(self.request).get(model, **lookup)
+
+    def get_cached_object_or_404(self, model, **lookup):
+        """Like ``get_cached_object``, but raise Http404 when missing."""
+        return get_request_cache(self.request).get_or_404(model, **lookup)
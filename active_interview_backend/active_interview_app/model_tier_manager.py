@@ -7,10 +7,15 @@ This module provides functionality for:
 - Determining which model tier to use based on spending cap
 - Automatic fallback to cheaper models when budget exceeded
 - Model selection for each tier
+- Generation profiles (token budget, temperature, deadline, retries) per
+  call site
 """
 
 from decimal import Decimal
 
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
 
 # Model tier to model name mapping
 TIER_TO_MODEL = {
@@ -35,6 +40,73 @@ TIER_COST_MULTIPLIER = {
     'fallback': 1.0,       # Baseline
 }
 
+# Prompt context budget per tier for long interviews (see context_utils)
+# - max_context_tokens: estimated prompt size above which older turns are
+#   replaced by a rolling summary
+# - recent_turns: user/assistant exchanges always sent verbatim
+TIER_CONTEXT_BUDGET = {
+    'premium': {'max_context_tokens': 12000, 'recent_turns': 6},
+    'standard': {'max_context_tokens': 8000, 'recent_turns': 5},
+    'fallback': {'max_context_tokens': 4000, 'recent_turns': 4},
+}
+
+# Tiers from most to least expensive
+TIER_ORDER = ('premium', 'standard', 'fallback')
+
+
+def _profile(max_tokens, temperature=None, response_format=None,
+             timeout=60, retries=2, tier=None):
+    return {
+        'max_tokens': max_tokens,
+        'temperature': temperature,
+        'response_format': response_format,
+        'timeout': timeout,
+        'retries': retries,
+        'tier': tier,
+    }
+
+
+_JSON_OBJECT = {'type': 'json_object'}
+
+# Generation settings per call site, keyed by TokenUsage endpoint name
+# - max_tokens: completion budget sized to the expected reply
+# - temperature / response_format: None keeps the provider default
+# - timeout: deadline in seconds for the call, retries included
+# - retries: extra attempts after a timeout, connection error, 429 or 5xx
+#   (see openai_utils.create_completion; streamed calls are not retried)
+# - tier: preferred tier; the spending-based tier wins when it is cheaper
+# settings.OPENAI_GENERATION_PROFILES overrides keys per profile, e.g.
+# {'chat_view': {'max_tokens': 2048}}. Unknown endpoints use 'default'.
+GENERATION_PROFILES = {
+    'default': _profile(2048),
+    # Interview turns and greetings
+    'chat_view': _profile(1024, temperature=0.7, retries=1),
+    'create_chat': _profile(400, temperature=0.7, timeout=30, retries=1),
+    'start_invited_interview': _profile(400, temperature=0.7, timeout=30,
+                                        retries=1),
+    # Key question lists (JSON array in the reply text)
+    'create_chat_timed_questions': _profile(2000, temperature=0.4),
+    'generate_key_questions': _profile(2000, temperature=0.4),
+    'single_question': _profile(800, temperature=0.5, timeout=45,
+                                retries=1),
+    # Results pages
+    'results_chat': _profile(1500, temperature=0.5),
+    'result_charts_scores': _profile(150, temperature=0, timeout=30),
+    'result_charts_feedback': _profile(1000, temperature=0.5),
+    # Exportable report (single call, then per-section fallbacks)
+    'generate_report': _profile(3000, temperature=0.2, timeout=90),
+    'report_scores': _profile(50, temperature=0, timeout=30,
+                              tier='standard'),
+    'report_feedback': _profile(1500, temperature=0.5),
+    'report_rationales': _profile(1000, temperature=0.3),
+    # Document parsers
+    'resume_parse': _profile(2000, temperature=0.3,
+                             response_format=_JSON_OBJECT, tier='standard'),
+    'job_parse': _profile(1500, temperature=0.3,
+                          response_format=_JSON_OBJECT, tier='standard'),
+    'context_summary': _profile(600, temperature=0.3),
+}
+
 
 def get_active_tier(force_tier=None):
     """
@@ -87,6 +159,34 @@ def get_active_tier(force_tier=None):
         return 'premium'
 
 
+def get_tier_for_spending(total_cost_usd, cap_amount_usd):
+    """
+    Determine the tier for a spending total without querying the database.
+
+    Mirrors the thresholds in get_active_tier(). Used to decide whether a
+    spending update can change the cached tier decision.
+
+    Args:
+        total_cost_usd: Month-to-date spending in USD
+        cap_amount_usd: Active monthly cap in USD, or None if no cap is set
+
+    Returns:
+        str: 'premium', 'standard', or 'fallback'
+    """
+    if cap_amount_usd is None:
+        return 'premium'
+
+    total = Decimal(str(total_cost_usd))
+    cap = Decimal(str(cap_amount_usd))
+    if total > cap:
+        return 'fallback'
+    if cap == 0:
+        return 'fallback' if total > 0 else 'premium'
+    if total / cap * Decimal('100') >= 85:
+        return 'standard'
+    return 'premium'
+
+
 def get_model_for_tier(tier='premium', provider='openai'):
     """
     Get the model name for a specific tier and provider.
@@ -101,6 +201,67 @@ def get_model_for_tier(tier='premium', provider='openai'):
     return TIER_TO_MODEL.get(tier, {}).get(provider, 'gpt-4o')
 
 
+def get_context_budget(tier='premium'):
+    """
+    Get the prompt context budget for a specific tier.
+
+    Args:
+        tier (str): Model tier ('premium', 'standard', 'fallback')
+
+    Returns:
+        dict: {'max_context_tokens': int, 'recent_turns': int}
+    """
+    return TIER_CONTEXT_BUDGET.get(tier, TIER_CONTEXT_BUDGET['premium'])
+
+
+def get_generation_profile(name):
+    """
+    Get the generation settings for a call site.
+
+    Args:
+        name (str): Profile name (the call site's TokenUsage endpoint)
+
+    Returns:
+        dict: max_tokens, temperature, response_format, timeout, retries
+            and tier, plus the profile name
+
+    Raises:
+        ImproperlyConfigured: If settings override an unknown key
+    """
+    profile = dict(GENERATION_PROFILES['default'])
+    profile.update(GENERATION_PROFILES.get(name, {}))
+
+    overrides = getattr(settings, 'OPENAI_GENERATION_PROFILES', {}).get(name, {})
+    unknown = set(overrides) - set(profile)
+    if unknown:
+        raise ImproperlyConfigured(
+            f"Unknown OPENAI_GENERATION_PROFILES keys for {name!r}: "
+            f"{', '.join(sorted(unknown))}"
+        )
+    profile.update(overrides)
+    profile['name'] = name
+    return profile
+
+
+def get_tier_for_profile(active_tier, preferred_tier):
+    """
+    Pick the tier for a call whose profile prefers a tier.
+
+    A profile can only move a call to a cheaper tier; it never overrides
+    a spending-based downgrade.
+
+    Args:
+        active_tier (str): Tier chosen from spending
+        preferred_tier (str): Profile's preferred tier, or None
+
+    Returns:
+        str: The cheaper of the two tiers
+    """
+    if preferred_tier not in TIER_ORDER or active_tier not in TIER_ORDER:
+        return active_tier
+    return max(active_tier, preferred_tier, key=TIER_ORDER.index)
+
+
 def get_tier_info():
     """
     Get information about the current tier and spending status.
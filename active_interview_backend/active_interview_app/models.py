@@ -1,5 +1,6 @@
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Max
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -9,6 +10,8 @@ from django.conf import settings
 from django.utils import timezone
 import uuid
 
+from .fields import CompressedJSONField, CompressedTextField
+
 
 # Create your models here.
 
@@ -63,6 +66,12 @@ class UserProfile(models.Model):
         help_text='User role for access control'
     )
 
+    # Bumped whenever the user's chat sidebar changes (chat_index.py)
+    sidebar_version = models.PositiveIntegerField(
+        default=0,
+        help_text='Version stamp of the cached chat sidebar'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -91,7 +100,7 @@ def save_user_profile(sender, instance, **kwargs):
 class UploadedResume(models.Model):  # Renamed from UploadedFile
     # Will be saved under media/uploads/
     file = models.FileField(upload_to='uploads/')
-    content = models.TextField()
+    content = CompressedTextField()
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     filesize = models.IntegerField(null=True, blank=True)
@@ -134,7 +143,7 @@ class UploadedJobListing(models.Model):  # Renamed from PastedText
     file = models.FileField(upload_to='uploads/')
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     filename = models.CharField(max_length=255)
-    content = models.TextField()
+    content = CompressedTextField()
     created_at = models.DateTimeField(auto_now_add=True)
     filepath = models.CharField(max_length=255, null=True, blank=True)
     title = models.CharField(max_length=255, null=True, blank=True)
@@ -213,8 +222,6 @@ class Chat(models.Model):
         default=5,
         validators=[MinValueValidator(1), MaxValueValidator(10)]
     )
-    # Json of the messages object
-    messages = models.JSONField(blank=True, default=list)
     # Json of the key questions
     key_questions = models.JSONField(blank=True, default=list)
     job_listing = models.ForeignKey(
@@ -284,12 +291,238 @@ class Chat(models.Model):
         help_text='When the last question was asked (for graceful ending calculation)'
     )
 
+    # Transcript counters, kept up to date with F() updates in the same
+    # transaction as each ChatMessage write (see _save_messages)
+    user_turn_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of candidate messages'
+    )
+    assistant_turn_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of interviewer messages'
+    )
+    prompt_token_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Estimated prompt tokens of the whole transcript'
+    )
+    last_question_index = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text='Sequence number of the latest interviewer message'
+    )
+    TURN_COUNTER_FIELDS = (
+        'user_turn_count', 'assistant_turn_count', 'prompt_token_count',
+        'last_question_index',
+    )
+
     # create object itself, not the field
     # all templates for documents in /documents/
     # thing that returns all user files is at views
 
     modified_date = models.DateTimeField(auto_now=True)  # date last modified
 
+    # The transcript lives in ChatMessage rows. ``_messages`` is the list
+    # handed out by the ``messages`` property; ``_message_rows`` holds the
+    # (seq, role, content) rows as stored, so save() writes only changes.
+    _messages = None
+    _message_rows = None
+
+    @property
+    def messages(self):
+        """
+        The transcript as a list of {"role": str, "content": str} dicts.
+
+        Loaded from ChatMessage on first access. The list can be changed or
+        replaced in place like the old JSON field; ``save()`` then writes
+        only the difference, so appending a turn is a single INSERT.
+        """
+        if self._messages is None:
+            self._messages = [
+                {"role": role, "content": content}
+                for _, role, content in self._get_message_rows()
+            ]
+        return self._messages
+
+    @messages.setter
+    def messages(self, value):
+        self._messages = value if value is not None else []
+
+    def get_messages(self, start=0, stop=None):
+        """
+        Return a slice of the transcript without loading all of it.
+
+        Args:
+            start: Index of the first message
+            stop: Index after the last message (None for the end)
+
+        Returns:
+            list: {"role": str, "content": str} dicts
+        """
+        if self._messages is not None or self.pk is None:
+            return self.messages[start:stop]
+        rows = self.chat_messages.order_by('seq').values_list(
+            'role', 'content')[start:stop]
+        return [{"role": role, "content": content} for role, content in rows]
+
+    def message_count(self):
+        """Number of messages in the transcript."""
+        if self._messages is not None or self.pk is None:
+            return len(self.messages)
+        return self.chat_messages.count()
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        sync_messages = kwargs.get('update_fields') is None
+        if (sync_messages and not adding and self.pk is not None
+                and not args and not kwargs.get('force_insert')):
+            # The counters only change through _save_messages(); writing
+            # this instance's copy could undo a concurrent append
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.TURN_COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+        if adding and self._message_rows is None:
+            self._message_rows = []
+        if self._messages is not None and sync_messages:
+            self._save_messages()
+
+    def refresh_from_db(self, using=None, fields=None):
+        if fields is None:
+            self._messages = self._message_rows = None
+        super().refresh_from_db(using=using, fields=fields)
+
+    def _get_message_rows(self):
+        """Stored (seq, role, content) rows, loaded on first use."""
+        if self._message_rows is None:
+            if self.pk is None:
+                self._message_rows = []
+                return self._message_rows
+            prefetched = getattr(
+                self, '_prefetched_objects_cache', {}).get('chat_messages')
+            if prefetched is not None:
+                rows = [(m.seq, m.role, m.content) for m in prefetched]
+            else:
+                rows = self.chat_messages.order_by('seq').values_list(
+                    'seq', 'role', 'content')
+            self._message_rows = list(rows)
+        return self._message_rows
+
+    def _save_messages(self):
+        """
+        Write the differences between ``messages`` and the stored rows.
+
+        The turn counters are adjusted in the same transaction.
+        """
+        rows = self._get_message_rows()
+        current = [
+            (message.get('role') or '', message.get('content') or '')
+            for message in self._messages
+        ]
+        kept = min(len(rows), len(current))
+        removed = rows[kept:]
+        edited = [
+            (row, message)
+            for row, message in zip(rows[:kept], current[:kept])
+            if row[1:] != message
+        ]
+
+        with transaction.atomic():
+            if removed:
+                # Transcript was cut short (e.g. RestartChat)
+                self.chat_messages.filter(seq__gte=removed[0][0]).delete()
+            for row, (role, content) in edited:
+                # Edited in place (e.g. the difficulty in the prompt)
+                self.chat_messages.filter(seq=row[0]).update(
+                    role=role,
+                    content=content,
+                    token_count=ChatMessage.estimate_tokens(content)
+                )
+
+            new_rows = [
+                (row[0],) + message
+                for row, message in zip(rows, current[:kept])
+            ]
+            added = [(row[0],) + message for row, message in edited]
+            if len(current) > kept:
+                next_seq = new_rows[-1][0] + 1 if new_rows else 0
+                inserted = self._insert_messages(current[kept:], next_seq)
+                new_rows += inserted
+                added += inserted
+
+            self._update_turn_counters(
+                removed + [row for row, _ in edited], added, new_rows)
+        self._message_rows = new_rows
+
+    def _update_turn_counters(self, removed, added, rows):
+        """
+        Apply the counter changes for ``removed`` and ``added`` rows.
+
+        Counts are adjusted with F() expressions so concurrent turns add
+        up; ``rows`` is the transcript after the change.
+        """
+        def totals(rows):
+            return (
+                sum(1 for _, role, _ in rows if role == 'user'),
+                sum(1 for _, role, _ in rows if role == 'assistant'),
+                sum(ChatMessage.estimate_tokens(content)
+                    for _, _, content in rows),
+            )
+
+        user, assistant, tokens = (
+            after - before
+            for after, before in zip(totals(added), totals(removed))
+        )
+        assistant_seqs = [seq for seq, role, _ in rows if role == 'assistant']
+        last_question_index = assistant_seqs[-1] if assistant_seqs else None
+
+        Chat.objects.filter(pk=self.pk).update(
+            user_turn_count=F('user_turn_count') + user,
+            assistant_turn_count=F('assistant_turn_count') + assistant,
+            prompt_token_count=F('prompt_token_count') + tokens,
+            last_question_index=last_question_index
+        )
+        self.user_turn_count += user
+        self.assistant_turn_count += assistant
+        self.prompt_token_count += tokens
+        self.last_question_index = last_question_index
+
+    def _insert_messages(self, messages, seq):
+        """
+        INSERT ``messages`` as new rows starting at ``seq``.
+
+        If another request appended to the chat since it was loaded, the
+        sequence numbers collide; the insert is then retried after the
+        last stored message so neither request's turns are lost.
+
+        Returns:
+            list: The inserted (seq, role, content) rows
+        """
+        for attempt in range(CHAT_MESSAGE_INSERT_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    ChatMessage.objects.bulk_create([
+                        ChatMessage(
+                            chat=self,
+                            seq=seq + i,
+                            role=role,
+                            content=content,
+                            token_count=ChatMessage.estimate_tokens(content)
+                        )
+                        for i, (role, content) in enumerate(messages)
+                    ])
+            except IntegrityError:
+                if attempt == CHAT_MESSAGE_INSERT_ATTEMPTS - 1:
+                    raise
+                last = self.chat_messages.aggregate(last=Max('seq'))['last']
+                seq = 0 if last is None else last + 1
+                continue
+            return [
+                (seq + i, role, content)
+                for i, (role, content) in enumerate(messages)
+            ]
+
     def is_time_expired(self):
         """
         Check if the interview time has expired.
@@ -315,8 +548,7 @@ class Chat(models.Model):
         Check if all key questions have been answered by the candidate.
 
         Logic:
-        - Count user messages in self.messages (excluding first system message)
-        - Compare to len(self.key_questions)
+        - Compare the user_turn_count counter to len(self.key_questions)
         - Return True if user has answered all questions
 
         Related to Phase 8: Auto-finalize on Last Question Answered
@@ -325,16 +557,139 @@ class Chat(models.Model):
             # No key questions generated yet
             return False
 
-        # Count user messages (role == "user")
-        user_message_count = sum(1 for msg in self.messages if msg.get('role') == 'user')
-
         # User should have answered all key questions
-        return user_message_count >= len(self.key_questions)
+        return self.user_turn_count >= len(self.key_questions)
+
+    class Meta:
+        indexes = [
+            # Sidebar index: a user's chats, most recently modified first
+            models.Index(fields=['owner', '-modified_date']),
+        ]
 
     def __str__(self):
         return self.title
 
 
+# Attempts to append to a chat whose sequence numbers keep colliding
+CHAT_MESSAGE_INSERT_ATTEMPTS = 3
+
+
+class ChatMessage(models.Model):
+    """
+    One message of an interview chat transcript.
+
+    A turn appends rows instead of rewriting the whole transcript, so
+    write cost no longer grows with the length of the interview.
+    ``Chat.messages`` is a list view over these rows for existing callers.
+    """
+    chat = models.ForeignKey(Chat, on_delete=models.CASCADE,
+                             related_name='chat_messages')
+    seq = models.PositiveIntegerField(
+        help_text='Position of the message in the transcript'
+    )
+    role = models.CharField(max_length=20)
+    content = CompressedTextField(blank=True)
+    token_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Estimated prompt tokens (see context_utils)'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['chat', 'seq']
+        unique_together = ['chat', 'seq']
+
+    @staticmethod
+    def estimate_tokens(content):
+        """Estimated prompt tokens for one message's content."""
+        from .context_utils import estimate_tokens
+        return estimate_tokens([{"content": content}])
+
+    def __str__(self):
+        return f"{self.chat_id}#{self.seq} ({self.role})"
+
+
+class ChatContextSummary(models.Model):
+    """
+    Rolling summary of the older turns of an interview chat.
+
+    Long interviews send only the system prompt, this summary and the most
+    recent turns to the model (see context_utils). Kept in its own table so
+    the background refresh never races with ``Chat.save()`` on a turn.
+    """
+    chat = models.OneToOneField(Chat, on_delete=models.CASCADE,
+                                related_name='context_summary')
+    summary = models.TextField(blank=True)
+    summarized_through = models.IntegerField(
+        default=1,
+        help_text='Index into Chat.messages up to which (exclusive) '
+                  'messages are covered by the summary'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Context summary for {self.chat.title}"
+
+
+class AIResponseCache(models.Model):
+    """
+    Stored AI reply for a chat, keyed by a hash of the exact request.
+
+    ``cache_key`` hashes the endpoint, the model and the full input
+    messages (transcript plus the endpoint's prompt), so a new message, a
+    changed prompt or a different model tier all miss the cache. Only the
+    latest entry per chat and endpoint is kept (see response_cache).
+    """
+    chat = models.ForeignKey(Chat, on_delete=models.CASCADE,
+                             related_name='response_cache')
+    endpoint = models.CharField(max_length=50)
+    cache_key = models.CharField(max_length=64, unique=True)
+    model_name = models.CharField(max_length=100)
+    content = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['chat', 'endpoint']),
+        ]
+
+    def __str__(self):
+        return f"{self.endpoint} response for {self.chat.title}"
+
+
+class ParseResultCache(models.Model):
+    """
+    Stored AI parse of a resume or job listing, shared across users.
+
+    ``content_hash`` is a SHA-256 of the kind, the parser's prompt version
+    and the whitespace-normalized text, so re-uploading the same document
+    reuses the earlier parse and a prompt change starts a fresh entry.
+    The table is size-bounded; least recently hit rows are evicted first
+    (see parse_cache).
+    """
+    KIND_RESUME = 'resume'
+    KIND_JOB_LISTING = 'job_listing'
+    KIND_CHOICES = [
+        (KIND_RESUME, 'Resume'),
+        (KIND_JOB_LISTING, 'Job Listing'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    content_hash = models.CharField(max_length=64, unique=True)
+    prompt_version = models.CharField(max_length=20)
+    result = models.JSONField()
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = 'Parse Result Cache Entry'
+        verbose_name_plural = 'Parse Result Cache'
+
+    def __str__(self):
+        return f"{self.get_kind_display()} parse {self.content_hash[:12]}"
+
+
 class ExportableReport(models.Model):
     """
     Data structure to store exportable report information for an interview.
@@ -390,7 +745,7 @@ class ExportableReport(models.Model):
     )
 
     # Question-by-question analysis
-    question_responses = models.JSONField(default=list)
+    question_responses = CompressedJSONField(default=list)
     # Structure: [{"question": str, "answer": str, "score": int,
     # "feedback": str}, ...]
 
@@ -1091,7 +1446,7 @@ class AuditLog(models.Model):
     )
 
     # Additional metadata
-    extra_data = models.JSONField(
+    extra_data = CompressedJSONField(
         default=dict,
         blank=True,
         help_text='Additional action-specific metadata'
@@ -1445,6 +1800,7 @@ from .merge_stats_models import MergeTokenStats  # noqa: E402, F401
 # Import observability models (Issues #14, #15)
 from .observability_models import (  # noqa: E402, F401
     RequestMetric,
+    RequestMetricRollup,
     DailyMetricsSummary,
     ProviderCostDaily,
     ErrorLog
@@ -1636,3 +1992,10 @@ from .api_key_rotation_models import (  # noqa: E402, F401
     KeyRotationSchedule,
     KeyRotationLog
 )
+
+
+# Import background job model (Job queue)
+from .job_queue_models import Job  # noqa: E402, F401
+
+# Import email outbox model (Issues #8, #139)
+from .email_outbox_models import OutboundEmail  # noqa: E402, F401
@@ -7,7 +7,8 @@ Related to Issues #14, #15 (Observability Dashboard).
 from django.db import models
 from django.utils import timezone
 from datetime import timedelta
-import statistics
+
+from .latency_sketch import LatencySketch
 
 
 class RequestMetric(models.Model):
@@ -37,6 +38,18 @@ class RequestMetric(models.Model):
         blank=True,
         help_text="ID of authenticated user (null for anonymous)"
     )
+    query_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Database queries run while handling the request"
+    )
+    queries_saved = models.PositiveIntegerField(
+        default=0,
+        help_text=(
+            "Lookups answered by the request object cache; "
+            "query_count + queries_saved is the count without it"
+        )
+    )
 
     class Meta:
         ordering = ['-timestamp']
@@ -155,7 +168,10 @@ class RequestMetric(models.Model):
     @classmethod
     def calculate_percentiles(cls, endpoint=None, start_time=None, end_time=None):
         """
-        Calculate p50 and p95 latency percentiles.
+        Calculate latency percentiles.
+
+        Response times are streamed into a LatencySketch rather than
+        sorted, so percentiles are within 1% and memory stays flat.
 
         Args:
             endpoint: Specific endpoint to analyze (None for all endpoints)
@@ -163,7 +179,8 @@ class RequestMetric(models.Model):
             end_time: End of time window (default: now)
 
         Returns:
-            Dict with p50, p95, min, max, and mean latency in milliseconds
+            Dict with count, p50, p90, p95, p99, min, max, and mean
+            latency in milliseconds
         """
         if end_time is None:
             end_time = timezone.now()
@@ -178,32 +195,116 @@ class RequestMetric(models.Model):
         if endpoint:
             queryset = queryset.filter(endpoint=endpoint)
 
-        # Get response times
-        response_times = list(
-            queryset.values_list('response_time_ms', flat=True)
+        response_times = queryset.order_by().values_list(
+            'response_time_ms', flat=True)
+
+        return LatencySketch.from_values(response_times.iterator()).summary()
+
+
+class RequestMetricRollup(models.Model):
+    """
+    Request counts and latency sketch for one endpoint and method
+    over one period (a minute, hour or day).
+
+    Maintained incrementally by the metrics pipeline (see
+    metric_rollups.record_samples) and compacted into hourly, then
+    daily rows as it ages, so traffic history outlives the raw
+    RequestMetric rows. Dashboard ranges longer than an hour read
+    these rows instead of RequestMetric.
+    """
+    MINUTE = 'minute'
+    HOUR = 'hour'
+    DAY = 'day'
+    RESOLUTION_CHOICES = [
+        (MINUTE, 'Minute'),
+        (HOUR, 'Hour'),
+        (DAY, 'Day'),
+    ]
+
+    minute = models.DateTimeField(
+        db_index=True,
+        help_text="Start of the period covered by this row"
+    )
+    resolution = models.CharField(
+        max_length=10,
+        choices=RESOLUTION_CHOICES,
+        default=MINUTE
+    )
+    endpoint = models.CharField(max_length=255)
+    method = models.CharField(max_length=10)
+    count = models.PositiveIntegerField(default=0)
+    error_4xx = models.PositiveIntegerField(default=0)
+    error_5xx = models.PositiveIntegerField(default=0)
+    sum_ms = models.FloatField(
+        default=0.0,
+        help_text="Sum of response times in milliseconds"
+    )
+    max_ms = models.FloatField(
+        default=0.0,
+        help_text="Slowest response time in milliseconds"
+    )
+    histogram = models.JSONField(
+        default=dict,
+        help_text="Serialized LatencySketch of response times (latency_sketch.py)"
+    )
+
+    class Meta:
+        ordering = ['-minute']
+        unique_together = ['minute', 'resolution', 'endpoint', 'method']
+        indexes = [
+            models.Index(fields=['resolution', 'minute']),
+            models.Index(fields=['endpoint', 'minute']),
+        ]
+        verbose_name = "Request Metric Rollup"
+        verbose_name_plural = "Request Metric Rollups"
+
+    def __str__(self):
+        return (
+            f"{self.method} {self.endpoint} @ {self.minute} "
+            f"({self.resolution}): {self.count} requests"
         )
 
-        if not response_times:
-            return {
-                'count': 0,
-                'p50': 0.0,
-                'p95': 0.0,
-                'min': 0.0,
-                'max': 0.0,
-                'mean': 0.0
-            }
+    @property
+    def errors(self):
+        """Requests that resulted in an error (4xx or 5xx)."""
+        return self.error_4xx + self.error_5xx
 
-        # Calculate percentiles
-        sorted_times = sorted(response_times)
+    @property
+    def mean_ms(self):
+        """Mean response time in milliseconds."""
+        return self.sum_ms / self.count if self.count else 0.0
 
-        return {
-            'count': len(response_times),
-            'p50': statistics.quantiles(sorted_times, n=100)[49],  # 50th percentile
-            'p95': statistics.quantiles(sorted_times, n=100)[94],  # 95th percentile
-            'min': min(response_times),
-            'max': max(response_times),
-            'mean': statistics.mean(response_times)
-        }
+    @property
+    def sketch(self):
+        """LatencySketch of this row's response times (written on save)."""
+        if '_sketch' not in self.__dict__:
+            self._sketch = LatencySketch.from_dict(self.histogram)
+        return self._sketch
+
+    def save(self, *args, **kwargs):
+        if '_sketch' in self.__dict__:
+            self.histogram = self._sketch.to_dict()
+        super().save(*args, **kwargs)
+
+    def add(self, status_code, response_time_ms):
+        """Count one request into this row (not saved)."""
+        self.count += 1
+        if 400 <= status_code < 500:
+            self.error_4xx += 1
+        elif status_code >= 500:
+            self.error_5xx += 1
+        self.sum_ms += response_time_ms
+        self.max_ms = max(self.max_ms, response_time_ms)
+        self.sketch.add(response_time_ms)
+
+    def merge(self, other):
+        """Add the counts of another rollup into this row (not saved)."""
+        self.count += other.count
+        self.error_4xx += other.error_4xx
+        self.error_5xx += other.error_5xx
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.sketch.merge(other.sketch)
 
 
 class DailyMetricsSummary(models.Model):
@@ -413,6 +514,11 @@ class InterviewResponseLatency(models.Model):
         blank=True,
         help_text="OpenAI API call duration in milliseconds"
     )
+    time_to_first_token_ms = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Time until the first streamed token was sent (streaming responses only)"
+    )
 
     # Context
     question_number = models.IntegerField(
@@ -485,6 +591,7 @@ class InterviewResponseLatency(models.Model):
                 'p50': 0.0,
                 'p90': 0.0,
                 'p95': 0.0,
+                'p99': 0.0,
                 'min': 0.0,
                 'max': 0.0,
                 'mean': 0.0
@@ -494,20 +601,22 @@ class InterviewResponseLatency(models.Model):
         within_budget = metrics.filter(exceeded_threshold=False).count()
         exceeded_budget = metrics.filter(exceeded_threshold=True).count()
 
-        response_times = list(metrics.values_list('response_time_ms', flat=True))
-        sorted_times = sorted(response_times)
+        response_times = metrics.order_by().values_list(
+            'response_time_ms', flat=True)
+        summary = LatencySketch.from_values(response_times.iterator()).summary()
 
         return {
             'total_responses': total,
             'within_budget': within_budget,
             'exceeded_budget': exceeded_budget,
             'budget_compliance_rate': (within_budget / total) * 100,
-            'p50': statistics.quantiles(sorted_times, n=100)[49] if len(sorted_times) >= 100 else statistics.median(sorted_times),
-            'p90': statistics.quantiles(sorted_times, n=100)[89] if len(sorted_times) >= 100 else sorted_times[int(len(sorted_times) * 0.9)],
-            'p95': statistics.quantiles(sorted_times, n=100)[94] if len(sorted_times) >= 100 else sorted_times[int(len(sorted_times) * 0.95)],
-            'min': min(response_times),
-            'max': max(response_times),
-            'mean': statistics.mean(response_times)
+            'p50': summary['p50'],
+            'p90': summary['p90'],
+            'p95': summary['p95'],
+            'p99': summary['p99'],
+            'min': summary['min'],
+            'max': summary['max'],
+            'mean': summary['mean']
         }
 
     @classmethod
@@ -570,7 +679,8 @@ class InterviewResponseLatency(models.Model):
             end_time: End of time window (default: now)
 
         Returns:
-            Dict with p50, p90, p95, min, max, and mean latency in milliseconds
+            Dict with count, p50, p90, p95, p99, min, max, and mean latency
+            in milliseconds (percentiles from a LatencySketch, within 1%)
         """
         if end_time is None:
             end_time = timezone.now()
@@ -584,27 +694,7 @@ class InterviewResponseLatency(models.Model):
         if interview_type:
             queryset = queryset.filter(interview_type=interview_type)
 
-        response_times = list(queryset.values_list('response_time_ms', flat=True))
-
-        if not response_times:
-            return {
-                'count': 0,
-                'p50': 0.0,
-                'p90': 0.0,
-                'p95': 0.0,
-                'min': 0.0,
-                'max': 0.0,
-                'mean': 0.0
-            }
-
-        sorted_times = sorted(response_times)
+        response_times = queryset.order_by().values_list(
+            'response_time_ms', flat=True)
 
-        return {
-            'count': len(response_times),
-            'p50': statistics.quantiles(sorted_times, n=100)[49] if len(sorted_times) >= 100 else statistics.median(sorted_times),
-            'p90': statistics.quantiles(sorted_times, n=100)[89] if len(sorted_times) >= 100 else sorted_times[int(len(sorted_times) * 0.9)],
-            'p95': statistics.quantiles(sorted_times, n=100)[94] if len(sorted_times) >= 100 else sorted_times[int(len(sorted_times) * 0.95)],
-            'min': min(response_times),
-            'max': max(response_times),
-            'mean': statistics.mean(response_times)
-        }
+        return LatencySketch.from_values(response_times.iterator()).summary()
@@ -13,8 +13,62 @@ from decimal import Decimal
 
 from .observability_models import (
     RequestMetric,
+    RequestMetricRollup,
     ProviderCostDaily
 )
+from .metric_buckets import (
+    BucketWindow,
+    iter_bucket_stats,
+    latency_buckets,
+    request_counts,
+)
+from .metric_rollups import (
+    rollup_bucket_stats,
+    rollup_request_counts,
+    uses_rollups,
+)
+
+
+def _request_metrics(endpoint=None):
+    """RequestMetric rows, optionally for one endpoint."""
+    queryset = RequestMetric.objects.all()
+    if endpoint:
+        queryset = queryset.filter(endpoint=endpoint)
+    return queryset
+
+
+def _rollups(endpoint=None):
+    """RequestMetricRollup rows, optionally for one endpoint."""
+    queryset = RequestMetricRollup.objects.all()
+    if endpoint:
+        queryset = queryset.filter(endpoint=endpoint)
+    return queryset
+
+
+def _bucket_counts(window, endpoint=None):
+    """
+    (total, errors) per bucket in one query; ranges over an hour read
+    the minute rollups instead of raw rows.
+    """
+    if uses_rollups(window):
+        return rollup_request_counts(window, _rollups(endpoint))
+    return request_counts(window, _request_metrics(endpoint))
+
+
+def _bucket_latencies(window, endpoint=None):
+    """
+    Latency summary (p50, p95, mean) per bucket in one query; ranges
+    over an hour merge the rollup sketches instead of raw rows.
+    """
+    if uses_rollups(window):
+        return [
+            summary for _, _, summary in
+            rollup_bucket_stats(window, _rollups(endpoint))
+        ]
+    return [
+        sketch.summary()
+        for sketch in latency_buckets(window, _request_metrics(endpoint))
+    ]
 
 
 @staff_member_required
@@ -56,46 +110,18 @@ def api_metrics_rps(request):
     """
     time_range = request.GET.get('time_range', '24h')
     endpoint = request.GET.get('endpoint', None)
+    window = BucketWindow.for_time_range(time_range)
 
-    # Parse time range
-    end_time = timezone.now()
-    if time_range == '1h':
-        start_time = end_time - timedelta(hours=1)
-        bucket_minutes = 1  # 1-minute buckets
-    elif time_range == '7d':
-        start_time = end_time - timedelta(days=7)
-        bucket_minutes = 60  # 1-hour buckets
-    elif time_range == '30d':
-        start_time = end_time - timedelta(days=30)
-        bucket_minutes = 360  # 6-hour buckets
-    else:  # 24h default
-        start_time = end_time - timedelta(hours=24)
-        bucket_minutes = 5  # 5-minute buckets
-
-    # Calculate RPS for each time bucket
-    data_points = []
-    current_time = start_time
+    # Count requests for every time bucket in one grouped query
+    counts = _bucket_counts(window, endpoint)
 
-    while current_time < end_time:
-        bucket_end = current_time + timedelta(minutes=bucket_minutes)
-
-        # Count requests in this bucket
-        queryset = RequestMetric.objects.filter(
-            timestamp__gte=current_time,
-            timestamp__lt=bucket_end
-        )
-        if endpoint:
-            queryset = queryset.filter(endpoint=endpoint)
-
-        count = queryset.count()
-        rps = count / (bucket_minutes * 60) if bucket_minutes > 0 else count
-
-        data_points.append({
-            'timestamp': current_time.isoformat(),
-            'value': round(rps, 3)
-        })
-
-        current_time = bucket_end
+    data_points = [
+        {
+            'timestamp': bucket_start.isoformat(),
+            'value': round(total / window.bucket_seconds, 3)
+        }
+        for bucket_start, (total, _) in zip(window.bucket_starts(), counts)
+    ]
 
     return JsonResponse({
         'metric': 'rps',
@@ -119,44 +145,20 @@ def api_metrics_latency(request):
     """
     time_range = request.GET.get('time_range', '24h')
     endpoint = request.GET.get('endpoint', None)
+    window = BucketWindow.for_time_range(time_range)
 
-    # Parse time range
-    end_time = timezone.now()
-    if time_range == '1h':
-        start_time = end_time - timedelta(hours=1)
-        bucket_minutes = 1
-    elif time_range == '7d':
-        start_time = end_time - timedelta(days=7)
-        bucket_minutes = 60
-    elif time_range == '30d':
-        start_time = end_time - timedelta(days=30)
-        bucket_minutes = 360
-    else:  # 24h
-        start_time = end_time - timedelta(hours=24)
-        bucket_minutes = 5
+    # Latency percentiles for every time bucket from one query
+    summaries = _bucket_latencies(window, endpoint)
 
-    # Calculate percentiles for each time bucket
     data_points = []
-    current_time = start_time
-
-    while current_time < end_time:
-        bucket_end = current_time + timedelta(minutes=bucket_minutes)
-
-        percentiles = RequestMetric.calculate_percentiles(
-            endpoint=endpoint,
-            start_time=current_time,
-            end_time=bucket_end
-        )
-
+    for bucket_start, percentiles in zip(window.bucket_starts(), summaries):
         data_points.append({
-            'timestamp': current_time.isoformat(),
+            'timestamp': bucket_start.isoformat(),
             'p50': round(percentiles['p50'], 2),
             'p95': round(percentiles['p95'], 2),
             'mean': round(percentiles['mean'], 2)
         })
 
-        current_time = bucket_end
-
     return JsonResponse({
         'metric': 'latency',
         'time_range': time_range,
@@ -179,43 +181,20 @@ def api_metrics_errors(request):
     """
     time_range = request.GET.get('time_range', '24h')
     endpoint = request.GET.get('endpoint', None)
+    window = BucketWindow.for_time_range(time_range)
 
-    # Parse time range
-    end_time = timezone.now()
-    if time_range == '1h':
-        start_time = end_time - timedelta(hours=1)
-        bucket_minutes = 1
-    elif time_range == '7d':
-        start_time = end_time - timedelta(days=7)
-        bucket_minutes = 60
-    elif time_range == '30d':
-        start_time = end_time - timedelta(days=30)
-        bucket_minutes = 360
-    else:  # 24h
-        start_time = end_time - timedelta(hours=24)
-        bucket_minutes = 5
-
-    # Calculate error rate for each time bucket
-    data_points = []
-    current_time = start_time
+    # Request and error counts for every time bucket in one grouped query
+    counts = _bucket_counts(window, endpoint)
 
-    while current_time < end_time:
-        bucket_end = current_time + timedelta(minutes=bucket_minutes)
-
-        error_stats = RequestMetric.get_error_rate(
-            endpoint=endpoint,
-            start_time=current_time,
-            end_time=bucket_end
-        )
-
-        data_points.append({
-            'timestamp': current_time.isoformat(),
-            'error_rate': round(error_stats['error_rate'], 2),
-            'total_requests': error_stats['total_requests'],
-            'error_count': error_stats['error_count']
-        })
-
-        current_time = bucket_end
+    data_points = [
+        {
+            'timestamp': bucket_start.isoformat(),
+            'error_rate': round(errors / total * 100, 2) if total else 0.0,
+            'total_requests': total,
+            'error_count': errors
+        }
+        for bucket_start, (total, errors) in zip(window.bucket_starts(), counts)
+    ]
 
     return JsonResponse({
         'metric': 'error_rate',
@@ -291,30 +270,92 @@ def api_metrics_costs(request):
 
 
 @staff_member_required
-def api_export_metrics(request):
+def api_metrics_clients(request):
     """
-    Export metrics data as CSV.
+    API endpoint for OpenAI client pool counters.
 
-    Query params:
-        time_range: 1h, 24h, 7d, 30d (default: 24h)
-        metrics: Comma-separated list (rps,latency,errors,costs)
+    Counters are per worker process and reset on restart.
 
     Returns:
-        CSV file download
+        JSON with hit/miss/eviction counts for the sync and async pools
     """
-    import csv
-    from django.http import HttpResponse
+    from .openai_utils import get_client_pool_stats
 
-    time_range = request.GET.get('time_range', '24h')
-    metrics = request.GET.get('metrics', 'rps,latency,errors').split(',')
+    return JsonResponse({
+        'metric': 'client_pool',
+        'data': get_client_pool_stats()
+    })
+
+
+@staff_member_required
+def api_metrics_breakers(request):
+    """
+    API endpoint for the AI provider circuit breakers.
+
+    State is per worker process and resets on restart.
+
+    Returns:
+        JSON with state, consecutive failures and trip count per
+        (tier, key) breaker
+    """
+    from .circuit_breaker import get_breaker_stats
+
+    return JsonResponse({
+        'metric': 'circuit_breakers',
+        'data': get_breaker_stats()
+    })
+
+
+@staff_member_required
+def api_metrics_buffer(request):
+    """
+    API endpoint for the request metrics write buffer.
+
+    Counters are per worker process and reset on restart.
+
+    Returns:
+        JSON with pending, flushed, dropped and failed sample counts
+    """
+    from .metrics_buffer import get_metrics_buffer_stats
+
+    return JsonResponse({
+        'metric': 'metrics_buffer',
+        'data': get_metrics_buffer_stats()
+    })
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _daily_costs(window):
+    """Total provider cost per day in the window, from one query."""
+    rows = ProviderCostDaily.objects.filter(
+        date__gte=window.start.date(),
+        date__lte=window.end.date()
+    ).values('date').annotate(total=Sum('total_cost_usd')).order_by()
+    return {row['date']: float(row['total'] or Decimal('0.0')) for row in rows}
 
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="metrics_{time_range}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
 
-    writer = csv.writer(response)
+def _export_stats(window):
+    """Yield (bucket start, total, errors, latency summary) per bucket."""
+    if uses_rollups(window):
+        stats = rollup_bucket_stats(window, RequestMetricRollup.objects.all())
+        for bucket_start, (total, errors, summary) in zip(
+                window.bucket_starts(), stats):
+            yield bucket_start, total, errors, summary
+        return
 
-    # Write header
+    for bucket_start, total, errors, sketch in iter_bucket_stats(
+            window, RequestMetric.objects.all()):
+        yield bucket_start, total, errors, sketch.summary()
+
+
+def _export_rows(window, metrics):
+    """Yield the CSV header and one row per bucket."""
     headers = ['timestamp']
     if 'rps' in metrics:
         headers.append('rps')
@@ -324,65 +365,66 @@ def api_export_metrics(request):
         headers.extend(['error_rate', 'error_count'])
     if 'costs' in metrics:
         headers.append('total_cost')
+    yield headers
 
-    writer.writerow(headers)
+    costs = _daily_costs(window) if 'costs' in metrics else {}
 
-    # Parse time range
-    end_time = timezone.now()
-    if time_range == '1h':
-        start_time = end_time - timedelta(hours=1)
-    elif time_range == '7d':
-        start_time = end_time - timedelta(days=7)
-    elif time_range == '30d':
-        start_time = end_time - timedelta(days=30)
+    if metrics & {'rps', 'latency', 'errors'}:
+        buckets = _export_stats(window)
     else:
-        start_time = end_time - timedelta(hours=24)
+        buckets = ((start, 0, 0, None) for start in window.bucket_starts())
 
-    # Collect data points
-    # For simplicity, use 5-minute buckets
-    bucket_minutes = 5
-    current_time = start_time
-
-    while current_time < end_time:
-        bucket_end = current_time + timedelta(minutes=bucket_minutes)
-        row = [current_time.isoformat()]
+    for bucket_start, total, errors, percentiles in buckets:
+        row = [bucket_start.isoformat()]
 
         if 'rps' in metrics:
-            count = RequestMetric.objects.filter(
-                timestamp__gte=current_time,
-                timestamp__lt=bucket_end
-            ).count()
-            rps = count / (bucket_minutes * 60)
-            row.append(round(rps, 3))
+            row.append(round(total / window.bucket_seconds, 3))
 
         if 'latency' in metrics:
-            percentiles = RequestMetric.calculate_percentiles(
-                start_time=current_time,
-                end_time=bucket_end
-            )
             row.extend([
                 round(percentiles['p50'], 2),
                 round(percentiles['p95'], 2)
             ])
 
         if 'errors' in metrics:
-            error_stats = RequestMetric.get_error_rate(
-                start_time=current_time,
-                end_time=bucket_end
-            )
-            row.extend([
-                round(error_stats['error_rate'], 2),
-                error_stats['error_count']
-            ])
+            error_rate = errors / total * 100 if total else 0.0
+            row.extend([round(error_rate, 2), errors])
 
         if 'costs' in metrics:
-            costs = ProviderCostDaily.objects.filter(
-                date=current_time.date()
-            ).aggregate(total=Sum('total_cost_usd'))['total'] or Decimal('0.0')
-            row.append(float(costs))
+            row.append(costs.get(bucket_start.date(), 0.0))
+
+        yield row
+
+
+@staff_member_required
+def api_export_metrics(request):
+    """
+    Export metrics data as CSV.
+
+    Rows are streamed from a single pass over the window's requests
+    (rollups for ranges over an hour); buckets are 5 minutes, widened
+    for long ranges (see BucketWindow.for_export).
+
+    Query params:
+        time_range: 1h, 24h, 7d, 30d (default: 24h)
+        metrics: Comma-separated list (rps,latency,errors,costs)
 
-        writer.writerow(row)
-        current_time = bucket_end
+    Returns:
+        Streaming CSV file download
+    """
+    import csv
+    from django.http import StreamingHttpResponse
+
+    time_range = request.GET.get('time_range', '24h')
+    metrics = set(request.GET.get('metrics', 'rps,latency,errors').split(','))
+    window = BucketWindow.for_export(time_range)
+
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in _export_rows(window, metrics)),
+        content_type='text/csv'
+    )
+    response['Content-Disposition'] = f'attachment; filename="metrics_{time_range}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
 
     return response
 
@@ -7,20 +7,325 @@ This module prevents circular imports between views.py and resume_parser.py.
 Updated for:
 - Issue #13: API key rotation from key pool
 - Issue #14: Automatic fallback tier switching based on spending cap
+- Async (ASGI) views: shared AsyncOpenAI client
+- Concurrent independent completions (greeting + key questions)
+- Client pool keyed by provider, tier and API key
+- TTL cache for tier and API key resolution
+- Generation profiles: per call site token budget, temperature and timeout
+- Deadlines, jittered retries and per tier/key circuit breakers
 """
 
+import asyncio
+import hashlib
 import logging
-from openai import OpenAI
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from asgiref.sync import sync_to_async
+from openai import (
+    APIConnectionError, APIStatusError, AsyncOpenAI, DefaultAsyncHttpxClient,
+    DefaultHttpxClient, OpenAI, RateLimitError
+)
 from django.conf import settings
 
+from .circuit_breaker import CLOSED, CircuitOpenError, get_breaker
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
 
 # OpenAI client configuration with graceful degradation
+# Upper bound for any generation profile's max_tokens (see
+# model_tier_manager.GENERATION_PROFILES)
 MAX_TOKENS = 15000
-_openai_client = None
-_current_api_key = None
+
+# Client pool: one client per (provider, tier, key fingerprint), so tier
+# flips and key rotation reuse warm clients instead of rebuilding them.
+CLIENT_POOL_MAX_SIZE = 8
+
+# Keep-alive limits for the httpx pool shared by every pooled client.
+# Auth is sent per request, so clients for different keys share connections.
+CLIENT_POOL_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60
+)
+
+
+class _ClientPool:
+    """
+    Bounded, thread-safe LRU pool of API clients.
+
+    Evicted clients are dropped, not closed: they share one httpx
+    transport, and closing a client would close it for every other one.
+    """
+
+    def __init__(self, max_size=CLIENT_POOL_MAX_SIZE):
+        self.max_size = max_size
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build, force_refresh=False):
+        """
+        Return the pooled client for ``key``, building it on a miss.
+
+        Args:
+            key: Hashable pool key
+            build: Callable returning a new client
+            force_refresh (bool): Replace any pooled client for ``key``
+
+        Returns:
+            The pooled client
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and not force_refresh:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+
+            self.misses += 1
+            client = build()
+            self._clients[key] = client
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+            return client
+
+    def discard(self, predicate):
+        """
+        Drop the pooled clients whose key matches ``predicate``.
+
+        Args:
+            predicate: Callable taking a pool key
+
+        Returns:
+            int: Number of clients dropped
+        """
+        with self._lock:
+            stale = [key for key in self._clients if predicate(key)]
+            for key in stale:
+                del self._clients[key]
+            return len(stale)
+
+    def clear(self):
+        """Drop all pooled clients and reset the counters."""
+        with self._lock:
+            self._clients.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Return pool counters for monitoring.
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_rate (%)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._clients),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0.0,
+            }
+
+
+_client_pool = _ClientPool()
+# Pooled client -> its (tier, key) circuit breaker
+_client_breakers = weakref.WeakKeyDictionary()
+_shared_http_client = None
+_shared_http_client_lock = threading.Lock()
+
+# Async clients for ASGI views. httpx connections are bound to the event
+# loop that opened them, so async clients and their transport are pooled
+# per running loop (e.g. async views served under WSGI get a new loop).
+_async_client_pool = _ClientPool()
+_async_http_clients = weakref.WeakKeyDictionary()
+
+
+def _key_fingerprint(api_key):
+    """Short, non-reversible identifier for an API key (pool key only)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _get_shared_http_client():
+    """Return the process-wide httpx client used by all pooled clients."""
+    global _shared_http_client
+
+    with _shared_http_client_lock:
+        if _shared_http_client is None:
+            _shared_http_client = DefaultHttpxClient(limits=CLIENT_POOL_LIMITS)
+        return _shared_http_client
+
+
+def _get_async_http_client(loop):
+    """Return the httpx async client shared by pooled clients on ``loop``."""
+    with _shared_http_client_lock:
+        http_client = _async_http_clients.get(loop)
+        if http_client is None:
+            http_client = DefaultAsyncHttpxClient(limits=CLIENT_POOL_LIMITS)
+            _async_http_clients[loop] = http_client
+        return http_client
+
+
+def _discard_closed_loops():
+    """Drop async clients and transports bound to event loops that closed."""
+    _async_client_pool.discard(lambda key: key[-1].is_closed())
+    with _shared_http_client_lock:
+        for loop in [loop for loop in _async_http_clients if loop.is_closed()]:
+            del _async_http_clients[loop]
+
+
+def get_client_pool_stats():
+    """
+    Get hit/miss counters for the sync and async client pools.
+
+    Returns:
+        dict: {'sync': {...}, 'async': {...}} as returned by _ClientPool.stats()
+    """
+    return {
+        'sync': _client_pool.stats(),
+        'async': _async_client_pool.stats(),
+    }
+
+
+def reset_client_pools():
+    """
+    Drop every pooled client and reset the pool counters.
+
+    Used by tests; rotation does not need it since a new key is a new
+    pool entry.
+    """
+    _client_pool.clear()
+    _async_client_pool.clear()
+
+
+# Tier and API key resolution cache. Every LLM call resolves a tier (spending
+# and cap queries) and a key (key pool query + Fernet decrypt); both answers
+# are kept in memory for a short TTL and invalidated by the MonthlySpending,
+# MonthlySpendingCap and APIKeyPool signals (see spending_signals).
+# settings.OPENAI_RESOLVER_CACHE_TTL overrides the TTL; 0 disables caching.
+RESOLVER_CACHE_TTL = 30  # seconds
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Small thread-safe dict whose entries expire after the resolver TTL."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def ttl():
+        """Current TTL in seconds (read from settings on every write)."""
+        return getattr(settings, 'OPENAI_RESOLVER_CACHE_TTL', RESOLVER_CACHE_TTL)
+
+    def get(self, key):
+        """Return the cached value for ``key``, or _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            return value
+
+    def set(self, key, value):
+        """Cache ``value`` under ``key`` until the TTL expires."""
+        ttl = self.ttl()
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def values(self):
+        """Return the unexpired cached values."""
+        now = time.monotonic()
+        with self._lock:
+            return [value for expires_at, value in self._entries.values()
+                    if expires_at > now]
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# (provider, tier) -> (APIKeyPool id, decrypted key), or None if the pool
+# has no active key for that tier
+_key_cache = _TTLCache()
+# force_tier -> (active_tier, model_name, tier_info)
+_tier_cache = _TTLCache()
+# Set once the app tables exist; they do not disappear at runtime
+_database_ready = False
+
+
+def _is_database_ready():
+    """Return True once the database has tables (cached after first True)."""
+    global _database_ready
+
+    if not _database_ready:
+        from django.db import connection
+        _database_ready = bool(connection.introspection.table_names())
+    return _database_ready
+
+
+def invalidate_key_cache():
+    """Forget cached API keys (called when the key pool changes)."""
+    _key_cache.clear()
+
+
+def invalidate_tier_cache():
+    """Forget cached tier decisions (called when the spending cap changes)."""
+    _tier_cache.clear()
+
+
+def invalidate_tier_cache_for_spending(total_cost_usd):
+    """
+    Forget cached tier decisions that a new spending total would change.
+
+    Spending is saved after every LLM call, so the cache is only dropped
+    when the total crosses a tier threshold for the cached cap.
+
+    Args:
+        total_cost_usd: Updated month-to-date spending in USD
+    """
+    from .model_tier_manager import get_tier_for_spending
+
+    for _, _, tier_info in _tier_cache.values():
+        cap_amount = (tier_info.get('spending_info') or {}).get('cap_amount')
+        new_tier = get_tier_for_spending(total_cost_usd, cap_amount)
+        if new_tier != tier_info.get('active_tier'):
+            _tier_cache.clear()
+            return
+
+
+def reset_resolver_cache():
+    """
+    Drop all cached tier and key decisions.
+
+    Used by tests; production code relies on the TTL and the signals.
+    """
+    global _database_ready
+
+    _key_cache.clear()
+    _tier_cache.clear()
+    _database_ready = False
 
 
 def get_api_key_from_pool(model_tier='premium'):
@@ -41,23 +346,28 @@ def get_api_key_from_pool(model_tier='premium'):
     try:
         # Import here to avoid circular imports
         from .api_key_rotation_models import APIKeyPool
-        from django.db import connection
+        from .api_key_usage import record_key_usage
 
         # Check if database tables exist (important for tests and migrations)
-        if not connection.introspection.table_names():
+        if not _is_database_ready():
             # Database not ready, skip to fallback
             raise Exception("Database not ready")
 
-        # Try to get active key from pool for this tier
-        active_key = APIKeyPool.get_active_key(
-            provider='openai',
-            model_tier=model_tier
-        )
-
-        if active_key:
-            # Increment usage counter
-            active_key.increment_usage()
-            return active_key.get_key()
+        # Try to get active key from pool for this tier (cached, decrypted)
+        pooled_key = _key_cache.get(('openai', model_tier))
+        if pooled_key is _MISSING:
+            active_key = APIKeyPool.get_active_key(
+                provider='openai',
+                model_tier=model_tier
+            )
+            pooled_key = (active_key.pk, active_key.get_key()) if active_key else None
+            _key_cache.set(('openai', model_tier), pooled_key)
+
+        if pooled_key:
+            key_id, api_key = pooled_key
+            # Increment usage counter (buffered, see api_key_usage)
+            record_key_usage(key_id)
+            return api_key
 
     except Exception as e:
         # If key pool is not set up or fails, fall back to settings
@@ -92,7 +402,8 @@ def get_openai_client(model_tier='premium', force_refresh=False):
     This prevents import-time errors when API key is not set.
 
     Updated for Issue #13 to support key rotation and Issue #14 for tier-based fallback.
-    Will use a new client if the active key has changed.
+    Clients are pooled per tier and API key, so a rotated key gets a new
+    client while switching back to a previous tier reuses its client.
 
     Args:
         model_tier (str): Model tier ('premium', 'standard', 'fallback')
@@ -104,24 +415,69 @@ def get_openai_client(model_tier='premium', force_refresh=False):
     Raises:
         ValueError: If no API key is available or client initialization fails
     """
-    global _openai_client, _current_api_key
-
     try:
         # Get current active key for this tier
         current_key = get_api_key_from_pool(model_tier=model_tier)
 
-        # Check if we need to refresh the client
-        # (key has changed or client doesn't exist)
-        if force_refresh or _openai_client is None or _current_api_key != current_key:
-            _openai_client = OpenAI(api_key=current_key)
-            _current_api_key = current_key
-
-        return _openai_client
+        fingerprint = _key_fingerprint(current_key)
+        # Retries are handled by create_completion, within the deadline
+        client = _client_pool.get(
+            ('openai', model_tier, fingerprint),
+            lambda: OpenAI(api_key=current_key,
+                           http_client=_get_shared_http_client(),
+                           max_retries=0),
+            force_refresh=force_refresh
+        )
+        _client_breakers[client] = get_breaker(model_tier, fingerprint)
+        return client
 
     except Exception as e:
         raise ValueError(f"Failed to initialize OpenAI client for tier '{model_tier}': {e}")
 
 
+async def aget_openai_client(model_tier='premium', force_refresh=False):
+    """
+    Async counterpart of get_openai_client() for ASGI views.
+
+    Returns a pooled AsyncOpenAI client so every in-flight request on the
+    event loop shares one connection pool. The key pool lookup runs in a
+    thread because it touches the database.
+
+    Args:
+        model_tier (str): Model tier ('premium', 'standard', 'fallback')
+        force_refresh (bool): Force recreation of client even if one exists
+
+    Returns:
+        AsyncOpenAI: Initialized async OpenAI client instance
+
+    Raises:
+        ValueError: If no API key is available or client initialization fails
+    """
+    try:
+        current_key = await sync_to_async(get_api_key_from_pool)(
+            model_tier=model_tier)
+        loop = asyncio.get_running_loop()
+
+        fingerprint = _key_fingerprint(current_key)
+        # Keyed by the loop itself (not id()) so a dead loop's id being
+        # reused can never hand out a client bound to that loop. The key
+        # holds the loop alive, so entries for closed loops are dropped
+        # here rather than waiting for LRU eviction.
+        _discard_closed_loops()
+        client = _async_client_pool.get(
+            ('openai', model_tier, fingerprint, loop),
+            lambda: AsyncOpenAI(api_key=current_key,
+                                http_client=_get_async_http_client(loop),
+                                max_retries=0),
+            force_refresh=force_refresh
+        )
+        _client_breakers[client] = get_breaker(model_tier, fingerprint)
+        return client
+
+    except Exception as e:
+        raise ValueError(f"Failed to initialize async OpenAI client for tier '{model_tier}': {e}")
+
+
 def ai_available():
     """
     Return True if the OpenAI client can be initialized and is usable.
@@ -206,7 +562,35 @@ def get_current_api_key_info(model_tier='premium'):
     return None
 
 
-def get_client_and_model(force_tier=None):
+def completion_kwargs(profile, **overrides):
+    """
+    Request options for a call site's generation profile.
+
+    Args:
+        profile (str): Profile name (the call site's TokenUsage endpoint)
+        **overrides: Extra or replacement create() arguments
+            (e.g. stream=True, a JSON schema response_format)
+
+    Returns:
+        dict: Keyword arguments for client.chat.completions.create():
+            max_tokens (capped at MAX_TOKENS), plus temperature,
+            response_format and timeout when the profile sets them
+
+    Example:
+        kwargs = completion_kwargs('chat_view', stream=True)
+    """
+    from .model_tier_manager import get_generation_profile
+
+    options = get_generation_profile(profile)
+    kwargs = {'max_tokens': min(options['max_tokens'], MAX_TOKENS)}
+    for key in ('temperature', 'response_format', 'timeout'):
+        if options[key] is not None:
+            kwargs[key] = options[key]
+    kwargs.update(overrides)
+    return kwargs
+
+
+def get_client_and_model(force_tier=None, profile=None):
     """
     Get OpenAI client and model name with automatic tier selection.
 
@@ -219,6 +603,8 @@ def get_client_and_model(force_tier=None):
 
     Args:
         force_tier (str): Force a specific tier (for testing/admin override)
+        profile (str): Generation profile of the call; its preferred tier
+            is used when cheaper than the spending-based tier
 
     Returns:
         tuple: (client, model_name, tier_info)
@@ -226,25 +612,401 @@ def get_client_and_model(force_tier=None):
             - model_name: Model to use (e.g., 'gpt-4o', 'gpt-3.5-turbo')
             - tier_info: Dict with tier details and spending info
 
+    Raises:
+        CircuitOpenError: If the circuit breaker of every candidate tier
+            is open
+
+    While the selected tier's circuit breaker is open, the next cheaper
+    tier (with its own key) is used instead; forced tiers do not fail
+    over.
+
     Example:
         client, model, tier_info = get_client_and_model()
-        response = client.chat.completions.create(
-            model=model,
-            messages=[...]
-        )
+        response = create_completion(client, model, [...], 'chat_view')
+    """
+    # Get active tier, model name and tier info (cached, see _resolve_tier)
+    active_tier, model_name, tier_info = _resolve_profile_tier(
+        force_tier=force_tier, profile=profile)
+
+    # Get client with key for this tier, skipping tiers with open breakers
+    last_breaker = None
+    for tier in _failover_tiers(active_tier, force_tier):
+        try:
+            client = get_openai_client(model_tier=tier)
+        except ValueError:
+            if tier == active_tier:
+                raise
+            continue
+        if _breaker_allows(client):
+            return (client,) + _failover_model(
+                active_tier, tier, model_name, tier_info)
+        last_breaker = _client_breakers.get(client)
+
+    raise _circuit_open_error(active_tier, last_breaker)
+
+
+def get_model_name(force_tier=None, profile=None):
+    """
+    Model name get_client_and_model() selects, without getting a client.
+
+    For callers that only need the model (e.g. to build a cache key):
+    no client is built or pooled, no API key usage is counted and open
+    circuit breakers are not consulted, so no tier failover is applied.
+
+    Args:
+        force_tier (str): Force a specific tier (for testing/admin override)
+        profile (str): Generation profile of the call
+
+    Returns:
+        str: Model name (e.g., 'gpt-4o')
+    """
+    return _resolve_profile_tier(force_tier=force_tier, profile=profile)[1]
+
+
+def _resolve_tier(force_tier=None):
+    """
+    Return (active_tier, model_name, tier_info) for the current spend.
+
+    Answered from the resolver cache when possible; a miss runs the
+    spending and cap queries in model_tier_manager.
     """
     from .model_tier_manager import get_active_tier, get_model_for_tier, get_tier_info
 
-    # Get active tier based on spending cap
-    active_tier = get_active_tier(force_tier=force_tier)
+    resolved = _tier_cache.get(force_tier)
+    if resolved is _MISSING:
+        active_tier = get_active_tier(force_tier=force_tier)
+        model_name = get_model_for_tier(tier=active_tier, provider='openai')
+        resolved = (active_tier, model_name, get_tier_info())
+        _tier_cache.set(force_tier, resolved)
+    return resolved
+
+
+def _resolve_profile_tier(force_tier=None, profile=None):
+    """
+    _resolve_tier() adjusted for the profile's preferred tier.
+
+    Forced tiers are used as given.
+    """
+    from .model_tier_manager import (
+        get_generation_profile, get_model_for_tier, get_tier_for_profile
+    )
+
+    active_tier, model_name, tier_info = _resolve_tier(force_tier=force_tier)
+    if profile is None or force_tier:
+        return active_tier, model_name, tier_info
+
+    tier = get_tier_for_profile(
+        active_tier, get_generation_profile(profile)['tier'])
+    if tier == active_tier:
+        return active_tier, model_name, tier_info
+    model_name = get_model_for_tier(tier=tier, provider='openai')
+    return tier, model_name, dict(tier_info, active_tier=tier, model=model_name)
+
+
+async def aget_client_and_model(force_tier=None, profile=None):
+    """
+    Async counterpart of get_client_and_model() for ASGI views.
+
+    Tier selection reads spending data from the database, so it runs in a
+    thread; the returned client is the shared AsyncOpenAI client.
 
-    # Get model name for this tier
-    model_name = get_model_for_tier(tier=active_tier, provider='openai')
+    Args:
+        force_tier (str): Force a specific tier (for testing/admin override)
+        profile (str): Generation profile of the call (see
+            get_client_and_model)
+
+    Returns:
+        tuple: (client, model_name, tier_info) with an AsyncOpenAI client
+
+    Example:
+        client, model, tier_info = await aget_client_and_model()
+        response = await acreate_completion(client, model, [...], 'chat_view')
+    """
+    active_tier, model_name, tier_info = await sync_to_async(
+        _resolve_profile_tier)(force_tier=force_tier, profile=profile)
+
+    last_breaker = None
+    for tier in _failover_tiers(active_tier, force_tier):
+        try:
+            client = await aget_openai_client(model_tier=tier)
+        except ValueError:
+            if tier == active_tier:
+                raise
+            continue
+        if _breaker_allows(client):
+            return (client,) + _failover_model(
+                active_tier, tier, model_name, tier_info)
+        last_breaker = _client_breakers.get(client)
+
+    raise _circuit_open_error(active_tier, last_breaker)
+
+
+def _failover_tiers(active_tier, force_tier=None):
+    """Tiers to try, in order: the active tier, then cheaper ones."""
+    from .model_tier_manager import TIER_ORDER
+
+    if force_tier or active_tier not in TIER_ORDER:
+        return [active_tier]
+    return list(TIER_ORDER[TIER_ORDER.index(active_tier):])
+
+
+def _breaker_allows(client):
+    """True unless the client's circuit breaker refuses requests."""
+    breaker = _client_breakers.get(client)
+    return breaker is None or breaker.allow_request()
+
+
+def _failover_model(active_tier, tier, model_name, tier_info):
+    """(model_name, tier_info) for a call moved from active_tier to tier."""
+    from .model_tier_manager import get_model_for_tier
+
+    if tier == active_tier:
+        return model_name, tier_info
+    logger.warning(
+        f"Circuit breaker open for tier '{active_tier}', "
+        f"failing over to '{tier}'")
+    model_name = get_model_for_tier(tier=tier, provider='openai')
+    return model_name, dict(tier_info, active_tier=tier, model=model_name,
+                            failover_from=active_tier)
+
+
+def _circuit_open_error(active_tier, breaker):
+    retry_after = breaker.retry_after() if breaker is not None else None
+    return CircuitOpenError(
+        f"AI provider unavailable: circuit breaker open for tier "
+        f"'{active_tier}' and every fallback tier",
+        retry_after=retry_after
+    )
+
+
+# Retry backoff (full jitter): sleep a random time in
+# [0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt)]
+RETRY_BACKOFF_BASE = 0.5  # seconds
+RETRY_BACKOFF_MAX = 4  # seconds
+
+
+def is_upstream_failure(error):
+    """
+    Return True if ``error`` means the provider is unhealthy.
+
+    Timeouts, connection errors, rate limits and 5xx responses count
+    toward the circuit breaker and are retried; other errors (bad
+    requests, auth, programming errors) are raised at once.
+    """
+    if isinstance(error, (APIConnectionError, RateLimitError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+class _Attempts:
+    """Deadline, retry and breaker bookkeeping for one completion."""
+
+    def __init__(self, client, profile, overrides):
+        from .model_tier_manager import get_generation_profile
+
+        if profile is None:
+            self.kwargs = dict(overrides)
+            self.retries = 0
+        else:
+            self.kwargs = completion_kwargs(profile, **overrides)
+            self.retries = get_generation_profile(profile)['retries']
+        # A streamed reply may already be shown to the user when it
+        # fails, so only whole (idempotent) responses are retried
+        if self.kwargs.get('stream'):
+            self.retries = 0
+        self.profile = profile
+        self.deadline = self.kwargs.get('timeout')
+        self.breaker = _client_breakers.get(client)
+        self.started = time.monotonic()
+        self.attempt = 0
+
+    def request_kwargs(self):
+        """create() arguments with the time left before the deadline."""
+        if self.deadline is None:
+            return self.kwargs
+        remaining = self.deadline - (time.monotonic() - self.started)
+        return dict(self.kwargs, timeout=max(remaining, 0.001))
+
+    def succeeded(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def retry_delay(self, error):
+        """
+        Record a failed attempt.
+
+        Returns:
+            float: Seconds to wait before retrying, or None to give up
+        """
+        if not is_upstream_failure(error):
+            return None
+        if self.breaker is not None:
+            self.breaker.record_failure(error)
+            if self.breaker.state != CLOSED:
+                return None
+        if self.attempt >= self.retries:
+            return None
+
+        delay = random.uniform(0, min(
+            RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** self.attempt))
+        elapsed = time.monotonic() - self.started
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+
+        self.attempt += 1
+        logger.warning(
+            f"Retrying {self.profile or 'completion'} "
+            f"(attempt {self.attempt + 1}) in {delay:.2f}s after "
+            f"{type(error).__name__}: {error}")
+        return delay
+
+
+def create_completion(client, model, messages, profile=None, **overrides):
+    """
+    Run a chat completion with the profile's deadline and retries.
+
+    The profile's timeout is a deadline for the whole call: each attempt
+    gets the time that is left. Timeouts, connection errors, 429s and
+    5xx are retried with jittered backoff up to the profile's retries
+    (never for streamed calls) and reported to the client's circuit
+    breaker.
+
+    Args:
+        client: OpenAI client (from get_client_and_model)
+        model (str): Model name
+        messages (list): Input messages
+        profile (str): Generation profile, or None to send only
+            ``overrides``
+        **overrides: Extra or replacement create() arguments
 
-    # Get client with key for this tier
-    client = get_openai_client(model_tier=active_tier)
+    Returns:
+        The completion response (a stream when stream=True)
+    """
+    attempts = _Attempts(client, profile, overrides)
+    while True:
+        try:
+            response = client.chat.completions.create(
+                model=model, messages=messages, **attempts.request_kwargs())
+        except Exception as e:
+            delay = attempts.retry_delay(e)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+        attempts.succeeded()
+        return response
+
+
+async def acreate_completion(client, model, messages, profile=None,
+                             **overrides):
+    """
+    Async counterpart of create_completion() for AsyncOpenAI clients.
+
+    Returns:
+        The completion response (an async stream when stream=True)
+    """
+    attempts = _Attempts(client, profile, overrides)
+    while True:
+        try:
+            response = await client.chat.completions.create(
+                model=model, messages=messages, **attempts.request_kwargs())
+        except Exception as e:
+            delay = attempts.retry_delay(e)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+        attempts.succeeded()
+        return response
+
+
+def _request_profiles(message_lists, max_tokens, profiles):
+    """(profile, overrides) per message list (see run_completions_concurrently)."""
+    if profiles is None:
+        return [(None, {'max_tokens': max_tokens}) for _ in message_lists]
+    return [(profile, {}) for profile in profiles]
+
+
+def run_completions_concurrently(client, model, message_lists,
+                                 max_tokens=MAX_TOKENS, profiles=None):
+    """
+    Issue independent chat completions at the same time.
+
+    Used where a view needs several unrelated replies (e.g. the opening
+    greeting and the key questions), so the user waits for the slowest
+    call instead of the sum of all of them. Requests are submitted in
+    order, one thread each.
+
+    Only the API calls run in worker threads; callers record token usage
+    and touch the database from their own thread.
+
+    Args:
+        client: OpenAI client (from get_client_and_model)
+        model (str): Model name
+        message_lists (list): One messages list per completion
+        max_tokens (int): Max tokens per completion
+        profiles (list): Generation profile per completion; replaces
+            max_tokens with each profile's settings
+
+    Returns:
+        list: (response, error) tuples in input order. Exactly one of the
+            two is None, so one failed call does not discard the others.
+    """
+    if not message_lists:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(message_lists),
+                            thread_name_prefix='openai-completion') as executor:
+        futures = [
+            executor.submit(
+                create_completion, client, model, messages, profile,
+                **overrides
+            )
+            for messages, (profile, overrides) in zip(
+                message_lists,
+                _request_profiles(message_lists, max_tokens, profiles))
+        ]
+
+    results = []
+    for future in futures:
+        try:
+            results.append((future.result(), None))
+        except Exception as e:
+            logger.warning(f"Concurrent completion failed: {type(e).__name__}: {e}")
+            results.append((None, e))
+    return results
+
+
+async def arun_completions_concurrently(client, model, message_lists,
+                                        max_tokens=MAX_TOKENS, profiles=None):
+    """
+    Async counterpart of run_completions_concurrently() using asyncio.gather.
 
-    # Get full tier info for logging/monitoring
-    tier_info = get_tier_info()
+    Args:
+        client: AsyncOpenAI client (from aget_client_and_model)
+        model (str): Model name
+        message_lists (list): One messages list per completion
+        max_tokens (int): Max tokens per completion
+        profiles (list): Generation profile per completion
+
+    Returns:
+        list: (response, error) tuples in input order
+    """
+    outcomes = await asyncio.gather(
+        *[
+            acreate_completion(client, model, messages, profile, **overrides)
+            for messages, (profile, overrides) in zip(
+                message_lists,
+                _request_profiles(message_lists, max_tokens, profiles))
+        ],
+        return_exceptions=True
+    )
 
-    return client, model_name, tier_info
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            logger.warning(f"Concurrent completion failed: {type(outcome).__name__}: {outcome}")
+            results.append((None, outcome))
+        else:
+            results.append((outcome, None))
+    return results
@@ -0,0 +1,161 @@
+"""
+Deduplicating store for AI resume and job listing parses.
+
+``parse_resume_with_ai`` and ``parse_job_listing_with_ai`` used to send the
+full text to the model on every upload and every re-analysis, even when the
+same document had been parsed before. Results are now stored in
+``ParseResultCache`` under a SHA-256 of (kind, prompt version, normalized
+text) and shared across users:
+
+- whitespace-only differences (re-exports, copy/paste) hit the same entry
+- a change to a parser's prompts (its ``PROMPT_VERSION``) misses every
+  older entry
+- failed parses are never stored
+
+The table holds at most ``PARSE_CACHE_MAX_ENTRIES`` rows; least recently
+hit rows are evicted after each insert.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import ParseResultCache
+
+logger = logging.getLogger(__name__)
+
+# Default maximum number of stored parse results
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def get_max_entries():
+    """
+    Get the configured store size from settings.
+
+    Returns:
+        int: Maximum number of stored parse results
+    """
+    return getattr(settings, 'PARSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)
+
+
+def normalize_text(text):
+    """Collapse all whitespace runs so formatting-only changes still hit."""
+    return ' '.join(text.split())
+
+
+def parse_cache_key(kind, prompt_version, text):
+    """
+    Hash a parse request.
+
+    Args:
+        kind (str): ParseResultCache.KIND_RESUME or KIND_JOB_LISTING
+        prompt_version (str): Version of the parser's prompt
+        text (str): Extracted document text
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = f"{kind}\n{prompt_version}\n{normalize_text(text)}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cached_parse(kind, prompt_version, text, parse):
+    """
+    Return the parse of ``text``, calling ``parse`` only on a miss.
+
+    Args:
+        kind (str): ParseResultCache.KIND_RESUME or KIND_JOB_LISTING
+        prompt_version (str): Version of the parser's prompt
+        text (str): Extracted document text
+        parse (callable): Uncached parser, called with ``text``
+
+    Returns:
+        dict: Parsed data
+
+    Raises:
+        ValueError: Propagated from ``parse``; nothing is stored
+    """
+    content_hash = parse_cache_key(kind, prompt_version, text)
+
+    result = ParseResultCache.objects.filter(
+        content_hash=content_hash
+    ).values_list('result', flat=True).first()
+    if result is not None:
+        ParseResultCache.objects.filter(content_hash=content_hash).update(
+            hit_count=F('hit_count') + 1,
+            last_hit_at=timezone.now()
+        )
+        logger.debug(f"Parse cache hit for {kind} {content_hash[:12]}")
+        return result
+
+    result = parse(text)
+    try:
+        ParseResultCache.objects.create(
+            kind=kind,
+            content_hash=content_hash,
+            prompt_version=prompt_version,
+            result=result
+        )
+    except IntegrityError:
+        # Another request stored the same document first
+        pass
+    else:
+        evict_parse_cache()
+    return result
+
+
+def evict_parse_cache(max_entries=None):
+    """
+    Trim the store to ``max_entries`` rows, least recently hit first.
+
+    Args:
+        max_entries (int): Rows to keep (defaults to get_max_entries())
+
+    Returns:
+        int: Number of rows deleted
+    """
+    if max_entries is None:
+        max_entries = get_max_entries()
+
+    stale_ids = list(
+        ParseResultCache.objects.order_by('-last_hit_at', '-id')
+        .values_list('id', flat=True)[max_entries:]
+    )
+    if not stale_ids:
+        return 0
+    deleted, _ = ParseResultCache.objects.filter(id__in=stale_ids).delete()
+    return deleted
+
+
+def get_parse_cache_stats():
+    """
+    Summarize the store per kind for the admin report.
+
+    Every stored row is one miss (the parse that created it), so the hit
+    rate is hits / (hits + rows). Rows that were evicted no longer count.
+
+    Returns:
+        list: Dicts with kind, label, entries, hits and hit_rate (percent)
+    """
+    totals = {
+        row['kind']: row
+        for row in ParseResultCache.objects.values('kind').annotate(
+            entries=Count('id'), hits=Sum('hit_count'))
+    }
+    stats = []
+    for kind, label in ParseResultCache.KIND_CHOICES:
+        row = totals.get(kind, {})
+        entries = row.get('entries', 0)
+        hits = row.get('hits') or 0
+        lookups = entries + hits
+        stats.append({
+            'kind': kind,
+            'label': label,
+            'entries': entries,
+            'hits': hits,
+            'hit_rate': round(hits / lookups * 100, 1) if lookups else 0.0,
+        })
+    return stats
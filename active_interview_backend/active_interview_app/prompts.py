@@ -0,0 +1,542 @@
+"""
+Registry of the prompt templates sent to the AI provider.
+
+The interviewer, report and parser prompts used to be inline
+``textwrap.dedent(...).format(...)`` strings, rebuilt on every request
+and copied for the resume / no-resume variants. They are now
+registered here once, at import:
+
+- each ``PromptTemplate`` is dedented and its placeholders parsed up
+  front; ``render()`` only fills them in
+- ``version`` is a short SHA-256 of the template text. It changes
+  whenever the wording does, so it can key stored results (the parsers'
+  PROMPT_VERSION) and is recorded on TokenUsage for the endpoints that
+  send the prompt, to compare prompt revisions
+- interview prompts put every fixed instruction first and the
+  per-chat job listing, resume and settings last, so requests share
+  the longest possible prefix for provider-side prompt caching
+"""
+import hashlib
+import string
+import textwrap
+
+# Hex digits of the SHA-256 kept as the prompt version
+VERSION_LENGTH = 12
+
+PROMPTS = {}
+_ENDPOINT_PROMPTS = {}
+
+
+class PromptTemplate:
+    """A dedented ``str.format`` template with a content version."""
+
+    def __init__(self, name, template, endpoints=()):
+        self.name = name
+        self.text = textwrap.dedent(template)
+        self.endpoints = tuple(endpoints)
+        self.version = hashlib.sha256(
+            self.text.encode('utf-8')).hexdigest()[:VERSION_LENGTH]
+
+        prefix = []
+        fields = []
+        for literal, field, _, _ in string.Formatter().parse(self.text):
+            if not fields:
+                prefix.append(literal)
+            if field is not None:
+                fields.append(field)
+        self.fields = frozenset(fields)
+        # Text sent unchanged on every request, before the first value
+        self.static_prefix = ''.join(prefix)
+
+    def render(self, **values):
+        """
+        Fill in the template.
+
+        Raises:
+            KeyError: If a placeholder has no value
+        """
+        return self.text.format(**values)
+
+    def __repr__(self):
+        return f'<PromptTemplate {self.name} {self.version}>'
+
+
+def register(name, template, endpoints=()):
+    """
+    Add a template to the registry.
+
+    Args:
+        name: Unique prompt name
+        template: Template text (dedented here)
+        endpoints: TokenUsage endpoint names whose calls send this prompt
+
+    Returns:
+        PromptTemplate: The registered template
+
+    Raises:
+        ValueError: If the name is already registered
+    """
+    if name in PROMPTS:
+        raise ValueError(f'Prompt {name!r} is already registered')
+    prompt = PromptTemplate(name, template, endpoints)
+    PROMPTS[name] = prompt
+    for endpoint in prompt.endpoints:
+        _ENDPOINT_PROMPTS.setdefault(endpoint, []).append(prompt)
+    return prompt
+
+
+def get_prompt(name):
+    """Look up a registered template by name."""
+    return PROMPTS[name]
+
+
+def combined_version(*prompts):
+    """Version covering several templates (e.g. a system + user pair)."""
+    if len(prompts) == 1:
+        return prompts[0].version
+    joined = ':'.join(prompt.version for prompt in prompts)
+    return hashlib.sha256(
+        joined.encode('utf-8')).hexdigest()[:VERSION_LENGTH]
+
+
+def version_for_endpoint(endpoint):
+    """
+    Prompt version sent by a TokenUsage endpoint.
+
+    Returns:
+        str: Version of the endpoint's prompt(s), or '' if none registered
+    """
+    prompts = _ENDPOINT_PROMPTS.get(endpoint)
+    if not prompts:
+        return ''
+    return combined_version(*prompts)
+
+
+# ---------------------------------------------------------------------------
+# Practice interview prompts (CreateChat, KeyQuestionsView)
+# ---------------------------------------------------------------------------
+
+_INTERVIEWER_ROLE = """\
+    You are a professional interviewer for a company
+    preparing for a candidate's interview. You will act as
+    the interviewer and engage in a roleplaying session
+    with the candidate.
+
+    The job listing, the candidate's resume (when one is provided) and
+    the interview details are given at the end of this prompt. Ignore
+    any formatting issues in the resume, and focus on its content.
+"""
+
+_STAY_ON_TOPIC = """\
+    Respond critically to any responses that are off-topic
+    or ignore the fact that the user is in an interview.
+    For example, the user may not ask questions that are
+    normally acceptable for AI like recipes or book
+    reviews.
+
+    # Difficulty
+    - **Scale:** 1 to 10
+    - **1** = extremely easygoing interview, no curveballs
+    - **10** = very challenging, for top‑tier candidates only
+"""
+
+# Per-chat content; always last so the prefix above is shared
+_INTERVIEW_DETAILS = """\
+
+    # Job Listing:
+    \"\"\"{listing}\"\"\"
+    {resume_section}
+    # Type of Interview
+    This interview will be of the following type: {interview_type}
+
+    # Selected Difficulty
+    - **Selected level:** <<{difficulty}>>
+"""
+
+CANDIDATE_RESUME = register('candidate_resume', """\
+
+    # Candidate Resume:
+    \"\"\"{resume}\"\"\"
+""")
+
+INTERVIEW_GREETING = register('interview_greeting', _INTERVIEWER_ROLE + """\
+
+    Begin the session by greeting the candidate and asking
+    an introductory question about their background, then
+    move on to deeper, role-related questions based on the
+    job listing and resume.
+
+""" + _STAY_ON_TOPIC + _INTERVIEW_DETAILS, endpoints=('create_chat',))
+
+INTERVIEW_KEY_QUESTIONS = register('interview_key_questions', _INTERVIEWER_ROLE + """\
+
+    Please provide a json formatted list of 10 key
+    interview questions you wish to ask the user and the
+    duration of time they should have to answer each
+    question in seconds.  For example:
+
+    \"\"\"
+    [
+        {{
+            "id": 0,
+            "title": "Merge Conflicts",
+            "duration": 60,
+            "content": "How would you handle a merge conflict?"
+        }}
+    ]
+    \"\"\"
+
+""" + _STAY_ON_TOPIC + _INTERVIEW_DETAILS, endpoints=('create_chat_timed_questions',))
+
+QUESTION_FEEDBACK = register('question_feedback', _INTERVIEWER_ROLE + """\
+
+    Please review the candidate's answer to the interviewer question
+    given after the interview details, and provide constructive feedback
+    about the user's answer, including a rating of the answer from 1-10
+    like so: "6/10".
+
+""" + _STAY_ON_TOPIC + _INTERVIEW_DETAILS + """\
+
+    # Question and Answer
+    \"\"\"
+    [
+        {{
+            "role": "interviewer",
+            "content": "{question}"
+        }},
+        {{
+            "role": "user",
+            "content": "{answer}"
+        }}
+    ]
+    \"\"\"
+""", endpoints=('single_question',))
+
+
+def render_interview_prompt(prompt, *, listing, resume, interview_type,
+                            difficulty, **values):
+    """
+    Render a practice interview prompt.
+
+    Args:
+        prompt: INTERVIEW_GREETING, INTERVIEW_KEY_QUESTIONS or
+            QUESTION_FEEDBACK
+        listing: Job listing text
+        resume: Resume text, or None for the no-resume variant
+        interview_type: Display name of the interview type
+        difficulty: Selected difficulty (1-10)
+        **values: The prompt's remaining placeholders
+
+    Returns:
+        str: The system prompt
+    """
+    resume_section = (
+        CANDIDATE_RESUME.render(resume=resume) if resume is not None else '')
+    return prompt.render(
+        listing=listing,
+        resume_section=resume_section,
+        interview_type=interview_type,
+        difficulty=difficulty,
+        **values
+    )
+
+
+# ---------------------------------------------------------------------------
+# Results pages (ResultsChat, ResultCharts)
+# ---------------------------------------------------------------------------
+
+RESULTS_FEEDBACK = register('results_feedback', """\
+    Please provide constructive feedback to me about the
+    interview so far.
+""", endpoints=('results_chat',))
+
+RESULT_CHARTS_SCORES = register('result_charts_scores', """\
+    Based on the interview so far, please rate the interviewee in the
+    following categories from 0 to 100, and return the result as a JSON
+    object with integers only, in the following order that list only
+    the integers:
+
+    - Professionalism
+    - Subject Knowledge
+    - Clarity
+    - Overall
+
+    Example format:
+        8
+        7
+        9
+        6
+""", endpoints=('result_charts_scores',))
+
+RESULT_CHARTS_EXPLAIN = register('result_charts_explain', """\
+    Explain the reason for the following scores so that the user can
+    understand, do not include json object for scores IF NO response
+    was given since start of interview please tell them to start
+    interview
+""", endpoints=('result_charts_feedback',))
+
+
+# ---------------------------------------------------------------------------
+# Invited interview prompts (start_invited_interview)
+# ---------------------------------------------------------------------------
+
+INVITED_INTERVIEW = register('invited_interview', """\
+    You are a professional interviewer conducting a structured interview.
+    The interview template, its time limit and its sections are given at
+    the end of this prompt.
+
+    # CRITICAL INSTRUCTIONS - READ CAREFULLY
+    - ONLY greet the candidate briefly and ask ONE question at a time
+    - DO NOT list all the sections or questions upfront
+    - DO NOT provide an agenda or overview of the interview
+    - Start with a brief greeting, then immediately ask your first question from the first section
+    - Wait for the candidate's response before asking the next question
+    - Ask questions one at a time, conversationally
+    - Progress through sections naturally based on their order and weight
+    - Keep your responses concise - this is an interview, not a lecture
+    - Be professional and encouraging in your tone
+    - At the very end (after all sections), thank the candidate briefly
+
+    IMPORTANT: This is a conversational interview. Ask questions one by one,
+    listen to responses, and follow up naturally. Do NOT dump all questions
+    at once or provide a roadmap of the interview.
+
+    Respond critically to any responses that are off-topic or ignore
+    the fact that the user is in an interview. The candidate should
+    focus on answering interview questions, not asking for general
+    AI assistance.
+
+    # Interview Template: {template_name}
+    {template_description}
+
+    # Interview Duration
+    This interview has a time limit of {duration} minutes.
+
+    # Interview Structure
+    The interview is organized into the following sections:
+    {sections_content}
+""", endpoints=('start_invited_interview',))
+
+INVITED_KEY_QUESTIONS = register('invited_key_questions', """\
+    Based on the interview template below, generate the requested number
+    of key questions that should be asked during this interview. Cover
+    all sections proportionally based on their weight. Return ONLY a
+    JSON array of question strings.
+
+    Example format: ["Question 1?", "Question 2?", "Question 3?"]
+
+    Number of questions: {question_count}
+
+    Template: {template_name}
+    {template_description}
+
+    Sections:
+    {sections_content}
+""", endpoints=('generate_key_questions',))
+
+
+# ---------------------------------------------------------------------------
+# Report generation (report_utils)
+# ---------------------------------------------------------------------------
+
+RUSHED_NOTE = register('rushed_note', """\
+
+    NOTE: The candidate's final response(s) may have been submitted during
+    the last 5 minutes of the interview window and could be rushed or incomplete.
+    Please take this into consideration when evaluating those responses.
+""")
+
+REPORT = register('report', """\
+    Evaluate the interviewee's performance in the interview so far.
+
+    Rate the interviewee from 0 to 100 in each category: Professionalism,
+    Subject Knowledge, Clarity and Overall.
+
+    Provide comprehensive feedback with specific strengths, areas for
+    improvement, and an overall assessment. Focus on professionalism,
+    subject knowledge, and communication clarity. If no response was given
+    since start of interview, please tell them to start.
+
+    Provide a brief rationale explaining each score.
+    {rushed_note}
+""", endpoints=('generate_report',))
+
+# Appended to REPORT for models without json_schema support, which are
+# sent response_format json_object and need the shape spelled out
+REPORT_JSON_FORMAT = register('report_json_format', """
+    Respond with a JSON object only, in exactly this format:
+    {{
+        "scores": {{"professionalism": 0, "subject_knowledge": 0,
+                    "clarity": 0, "overall": 0}},
+        "feedback": "<feedback>",
+        "rationales": {{"professionalism": "<rationale>",
+                        "subject_knowledge": "<rationale>",
+                        "clarity": "<rationale>", "overall": "<rationale>"}}
+    }}
+    Scores are integers from 0 to 100.
+""", endpoints=('generate_report',))
+
+REPORT_SCORES = register('report_scores', """\
+    Based on the interview so far, please rate the interviewee in the
+    following categories from 0 to 100, and return the result as integers
+    only, in the following order:
+
+    - Professionalism
+    - Subject Knowledge
+    - Clarity
+    - Overall
+
+    Example format:
+        85
+        78
+        92
+        81
+""", endpoints=('report_scores',))
+
+REPORT_FEEDBACK = register('report_feedback', """\
+    Provide a comprehensive evaluation of the interviewee's performance.
+    Include specific strengths, areas for improvement, and overall assessment.
+    Focus on professionalism, subject knowledge, and communication clarity.
+    If no response was given since start of interview, please tell them to start.
+    {rushed_note}
+""", endpoints=('report_feedback',))
+
+REPORT_RATIONALES = register('report_rationales', """\
+    Based on the interview, provide a brief rationale for each score.
+    Format your response exactly as shown:
+
+    Professionalism: [Explanation for score of {professionalism}]
+
+    Subject Knowledge: [Explanation for score of {subject_knowledge}]
+
+    Clarity: [Explanation for score of {clarity}]
+
+    Overall: [Explanation for score of {overall}]
+""", endpoints=('report_rationales',))
+
+
+# ---------------------------------------------------------------------------
+# Document parsers (resume_parser, job_listing_parser)
+# ---------------------------------------------------------------------------
+
+RESUME_PARSE_SYSTEM = register('resume_parse_system', """\
+    You are a professional resume parser. Your task is to extract
+    structured information from resumes and return it as valid JSON.
+
+    Extract the following information:
+    1. Skills: Technical skills, programming languages, tools, frameworks,
+       soft skills, certifications
+    2. Experience: Work history with company name, job title, duration,
+       and brief description
+    3. Education: Educational background with institution, degree, field
+       of study, and graduation year
+
+    Return ONLY a valid JSON object with this exact structure (no markdown,
+    no code blocks, just pure JSON):
+    {{
+        "skills": ["skill1", "skill2", "skill3"],
+        "experience": [
+            {{
+                "company": "Company Name",
+                "title": "Job Title",
+                "duration": "Jan 2020 - Dec 2022",
+                "description": "Brief summary of responsibilities and achievements"
+            }}
+        ],
+        "education": [
+            {{
+                "institution": "University Name",
+                "degree": "Bachelor of Science",
+                "field": "Computer Science",
+                "year": "2019"
+            }}
+        ]
+    }}
+
+    Important guidelines:
+    - If a section is not found, return an empty array [] for that field
+    - Keep descriptions concise (1-2 sentences max)
+    - Extract ALL skills mentioned (technical and soft skills)
+    - For duration, use any format found in resume (e.g., "2020-2022",
+      "Jan 2020 - Present")
+    - For year in education, extract graduation year or expected year
+    - Return pure JSON only - no markdown formatting, no ```json blocks""", endpoints=('resume_parse',))
+
+RESUME_PARSE_USER = register('resume_parse_user', """\
+    Please parse the following resume and extract skills, experience,
+    and education information.
+
+    Resume content:
+    \"\"\"
+    {resume_content}
+    \"\"\"
+
+    Return the structured data as JSON following the specified format.""", endpoints=('resume_parse',))
+
+JOB_PARSE_SYSTEM = register('job_parse_system', """\
+    You are a professional job description parser.
+    Your task is to extract structured information from job postings
+    and return it as valid JSON.
+
+    Extract the following information:
+
+    1. Required Skills: Extract ALL skills mentioned including:
+       - Technical skills (programming languages, frameworks, tools)
+       - Soft skills (leadership, communication, teamwork)
+       - Domain knowledge (industry-specific expertise)
+       - Years of experience requirements (e.g., "5+ years Python")
+
+    2. Seniority Level: Infer the seniority level based on:
+       - Job title (Junior, Senior, Lead, Principal, Director, etc.)
+       - Years of experience required
+       - Level of responsibility described
+       - Team leadership expectations
+
+       Return ONE of these exact values:
+       - "entry" - Entry level, junior positions, 0-2 years
+       - "mid" - Mid-level, 2-5 years experience
+       - "senior" - Senior positions, 5+ years, technical expertise
+       - "lead" - Lead/Principal, 7+ years, team leadership
+       - "executive" - Executive, Director, VP, C-level positions
+
+    3. Requirements: Extract structured requirements:
+       - Education: Degree requirements (if mentioned)
+       - Years of experience: Extract as string (e.g., "5+", "3-5")
+       - Certifications: Professional certifications (if mentioned)
+       - Responsibilities: Key job responsibilities and duties
+
+    Return ONLY a valid JSON object with this exact structure
+    (no markdown, no code blocks, just pure JSON):
+    {{
+        "required_skills": ["skill1", "skill2", "skill3"],
+        "seniority_level": "senior",
+        "requirements": {{
+            "education": ["Bachelor's in CS", "Master's pref"],
+            "years_experience": "5+",
+            "certifications": ["AWS Certified", "PMP"],
+            "responsibilities": [
+                "Lead engineering team",
+                "Design scalable systems",
+                "Mentor junior developers"
+            ]
+        }}
+    }}
+
+    Important guidelines:
+    - If section not found, return empty array [] or empty string ""
+    - For seniority_level, MUST return: entry/mid/senior/lead/exec
+    - Extract ALL skills (combine technical and soft skills)
+    - For years_experience, extract number or use "" if not specified
+    - Keep responsibilities concise (1-2 sentences max per item)
+    - Return pure JSON only - no markdown, no ```json blocks""", endpoints=('job_parse',))
+
+JOB_PARSE_USER = register('job_parse_user', """\
+    Please parse the following job description and extract
+    required skills, seniority level, and requirements.
+
+    Job Description:
+    \"\"\"
+    {job_description}
+    \"\"\"
+
+    Return the structured data as JSON following specified format.""", endpoints=('job_parse',))
@@ -7,18 +7,91 @@ This module provides functions to:
 - Extract AI feedback and rationales
 - Create and save ExportableReport instances
 
+Scores, feedback and rationales are requested in a single structured-output
+call (a strict JSON schema where the model supports it, JSON mode
+otherwise); the older three-call path is kept as a fallback when that call
+fails or its output does not validate.
+
 Related to: Report Generation Refactor (Phase 2)
 """
 
-import textwrap
+import json
+import logging
+
+from django.db import IntegrityError, transaction
+
+from . import prompts
 from .models import ExportableReport
-from .openai_utils import get_openai_client, ai_available, MAX_TOKENS
+from .openai_utils import get_client_and_model, ai_available, create_completion
+from .token_tracking import record_openai_usage
+
+logger = logging.getLogger(__name__)
+
+
+# Score categories: display name used by the score dict -> schema/field key
+SCORE_CATEGORIES = {
+    'Professionalism': 'professionalism',
+    'Subject Knowledge': 'subject_knowledge',
+    'Clarity': 'clarity',
+    'Overall': 'overall',
+}
+
+
+def _string_properties(keys):
+    return {key: {"type": "string"} for key in keys}
+
+
+# JSON schema for the single-call report (OpenAI structured outputs)
+REPORT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "interview_report",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "scores": {
+                    "type": "object",
+                    "properties": {
+                        key: {"type": "integer"}
+                        for key in SCORE_CATEGORIES.values()
+                    },
+                    "required": list(SCORE_CATEGORIES.values()),
+                    "additionalProperties": False
+                },
+                "feedback": {"type": "string"},
+                "rationales": {
+                    "type": "object",
+                    "properties": _string_properties(SCORE_CATEGORIES.values()),
+                    "required": list(SCORE_CATEGORIES.values()),
+                    "additionalProperties": False
+                }
+            },
+            "required": ["scores", "feedback", "rationales"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+# Model name prefixes that accept a strict json_schema response_format;
+# older models (e.g. the gpt-4-turbo and gpt-3.5-turbo tiers) reject it
+JSON_SCHEMA_MODEL_PREFIXES = ('gpt-4o', 'gpt-4.1', 'gpt-5', 'o3', 'o4')
+
+# JSON mode for the other models; the prompt then describes the shape
+REPORT_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def supports_json_schema(model):
+    """Return True if ``model`` accepts a json_schema response_format."""
+    return model.startswith(JSON_SCHEMA_MODEL_PREFIXES)
 
 
 def generate_and_save_report(chat, include_rushed_qualifier=False):
     """
     Generate an ExportableReport for a chat.
-    Makes AI calls to extract scores, feedback, and rationales.
+    Makes one structured AI call for scores, feedback, and rationales,
+    falling back to three separate calls if that call fails.
 
     This is the main entry point for report generation. It orchestrates
     all the AI calls needed to create a complete report.
@@ -28,6 +101,10 @@ def generate_and_save_report(chat, include_rushed_qualifier=False):
         include_rushed_qualifier: If True, add note about rushed final responses
                                  (for invited interviews with time pressure)
 
+    The report is built in memory and saved once its content is
+    generated, so no blank report is visible while this runs (it may run
+    on the job queue) and a crashed run leaves nothing to reuse.
+
     Returns:
         ExportableReport instance (newly created or existing)
 
@@ -39,42 +116,155 @@ def generate_and_save_report(chat, include_rushed_qualifier=False):
     if existing:
         return existing
 
-    # Create new report
-    report = ExportableReport.objects.create(chat=chat)
+    report = ExportableReport(chat=chat)
+
+    # Scores, feedback and rationales in one structured-output call
+    content = _generate_report_content(chat, include_rushed_qualifier)
+
+    if content is not None:
+        scores = content['scores']
+        feedback = content['feedback']
+        rationales = content['rationales']
+    else:
+        # Fall back to one call each for scores, feedback and rationales
+        # (also returns the defaults when AI is unavailable)
+        scores = _extract_scores_from_chat(chat)
+        feedback = _extract_feedback_from_chat(chat, include_rushed_qualifier)
+        rationales = _extract_rationales_from_chat(chat, scores)
 
-    # Extract scores from chat (AI call 1)
-    scores = _extract_scores_from_chat(chat)
     report.professionalism_score = scores['Professionalism']
     report.subject_knowledge_score = scores['Subject Knowledge']
     report.clarity_score = scores['Clarity']
     report.overall_score = scores['Overall']
 
-    # Extract feedback text (AI call 2)
-    report.feedback_text = _extract_feedback_from_chat(chat, include_rushed_qualifier)
+    report.feedback_text = feedback
 
-    # Extract rationales for each score (AI call 3)
-    rationales = _extract_rationales_from_chat(chat, scores)
     report.professionalism_rationale = rationales['professionalism']
     report.subject_knowledge_rationale = rationales['subject_knowledge']
     report.clarity_rationale = rationales['clarity']
     report.overall_rationale = rationales['overall']
 
-    # Calculate interview statistics (no AI needed)
-    user_messages = [m for m in chat.messages if m.get('role') == 'user']
-    assistant_messages = [m for m in chat.messages if m.get('role') == 'assistant']
-    report.total_questions_asked = len(assistant_messages)
-    report.total_responses_given = len(user_messages)
+    # Interview statistics from the chat's turn counters (no AI needed)
+    report.total_questions_asked = chat.assistant_turn_count
+    report.total_responses_given = chat.user_turn_count
 
     # Calculate duration if timestamps available
     if chat.started_at and chat.finalized_at:
         duration = chat.finalized_at - chat.started_at
         report.interview_duration_minutes = int(duration.total_seconds() / 60)
 
-    # Save and return
-    report.save()
+    # Save and return; a concurrent run may have saved one first
+    try:
+        with transaction.atomic():
+            report.save()
+    except IntegrityError:
+        return ExportableReport.objects.get(chat=chat)
     return report
 
 
+def _rushed_note(include_rushed_qualifier):
+    """Return the note about rushed final responses, or an empty string."""
+    if not include_rushed_qualifier:
+        return ""
+    return prompts.RUSHED_NOTE.render()
+
+
+def _generate_report_content(chat, include_rushed_qualifier=False):
+    """
+    Generate scores, feedback and rationales in a single AI call.
+
+    Uses a JSON-schema response format so the transcript is sent once
+    instead of three times. The model is chosen by the tier manager;
+    models without json_schema support get JSON mode and the expected
+    shape in the prompt instead.
+
+    Args:
+        chat: Chat instance with messages to analyze
+        include_rushed_qualifier: If True, adds a note about rushed final responses
+
+    Returns:
+        dict: {
+            'scores': dict keyed like _extract_scores_from_chat,
+            'feedback': str,
+            'rationales': dict keyed like _extract_rationales_from_chat
+        }
+        or None if AI is unavailable, the call fails or the output is invalid.
+    """
+    if not ai_available():
+        return None
+
+    report_prompt = prompts.REPORT.render(
+        rushed_note=_rushed_note(include_rushed_qualifier))
+
+    try:
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = get_client_and_model(
+            profile='generate_report')
+        if supports_json_schema(model):
+            response_format = REPORT_RESPONSE_FORMAT
+        else:
+            response_format = REPORT_JSON_OBJECT_FORMAT
+            report_prompt += prompts.REPORT_JSON_FORMAT.render()
+
+        input_messages = list(chat.messages)
+        input_messages.append({"role": "user", "content": report_prompt})
+
+        response = create_completion(
+            client, model, input_messages, 'generate_report',
+            response_format=response_format
+        )
+        # Track token usage for spending cap (Issue #15.10)
+        record_openai_usage(chat.owner, 'generate_report', response)
+        return _parse_report_content(response.choices[0].message.content)
+
+    except Exception as e:
+        logger.warning(
+            f"Single-call report generation failed for chat {chat.id}, "
+            f"falling back to separate calls: {type(e).__name__}: {e}"
+        )
+        return None
+
+
+def _parse_report_content(content):
+    """
+    Validate the structured report output.
+
+    Args:
+        content: JSON string returned by the model
+
+    Returns:
+        dict: Report content (see _generate_report_content)
+
+    Raises:
+        ValueError: If a score is missing or outside 0-100, or the feedback
+            or a rationale is missing or empty
+    """
+    data = json.loads(content)
+
+    scores = {}
+    rationales = {}
+    for name, key in SCORE_CATEGORIES.items():
+        score = data['scores'][key]
+        if isinstance(score, bool) or not isinstance(score, int) or not 0 <= score <= 100:
+            raise ValueError(f"Invalid {key} score: {score!r}")
+        scores[name] = score
+
+        rationale = data['rationales'][key]
+        if not isinstance(rationale, str) or not rationale.strip():
+            raise ValueError(f"Missing {key} rationale")
+        rationales[key] = rationale.strip()
+
+    feedback = data['feedback']
+    if not isinstance(feedback, str) or not feedback.strip():
+        raise ValueError("Missing feedback")
+
+    return {
+        'scores': scores,
+        'feedback': feedback.strip(),
+        'rationales': rationales
+    }
+
+
 def _extract_scores_from_chat(chat):
     """
     Generate performance scores from chat messages using AI.
@@ -99,22 +289,7 @@ def _extract_scores_from_chat(chat):
     Note:
         Returns all zeros if AI is unavailable or parsing fails.
     """
-    scores_prompt = textwrap.dedent("""\
-        Based on the interview so far, please rate the interviewee in the
-        following categories from 0 to 100, and return the result as integers
-        only, in the following order:
-
-        - Professionalism
-        - Subject Knowledge
-        - Clarity
-        - Overall
-
-        Example format:
-            85
-            78
-            92
-            81
-    """)
+    scores_prompt = prompts.REPORT_SCORES.render()
 
     input_messages = list(chat.messages)
     input_messages.append({"role": "user", "content": scores_prompt})
@@ -128,11 +303,14 @@ def _extract_scores_from_chat(chat):
         }
 
     try:
-        response = get_openai_client().chat.completions.create(
-            model="gpt-4o",
-            messages=input_messages,
-            max_tokens=MAX_TOKENS
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = get_client_and_model(
+            profile='report_scores')
+        response = create_completion(
+            client, model, input_messages, 'report_scores'
         )
+        # Track token usage for spending cap (Issue #15.10)
+        record_openai_usage(chat.owner, 'report_scores', response)
         ai_message = response.choices[0].message.content.strip()
 
         # Parse scores from response (looking for lines with just digits)
@@ -145,8 +323,12 @@ def _extract_scores_from_chat(chat):
             # Fallback if we didn't get exactly 4 scores
             professionalism, subject_knowledge, clarity, overall = [0, 0, 0, 0]
 
-    except Exception:
+    except Exception as e:
         # Catch any errors (API failures, parsing issues, etc.)
+        logger.warning(
+            f"Score generation failed for chat {chat.id}, saving zero "
+            f"scores: {type(e).__name__}: {e}"
+        )
         professionalism, subject_knowledge, clarity, overall = [0, 0, 0, 0]
 
     return {
@@ -176,22 +358,9 @@ def _extract_feedback_from_chat(chat, include_rushed_qualifier=False):
         Returns fallback message if AI is unavailable.
     """
     # Optional note about rushed responses (for invited interviews)
-    rushed_note = ""
-    if include_rushed_qualifier:
-        rushed_note = textwrap.dedent("""\
-
-            NOTE: The candidate's final response(s) may have been submitted during
-            the last 5 minutes of the interview window and could be rushed or incomplete.
-            Please take this into consideration when evaluating those responses.
-        """)
-
-    explain_prompt = textwrap.dedent(f"""\
-        Provide a comprehensive evaluation of the interviewee's performance.
-        Include specific strengths, areas for improvement, and overall assessment.
-        Focus on professionalism, subject knowledge, and communication clarity.
-        If no response was given since start of interview, please tell them to start.
-        {rushed_note}
-    """)
+    rushed_note = _rushed_note(include_rushed_qualifier)
+
+    explain_prompt = prompts.REPORT_FEEDBACK.render(rushed_note=rushed_note)
 
     input_messages = list(chat.messages)
     input_messages.append({"role": "user", "content": explain_prompt})
@@ -200,14 +369,21 @@ def _extract_feedback_from_chat(chat, include_rushed_qualifier=False):
         return "AI features are currently unavailable."
 
     try:
-        response = get_openai_client().chat.completions.create(
-            model="gpt-4o",
-            messages=input_messages,
-            max_tokens=MAX_TOKENS
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = get_client_and_model(
+            profile='report_feedback')
+        response = create_completion(
+            client, model, input_messages, 'report_feedback'
         )
+        # Track token usage for spending cap (Issue #15.10)
+        record_openai_usage(chat.owner, 'report_feedback', response)
         return response.choices[0].message.content.strip()
 
-    except Exception:
+    except Exception as e:
+        logger.warning(
+            f"Feedback generation failed for chat {chat.id}: "
+            f"{type(e).__name__}: {e}"
+        )
         return "Unable to generate feedback at this time."
 
 
@@ -233,18 +409,12 @@ def _extract_rationales_from_chat(chat, scores):
     Note:
         Returns fallback messages if AI is unavailable or parsing fails.
     """
-    rationale_prompt = textwrap.dedent(f"""\
-        Based on the interview, provide a brief rationale for each score.
-        Format your response exactly as shown:
-
-        Professionalism: [Explanation for score of {scores.get('Professionalism', 0)}]
-
-        Subject Knowledge: [Explanation for score of {scores.get('Subject Knowledge', 0)}]
-
-        Clarity: [Explanation for score of {scores.get('Clarity', 0)}]
-
-        Overall: [Explanation for score of {scores.get('Overall', 0)}]
-    """)
+    rationale_prompt = prompts.REPORT_RATIONALES.render(
+        professionalism=scores.get('Professionalism', 0),
+        subject_knowledge=scores.get('Subject Knowledge', 0),
+        clarity=scores.get('Clarity', 0),
+        overall=scores.get('Overall', 0)
+    )
 
     input_messages = list(chat.messages)
     input_messages.append({"role": "user", "content": rationale_prompt})
@@ -261,11 +431,14 @@ def _extract_rationales_from_chat(chat, scores):
         return default_rationales
 
     try:
-        response = get_openai_client().chat.completions.create(
-            model="gpt-4o",
-            messages=input_messages,
-            max_tokens=MAX_TOKENS
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = get_client_and_model(
+            profile='report_rationales')
+        response = create_completion(
+            client, model, input_messages, 'report_rationales'
         )
+        # Track token usage for spending cap (Issue #15.10)
+        record_openai_usage(chat.owner, 'report_rationales', response)
         rationale_text = response.choices[0].message.content.strip()
 
         # Parse the structured response
@@ -320,8 +493,12 @@ def _extract_rationales_from_chat(chat, scores):
 
         return rationales
 
-    except Exception:
+    except Exception as e:
         # If anything fails, return default messages
+        logger.warning(
+            f"Rationale generation failed for chat {chat.id}: "
+            f"{type(e).__name__}: {e}"
+        )
         return {
             'professionalism': 'Unable to generate rationale at this time.',
             'subject_knowledge': 'Unable to generate rationale at this time.',
@@ -0,0 +1,108 @@
+"""
+Request-scoped identity map for model lookups.
+
+The chat views used to load the same Chat in ``test_func`` and again in
+``get``/``post``, and the chat's InvitedInterview from several helpers
+in one request. ``RequestObjectCache`` memoizes
+``Model.objects.get(**lookup)`` by (model, lookup) for the lifetime of a
+request:
+
+- each object is loaded once and every caller gets the same instance,
+  so changes made by one caller are seen by the next
+- an object loaded by a unique key (e.g. ``chat=chat``) is also
+  registered under its pk
+- misses (DoesNotExist) are remembered too, and raised again
+
+The cache lives on ``request.object_cache``; use it through
+``get_request_cache``, ``RequestCacheMixin`` (class-based views) or
+``@with_request_cache`` (function views). ``hits`` is reported by
+MetricsMiddleware as the queries saved.
+"""
+from django.db import models
+from django.http import Http404
+
+_MISSING = object()
+
+
+class RequestObjectCache:
+    """Memoized ``get()`` lookups for one request."""
+
+    def __init__(self):
+        self._objects = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(model, lookup):
+        items = []
+        for name, value in lookup.items():
+            if name == 'pk':
+                name = model._meta.pk.name
+            if isinstance(value, models.Model):
+                value = value.pk
+            items.append((name, str(value)))
+        return (model._meta.label, tuple(sorted(items)))
+
+    def get(self, model, **lookup):
+        """
+        Return ``model.objects.get(**lookup)``, loading it at most once.
+
+        Raises:
+            model.DoesNotExist: If no object matches (also memoized)
+            model.MultipleObjectsReturned: Not memoized
+        """
+        key = self._key(model, lookup)
+        obj = self._objects.get(key, _MISSING)
+        if obj is _MISSING:
+            self.misses += 1
+            try:
+                obj = model._default_manager.get(**lookup)
+            except model.DoesNotExist:
+                obj = None
+            self._objects[key] = obj
+            if obj is not None:
+                self._objects.setdefault(
+                    self._key(model, {'pk': obj.pk}), obj)
+        else:
+            self.hits += 1
+
+        if obj is None:
+            raise model.DoesNotExist(
+                f'{model._meta.object_name} matching query does not exist.')
+        return obj
+
+    def get_or_404(self, model, **lookup):
+        """Like ``get()``, but raise Http404 when nothing matches."""
+        try:
+            return self.get(model, **lookup)
+        except model.DoesNotExist:
+            raise Http404(
+                f'No {model._meta.object_name} matches the given query.')
+
+    def add(self, obj):
+        """Register an already loaded instance under its pk."""
+        self._objects[self._key(type(obj), {'pk': obj.pk})] = obj
+
+    def clear(self):
+        """Forget every memoized lookup."""
+        self._objects.clear()
+
+
+def get_request_cache(request):
+    """
+    Get the request's object cache, creating it on first use.
+
+    Args:
+        request: The current request, or None outside a request
+
+    Returns:
+        RequestObjectCache: The request's cache (a fresh, unshared one
+        when request is None)
+    """
+    if request is None:
+        return RequestObjectCache()
+    cache = getattr(request, 'object_cache', None)
+    if cache is None:
+        cache = RequestObjectCache()
+        request.object_cache = cache
+    return cache
@@ -0,0 +1,147 @@
+"""
+Content-addressed cache for AI replies on the results pages.
+
+``ResultsChat`` and ``ResultCharts`` used to call the model on every page
+load, even when the transcript had not changed. Replies are now stored in
+``AIResponseCache`` under a SHA-256 of (endpoint, model, input messages).
+The input messages hold the transcript and the endpoint's prompt, so:
+
+- a new chat message changes the key (the old entry is replaced)
+- editing a prompt acts as a new prompt version
+- a tier switch to another model is a miss, not a stale hit
+"""
+import hashlib
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+
+from .models import AIResponseCache
+from .openai_utils import (
+    acreate_completion, aget_client_and_model, create_completion,
+    get_client_and_model, get_model_name
+)
+from .token_tracking import record_openai_usage
+
+logger = logging.getLogger(__name__)
+
+
+def response_cache_key(endpoint, model, messages):
+    """
+    Hash a completion request.
+
+    Args:
+        endpoint (str): Call site name (e.g. 'results_chat')
+        model (str): Model the request is sent to
+        messages (list): Full input messages, prompt included
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps([endpoint, model, messages], sort_keys=True,
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cached_response(endpoint, model, messages):
+    """
+    Look up a stored reply for an identical request.
+
+    Returns:
+        str: Cached reply content, or None on a miss
+    """
+    return AIResponseCache.objects.filter(
+        cache_key=response_cache_key(endpoint, model, messages)
+    ).values_list('content', flat=True).first()
+
+
+def store_cached_response(chat, endpoint, model, messages, content):
+    """
+    Store a reply and drop this chat's older replies for the endpoint.
+
+    Older entries were computed from an earlier transcript and can never
+    be hit again.
+
+    Returns:
+        AIResponseCache: The stored entry
+    """
+    cache_key = response_cache_key(endpoint, model, messages)
+    entry, _ = AIResponseCache.objects.update_or_create(
+        cache_key=cache_key,
+        defaults={
+            'chat': chat,
+            'endpoint': endpoint,
+            'model_name': model,
+            'content': content,
+        }
+    )
+    AIResponseCache.objects.filter(
+        chat=chat, endpoint=endpoint
+    ).exclude(pk=entry.pk).delete()
+    return entry
+
+
+def cached_completion(user, chat, endpoint, messages):
+    """
+    Return the reply for ``messages``, calling the model only on a miss.
+
+    Token usage is recorded only for real calls. A hit needs only the
+    model name, so it builds no client and is served even while the
+    provider's circuit breaker is open.
+
+    Args:
+        user: User the call is billed to
+        chat: Chat the messages belong to
+        endpoint (str): Call site name, also used for token tracking and
+            as the generation profile
+        messages (list): Full input messages, prompt included
+
+    Returns:
+        str: Reply content
+    """
+    model = get_model_name(profile=endpoint)
+
+    content = get_cached_response(endpoint, model, messages)
+    if content is not None:
+        logger.debug(f"Response cache hit for {endpoint} on chat {chat.id}")
+        return content
+
+    # Auto-select model tier based on spending cap (Issue #14)
+    client, model, tier_info = get_client_and_model(profile=endpoint)
+
+    response = create_completion(
+        client, model, messages, endpoint
+    )
+    # Track token usage for spending cap (Issue #15.10)
+    record_openai_usage(user, endpoint, response)
+    content = response.choices[0].message.content
+    store_cached_response(chat, endpoint, model, messages, content)
+    return content
+
+
+async def acached_completion(user, chat, endpoint, messages):
+    """
+    Async counterpart of cached_completion() for ASGI views.
+
+    Returns:
+        str: Reply content
+    """
+    model = await sync_to_async(get_model_name)(profile=endpoint)
+
+    content = await sync_to_async(get_cached_response)(endpoint, model, messages)
+    if content is not None:
+        logger.debug(f"Response cache hit for {endpoint} on chat {chat.id}")
+        return content
+
+    # Auto-select model tier based on spending cap (Issue #14)
+    client, model, tier_info = await aget_client_and_model(profile=endpoint)
+
+    response = await acreate_completion(
+        client, model, messages, endpoint
+    )
+    # Track token usage for spending cap (Issue #15.10)
+    await sync_to_async(record_openai_usage)(user, endpoint, response)
+    content = response.choices[0].message.content
+    await sync_to_async(store_cached_response)(
+        chat, endpoint, model, messages, content)
+    return content
@@ -8,19 +8,26 @@ Issues: #48, #49, #50
 """
 
 import json
-import textwrap
 from typing import Dict, Any
 
 # Import the OpenAI client utilities from openai_utils
 # This ensures consistent error handling and configuration
 # Updated for Issue #14: Multi-tier model selection with automatic fallback
-from .openai_utils import get_client_and_model, ai_available, MAX_TOKENS
+from .openai_utils import get_client_and_model, ai_available, create_completion
+from .token_tracking import record_openai_usage
+from .models import ParseResultCache
+from . import prompts
+from .parse_cache import cached_parse
 
 # Maximum characters for resume content before truncation
 # Keep first 10,000 characters (roughly 2,500 tokens) to prevent token
 # limit issues
 RESUME_CONTENT_LIMIT = 10000
 
+# Changes whenever the parse prompts change, so stored parses are not reused
+PROMPT_VERSION = prompts.combined_version(
+    prompts.RESUME_PARSE_SYSTEM, prompts.RESUME_PARSE_USER)
+
 
 def parse_resume_with_ai(resume_content: str) -> Dict[str, Any]:
     """
@@ -32,6 +39,9 @@ def parse_resume_with_ai(resume_content: str) -> Dict[str, Any]:
     - Experience: Work history with company, title, duration, description
     - Education: Educational background with institution, degree, field, year
 
+    Results are stored by content hash (see parse_cache), so identical
+    resumes return without an API call.
+
     Args:
         resume_content (str): The resume text in markdown format
 
@@ -50,6 +60,12 @@ def parse_resume_with_ai(resume_content: str) -> Dict[str, Any]:
         >>> print(result['skills'])
         ['Python', 'Django']
     """
+    return cached_parse(ParseResultCache.KIND_RESUME, PROMPT_VERSION,
+                        resume_content, _parse_resume)
+
+
+def _parse_resume(resume_content: str) -> Dict[str, Any]:
+    """Uncached resume parse; see parse_resume_with_ai()."""
     # Check if OpenAI is available (same pattern as views.py)
     if not ai_available():
         raise ValueError(
@@ -63,76 +79,26 @@ def parse_resume_with_ai(resume_content: str) -> Dict[str, Any]:
             "\n... (truncated)"
 
     # System prompt for structured extraction
-    system_prompt = textwrap.dedent("""
-        You are a professional resume parser. Your task is to extract
-        structured information from resumes and return it as valid JSON.
-
-        Extract the following information:
-        1. Skills: Technical skills, programming languages, tools, frameworks,
-           soft skills, certifications
-        2. Experience: Work history with company name, job title, duration,
-           and brief description
-        3. Education: Educational background with institution, degree, field
-           of study, and graduation year
-
-        Return ONLY a valid JSON object with this exact structure (no markdown,
-        no code blocks, just pure JSON):
-        {
-            "skills": ["skill1", "skill2", "skill3"],
-            "experience": [
-                {
-                    "company": "Company Name",
-                    "title": "Job Title",
-                    "duration": "Jan 2020 - Dec 2022",
-                    "description": "Brief summary of responsibilities and achievements"
-                }
-            ],
-            "education": [
-                {
-                    "institution": "University Name",
-                    "degree": "Bachelor of Science",
-                    "field": "Computer Science",
-                    "year": "2019"
-                }
-            ]
-        }
-
-        Important guidelines:
-        - If a section is not found, return an empty array [] for that field
-        - Keep descriptions concise (1-2 sentences max)
-        - Extract ALL skills mentioned (technical and soft skills)
-        - For duration, use any format found in resume (e.g., "2020-2022",
-          "Jan 2020 - Present")
-        - For year in education, extract graduation year or expected year
-        - Return pure JSON only - no markdown formatting, no ```json blocks
-    """).strip()
+    system_prompt = prompts.RESUME_PARSE_SYSTEM.render()
 
     # User prompt with the resume content
-    user_prompt = textwrap.dedent(f"""
-        Please parse the following resume and extract skills, experience,
-        and education information.
-
-        Resume content:
-        \"\"\"
-        {resume_content}
-        \"\"\"
-
-        Return the structured data as JSON following the specified format.
-    """).strip()
+    user_prompt = prompts.RESUME_PARSE_USER.render(resume_content=resume_content)
 
     try:
         # Call OpenAI API with automatic tier selection (Issue #14)
-        client, model, tier_info = get_client_and_model()
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
+        client, model, tier_info = get_client_and_model(
+            profile='resume_parse')
+        response = create_completion(
+            client, model,
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=MAX_TOKENS,
-            temperature=0.3,  # Lower temperature for more consistent parsing
-            response_format={"type": "json_object"}  # Force JSON response
+            # Low temperature and JSON mode for consistent parsing
+            'resume_parse'
         )
+        # Parses are cached per document, not billed to a user
+        record_openai_usage(None, 'resume_parse', response)
 
         # Extract the response content
         response_content = response.choices[0].message.content.strip()
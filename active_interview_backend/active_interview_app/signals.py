@@ -6,12 +6,15 @@ For spending-related signals, see spending_signals.py (Issue #11, #15.10).
 For audit logging signals, see admin action logging below (Issues #66, #67, #68).
 """
 
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import Group
 from django.contrib.admin.models import LogEntry, ADDITION, CHANGE, DELETION
 from django.contrib.auth.signals import user_logged_in, user_logged_out, user_login_failed
 
+from .chat_index import invalidate_sidebar_chats
+from .models import Chat, InvitedInterview
+
 
 @receiver(post_migrate)
 def ensure_average_role_group(sender, **kwargs):
@@ -153,3 +156,24 @@ def log_failed_login(sender, credentials, request, **kwargs):
             'attempted_username': username
         }
     )
+
+
+# Sidebar chat index cache (see chat_index)
+
+@receiver(post_save, sender=Chat)
+@receiver(post_delete, sender=Chat)
+def invalidate_sidebar_on_chat_change(sender, instance, **kwargs):
+    """Drop the owner's cached sidebar when a chat is saved or deleted."""
+    invalidate_sidebar_chats(instance.owner_id)
+
+
+@receiver(post_save, sender=InvitedInterview)
+@receiver(post_delete, sender=InvitedInterview)
+def invalidate_sidebar_on_invitation_change(sender, instance, **kwargs):
+    """The sidebar shows the invitation's review status on its chat."""
+    if instance.chat_id is None:
+        return
+    owner_id = Chat.objects.filter(pk=instance.chat_id).values_list(
+        'owner_id', flat=True).first()
+    if owner_id is not None:
+        invalidate_sidebar_chats(owner_id)
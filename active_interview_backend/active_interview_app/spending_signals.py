@@ -8,11 +8,14 @@ Related to:
 This module contains Django signals that automatically:
 1. Update monthly spending totals when new TokenUsage records are created
 2. Trigger API key rotation when spending exceeds the configured cap
+3. Invalidate the cached tier and API key decisions in openai_utils
 """
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from .token_usage_models import TokenUsage
-from .spending_tracker_models import MonthlySpending
+from .spending_tracker_models import MonthlySpending, MonthlySpendingCap
+from .api_key_rotation_models import APIKeyPool
+from . import openai_utils
 import logging
 
 logger = logging.getLogger(__name__)
@@ -118,3 +121,30 @@ def check_cap_and_trigger_rotation(sender, instance, created, **kwargs):
     except Exception as e:
         # Don't fail the spending update if rotation fails
         logger.error(f"Error checking cap-exceeded rotation: {e}", exc_info=True)
+
+
+@receiver(post_save, sender=MonthlySpending)
+def invalidate_tier_cache_on_spending(sender, instance, **kwargs):
+    """
+    Drop cached tier decisions when new spending crosses a tier threshold.
+
+    Args:
+        sender: The model class (MonthlySpending)
+        instance: The MonthlySpending instance being saved
+        **kwargs: Additional keyword arguments
+    """
+    openai_utils.invalidate_tier_cache_for_spending(instance.total_cost_usd)
+
+
+@receiver(post_save, sender=MonthlySpendingCap)
+@receiver(post_delete, sender=MonthlySpendingCap)
+def invalidate_tier_cache_on_cap_change(sender, instance, **kwargs):
+    """Drop cached tier decisions when the spending cap changes."""
+    openai_utils.invalidate_tier_cache()
+
+
+@receiver(post_save, sender=APIKeyPool)
+@receiver(post_delete, sender=APIKeyPool)
+def invalidate_key_cache_on_pool_change(sender, instance, **kwargs):
+    """Drop cached API keys when a key is added, activated or revoked."""
+    openai_utils.invalidate_key_cache()
@@ -296,6 +296,9 @@ async function loadAllMetrics() {
             loadLatencyMetrics(),
             loadErrorMetrics(),
             loadCostMetrics(),
+            loadClientPoolMetrics(),
+            loadBreakerMetrics(),
+            loadMetricsBufferStats(),
             loadSpendingData()  // Issue #11: Monthly Spending Tracker
         ]);
 
@@ -384,6 +387,83 @@ async function loadCostMetrics() {
     document.getElementById('statTotalCost').textContent = '$' + totalCost;
 }
 
+/**
+ * Load OpenAI client pool counters (sync + async pools combined)
+ */
+async function loadClientPoolMetrics() {
+    const response = await fetch('/admin/observability/api/metrics/clients/');
+    const data = await response.json();
+
+    const pools = Object.values(data.data);
+    const hits = pools.reduce((total, pool) => total + pool.hits, 0);
+    const misses = pools.reduce((total, pool) => total + pool.misses, 0);
+    const evictions = pools.reduce((total, pool) => total + pool.evictions, 0);
+    const lookups = hits + misses;
+
+    document.getElementById('statClientHitRate').textContent =
+        lookups > 0 ? (hits / lookups * 100).toFixed(2) + '%' : '--';
+    document.getElementById('statClientHits').textContent = hits;
+    document.getElementById('statClientMisses').textContent = misses;
+    document.getElementById('statClientEvictions').textContent = evictions;
+}
+
+/**
+ * Load request metrics write buffer counters (this worker process)
+ */
+async function loadMetricsBufferStats() {
+    const response = await fetch('/admin/observability/api/metrics/buffer/');
+    const data = await response.json();
+
+    document.getElementById('statBufferPending').textContent =
+        `${data.data.pending} / ${data.data.capacity}`;
+    document.getElementById('statBufferFlushed').textContent = data.data.flushed;
+    document.getElementById('statBufferDropped').textContent = data.data.dropped;
+    document.getElementById('statBufferFailed').textContent = data.data.failed;
+}
+
+/**
+ * Load AI provider circuit breaker state (one row per tier and key)
+ */
+async function loadBreakerMetrics() {
+    const response = await fetch('/admin/observability/api/metrics/breakers/');
+    const data = await response.json();
+
+    const tbody = document.getElementById('breakerTableBody');
+    const names = Object.keys(data.data).sort();
+    if (names.length === 0) {
+        tbody.innerHTML =
+            '<tr><td colspan="6" class="text-muted text-center">No calls yet</td></tr>';
+        return;
+    }
+
+    const stateClass = {
+        closed: 'text-success',
+        half_open: 'text-warning',
+        open: 'text-danger'
+    };
+    tbody.innerHTML = '';
+    names.forEach(name => {
+        const breaker = data.data[name];
+        const row = document.createElement('tr');
+        [
+            name,
+            breaker.state.replace('_', '-'),
+            breaker.failures,
+            breaker.trips,
+            breaker.state === 'open' ? breaker.retry_after : '--',
+            breaker.last_error || '--'
+        ].forEach((value, index) => {
+            const cell = document.createElement('td');
+            cell.textContent = value;
+            if (index === 1) {
+                cell.className = stateClass[breaker.state] || '';
+            }
+            row.appendChild(cell);
+        });
+        tbody.appendChild(row);
+    });
+}
+
 /**
  * Toggle auto-refresh
  */
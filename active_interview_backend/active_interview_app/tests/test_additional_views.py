@@ -591,7 +591,7 @@ class OpenAIClientTest(TestCase):
         import active_interview_app.openai_utils as openai_utils
 
         # Reset the global client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         mock_settings.OPENAI_API_KEY = None
 
@@ -608,7 +608,7 @@ class OpenAIClientTest(TestCase):
         import active_interview_app.openai_utils as openai_utils
 
         # Reset the global client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         mock_settings.OPENAI_API_KEY = None
 
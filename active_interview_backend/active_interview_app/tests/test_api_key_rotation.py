@@ -23,7 +23,7 @@ from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 from io import StringIO
 from django.core.management import call_command
 from cryptography.fernet import Fernet
@@ -216,6 +216,24 @@ class APIKeyPoolModelTest(TestCase):
         key.refresh_from_db()
         self.assertEqual(key.usage_count, 2)
 
+    def test_record_usage(self):
+        """Test that record_usage adds uses atomically by primary key"""
+        key = APIKeyPool.objects.create(
+            provider='openai',
+            key_name='Record Usage Key',
+            status=APIKeyPool.ACTIVE,
+            added_by=self.admin_user
+        )
+        key.set_key('sk-test-record')
+        key.save()
+
+        APIKeyPool.record_usage(key.pk)
+        APIKeyPool.record_usage(key.pk, count=3)
+
+        key.refresh_from_db()
+        self.assertEqual(key.usage_count, 4)
+        self.assertIsNotNone(key.last_used_at)
+
     def test_get_active_key(self):
         """Test retrieving the currently active key for a provider"""
         # No active key initially
@@ -313,6 +331,85 @@ class APIKeyPoolModelTest(TestCase):
         # Just verify the key name is present
 
 
+@override_settings(API_KEY_USAGE_FLUSH_INTERVAL=60)
+class APIKeyUsageBufferTest(TestCase):
+    """Test write-behind usage counting (api_key_usage)"""
+
+    def setUp(self):
+        """Create a pool key and make sure nothing is left pending"""
+        from active_interview_app import api_key_usage
+        self.addCleanup(api_key_usage.flush_key_usage)
+
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            is_staff=True
+        )
+        self.key = APIKeyPool.objects.create(
+            provider='openai',
+            key_name='Buffered Key',
+            status=APIKeyPool.ACTIVE,
+            added_by=self.admin_user
+        )
+        self.key.set_key('sk-test-buffered')
+        self.key.save()
+
+    def test_uses_buffered_until_flush(self):
+        """Test that uses are kept in memory and written in one update"""
+        from active_interview_app.api_key_usage import (
+            flush_key_usage, get_pending_usage
+        )
+
+        for _ in range(3):
+            self.key.increment_usage()
+
+        self.key.refresh_from_db()
+        self.assertEqual(self.key.usage_count, 0)
+        self.assertEqual(get_pending_usage(self.key.pk), 3)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(flush_key_usage(), 1)
+
+        self.key.refresh_from_db()
+        self.assertEqual(self.key.usage_count, 3)
+        self.assertIsNotNone(self.key.last_used_at)
+        self.assertEqual(get_pending_usage(self.key.pk), 0)
+
+    @override_settings(OPENAI_API_KEY='sk-fallback')
+    def test_get_api_key_from_pool_buffers_usage(self):
+        """Test that the LLM hot path does not write the key row"""
+        from active_interview_app.api_key_usage import get_pending_usage
+        from active_interview_app.openai_utils import get_api_key_from_pool
+
+        get_api_key_from_pool()
+        get_api_key_from_pool()
+
+        self.key.refresh_from_db()
+        self.assertEqual(self.key.usage_count, 0)
+        self.assertEqual(get_pending_usage(self.key.pk), 2)
+
+    def test_failed_flush_keeps_counts(self):
+        """Test that counts are retried when the update fails"""
+        from active_interview_app.api_key_usage import (
+            flush_key_usage, get_pending_usage
+        )
+
+        self.key.increment_usage()
+        with patch.object(APIKeyPool, 'record_usage', side_effect=Exception('DB down')):
+            self.assertEqual(flush_key_usage(), 0)
+
+        self.assertEqual(get_pending_usage(self.key.pk), 1)
+
+    @override_settings(API_KEY_USAGE_FLUSH_INTERVAL=0)
+    def test_zero_interval_writes_immediately(self):
+        """Test that API_KEY_USAGE_FLUSH_INTERVAL=0 disables buffering"""
+        self.key.increment_usage()
+
+        self.key.refresh_from_db()
+        self.assertEqual(self.key.usage_count, 1)
+
+
 class KeyRotationScheduleModelTest(TestCase):
     """Test KeyRotationSchedule model functionality"""
 
@@ -745,8 +842,7 @@ class OpenAIUtilsIntegrationTest(TestCase):
     def setUp(self):
         """Create test data and reset OpenAI client"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
         self.admin_user = User.objects.create_user(
             username='admin',
@@ -758,8 +854,7 @@ class OpenAIUtilsIntegrationTest(TestCase):
     def tearDown(self):
         """Reset OpenAI client after tests"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
     @override_settings(OPENAI_API_KEY='sk-fallback-key')
     def test_get_api_key_from_pool_with_active_key(self):
@@ -826,7 +921,8 @@ class OpenAIUtilsIntegrationTest(TestCase):
         # Get client (should use key1)
         get_openai_client()
         self.assertEqual(mock_openai.call_count, 1)
-        mock_openai.assert_called_with(api_key='sk-key1')
+        mock_openai.assert_called_with(
+            api_key='sk-key1', http_client=ANY, max_retries=0)
 
         # Create second key and activate (simulating rotation)
         key2 = APIKeyPool.objects.create(
@@ -842,7 +938,8 @@ class OpenAIUtilsIntegrationTest(TestCase):
         # Get client again (should refresh with key2)
         get_openai_client()
         self.assertEqual(mock_openai.call_count, 2)
-        mock_openai.assert_called_with(api_key='sk-key2')
+        mock_openai.assert_called_with(
+            api_key='sk-key2', http_client=ANY, max_retries=0)
 
     @override_settings(OPENAI_API_KEY='sk-fallback')
     def test_get_current_api_key_info_from_pool(self):
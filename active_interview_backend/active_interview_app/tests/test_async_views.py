@@ -0,0 +1,461 @@
+"""
+Tests for the async (ASGI) versions of the AI-bound views.
+
+Covers:
+- Login and ownership checks for async views
+- Chat turns, streamed replies and key question feedback via AsyncOpenAI
+- Chat creation and invited interview start
+- Shared AsyncOpenAI client caching in openai_utils
+- LatencyTracker as an async context manager
+- Project middleware on the async request path
+"""
+import asyncio
+import json
+import uuid
+from datetime import timedelta
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase
+from django.utils import timezone
+
+from active_interview_app import async_views, openai_utils
+from active_interview_app.latency_utils import LatencyTracker
+from active_interview_app.middleware import (
+    AuditLogMiddleware, MetricsMiddleware, RateLimitMiddleware,
+    get_current_request
+)
+from active_interview_app.models import (
+    Chat, InterviewTemplate, InvitedInterview, UploadedJobListing
+)
+from active_interview_app.observability_models import (
+    InterviewResponseLatency, RequestMetric
+)
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+def _mock_async_client(*responses):
+    """Build a mock AsyncOpenAI client returning the given responses."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=list(responses))
+    return client
+
+
+async def _astream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _make_chunk(content=None, usage=None):
+    """Build a mock streaming chunk with optional content and usage."""
+    chunk = MagicMock()
+    if content is None:
+        chunk.choices = []
+    else:
+        choice = MagicMock()
+        choice.delta.content = content
+        chunk.choices = [choice]
+    chunk.usage = usage
+    chunk.model = 'gpt-4o'
+    return chunk
+
+
+class AsyncViewTestCase(TestCase):
+    """Shared fixtures for async view tests."""
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.user = User.objects.create_user(
+            username='asyncuser',
+            email='candidate@example.com',
+            password=TEST_PASSWORD
+        )
+        self.chat = Chat.objects.create(
+            owner=self.user,
+            title='Async Interview',
+            messages=[
+                {"role": "system", "content": "You are an interviewer."},
+                {"role": "assistant", "content": "Hello! Let's begin."}
+            ],
+            key_questions=[
+                {"id": 0, "title": "Intro", "duration": 60,
+                 "content": "Tell me about yourself."}
+            ]
+        )
+
+    def _request(self, method, path, data=None, user=None, **extra):
+        """Build an async request with a user, session and messages."""
+        request = getattr(self.factory, method)(path, data or {}, **extra)
+        request.user = user or self.user
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        return request
+
+    def _patch_ai(self, client):
+        """Patch the async client lookup and AI availability."""
+        patchers = [
+            patch('active_interview_app.async_views.aget_client_and_model',
+                  AsyncMock(return_value=(client, 'gpt-4o', {}))),
+            patch('active_interview_app.async_views.ai_available',
+                  return_value=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class AsyncLoginRequiredTest(AsyncViewTestCase):
+    """Test async_login_required and chat ownership checks."""
+
+    async def test_anonymous_user_redirected_to_login(self):
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'Hi'},
+            user=AnonymousUser())
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('next=', response.url)
+
+    async def test_other_users_chat_forbidden(self):
+        other = await sync_to_async(User.objects.create_user)(
+            username='other', password=TEST_PASSWORD)
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'Hi'}, user=other)
+
+        with self.assertRaises(PermissionDenied):
+            await async_views.chat_view(request, chat_id=self.chat.id)
+
+    async def test_missing_chat_not_found(self):
+        from django.http import Http404
+        request = self._request('post', '/chat/9999/', {'message': 'Hi'})
+
+        with self.assertRaises(Http404):
+            await async_views.chat_view(request, chat_id=9999)
+
+
+class AsyncChatViewTest(AsyncViewTestCase):
+    """Test the async chat turn endpoint."""
+
+    async def test_post_returns_reply_and_saves_it(self):
+        client = _mock_async_client(
+            create_mock_openai_response('Tell me about a project.'))
+        self._patch_ai(client)
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'I am a developer'})
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['message'],
+                         'Tell me about a project.')
+        await self.chat.arefresh_from_db()
+        transcript = await sync_to_async(lambda: self.chat.messages)()
+        self.assertEqual(transcript[-1],
+                         {"role": "assistant",
+                          "content": "Tell me about a project."})
+        self.assertEqual(
+            await InterviewResponseLatency.objects.filter(
+                chat=self.chat).acount(), 1)
+        self.assertEqual(
+            await TokenUsage.objects.filter(endpoint='chat_view').acount(), 1)
+
+    @patch('active_interview_app.async_views.ai_available',
+           return_value=False)
+    async def test_post_ai_unavailable(self, mock_ai):
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'Hi'})
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+
+        self.assertEqual(response.status_code, 503)
+
+    async def test_post_ai_error_returns_503(self):
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=Exception('upstream down'))
+        self._patch_ai(client)
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'Hi'})
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.content)['message'],
+                         'upstream down')
+
+    async def test_post_expired_invited_interview(self):
+        self.chat.interview_type = Chat.INVITED
+        self.chat.scheduled_end_at = timezone.now() - timedelta(minutes=1)
+        await self.chat.asave()
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/', {'message': 'Hi'})
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(json.loads(response.content)['time_expired'])
+
+    async def test_post_streams_deltas_then_done(self):
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=_astream([
+            _make_chunk('Tell me '),
+            _make_chunk('more.'),
+        ]))
+        self._patch_ai(client)
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/',
+            {'message': 'Hi', 'stream': '1'})
+
+        response = await async_views.chat_view(request, chat_id=self.chat.id)
+        body = ''.join([
+            chunk.decode() async for chunk in response.streaming_content])
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn('event: delta', body)
+        self.assertIn('"message": "Tell me more."', body)
+        record = await InterviewResponseLatency.objects.aget(chat=self.chat)
+        self.assertIsNotNone(record.time_to_first_token_ms)
+
+
+class AsyncKeyQuestionsViewTest(AsyncViewTestCase):
+    """Test the async key question feedback endpoint."""
+
+    async def test_post_returns_feedback(self):
+        listing = await UploadedJobListing.objects.acreate(
+            user=self.user, title='Listing', content='Python developer')
+        self.chat.job_listing = listing
+        await self.chat.asave()
+        client = _mock_async_client(create_mock_openai_response('7/10'))
+        self._patch_ai(client)
+        request = self._request(
+            'post', f'/chat/{self.chat.id}/key-questions/0/',
+            {'message': 'I build APIs'})
+
+        response = await async_views.key_questions_view(
+            request, chat_id=self.chat.id, question_id=0)
+
+        self.assertEqual(json.loads(response.content), {'message': '7/10'})
+        prompt = client.chat.completions.create.call_args.kwargs[
+            'messages'][0]['content']
+        self.assertIn('Python developer', prompt)
+        self.assertIn('I build APIs', prompt)
+
+
+class AsyncCreateChatTest(AsyncViewTestCase):
+    """Test async chat creation."""
+
+    async def test_post_creates_chat_with_greeting_and_key_questions(self):
+        listing = await UploadedJobListing.objects.acreate(
+            user=self.user, title='Listing', content='Django role')
+        client = _mock_async_client(
+            create_mock_openai_response('Welcome!'),
+            create_mock_openai_response(
+                '[{"id": 0, "title": "T", "duration": 60, "content": "Q?"}]'),
+        )
+        self._patch_ai(client)
+        request = self._request('post', '/chat/create/', {
+            'create': 'true',
+            'title': 'New Interview',
+            'type': Chat.GENERAL,
+            'difficulty': 5,
+            'listing_choice': listing.id,
+        })
+
+        response = await async_views.create_chat(request)
+
+        self.assertEqual(response.status_code, 302)
+        chat = await Chat.objects.filter(title='New Interview').afirst()
+        transcript = await sync_to_async(lambda: chat.messages)()
+        self.assertEqual(transcript[-1],
+                         {"role": "assistant", "content": "Welcome!"})
+        self.assertEqual(chat.key_questions[0]['content'], 'Q?')
+        self.assertEqual(client.chat.completions.create.await_count, 2)
+
+    async def test_post_without_create_redirects(self):
+        request = self._request('post', '/chat/create/', {})
+
+        response = await async_views.create_chat(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, '/chat/')
+
+
+class AsyncStartInvitedInterviewTest(AsyncViewTestCase):
+    """Test async invited interview start."""
+
+    def setUp(self):
+        super().setUp()
+        interviewer = User.objects.create_user(
+            username='interviewer', password=TEST_PASSWORD)
+        template = InterviewTemplate.objects.create(
+            user=interviewer,
+            name='Backend Interview',
+            description='Django position',
+            sections=[{
+                'id': str(uuid.uuid4()),
+                'title': 'Technical Skills',
+                'content': 'Python, Django',
+                'order': 0,
+                'weight': 100
+            }]
+        )
+        self.invitation = InvitedInterview.objects.create(
+            interviewer=interviewer,
+            candidate_email='candidate@example.com',
+            template=template,
+            scheduled_time=timezone.now() - timedelta(minutes=5),
+            duration_minutes=45,
+        )
+
+    async def test_start_creates_and_links_chat(self):
+        client = _mock_async_client(
+            create_mock_openai_response('Hello candidate!'),
+            create_mock_openai_response('["Q1?", "Q2?"]'),
+        )
+        self._patch_ai(client)
+        request = self._request(
+            'get', f'/interview/invited/{self.invitation.id}/start/')
+
+        response = await async_views.start_invited_interview(
+            request, invitation_id=self.invitation.id)
+
+        await self.invitation.arefresh_from_db()
+        chat = await Chat.objects.aget(id=self.invitation.chat_id)
+        self.assertEqual(response.url, f'/chat/{chat.id}/')
+        self.assertEqual(chat.interview_type, Chat.INVITED)
+        transcript = await sync_to_async(lambda: chat.messages)()
+        self.assertEqual(transcript[-1]['content'], 'Hello candidate!')
+        self.assertEqual(chat.key_questions, ["Q1?", "Q2?"])
+
+    async def test_wrong_candidate_redirected(self):
+        other = await sync_to_async(User.objects.create_user)(
+            username='other', email='other@example.com',
+            password=TEST_PASSWORD)
+        request = self._request(
+            'get', f'/interview/invited/{self.invitation.id}/start/',
+            user=other)
+
+        response = await async_views.start_invited_interview(
+            request, invitation_id=self.invitation.id)
+
+        self.assertEqual(response.url, '/')
+        self.assertFalse(
+            await Chat.objects.filter(interview_type=Chat.INVITED).aexists())
+
+
+class AsyncOpenAIClientTest(TestCase):
+    """Test the shared AsyncOpenAI client in openai_utils."""
+
+    def setUp(self):
+        openai_utils.reset_client_pools()
+
+    @patch('active_interview_app.openai_utils.get_api_key_from_pool',
+           return_value='test-key-123')
+    @patch('active_interview_app.openai_utils.AsyncOpenAI')
+    def test_client_reused_within_loop(self, mock_async_openai, mock_key):
+        async def fetch_twice():
+            first = await openai_utils.aget_openai_client()
+            second = await openai_utils.aget_openai_client()
+            return first, second
+
+        first, second = asyncio.run(fetch_twice())
+
+        self.assertIs(first, second)
+        mock_async_openai.assert_called_once_with(
+            api_key='test-key-123', http_client=ANY, max_retries=0)
+
+    @patch('active_interview_app.openai_utils.get_api_key_from_pool',
+           return_value='test-key-123')
+    @patch('active_interview_app.openai_utils.AsyncOpenAI')
+    def test_client_rebuilt_for_new_loop(self, mock_async_openai, mock_key):
+        asyncio.run(openai_utils.aget_openai_client())
+        asyncio.run(openai_utils.aget_openai_client())
+
+        self.assertEqual(mock_async_openai.call_count, 2)
+
+    @patch('active_interview_app.openai_utils.get_api_key_from_pool',
+           return_value='test-key-123')
+    @patch('active_interview_app.openai_utils.AsyncOpenAI')
+    def test_closed_loop_clients_dropped(self, mock_async_openai, mock_key):
+        asyncio.run(openai_utils.aget_openai_client())
+        asyncio.run(openai_utils.aget_openai_client())
+
+        # Only the live loop's client remains pooled
+        self.assertEqual(openai_utils.get_client_pool_stats()['async']['size'], 1)
+        self.assertEqual(len(openai_utils._async_http_clients), 1)
+
+    @patch('active_interview_app.openai_utils.get_api_key_from_pool',
+           side_effect=['key-one', 'key-two'])
+    @patch('active_interview_app.openai_utils.AsyncOpenAI')
+    def test_client_rebuilt_when_key_rotates(self, mock_async_openai, mock_key):
+        async def fetch_twice():
+            await openai_utils.aget_openai_client()
+            await openai_utils.aget_openai_client()
+
+        asyncio.run(fetch_twice())
+
+        self.assertEqual(mock_async_openai.call_count, 2)
+
+    @patch('active_interview_app.openai_utils.get_api_key_from_pool',
+           side_effect=ValueError('no key'))
+    def test_missing_key_raises_value_error(self, mock_key):
+        with self.assertRaises(ValueError):
+            asyncio.run(openai_utils.aget_openai_client())
+
+
+class AsyncLatencyTrackerTest(AsyncViewTestCase):
+    """Test LatencyTracker as an async context manager."""
+
+    async def test_async_context_records_latency(self):
+        async with LatencyTracker(self.chat, question_number=3) as tracker:
+            await asyncio.sleep(0)
+
+        self.assertIsNotNone(tracker.latency_record)
+        record = await InterviewResponseLatency.objects.aget(chat=self.chat)
+        self.assertEqual(record.question_number, 3)
+
+
+class AsyncMiddlewareTest(AsyncViewTestCase):
+    """Test the project middleware on the async request path."""
+
+    def test_async_only_with_async_handler(self):
+        async def async_response(request):
+            return HttpResponse()
+
+        for middleware in (AuditLogMiddleware, MetricsMiddleware,
+                           RateLimitMiddleware):
+            self.assertTrue(
+                iscoroutinefunction(middleware(async_response)), middleware)
+            self.assertFalse(iscoroutinefunction(
+                middleware(lambda request: HttpResponse())), middleware)
+
+    async def test_audit_request_visible_to_sync_code(self):
+        request = self._request('get', '/chat/')
+
+        async def get_response(request):
+            current = await sync_to_async(get_current_request)()
+            return HttpResponse(status=200 if current is request else 500)
+
+        response = await AuditLogMiddleware(get_response)(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(get_current_request())
+
+    async def test_metrics_count_async_queries(self):
+        async def get_response(request):
+            await Chat.objects.filter(owner=self.user).acount()
+            return HttpResponse()
+
+        await MetricsMiddleware(get_response)(self._request('get', '/chat/'))
+
+        metric = await RequestMetric.objects.aget(endpoint='/chat/')
+        self.assertEqual(metric.query_count, 1)
+        self.assertEqual(metric.user_id, self.user.id)
@@ -3,7 +3,7 @@ import json
 from django.contrib.auth.models import User
 from django.test import TestCase
 from django.urls import reverse
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 
 # from ..forms import CreateChatForm, EditChatForm
 from ..models import Chat, UploadedJobListing, UploadedResume
@@ -370,12 +370,12 @@ class TestOpenAIClient(TestCase):
     def setUp(self):
         # Reset the global client before each test
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     def tearDown(self):
         # Reset the global client after each test
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     @patch('active_interview_app.openai_utils.settings')
     @patch('active_interview_app.openai_utils.OpenAI')
@@ -393,7 +393,8 @@ class TestOpenAIClient(TestCase):
         client = get_openai_client()
 
         # Verify OpenAI was called with API key
-        mock_openai_class.assert_called_once_with(api_key="test-api-key")
+        mock_openai_class.assert_called_once_with(
+            api_key="test-api-key", http_client=ANY, max_retries=0)
         self.assertEqual(client, mock_client_instance)
 
     @patch('active_interview_app.openai_utils.settings')
@@ -413,7 +414,8 @@ class TestOpenAIClient(TestCase):
         client2 = get_openai_client()
 
         # Verify OpenAI was only called once (cached)
-        mock_openai_class.assert_called_once_with(api_key="test-api-key")
+        mock_openai_class.assert_called_once_with(
+            api_key="test-api-key", http_client=ANY, max_retries=0)
         self.assertEqual(client1, client2)
 
     @patch('active_interview_app.openai_utils.settings')
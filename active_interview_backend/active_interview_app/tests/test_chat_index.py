@@ -0,0 +1,162 @@
+"""
+Tests for the sidebar chat index.
+
+Covers:
+- get_sidebar_chats: projection, ordering, invitation review status
+- Per-user caching and invalidation by the Chat / InvitedInterview signals
+- Invalidation through the database-stored sidebar version
+- sidebar_chats context processor
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.db.models import F
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.chat_index import get_sidebar_chats
+from active_interview_app.context_processors import sidebar_chats
+from active_interview_app.models import (
+    Chat,
+    InterviewTemplate,
+    InvitedInterview,
+    UserProfile
+)
+from .test_credentials import TEST_PASSWORD
+
+
+class SidebarChatsTest(TestCase):
+    """Test the sidebar projection."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.older = Chat.objects.create(
+            owner=self.user, title='Older', key_questions=[{"id": 0}])
+        self.newer = Chat.objects.create(
+            owner=self.user, title='Newer', interview_type=Chat.INVITED)
+        Chat.objects.filter(id=self.older.id).update(
+            modified_date=timezone.now() - timedelta(days=1))
+        other = User.objects.create_user(
+            username='other', password=TEST_PASSWORD)
+        Chat.objects.create(owner=other, title='Not mine')
+
+    def _invite(self, chat, review_status):
+        interviewer = User.objects.create_user(
+            username='interviewer', password=TEST_PASSWORD)
+        template = InterviewTemplate.objects.create(
+            user=interviewer, name='Template')
+        return InvitedInterview.objects.create(
+            interviewer=interviewer,
+            candidate_email='candidate@example.com',
+            template=template,
+            scheduled_time=timezone.now(),
+            duration_minutes=60,
+            chat=chat,
+            interviewer_review_status=review_status
+        )
+
+    def test_only_sidebar_fields_loaded(self):
+        chats = get_sidebar_chats(self.user)
+
+        self.assertEqual([chat.title for chat in chats], ['Newer', 'Older'])
+        self.assertIn('key_questions', chats[1].get_deferred_fields())
+        self.assertIsNone(chats[1].review_status)
+
+    def test_review_status_annotated(self):
+        self._invite(self.newer, InvitedInterview.REVIEW_PENDING)
+
+        chats = get_sidebar_chats(self.user)
+
+        self.assertEqual(chats[0].review_status, 'pending')
+
+    @override_settings(SIDEBAR_CACHE_TTL=60)
+    def test_cached_per_user(self):
+        get_sidebar_chats(self.user)
+
+        # Only the version stamp is read on a hit
+        with self.assertNumQueries(1):
+            self.assertEqual(len(get_sidebar_chats(self.user)), 2)
+
+    @override_settings(SIDEBAR_CACHE_TTL=60)
+    def test_version_bump_invalidates_without_cache_delete(self):
+        get_sidebar_chats(self.user)
+        Chat.objects.filter(id=self.older.id).update(title='Renamed')
+
+        # Another worker's invalidation only reaches the database
+        UserProfile.objects.filter(user=self.user).update(
+            sidebar_version=F('sidebar_version') + 1)
+
+        titles = [chat.title for chat in get_sidebar_chats(self.user)]
+        self.assertIn('Renamed', titles)
+
+    @override_settings(SIDEBAR_CACHE_TTL=60)
+    def test_chat_save_invalidates(self):
+        get_sidebar_chats(self.user)
+
+        self.older.title = 'Renamed'
+        self.older.save()
+
+        self.assertEqual(get_sidebar_chats(self.user)[0].title, 'Renamed')
+
+    @override_settings(SIDEBAR_CACHE_TTL=60)
+    def test_chat_delete_invalidates(self):
+        get_sidebar_chats(self.user)
+
+        self.newer.delete()
+
+        self.assertEqual(len(get_sidebar_chats(self.user)), 1)
+
+    @override_settings(SIDEBAR_CACHE_TTL=60)
+    def test_invitation_save_invalidates(self):
+        invitation = self._invite(self.newer, InvitedInterview.REVIEW_PENDING)
+        get_sidebar_chats(self.user)
+
+        invitation.interviewer_review_status = (
+            InvitedInterview.REVIEW_COMPLETED)
+        invitation.save()
+
+        self.assertEqual(get_sidebar_chats(self.user)[0].review_status,
+                         InvitedInterview.REVIEW_COMPLETED)
+
+
+class SidebarContextProcessorTest(TestCase):
+    """Test the sidebar_chats context processor."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        Chat.objects.create(owner=self.user, title='Practice')
+        Chat.objects.create(
+            owner=self.user, title='Invited', interview_type=Chat.INVITED)
+
+    def test_split_by_interview_type(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        context = sidebar_chats(request)
+
+        self.assertEqual(len(context['owner_chats']), 2)
+        self.assertEqual(
+            [chat.title for chat in context['sidebar_practice_chats']],
+            ['Practice'])
+        self.assertEqual(
+            [chat.title for chat in context['sidebar_invited_chats']],
+            ['Invited'])
+
+    def test_anonymous_user_gets_nothing(self):
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+
+        self.assertEqual(sidebar_chats(request), {})
+
+    def test_sidebar_rendered_on_chat_list(self):
+        self.client.login(username='candidate', password=TEST_PASSWORD)
+
+        response = self.client.get(reverse('chat-list'))
+
+        self.assertContains(response, 'Practice Interviews')
+        self.assertContains(response, 'Invited Interviews')
@@ -0,0 +1,209 @@
+"""
+Tests for the ChatMessage transcript table.
+
+Covers:
+- Chat.messages compatibility: create, append, replace, edit in place
+- Only changed rows are written (append is a single INSERT)
+- Concurrent appends from two stale copies of a chat keep every turn
+- get_messages / message_count paging
+- Turn counters and the backfill_chat_counters command
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from active_interview_app.models import Chat, ChatMessage
+from .test_credentials import TEST_PASSWORD
+
+
+def _messages(count):
+    messages = [{"role": "system", "content": "You are an interviewer."}]
+    for i in range(1, count):
+        role = "assistant" if i % 2 else "user"
+        messages.append({"role": role, "content": f"Message {i}"})
+    return messages
+
+
+class ChatMessageTest(TestCase):
+    """Test storing the transcript as ChatMessage rows."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Interview', messages=_messages(3))
+
+    def _stored(self):
+        return list(ChatMessage.objects.filter(chat=self.chat)
+                    .values_list('seq', 'role', 'content'))
+
+    def test_create_stores_rows(self):
+        self.assertEqual(self._stored(), [
+            (0, 'system', 'You are an interviewer.'),
+            (1, 'assistant', 'Message 1'),
+            (2, 'user', 'Message 2'),
+        ])
+        self.assertGreater(ChatMessage.objects.first().token_count, 0)
+
+    def test_messages_load_lazily(self):
+        chat = Chat.objects.get(id=self.chat.id)
+
+        self.assertEqual(chat.messages, _messages(3))
+
+    def test_append_is_single_insert(self):
+        chat = Chat.objects.get(id=self.chat.id)
+        chat.messages.append({"role": "assistant", "content": "Message 3"})
+        chat.messages.append({"role": "user", "content": "Message 4"})
+
+        with CaptureQueriesContext(connection) as queries:
+            chat.save()
+
+        inserts = [q['sql'] for q in queries.captured_queries
+                   if 'INSERT INTO "active_interview_app_chatmessage"'
+                   in q['sql']]
+        self.assertEqual(len(inserts), 1)
+        self.assertFalse(any(
+            q['sql'].startswith(('DELETE', 'UPDATE "active_interview_app_chatmessage"'))
+            for q in queries.captured_queries))
+        self.assertEqual(len(self._stored()), 5)
+
+    def test_truncate(self):
+        chat = Chat.objects.get(id=self.chat.id)
+        chat.messages = chat.messages[:2]
+        chat.save()
+
+        self.assertEqual([seq for seq, _, _ in self._stored()], [0, 1])
+
+    def test_edit_in_place(self):
+        chat = Chat.objects.get(id=self.chat.id)
+        chat.messages[0]['content'] = 'Difficulty <<8>>'
+        chat.save()
+
+        self.assertEqual(self._stored()[0], (0, 'system', 'Difficulty <<8>>'))
+        self.assertEqual(len(self._stored()), 3)
+
+    def test_save_update_fields_skips_messages(self):
+        chat = Chat.objects.get(id=self.chat.id)
+        chat.messages.append({"role": "assistant", "content": "Unsaved"})
+        chat.is_finalized = True
+        chat.save(update_fields=['is_finalized'])
+
+        self.assertEqual(len(self._stored()), 3)
+
+    def test_concurrent_appends_keep_both_turns(self):
+        first = Chat.objects.get(id=self.chat.id)
+        second = Chat.objects.get(id=self.chat.id)
+        first.messages
+        second.messages
+
+        first.messages += [{"role": "assistant", "content": "From first"}]
+        first.save()
+        second.messages += [{"role": "assistant", "content": "From second"}]
+        second.save()
+
+        contents = [content for _, _, content in self._stored()]
+        self.assertEqual(contents[3:], ['From first', 'From second'])
+
+    def test_refresh_from_db_reloads(self):
+        ChatMessage.objects.create(
+            chat=self.chat, seq=3, role='assistant', content='Added')
+        self.assertEqual(len(self.chat.messages), 3)
+
+        self.chat.refresh_from_db()
+
+        self.assertEqual(len(self.chat.messages), 4)
+
+    def test_get_messages_pages_from_database(self):
+        chat = Chat.objects.get(id=self.chat.id)
+
+        self.assertEqual(chat.message_count(), 3)
+        self.assertEqual(chat.get_messages(1, 2),
+                         [{"role": "assistant", "content": "Message 1"}])
+        self.assertEqual(len(chat.get_messages(1)), 2)
+
+    def test_delete_chat_deletes_messages(self):
+        self.chat.delete()
+
+        self.assertFalse(ChatMessage.objects.exists())
+
+
+class ChatTurnCounterTest(TestCase):
+    """Test the transcript counters kept on Chat."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Interview', messages=_messages(4))
+
+    def _counters(self):
+        chat = Chat.objects.get(id=self.chat.id)
+        return tuple(
+            getattr(chat, field) for field in Chat.TURN_COUNTER_FIELDS)
+
+    def test_counters_set_on_create(self):
+        tokens = sum(row.token_count for row in ChatMessage.objects.all())
+
+        self.assertEqual(self._counters(), (1, 2, tokens, 3))
+        self.assertEqual(self.chat.user_turn_count, 1)
+
+    def test_append_updates_counters(self):
+        self.chat.messages.append({"role": "user", "content": "Answer"})
+        self.chat.save()
+
+        self.assertEqual(self._counters()[:2], (2, 2))
+        self.assertEqual(self.chat.user_turn_count, 2)
+
+    def test_truncate_updates_counters(self):
+        self.chat.messages = self.chat.messages[:2]
+        self.chat.save()
+
+        self.assertEqual(self._counters()[:2], (0, 1))
+        self.assertEqual(self._counters()[3], 1)
+
+    def test_concurrent_appends_both_counted(self):
+        first = Chat.objects.get(id=self.chat.id)
+        second = Chat.objects.get(id=self.chat.id)
+        first.messages
+        second.messages
+
+        first.messages.append({"role": "user", "content": "From first"})
+        first.save()
+        second.messages.append({"role": "user", "content": "From second"})
+        second.save()
+
+        self.assertEqual(self._counters()[0], 3)
+
+    def test_all_questions_answered_uses_counter(self):
+        self.chat.key_questions = [{"id": 0}, {"id": 1}]
+        self.assertFalse(self.chat.all_questions_answered())
+
+        self.chat.messages.append({"role": "user", "content": "Answer"})
+        self.chat.save()
+
+        self.assertTrue(self.chat.all_questions_answered())
+
+    def test_backfill_command(self):
+        Chat.objects.filter(id=self.chat.id).update(
+            user_turn_count=0, assistant_turn_count=0,
+            prompt_token_count=0, last_question_index=None)
+
+        out = StringIO()
+        call_command('backfill_chat_counters', stdout=out)
+
+        tokens = sum(row.token_count for row in ChatMessage.objects.all())
+        self.assertEqual(self._counters(), (1, 2, tokens, 3))
+        self.assertIn('1 of 1 chat(s) updated', out.getvalue())
+
+    def test_backfill_dry_run(self):
+        Chat.objects.filter(id=self.chat.id).update(user_turn_count=9)
+
+        out = StringIO()
+        call_command('backfill_chat_counters', '--dry-run', stdout=out)
+
+        self.assertEqual(self._counters()[0], 9)
+        self.assertIn('DRY RUN', out.getvalue())
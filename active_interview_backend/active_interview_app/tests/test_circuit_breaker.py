@@ -0,0 +1,250 @@
+"""
+Tests for the AI provider resilience layer.
+
+Covers:
+- CircuitBreaker: trip, refuse while open, half-open probe, re-open
+- create_completion: deadline, jittered retries, breaker accounting
+- get_client_and_model: failover to the next tier while a breaker is open
+- ChatView 503 with Retry-After, breaker metrics API
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from openai import APITimeoutError
+
+from active_interview_app import circuit_breaker, openai_utils
+from active_interview_app.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_breaker,
+    get_breaker_stats,
+    reset_breakers,
+)
+from active_interview_app.models import Chat
+from active_interview_app.openai_utils import (
+    create_completion,
+    get_client_and_model,
+    is_upstream_failure,
+)
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+def _timeout():
+    return APITimeoutError(request=httpx.Request(
+        'POST', 'https://api.openai.com/v1/chat/completions'))
+
+
+@override_settings(OPENAI_BREAKER_FAILURE_THRESHOLD=2,
+                   OPENAI_BREAKER_RESET_TIMEOUT=30)
+@patch.object(circuit_breaker.time, 'monotonic')
+class CircuitBreakerTest(SimpleTestCase):
+    """Test the breaker state machine."""
+
+    def _tripped(self, mock_time):
+        mock_time.return_value = 100
+        breaker = CircuitBreaker('premium:test')
+        breaker.record_failure(_timeout())
+        breaker.record_failure(_timeout())
+        return breaker
+
+    def test_trips_at_threshold(self, mock_time):
+        breaker = self._tripped(mock_time)
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.stats()['trips'], 1)
+        self.assertEqual(breaker.stats()['last_error'], 'APITimeoutError')
+        self.assertEqual(breaker.retry_after(), 30)
+
+    def test_success_resets_failures(self, mock_time):
+        breaker = CircuitBreaker('premium:test')
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_half_open_single_probe(self, mock_time):
+        breaker = self._tripped(mock_time)
+        mock_time.return_value = 131
+
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_failed_probe_reopens(self, mock_time):
+        breaker = self._tripped(mock_time)
+        mock_time.return_value = 131
+        breaker.allow_request()
+
+        breaker.record_failure(_timeout())
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.trips, 2)
+
+
+@override_settings(OPENAI_BREAKER_FAILURE_THRESHOLD=2)
+@patch.object(openai_utils.time, 'sleep')
+class CreateCompletionTest(SimpleTestCase):
+    """Test retries and breaker accounting around one completion."""
+
+    def setUp(self):
+        reset_breakers()
+        self.client = MagicMock()
+        self.breaker = get_breaker('premium', 'test-key')
+        openai_utils._client_breakers[self.client] = self.breaker
+
+    def test_retries_upstream_failure(self, mock_sleep):
+        response = create_mock_openai_response('80')
+        self.client.chat.completions.create.side_effect = [_timeout(), response]
+
+        self.assertIs(
+            create_completion(self.client, 'gpt-4o', [], 'report_scores'),
+            response)
+        self.assertEqual(self.client.chat.completions.create.call_count, 2)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+
+    def test_deadline_split_across_attempts(self, mock_sleep):
+        self.client.chat.completions.create.side_effect = [
+            _timeout(), create_mock_openai_response('80')]
+
+        create_completion(self.client, 'gpt-4o', [], 'report_scores')
+
+        timeouts = [call.kwargs['timeout'] for call in
+                    self.client.chat.completions.create.call_args_list]
+        self.assertLessEqual(timeouts[1], timeouts[0])
+        self.assertLessEqual(timeouts[0], 30)
+
+    def test_other_errors_not_retried(self, mock_sleep):
+        self.client.chat.completions.create.side_effect = ValueError('bad')
+
+        with self.assertRaises(ValueError):
+            create_completion(self.client, 'gpt-4o', [], 'report_scores')
+
+        self.assertEqual(self.client.chat.completions.create.call_count, 1)
+        self.assertEqual(self.breaker.failures, 0)
+
+    def test_stream_not_retried(self, mock_sleep):
+        self.client.chat.completions.create.side_effect = _timeout()
+
+        with self.assertRaises(APITimeoutError):
+            create_completion(self.client, 'gpt-4o', [], 'chat_view',
+                              stream=True)
+
+        self.assertEqual(self.client.chat.completions.create.call_count, 1)
+
+    def test_open_breaker_stops_retries(self, mock_sleep):
+        self.client.chat.completions.create.side_effect = _timeout()
+
+        with self.assertRaises(APITimeoutError):
+            create_completion(self.client, 'gpt-4o', [], 'report_scores')
+
+        # Threshold 2: the second failure trips the breaker
+        self.assertEqual(self.client.chat.completions.create.call_count, 2)
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_upstream_failure_classification(self, mock_sleep):
+        self.assertTrue(is_upstream_failure(_timeout()))
+        self.assertFalse(is_upstream_failure(ValueError('bad')))
+
+
+@patch('active_interview_app.openai_utils.get_openai_client')
+@patch('active_interview_app.openai_utils._resolve_tier',
+       return_value=('premium', 'gpt-4o', {'active_tier': 'premium'}))
+class FailoverTest(SimpleTestCase):
+    """Test tier failover in get_client_and_model."""
+
+    def setUp(self):
+        reset_breakers()
+        self.clients = {}
+        for tier in ('premium', 'standard', 'fallback'):
+            client = MagicMock(name=tier)
+            openai_utils._client_breakers[client] = get_breaker(tier, tier)
+            self.clients[tier] = client
+
+    def _open(self, tier):
+        breaker = get_breaker(tier, tier)
+        for _ in range(breaker.failure_threshold()):
+            breaker.record_failure(_timeout())
+
+    def _get_client(self, model_tier):
+        return self.clients[model_tier]
+
+    def test_closed_breaker_keeps_tier(self, mock_resolve, mock_client):
+        mock_client.side_effect = self._get_client
+
+        client, model, _ = get_client_and_model()
+
+        self.assertIs(client, self.clients['premium'])
+        self.assertEqual(model, 'gpt-4o')
+
+    def test_open_breaker_fails_over(self, mock_resolve, mock_client):
+        mock_client.side_effect = self._get_client
+        self._open('premium')
+
+        client, model, tier_info = get_client_and_model()
+
+        self.assertIs(client, self.clients['standard'])
+        self.assertEqual(model, 'gpt-4-turbo')
+        self.assertEqual(tier_info['failover_from'], 'premium')
+
+    def test_all_open(self, mock_resolve, mock_client):
+        mock_client.side_effect = self._get_client
+        for tier in self.clients:
+            self._open(tier)
+
+        with self.assertRaises(CircuitOpenError) as raised:
+            get_client_and_model()
+
+        self.assertGreater(raised.exception.retry_after, 0)
+
+    def test_forced_tier_does_not_fail_over(self, mock_resolve, mock_client):
+        mock_client.side_effect = self._get_client
+        self._open('premium')
+
+        with self.assertRaises(CircuitOpenError):
+            get_client_and_model(force_tier='premium')
+
+
+class CircuitOpenViewTest(TestCase):
+    """Test the responses and metrics when breakers are open."""
+
+    def setUp(self):
+        reset_breakers()
+        self.user = User.objects.create_user(
+            username='admin', password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username='admin', password=TEST_PASSWORD)
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model',
+           side_effect=CircuitOpenError('open', retry_after=12))
+    def test_chat_view_retry_after(self, mock_gcm, mock_ai):
+        chat = Chat.objects.create(owner=self.user, title='Interview')
+
+        response = self.client.post(
+            reverse('chat-view', args=[chat.id]), {'message': 'Hello'})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '12')
+
+    def test_breaker_metrics_api(self):
+        get_breaker('premium', 'abcdef123456').record_failure(_timeout())
+
+        response = self.client.get(reverse('api_metrics_breakers'))
+        data = json.loads(response.content)
+
+        self.assertEqual(data['metric'], 'circuit_breakers')
+        self.assertEqual(data['data'], get_breaker_stats())
+        self.assertEqual(data['data']['premium:abcdef12']['failures'], 1)
@@ -125,7 +125,7 @@ class ViewsCompleteCoverageTest(TestCase):
                 mock_openai.return_value = mock_client
 
                 # Reset the global client
-                openai_utils._openai_client = None
+                openai_utils.reset_client_pools()
 
                 client = get_openai_client()
                 self.assertIsNotNone(client)
@@ -137,7 +137,7 @@ class ViewsCompleteCoverageTest(TestCase):
 
         with patch('active_interview_app.openai_utils.settings') as mock_settings:
             mock_settings.OPENAI_API_KEY = None
-            openai_utils._openai_client = None
+            openai_utils.reset_client_pools()
 
             with self.assertRaises(ValueError) as context:
                 get_openai_client()
@@ -153,7 +153,7 @@ class ViewsCompleteCoverageTest(TestCase):
             mock_settings.OPENAI_API_KEY = 'test-key'
             with patch('active_interview_app.openai_utils.OpenAI') as mock_openai:
                 mock_openai.side_effect = Exception('API Error')
-                openai_utils._openai_client = None
+                openai_utils.reset_client_pools()
 
                 with self.assertRaises(ValueError) as context:
                     get_openai_client()
@@ -6,7 +6,7 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User, Group
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 import json
 
 from active_interview_app.models import (
@@ -18,12 +18,17 @@ from active_interview_app import views
 class ViewsHelperFunctionsTest(TestCase):
     """Test helper functions in views"""
 
+    def tearDown(self):
+        # Don't leave a client built by a mocked OpenAI in the pool
+        from active_interview_app import openai_utils
+        openai_utils.reset_client_pools()
+
     @patch('active_interview_app.openai_utils.settings.OPENAI_API_KEY', '')
     def test_ai_available_no_api_key(self):
         """Test ai_available returns False when no API key"""
         from active_interview_app import openai_utils
         # Reset the cached client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
         result = openai_utils.ai_available()
         self.assertFalse(result)
 
@@ -33,7 +38,7 @@ class ViewsHelperFunctionsTest(TestCase):
         """Test ai_available returns True with valid API key"""
         from active_interview_app import openai_utils
         # Reset the global client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         result = openai_utils.ai_available()
         self.assertTrue(result)
@@ -53,18 +58,19 @@ class ViewsHelperFunctionsTest(TestCase):
         """Test get_openai_client successful initialization"""
         from active_interview_app import openai_utils
         # Reset global client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         client = openai_utils.get_openai_client()
         self.assertIsNotNone(client)
-        mock_openai.assert_called_once_with(api_key='test-key')
+        mock_openai.assert_called_once_with(
+            api_key='test-key', http_client=ANY, max_retries=0)
 
     @patch('active_interview_app.openai_utils.settings.OPENAI_API_KEY', '')
     def test_get_openai_client_no_key(self):
         """Test get_openai_client raises error without API key"""
         from active_interview_app import openai_utils
         # Reset global client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         with self.assertRaises(ValueError) as context:
             openai_utils.get_openai_client()
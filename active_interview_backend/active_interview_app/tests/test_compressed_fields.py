@@ -0,0 +1,165 @@
+"""
+Tests for the compressed text and JSON model fields.
+
+Covers:
+- compress_text / decompress_text round trips and the raw fallback
+- Stored column contents for CompressedTextField / CompressedJSONField
+- Models and forms still see plain str / JSON values
+- benchmark_compressed_fields command
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from active_interview_app.fields import (
+    HEADER_RAW,
+    HEADER_ZLIB,
+    compress_text,
+    decompress_text,
+)
+from active_interview_app.forms import DocumentEditForm
+from active_interview_app.models import (
+    AuditLog,
+    Chat,
+    ExportableReport,
+    UploadedResume,
+)
+from .test_credentials import TEST_PASSWORD
+
+RESUME = "## Experience\n- Built Django services\n" * 100
+
+
+def _stored_bytes(table, column, pk):
+    """Read a column without going through the model field."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT "{column}" FROM "{table}" WHERE "id" = %s', [pk])
+        return bytes(cursor.fetchone()[0])
+
+
+class CompressTextTest(SimpleTestCase):
+    """Test the encoding helpers."""
+
+    def test_large_text_compressed(self):
+        data = compress_text(RESUME)
+
+        self.assertEqual(data[:1], HEADER_ZLIB)
+        self.assertLess(len(data), len(RESUME) // 10)
+        self.assertEqual(decompress_text(data), RESUME)
+
+    def test_short_text_stored_raw(self):
+        data = compress_text('Short answer')
+
+        self.assertEqual(data, HEADER_RAW + b'Short answer')
+        self.assertEqual(decompress_text(memoryview(data)), 'Short answer')
+
+    def test_legacy_and_empty_values(self):
+        self.assertEqual(decompress_text('plain text'), 'plain text')
+        self.assertEqual(decompress_text(b''), '')
+
+    def test_unknown_header(self):
+        with self.assertRaises(ValueError):
+            decompress_text(b'\x07data')
+
+
+class CompressedFieldModelTest(TestCase):
+    """Test the fields on the models that use them."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.resume = UploadedResume.objects.create(
+            user=self.user,
+            title='Resume',
+            content=RESUME,
+            file=SimpleUploadedFile('resume.pdf', b'%PDF')
+        )
+
+    def test_text_field_stored_compressed(self):
+        stored = _stored_bytes(
+            UploadedResume._meta.db_table, 'content', self.resume.id)
+
+        self.assertEqual(stored[:1], HEADER_ZLIB)
+        self.assertEqual(
+            UploadedResume.objects.get(id=self.resume.id).content, RESUME)
+        self.assertEqual(
+            list(UploadedResume.objects.values_list('content', flat=True)),
+            [RESUME])
+
+    def test_queryset_update(self):
+        UploadedResume.objects.filter(id=self.resume.id).update(
+            content='Updated')
+
+        self.assertEqual(
+            UploadedResume.objects.get(id=self.resume.id).content, 'Updated')
+
+    def test_chat_messages_round_trip(self):
+        messages = [
+            {"role": "system", "content": RESUME},
+            {"role": "assistant", "content": "Question 1"},
+        ]
+        chat = Chat.objects.create(
+            owner=self.user, title='Interview', messages=messages)
+
+        self.assertEqual(Chat.objects.get(id=chat.id).messages, messages)
+
+    def test_json_field_round_trip(self):
+        responses = [
+            {"question": "Tell me about Django", "answer": RESUME,
+             "score": 8, "feedback": "Good"},
+        ]
+        chat = Chat.objects.create(owner=self.user, title='Interview')
+        report = ExportableReport.objects.create(
+            chat=chat, question_responses=responses)
+
+        stored = _stored_bytes(ExportableReport._meta.db_table,
+                               'question_responses', report.id)
+        self.assertEqual(stored[:1], HEADER_ZLIB)
+        self.assertEqual(
+            ExportableReport.objects.get(id=report.id).question_responses,
+            responses)
+
+    def test_json_field_default(self):
+        log = AuditLog.objects.create(action_type=AuditLog.LOGIN)
+
+        self.assertEqual(AuditLog.objects.get(id=log.id).extra_data, {})
+
+    def test_loaded_json_not_shared(self):
+        chat = Chat.objects.create(owner=self.user, title='Interview')
+        report = ExportableReport.objects.create(
+            chat=chat, question_responses=[{"score": 1}])
+
+        first = ExportableReport.objects.get(id=report.id)
+        first.question_responses[0]['score'] = 99
+
+        second = ExportableReport.objects.get(id=report.id)
+        self.assertEqual(second.question_responses, [{"score": 1}])
+
+    def test_model_form_uses_text(self):
+        form = DocumentEditForm(instance=self.resume)
+
+        self.assertEqual(form.initial['content'], RESUME)
+        self.assertIn('<textarea', str(form['content']))
+
+
+class BenchmarkCompressedFieldsCommandTest(TestCase):
+    """Test the benchmark_compressed_fields command."""
+
+    def test_reports_each_field(self):
+        user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        UploadedResume.objects.create(
+            user=user, title='Resume', content=RESUME,
+            file=SimpleUploadedFile('resume.pdf', b'%PDF'))
+
+        out = StringIO()
+        call_command('benchmark_compressed_fields', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('UploadedResume.content', output)
+        self.assertIn('UploadedJobListing.content', output)
+        self.assertIn('(no rows)', output)
@@ -0,0 +1,265 @@
+"""
+Tests for concurrent greeting and key question generation.
+
+Covers:
+- run_completions_concurrently: ordering, real concurrency, partial failure
+- arun_completions_concurrently: async gather counterpart
+- CreateChat.post and start_invited_interview using the helper
+- Token usage recorded per call; partial failures still produce a chat
+"""
+import asyncio
+import threading
+import uuid
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.models import (
+    Chat, InterviewTemplate, InvitedInterview, UploadedJobListing
+)
+from active_interview_app.openai_utils import (
+    arun_completions_concurrently,
+    run_completions_concurrently
+)
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+KEY_QUESTIONS_JSON = (
+    '[{"id": 0, "title": "Intro", "duration": 60, "content": "Why us?"}]'
+)
+
+
+def _is_key_questions_request(messages):
+    # Both key question prompts ask for JSON; greeting prompts do not
+    return 'json' in messages[0]['content'].lower()
+
+
+def _mock_client(greeting=None, key_questions=None,
+                 greeting_error=None, key_questions_error=None):
+    """Mock client that answers by prompt, independent of call order."""
+    def create(model, messages, **kwargs):
+        if _is_key_questions_request(messages):
+            if key_questions_error:
+                raise key_questions_error
+            return create_mock_openai_response(key_questions)
+        if greeting_error:
+            raise greeting_error
+        return create_mock_openai_response(greeting)
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    return client
+
+
+class RunCompletionsConcurrentlyTest(TestCase):
+    """Test the thread pool helper in openai_utils."""
+
+    def test_results_in_input_order(self):
+        client = MagicMock()
+        client.chat.completions.create.side_effect = (
+            lambda model, messages, max_tokens:
+                create_mock_openai_response(messages[0]['content'].upper())
+        )
+
+        results = run_completions_concurrently(client, 'gpt-4o', [
+            [{"role": "user", "content": "first"}],
+            [{"role": "user", "content": "second"}],
+        ])
+
+        self.assertEqual(
+            [r.choices[0].message.content for r, _ in results],
+            ['FIRST', 'SECOND'])
+        self.assertTrue(all(error is None for _, error in results))
+
+    def test_calls_overlap(self):
+        """Both calls must be in flight at once to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create(model, messages, max_tokens):
+            barrier.wait()
+            return create_mock_openai_response('ok')
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+
+        results = run_completions_concurrently(client, 'gpt-4o', [[], []])
+
+        self.assertEqual([error for _, error in results], [None, None])
+
+    def test_partial_failure_keeps_other_result(self):
+        def create(model, messages, max_tokens):
+            if messages == ['fail']:
+                raise RuntimeError('timeout')
+            return create_mock_openai_response('ok')
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+
+        (ok, ok_error), (failed, error) = run_completions_concurrently(
+            client, 'gpt-4o', [['ok'], ['fail']])
+
+        self.assertEqual(ok.choices[0].message.content, 'ok')
+        self.assertIsNone(ok_error)
+        self.assertIsNone(failed)
+        self.assertIsInstance(error, RuntimeError)
+
+    def test_empty_request_list(self):
+        self.assertEqual(
+            run_completions_concurrently(MagicMock(), 'gpt-4o', []), [])
+
+    def test_async_gather_partial_failure(self):
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=[
+            create_mock_openai_response('hello'),
+            RuntimeError('boom'),
+        ])
+
+        results = asyncio.run(
+            arun_completions_concurrently(client, 'gpt-4o', [[], []]))
+
+        self.assertEqual(results[0][0].choices[0].message.content, 'hello')
+        self.assertIsNone(results[1][0])
+        self.assertIsInstance(results[1][1], RuntimeError)
+
+
+@patch('active_interview_app.views.ai_available', return_value=True)
+@patch('active_interview_app.views.get_client_and_model')
+class CreateChatConcurrentTest(TestCase):
+    """Test CreateChat.post with concurrent generation."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='creator', password=TEST_PASSWORD)
+        self.client.login(username='creator', password=TEST_PASSWORD)
+        self.listing = UploadedJobListing.objects.create(
+            user=self.user, title='Listing', content='Django developer')
+
+    def _post(self):
+        return self.client.post(reverse('chat-create'), {
+            'create': 'true',
+            'title': 'Concurrent Interview',
+            'type': Chat.GENERAL,
+            'difficulty': 5,
+            'listing_choice': self.listing.id,
+        })
+
+    def test_greeting_and_key_questions_saved(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client('Welcome!', KEY_QUESTIONS_JSON), 'gpt-4o', {})
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 302)
+        chat = Chat.objects.get(title='Concurrent Interview')
+        self.assertEqual(chat.messages[-1]['content'], 'Welcome!')
+        self.assertEqual(chat.key_questions[0]['content'], 'Why us?')
+        # One tier selection shared by both calls
+        mock_gcm.assert_called_once()
+
+    def test_usage_recorded_for_each_call(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client('Welcome!', KEY_QUESTIONS_JSON), 'gpt-4o', {})
+
+        self._post()
+
+        self.assertEqual(
+            set(TokenUsage.objects.values_list('endpoint', flat=True)),
+            {'create_chat', 'create_chat_timed_questions'})
+
+    def test_key_questions_failure_still_creates_chat(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client('Welcome!',
+                         key_questions_error=RuntimeError('timeout')),
+            'gpt-4o', {})
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 302)
+        chat = Chat.objects.get(title='Concurrent Interview')
+        self.assertEqual(chat.messages[-1]['content'], 'Welcome!')
+        self.assertEqual(chat.key_questions, [])
+
+    def test_greeting_failure_still_creates_chat(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client(key_questions=KEY_QUESTIONS_JSON,
+                         greeting_error=RuntimeError('timeout')),
+            'gpt-4o', {})
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 302)
+        chat = Chat.objects.get(title='Concurrent Interview')
+        self.assertEqual(chat.messages[-1], {"role": "assistant", "content": ""})
+        self.assertEqual(len(chat.key_questions), 1)
+        self.assertEqual(
+            list(TokenUsage.objects.values_list('endpoint', flat=True)),
+            ['create_chat_timed_questions'])
+
+
+@patch('active_interview_app.views.ai_available', return_value=True)
+@patch('active_interview_app.views.get_client_and_model')
+class StartInvitedInterviewConcurrentTest(TestCase):
+    """Test start_invited_interview with concurrent generation."""
+
+    def setUp(self):
+        interviewer = User.objects.create_user(
+            username='interviewer', password=TEST_PASSWORD)
+        User.objects.create_user(
+            username='candidate', email='candidate@example.com',
+            password=TEST_PASSWORD)
+        template = InterviewTemplate.objects.create(
+            user=interviewer,
+            name='Backend Interview',
+            sections=[
+                {'id': str(uuid.uuid4()), 'title': 'Python',
+                 'content': 'Django', 'order': 0, 'weight': 50},
+                {'id': str(uuid.uuid4()), 'title': 'SQL',
+                 'content': 'Queries', 'order': 1, 'weight': 50},
+            ]
+        )
+        self.invitation = InvitedInterview.objects.create(
+            interviewer=interviewer,
+            candidate_email='candidate@example.com',
+            template=template,
+            scheduled_time=timezone.now() - timedelta(minutes=5),
+            duration_minutes=45,
+        )
+        self.client.login(username='candidate', password=TEST_PASSWORD)
+        self.url = reverse('start_invited_interview',
+                           kwargs={'invitation_id': self.invitation.id})
+
+    def test_key_questions_failure_uses_placeholders(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client('Hello candidate!',
+                         key_questions_error=RuntimeError('timeout')),
+            'gpt-4o', {})
+
+        self.client.post(self.url)
+
+        self.invitation.refresh_from_db()
+        chat = self.invitation.chat
+        self.assertEqual(chat.messages[-1]['content'], 'Hello candidate!')
+        self.assertEqual(chat.key_questions, ['Question 1', 'Question 2'])
+
+    def test_greeting_failure_uses_fallback_greeting(self, mock_gcm, mock_ai):
+        mock_gcm.return_value = (
+            _mock_client(key_questions='["Q1?", "Q2?", "Q3?"]',
+                         greeting_error=RuntimeError('timeout')),
+            'gpt-4o', {})
+
+        self.client.post(self.url)
+
+        self.invitation.refresh_from_db()
+        chat = self.invitation.chat
+        self.assertIn("I'm your interviewer today",
+                      chat.messages[-1]['content'])
+        self.assertEqual(chat.key_questions, ["Q1?", "Q2?", "Q3?"])
+        self.assertEqual(
+            list(TokenUsage.objects.values_list('endpoint', flat=True)),
+            ['generate_key_questions'])
@@ -0,0 +1,217 @@
+"""
+Tests for interview context windowing and rolling summaries.
+
+Covers:
+- Per-tier context budgets in model_tier_manager
+- build_context_messages: passthrough, windowing, stale summaries
+- refresh_context_summary: incremental summaries, usage tracking
+- ChatView.post sending the windowed context
+"""
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from active_interview_app.context_utils import (
+    build_context_messages,
+    estimate_tokens,
+    refresh_context_summary
+)
+from active_interview_app.model_tier_manager import (
+    TIER_CONTEXT_BUDGET,
+    get_context_budget
+)
+from active_interview_app.models import Chat, ChatContextSummary
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+SMALL_BUDGET = {'max_context_tokens': 100, 'recent_turns': 2}
+
+
+def _long_messages(turns):
+    """System prompt plus ``turns`` user/assistant exchanges."""
+    messages = [{"role": "system", "content": "You are an interviewer."}]
+    for i in range(turns):
+        messages.append({"role": "assistant", "content": f"Question {i} " + "x" * 80})
+        messages.append({"role": "user", "content": f"Answer {i} " + "y" * 80})
+    return messages
+
+
+class ContextBudgetTest(TestCase):
+    """Test per-tier context budgets."""
+
+    def test_cheaper_tiers_get_smaller_budgets(self):
+        self.assertGreater(
+            get_context_budget('premium')['max_context_tokens'],
+            get_context_budget('fallback')['max_context_tokens'])
+
+    def test_unknown_tier_uses_premium_budget(self):
+        self.assertEqual(get_context_budget(None),
+                         TIER_CONTEXT_BUDGET['premium'])
+
+    def test_estimate_tokens(self):
+        self.assertEqual(
+            estimate_tokens([{"role": "user", "content": "x" * 400}]), 104)
+
+
+@patch('active_interview_app.context_utils.get_context_budget',
+       return_value=SMALL_BUDGET)
+class BuildContextMessagesTest(TestCase):
+    """Test build_context_messages."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='windowuser', password=TEST_PASSWORD)
+        self.messages = _long_messages(10)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Long Interview', messages=self.messages)
+
+    def test_short_chat_sent_unchanged(self, mock_budget):
+        messages = self.messages[:3]
+
+        self.assertIs(build_context_messages(self.chat, messages), messages)
+
+    def test_without_summary_sends_all_and_schedules_refresh(self, mock_budget):
+        with self.captureOnCommitCallbacks() as callbacks:
+            context = build_context_messages(self.chat, self.messages)
+
+        self.assertEqual(context, self.messages)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_with_summary_sends_system_summary_and_recent_turns(self, mock_budget):
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Candidate knows Django.',
+            summarized_through=17)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            context = build_context_messages(self.chat, self.messages)
+
+        self.assertEqual(context[0], self.messages[0])
+        self.assertEqual(context[1]['role'], 'system')
+        self.assertIn('Candidate knows Django.', context[1]['content'])
+        # Last two turns (four messages) verbatim
+        self.assertEqual(context[2:], self.messages[-4:])
+        self.assertEqual(callbacks, [])
+
+    def test_partly_stale_summary_keeps_unsummarized_turns(self, mock_budget):
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Early answers.', summarized_through=9)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            context = build_context_messages(self.chat, self.messages)
+
+        self.assertEqual(context[2:], self.messages[9:])
+        self.assertEqual(len(callbacks), 1)
+
+    def test_summary_past_end_of_messages_ignored(self, mock_budget):
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Old interview.', summarized_through=50)
+
+        with self.captureOnCommitCallbacks():
+            context = build_context_messages(self.chat, self.messages)
+
+        self.assertEqual(context, self.messages)
+
+
+@patch('active_interview_app.context_utils.get_client_and_model')
+class RefreshContextSummaryTest(TestCase):
+    """Test refresh_context_summary."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='summaryuser', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Long Interview',
+            messages=_long_messages(10))
+
+    def _mock_client(self, content):
+        client = MagicMock()
+        client.chat.completions.create.return_value = (
+            create_mock_openai_response(content))
+        return client
+
+    def test_creates_summary_with_fallback_tier(self, mock_gcm):
+        client = self._mock_client('Summary one.')
+        mock_gcm.return_value = (client, 'gpt-3.5-turbo', {})
+
+        summary = refresh_context_summary(self.chat.id, 5)
+
+        mock_gcm.assert_called_once_with(force_tier='fallback')
+        self.assertEqual(summary.summary, 'Summary one.')
+        self.assertEqual(summary.summarized_through, 5)
+        prompt = client.chat.completions.create.call_args.kwargs[
+            'messages'][0]['content']
+        self.assertIn('Question 0', prompt)
+        self.assertNotIn('You are an interviewer.', prompt)
+        self.assertEqual(
+            list(TokenUsage.objects.values_list('endpoint', flat=True)),
+            ['context_summary'])
+
+    def test_only_new_messages_sent_with_previous_summary(self, mock_gcm):
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Summary one.', summarized_through=5)
+        client = self._mock_client('Summary two.')
+        mock_gcm.return_value = (client, 'gpt-3.5-turbo', {})
+
+        summary = refresh_context_summary(self.chat.id, 9)
+
+        prompt = client.chat.completions.create.call_args.kwargs[
+            'messages'][0]['content']
+        self.assertIn('Summary one.', prompt)
+        self.assertIn('Question 2', prompt)
+        self.assertNotIn('Question 1 ', prompt)
+        self.assertEqual(summary.summarized_through, 9)
+
+    def test_up_to_date_summary_skips_call(self, mock_gcm):
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Summary.', summarized_through=9)
+
+        refresh_context_summary(self.chat.id, 9)
+
+        mock_gcm.assert_not_called()
+
+
+@patch('active_interview_app.context_utils.get_context_budget',
+       return_value=SMALL_BUDGET)
+@patch('active_interview_app.views.ai_available', return_value=True)
+@patch('active_interview_app.views.get_client_and_model')
+class ChatViewContextTest(TestCase):
+    """Test ChatView.post with context windowing."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='chatwindow', password=TEST_PASSWORD)
+        self.client.login(username='chatwindow', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Long Interview',
+            messages=_long_messages(10))
+        ChatContextSummary.objects.create(
+            chat=self.chat, summary='Earlier turns.', summarized_through=19)
+
+    def test_post_sends_windowed_context_and_saves_full_history(
+            self, mock_gcm, mock_ai, mock_budget):
+        client = MagicMock()
+        client.chat.completions.create.return_value = (
+            create_mock_openai_response('Next question?'))
+        mock_gcm.return_value = (client, 'gpt-4o', {'active_tier': 'premium'})
+
+        self.client.post(reverse('chat-view', kwargs={'chat_id': self.chat.id}),
+                         {'message': 'My answer'})
+
+        sent = client.chat.completions.create.call_args.kwargs['messages']
+        self.assertEqual(len(sent), 6)
+        self.assertIn('Earlier turns.', sent[1]['content'])
+        self.assertEqual(sent[-1], {"role": "user", "content": "My answer"})
+        self.chat.refresh_from_db()
+        self.assertEqual(len(self.chat.messages), 23)
+
+    def test_restart_discards_summary(self, mock_gcm, mock_ai, mock_budget):
+        self.client.post(
+            reverse('chat-restart', kwargs={'chat_id': self.chat.id}),
+            {'restart': 'true'})
+
+        self.assertFalse(
+            ChatContextSummary.objects.filter(chat=self.chat).exists())
@@ -163,7 +163,7 @@ class ViewsCriticalPathsTest(TransactionTestCase):
             # Test missing API key
             mock_settings.OPENAI_API_KEY = None
             import active_interview_app.openai_utils as openai_utils
-            openai_utils._openai_client = None
+            openai_utils.reset_client_pools()
             with self.assertRaises(ValueError):
                 get_openai_client()
 
@@ -172,7 +172,7 @@ class ViewsCriticalPathsTest(TransactionTestCase):
             with patch('active_interview_app.openai_utils.OpenAI') as mock_openai:
                 mock_openai.return_value = MagicMock()
                 import active_interview_app.openai_utils as openai_utils
-                openai_utils._openai_client = None
+                openai_utils.reset_client_pools()
                 client = get_openai_client()
                 self.assertIsNotNone(client)
 
@@ -181,7 +181,7 @@ class ViewsCriticalPathsTest(TransactionTestCase):
             with patch('active_interview_app.openai_utils.OpenAI') as mock_openai:
                 mock_openai.side_effect = Exception('Init failed')
                 import active_interview_app.openai_utils as openai_utils
-                openai_utils._openai_client = None
+                openai_utils.reset_client_pools()
                 with self.assertRaises(ValueError):
                     get_openai_client()
 
@@ -0,0 +1,155 @@
+"""
+Tests for the outgoing email outbox.
+
+Covers:
+- queue_email / queue_mail_admins: queued vs eager sending
+- send_pending_emails: one connection per batch, backoff, giving up
+- send_outbound_email management command
+"""
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from active_interview_app.email_outbox import (
+    queue_email,
+    queue_mail_admins,
+    send_pending_emails
+)
+from active_interview_app.models import OutboundEmail
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_OUTBOX_EAGER=False
+)
+class EmailOutboxTest(TestCase):
+    """Test queueing and draining the outbox."""
+
+    def test_queue_does_not_send(self):
+        email = queue_email('Hello', 'Body', ['a@example.com'])
+
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+        self.assertEqual(email.from_email, 'noreply@activeinterviewservice.app')
+
+    def test_drain_sends_html_and_attachments(self):
+        queue_email('Invite', 'Plain', ['a@example.com'],
+                    html_body='<p>Html</p>',
+                    attachments=[('interview.ics', b'BEGIN:VCALENDAR',
+                                  'text/calendar')])
+
+        sent, failed = send_pending_emails()
+
+        self.assertEqual((sent, failed), (1, 0))
+        message = mail.outbox[0]
+        self.assertEqual(message.to, ['a@example.com'])
+        self.assertEqual(message.alternatives[0], ('<p>Html</p>', 'text/html'))
+        self.assertEqual(message.attachments[0][0], 'interview.ics')
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.SENT)
+        self.assertIsNotNone(email.sent_at)
+
+    @patch('active_interview_app.email_outbox.get_connection')
+    def test_batch_reuses_one_connection(self, mock_get_connection):
+        connection = MagicMock()
+        connection.send_messages.return_value = 1
+        mock_get_connection.return_value = connection
+        for i in range(3):
+            queue_email(f'Msg {i}', 'Body', [f'user{i}@example.com'])
+
+        sent, _ = send_pending_emails()
+
+        self.assertEqual(sent, 3)
+        mock_get_connection.assert_called_once()
+        connection.open.assert_called_once()
+        connection.close.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 3)
+
+    @patch('active_interview_app.email_outbox.get_connection')
+    def test_send_failure_backs_off(self, mock_get_connection):
+        connection = MagicMock()
+        connection.send_messages.side_effect = Exception('SMTP error')
+        mock_get_connection.return_value = connection
+        queue_email('Hello', 'Body', ['a@example.com'])
+
+        sent, failed = send_pending_emails()
+
+        self.assertEqual((sent, failed), (0, 1))
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('SMTP error', email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+        # Not due again until the backoff has passed
+        self.assertEqual(send_pending_emails(), (0, 0))
+
+    @patch('active_interview_app.email_outbox.get_connection')
+    def test_connection_failure_backs_off_whole_batch(self, mock_get_connection):
+        connection = MagicMock()
+        connection.open.side_effect = OSError('Connection refused')
+        mock_get_connection.return_value = connection
+        queue_email('One', 'Body', ['a@example.com'])
+        queue_email('Two', 'Body', ['b@example.com'])
+
+        self.assertEqual(send_pending_emails(), (0, 2))
+        self.assertEqual(
+            OutboundEmail.objects.filter(attempts=1).count(), 2)
+        connection.send_messages.assert_not_called()
+
+    @patch('active_interview_app.email_outbox.get_connection')
+    def test_gives_up_after_max_attempts(self, mock_get_connection):
+        connection = MagicMock()
+        connection.send_messages.side_effect = Exception('Mailbox full')
+        mock_get_connection.return_value = connection
+        email = queue_email('Hello', 'Body', ['a@example.com'])
+        OutboundEmail.objects.filter(pk=email.pk).update(
+            attempts=4, max_attempts=5)
+
+        send_pending_emails()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.FAILED)
+        self.assertEqual(email.attempts, 5)
+
+    @override_settings(ADMINS=[('Ops', 'ops@example.com')],
+                       EMAIL_SUBJECT_PREFIX='[AIS] ')
+    def test_queue_mail_admins(self):
+        email = queue_mail_admins(subject='Alert', message='Too many 429s')
+
+        self.assertEqual(email.to, ['ops@example.com'])
+        self.assertEqual(email.subject, '[AIS] Alert')
+
+    @override_settings(ADMINS=[])
+    def test_queue_mail_admins_without_admins(self):
+        self.assertIsNone(queue_mail_admins(subject='Alert', message='x'))
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_command_once_drains_outbox(self):
+        queue_email('One', 'Body', ['a@example.com'])
+        queue_email('Two', 'Body', ['b@example.com'])
+
+        out = StringIO()
+        call_command('send_outbound_email', '--once', stdout=out)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn('Sent 2 email(s), 0 failed', out.getvalue())
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_OUTBOX_EAGER=True
+)
+class EagerEmailOutboxTest(TestCase):
+    """Test eager mode used by the test settings."""
+
+    def test_queue_sends_immediately(self):
+        queue_email('Hello', 'Body', ['a@example.com'])
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            OutboundEmail.objects.get().status, OutboundEmail.SENT)
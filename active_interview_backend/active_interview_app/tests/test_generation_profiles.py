@@ -0,0 +1,170 @@
+"""
+Tests for per call site generation profiles.
+
+Covers:
+- get_generation_profile: defaults, settings overrides, unknown keys
+- get_tier_for_profile / get_client_and_model(profile=...)
+- completion_kwargs: unset options dropped, MAX_TOKENS cap
+- run_completions_concurrently with profiles
+- Report fallback calls use their profiles and record token usage
+"""
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from active_interview_app.model_tier_manager import (
+    GENERATION_PROFILES,
+    get_generation_profile,
+    get_tier_for_profile,
+)
+from active_interview_app.models import Chat
+from active_interview_app.openai_utils import (
+    MAX_TOKENS,
+    completion_kwargs,
+    get_client_and_model,
+    run_completions_concurrently,
+)
+from active_interview_app.report_utils import _extract_scores_from_chat
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+class GenerationProfileTest(SimpleTestCase):
+    """Test profile lookup and settings overrides."""
+
+    def test_named_profile(self):
+        profile = get_generation_profile('report_scores')
+
+        self.assertEqual(profile['name'], 'report_scores')
+        self.assertEqual(profile['max_tokens'], 50)
+        self.assertEqual(profile['temperature'], 0)
+        self.assertEqual(profile['tier'], 'standard')
+
+    def test_unknown_name_uses_default(self):
+        profile = get_generation_profile('new_endpoint')
+
+        self.assertEqual(profile['max_tokens'],
+                         GENERATION_PROFILES['default']['max_tokens'])
+
+    @override_settings(OPENAI_GENERATION_PROFILES={
+        'chat_view': {'max_tokens': 2048}})
+    def test_settings_override(self):
+        profile = get_generation_profile('chat_view')
+
+        self.assertEqual(profile['max_tokens'], 2048)
+        self.assertEqual(profile['temperature'], 0.7)
+
+    @override_settings(OPENAI_GENERATION_PROFILES={
+        'chat_view': {'max_token': 2048}})
+    def test_unknown_override_key(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_generation_profile('chat_view')
+
+    def test_tier_for_profile(self):
+        self.assertEqual(get_tier_for_profile('premium', 'standard'),
+                         'standard')
+        self.assertEqual(get_tier_for_profile('fallback', 'standard'),
+                         'fallback')
+        self.assertEqual(get_tier_for_profile('premium', None), 'premium')
+
+
+class CompletionKwargsTest(SimpleTestCase):
+    """Test the create() arguments built from a profile."""
+
+    def test_unset_options_dropped(self):
+        self.assertEqual(completion_kwargs('default'),
+                         {'max_tokens': 2048, 'timeout': 60})
+
+    def test_json_profile(self):
+        kwargs = completion_kwargs('resume_parse')
+
+        self.assertEqual(kwargs['response_format'], {'type': 'json_object'})
+        self.assertEqual(kwargs['temperature'], 0.3)
+
+    def test_overrides(self):
+        kwargs = completion_kwargs('chat_view', stream=True, timeout=5)
+
+        self.assertTrue(kwargs['stream'])
+        self.assertEqual(kwargs['timeout'], 5)
+
+    @override_settings(OPENAI_GENERATION_PROFILES={
+        'chat_view': {'max_tokens': MAX_TOKENS * 2}})
+    def test_capped_at_max_tokens(self):
+        self.assertEqual(completion_kwargs('chat_view')['max_tokens'],
+                         MAX_TOKENS)
+
+    def test_concurrent_completions_use_profiles(self):
+        client = MagicMock()
+
+        run_completions_concurrently(
+            client, 'gpt-4o', [[], []],
+            profiles=['create_chat', 'create_chat_timed_questions'])
+
+        sent = sorted(call.kwargs['max_tokens']
+                      for call in client.chat.completions.create.call_args_list)
+        self.assertEqual(sent, [400, 2000])
+
+
+@patch('active_interview_app.openai_utils.get_openai_client')
+@patch('active_interview_app.openai_utils._resolve_tier')
+class ProfileTierTest(SimpleTestCase):
+    """Test the preferred tier of a profile in get_client_and_model."""
+
+    def _tier(self, mock_resolve, tier):
+        mock_resolve.return_value = (
+            tier, 'model-' + tier, {'active_tier': tier})
+
+    def test_cheaper_preferred_tier(self, mock_resolve, mock_client):
+        self._tier(mock_resolve, 'premium')
+
+        _, model, tier_info = get_client_and_model(profile='report_scores')
+
+        self.assertEqual(model, 'gpt-4-turbo')
+        self.assertEqual(tier_info['active_tier'], 'standard')
+        mock_client.assert_called_once_with(model_tier='standard')
+
+    def test_spending_tier_wins_when_cheaper(self, mock_resolve, mock_client):
+        self._tier(mock_resolve, 'fallback')
+
+        _, model, _ = get_client_and_model(profile='report_scores')
+
+        self.assertEqual(model, 'model-fallback')
+
+    def test_forced_tier_kept(self, mock_resolve, mock_client):
+        self._tier(mock_resolve, 'premium')
+
+        _, model, _ = get_client_and_model(
+            force_tier='premium', profile='report_scores')
+
+        self.assertEqual(model, 'model-premium')
+
+
+@patch('active_interview_app.report_utils.ai_available', return_value=True)
+@patch('active_interview_app.report_utils.get_client_and_model')
+class ReportProfileTest(TestCase):
+    """Test the per-section report calls."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Interview',
+            messages=[{"role": "system", "content": "Interviewer"}])
+
+    def test_scores_call(self, mock_gcm, mock_ai):
+        client = MagicMock()
+        client.chat.completions.create.return_value = \
+            create_mock_openai_response('80\n70\n90\n85')
+        mock_gcm.return_value = (client, 'gpt-4-turbo', {})
+
+        scores = _extract_scores_from_chat(self.chat)
+
+        self.assertEqual(scores['Overall'], 85)
+        mock_gcm.assert_called_once_with(profile='report_scores')
+        kwargs = client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs['max_tokens'], 50)
+        self.assertEqual(
+            TokenUsage.objects.get().endpoint, 'report_scores')
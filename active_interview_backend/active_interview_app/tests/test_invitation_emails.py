@@ -153,10 +153,10 @@ class InvitationEmailTests(TestCase):
         # Should mention duration
         self.assertIn('60', html_content)
 
-    @patch('active_interview_app.invitation_utils.EmailMultiAlternatives.send')
-    def test_send_invitation_email_handles_send_failure(self, mock_send):
-        """Test graceful handling of email send failure"""
-        mock_send.side_effect = Exception("SMTP error")
+    @patch('active_interview_app.invitation_utils.queue_email')
+    def test_send_invitation_email_handles_send_failure(self, mock_queue):
+        """Test graceful handling of email queueing failure"""
+        mock_queue.side_effect = Exception("Database error")
 
         result = send_invitation_email(self.invitation)
 
@@ -260,8 +260,9 @@ class CompletionNotificationEmailTests(TestCase):
         self.assertIn(str(self.invitation.id), html_content)
 
     def test_completion_notification_handles_failure(self):
-        """Test graceful handling of send failure"""
-        with patch('django.core.mail.send_mail', side_effect=Exception("SMTP error")):
+        """Test graceful handling of queueing failure"""
+        with patch('active_interview_app.invitation_utils.queue_email',
+                   side_effect=Exception("Database error")):
             result = send_completion_notification_email(self.invitation)
 
             # Should return False on failure
@@ -351,8 +352,9 @@ class ReviewNotificationEmailTests(TestCase):
         self.assertIn('Data Scientist', html_content)
 
     def test_review_notification_handles_failure(self):
-        """Test graceful handling of send failure"""
-        with patch('django.core.mail.send_mail', side_effect=Exception("SMTP error")):
+        """Test graceful handling of queueing failure"""
+        with patch('active_interview_app.invitation_utils.queue_email',
+                   side_effect=Exception("Database error")):
             result = send_review_notification_email(self.invitation)
 
             # Should return False on failure
@@ -0,0 +1,276 @@
+"""
+Tests for the database-backed job queue.
+
+Covers:
+- enqueue: eager and queued modes
+- claim_jobs: priority, backoff, lease expiry
+- run_job: success, retries, final failure hooks
+- run_workers management command
+- views that enqueue work (resume upload, data export, finalize)
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.job_queue import (
+    claim_jobs,
+    enqueue,
+    run_job,
+    task
+)
+from active_interview_app.models import (
+    Chat,
+    DataExportRequest,
+    Job,
+    UploadedResume
+)
+from .test_credentials import TEST_PASSWORD
+
+calls = []
+failures = []
+
+
+@task('test_record_call')
+def record_call(value):
+    calls.append(value)
+
+
+@task('test_always_fails',
+      on_failure=lambda error, **payload: failures.append((payload, error)))
+def always_fails(value):
+    raise RuntimeError(f"boom {value}")
+
+
+class JobQueueTestMixin:
+    def setUp(self):
+        super().setUp()
+        calls.clear()
+        failures.clear()
+
+    def _job(self, task_name='test_record_call', **fields):
+        fields.setdefault('payload', {'value': 1})
+        return Job.objects.create(task=task_name, **fields)
+
+
+class EnqueueTest(JobQueueTestMixin, TestCase):
+    """Test enqueue."""
+
+    def test_eager_mode_runs_inline(self):
+        job = enqueue('test_record_call', {'value': 'now'})
+
+        self.assertEqual(calls, ['now'])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(job.attempts, 1)
+
+    def test_eager_mode_does_not_retry(self):
+        job = enqueue('test_always_fails', {'value': 1}, max_attempts=3)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(len(failures), 1)
+
+    @override_settings(JOB_QUEUE_EAGER=False)
+    def test_queued_mode_leaves_job_pending(self):
+        job = enqueue('test_record_call', {'value': 'later'}, priority=5)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertEqual(job.priority, 5)
+
+    def test_unknown_task_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue('no_such_task')
+        self.assertFalse(Job.objects.exists())
+
+
+class ClaimJobsTest(JobQueueTestMixin, TestCase):
+    """Test claim_jobs."""
+
+    def test_claims_highest_priority_first(self):
+        low = self._job(priority=0)
+        high = self._job(priority=10)
+
+        claimed = claim_jobs('worker-1', limit=1)
+
+        self.assertEqual([job.pk for job in claimed], [high.pk])
+        high.refresh_from_db()
+        self.assertEqual(high.status, Job.RUNNING)
+        self.assertEqual(high.attempts, 1)
+        self.assertEqual(high.locked_by, 'worker-1')
+        self.assertIsNotNone(high.lease_expires_at)
+        low.refresh_from_db()
+        self.assertEqual(low.status, Job.PENDING)
+
+    def test_skips_jobs_in_backoff(self):
+        self._job(run_after=timezone.now() + timedelta(minutes=5))
+
+        self.assertEqual(claim_jobs('worker-1', limit=5), [])
+
+    def test_reclaims_expired_lease_only(self):
+        expired = self._job(
+            status=Job.RUNNING, attempts=1,
+            lease_expires_at=timezone.now() - timedelta(seconds=1))
+        self._job(
+            status=Job.RUNNING, attempts=1,
+            lease_expires_at=timezone.now() + timedelta(minutes=5))
+
+        claimed = claim_jobs('worker-2', limit=5)
+
+        self.assertEqual([job.pk for job in claimed], [expired.pk])
+        self.assertEqual(claimed[0].attempts, 2)
+
+
+class RunJobTest(JobQueueTestMixin, TestCase):
+    """Test run_job."""
+
+    def test_success(self):
+        self._job(payload={'value': 'ok'})
+        job = claim_jobs('worker-1')[0]
+
+        self.assertTrue(run_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(calls, ['ok'])
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertIsNone(job.lease_expires_at)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_failure_retries_with_backoff(self):
+        self._job('test_always_fails', max_attempts=3)
+        job = claim_jobs('worker-1')[0]
+
+        self.assertFalse(run_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn('boom 1', job.last_error)
+        self.assertEqual(failures, [])
+
+    def test_last_attempt_marks_failed_and_calls_hook(self):
+        self._job('test_always_fails', attempts=2, max_attempts=3)
+        job = claim_jobs('worker-1')[0]
+
+        run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertEqual(failures, [({'value': 1}, 'boom 1')])
+
+    def test_unknown_task_fails(self):
+        self._job('removed_task', max_attempts=1)
+        job = claim_jobs('worker-1')[0]
+
+        self.assertFalse(run_job(job))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+
+class RunWorkersCommandTest(JobQueueTestMixin, TransactionTestCase):
+    """Test the run_workers management command."""
+
+    def test_once_drains_runnable_jobs(self):
+        for value in range(3):
+            self._job(payload={'value': value})
+        self._job(run_after=timezone.now() + timedelta(hours=1))
+
+        out = StringIO()
+        call_command('run_workers', '--once', '--threads', '2',
+                     '--poll-interval', '0.01', stdout=out)
+
+        self.assertEqual(sorted(calls), [0, 1, 2])
+        self.assertEqual(
+            Job.objects.filter(status=Job.SUCCEEDED).count(), 3)
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 1)
+        self.assertIn('stopped after 3 job(s)', out.getvalue())
+
+
+@override_settings(JOB_QUEUE_EAGER=False)
+class EnqueueingViewsTest(TestCase):
+    """Test that heavy views enqueue work and return at once."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='jobuser', password=TEST_PASSWORD,
+            email='jobuser@example.com')
+        self.client.login(username='jobuser', password=TEST_PASSWORD)
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.resume_parser.parse_resume_with_ai')
+    @patch('filetype.guess')
+    @patch('pymupdf4llm.to_markdown', return_value='Jane Doe\nPython')
+    def test_resume_upload_queues_parsing(
+            self, mock_to_markdown, mock_guess, mock_parse, mock_ai):
+        mock_guess.return_value = MagicMock(extension='pdf')
+        file = SimpleUploadedFile(
+            "resume.pdf", b"%PDF-1.4 test", content_type="application/pdf")
+
+        response = self.client.post(
+            reverse('upload_file'), {'file': file, 'title': 'Queued'},
+            follow=True)
+
+        mock_parse.assert_not_called()
+        self.assertContains(response, 'Parsing will finish in a moment')
+        resume = UploadedResume.objects.get(title='Queued')
+        self.assertEqual(resume.parsing_status, 'pending')
+        job = Job.objects.get(task='parse_resume')
+        self.assertEqual(job.payload, {'resume_id': resume.id})
+
+    @patch('active_interview_app.user_data_utils.process_export_request')
+    def test_data_export_queues_processing(self, mock_process):
+        self.client.post(reverse('request_data_export'))
+
+        mock_process.assert_not_called()
+        export_request = DataExportRequest.objects.get(user=self.user)
+        self.assertEqual(export_request.status, DataExportRequest.PENDING)
+        job = Job.objects.get(task='process_data_export')
+        self.assertEqual(job.payload,
+                         {'export_request_id': export_request.id})
+
+    @patch('active_interview_app.report_utils.generate_and_save_report')
+    def test_finalize_queues_report(self, mock_generate):
+        chat = Chat.objects.create(owner=self.user, title='Finalize Me',
+                                   messages=[])
+
+        response = self.client.post(
+            reverse('finalize_interview', kwargs={'chat_id': chat.id}))
+
+        mock_generate.assert_not_called()
+        chat.refresh_from_db()
+        self.assertTrue(chat.is_finalized)
+        job = Job.objects.get(task='generate_interview_report')
+        self.assertEqual(job.payload,
+                         {'chat_id': chat.id, 'notify_interviewer': False})
+
+        # Report page waits for the job instead of asking to finalize again
+        response = self.client.get(response.url)
+        self.assertRedirects(
+            response, reverse('chat-view', kwargs={'chat_id': chat.id}),
+            fetch_redirect_response=False)
+
+
+class ResumeParseFailureTest(TestCase):
+    """Test the parse_resume task's final failure handling."""
+
+    @patch('active_interview_app.resume_parser.parse_resume_with_ai',
+           side_effect=ValueError('Invalid api key sk-123'))
+    def test_final_failure_marks_resume_error(self, mock_parse):
+        user = User.objects.create_user(
+            username='parsefail', password=TEST_PASSWORD)
+        resume = UploadedResume.objects.create(
+            user=user, content='Resume text', title='Broken')
+
+        enqueue('parse_resume', {'resume_id': resume.id})
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.parsing_status, 'error')
+        self.assertEqual(resume.parsing_error, 'OpenAI authentication error')
@@ -0,0 +1,109 @@
+"""
+Tests for mergeable latency sketches.
+
+Covers:
+- Quantiles within RELATIVE_ACCURACY of the exact values
+- Merging sketches equals sketching the combined values
+- to_dict / from_dict round trip, bounded bucket count
+- Migrating fixed-bucket rollup histograms to sketches
+"""
+import random
+import statistics
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from active_interview_app.latency_sketch import (
+    MAX_BINS,
+    RELATIVE_ACCURACY,
+    LatencySketch,
+)
+
+
+class LatencySketchTest(SimpleTestCase):
+    """Test quantile accuracy, merging and serialization."""
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(5, 1.5) for _ in range(20000)]
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = LatencySketch.from_values(self.values)
+        exact = statistics.quantiles(self.values, n=100, method='inclusive')
+
+        for q in (50, 90, 95, 99):
+            estimate = sketch.quantile(q / 100)
+            self.assertLessEqual(
+                abs(estimate - exact[q - 1]) / exact[q - 1],
+                RELATIVE_ACCURACY)
+
+    def test_interpolates_between_ranks(self):
+        sketch = LatencySketch.from_values([50.0] * 50 + [100.0] * 50)
+
+        self.assertAlmostEqual(sketch.quantile(0.5), 75.0, delta=1.0)
+        self.assertAlmostEqual(sketch.quantile(0.0), 50.0, delta=0.5)
+        self.assertAlmostEqual(sketch.quantile(1.0), 100.0, delta=1.0)
+
+    def test_merge_matches_single_sketch(self):
+        merged = LatencySketch.from_values(self.values[:7000])
+        merged.merge(LatencySketch.from_values(self.values[7000:]))
+
+        self.assertEqual(
+            merged.quantiles([0.5, 0.99]),
+            LatencySketch.from_values(self.values).quantiles([0.5, 0.99]))
+        self.assertEqual(merged.count, len(self.values))
+
+    def test_round_trip(self):
+        sketch = LatencySketch.from_values(self.values + [0.0])
+
+        restored = LatencySketch.from_dict(sketch.to_dict())
+
+        self.assertEqual(restored.summary(), sketch.summary())
+        self.assertEqual(restored.zero_count, 1)
+
+    def test_memory_independent_of_volume(self):
+        sketch = LatencySketch.from_values(self.values)
+        for value in self.values:
+            sketch.add(value)
+
+        self.assertLessEqual(len(sketch.bins), 1000)
+
+    def test_bins_bounded(self):
+        sketch = LatencySketch()
+        for exponent in range(2 * MAX_BINS):
+            sketch.add(1.03 ** exponent)
+
+        self.assertEqual(len(sketch.bins), MAX_BINS)
+        self.assertEqual(sketch.count, 2 * MAX_BINS)
+        # Folding only touches the lowest buckets
+        self.assertLessEqual(
+            abs(sketch.quantile(0.99) / 1.03 ** (0.99 * (2 * MAX_BINS - 1))
+                - 1), 0.03)
+
+    def test_empty(self):
+        sketch = LatencySketch.from_dict({})
+
+        self.assertEqual(sketch.to_dict(), {})
+        self.assertEqual(sketch.summary()['p99'], 0.0)
+
+
+class LegacyHistogramMigrationTest(SimpleTestCase):
+    """Test converting fixed-bucket histograms (migration 0034)."""
+
+    def test_legacy_to_sketch(self):
+        migration = import_module(
+            'active_interview_app.migrations.0034_requestmetricrollup_sketch')
+        histogram = [0] * (len(migration.LEGACY_BOUNDS) + 1)
+        histogram[5] = 3  # (75, 100]
+        histogram[-1] = 1  # > 60000
+        row = SimpleNamespace(
+            sum_ms=70262.5, max_ms=70000.0, histogram=histogram)
+
+        sketch = LatencySketch.from_dict(migration._legacy_to_sketch(row))
+
+        self.assertEqual(sketch.count, 4)
+        self.assertEqual(sketch.max, 70000.0)
+        self.assertAlmostEqual(sketch.quantile(0.5), 87.5, delta=1.0)
+        self.assertEqual(migration._sketch_to_legacy(
+            SimpleNamespace(histogram=sketch.to_dict())), histogram)
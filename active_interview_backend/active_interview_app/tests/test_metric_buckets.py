@@ -0,0 +1,210 @@
+"""
+Tests for time-bucketed metric aggregation.
+
+Covers:
+- BucketIndex / BucketWindow bucket assignment, including boundaries
+- request_counts / latency_buckets / iter_bucket_stats
+- Metric APIs use the same number of queries for every time range
+- Streaming CSV export: bucket sizing, single pass, daily costs
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.metric_buckets import (
+    BucketWindow,
+    iter_bucket_stats,
+    latency_buckets,
+    request_counts,
+)
+from active_interview_app.observability_models import (
+    ProviderCostDaily,
+    RequestMetric,
+)
+from .test_credentials import TEST_PASSWORD
+
+
+def _metric(timestamp, status_code=200, response_time_ms=100.0,
+            endpoint='/api/test/'):
+    return RequestMetric.objects.create(
+        timestamp=timestamp, endpoint=endpoint, method='GET',
+        status_code=status_code, response_time_ms=response_time_ms)
+
+
+class BucketWindowTest(TestCase):
+    """Test bucket assignment in SQL."""
+
+    def setUp(self):
+        self.end = timezone.now().replace(microsecond=0)
+        self.window = BucketWindow(
+            self.end - timedelta(hours=1), self.end, bucket_minutes=5)
+
+    def test_bucket_starts(self):
+        starts = self.window.bucket_starts()
+
+        self.assertEqual(len(starts), 12)
+        self.assertEqual(starts[0], self.window.start)
+        self.assertEqual(starts[1] - starts[0], timedelta(minutes=5))
+
+    def test_for_time_range(self):
+        window = BucketWindow.for_time_range('30d', end_time=self.end)
+
+        self.assertEqual(window.count, 120)
+        self.assertEqual(BucketWindow.for_time_range(
+            'bogus', end_time=self.end).bucket_minutes, 5)
+
+    def test_request_counts(self):
+        start = self.window.start
+        _metric(start)
+        _metric(start + timedelta(minutes=4, seconds=59), status_code=500)
+        _metric(start + timedelta(minutes=5))
+        _metric(start + timedelta(minutes=59), status_code=404)
+        _metric(start - timedelta(seconds=1))
+
+        with self.assertNumQueries(1):
+            counts = request_counts(self.window, RequestMetric.objects.all())
+
+        self.assertEqual(counts[0], (2, 1))
+        self.assertEqual(counts[1], (1, 0))
+        self.assertEqual(counts[11], (1, 1))
+        self.assertEqual(sum(total for total, _ in counts), 4)
+
+    def test_latency_buckets(self):
+        start = self.window.start
+        for offset, latency in ((1, 300.0), (2, 100.0), (3, 200.0),
+                                (7, 50.0)):
+            _metric(start + timedelta(minutes=offset),
+                    response_time_ms=latency)
+
+        with self.assertNumQueries(1):
+            buckets = latency_buckets(
+                self.window, RequestMetric.objects.all())
+
+        self.assertEqual(buckets[0].count, 3)
+        self.assertEqual((buckets[0].min, buckets[0].max), (100.0, 300.0))
+        self.assertAlmostEqual(buckets[0].quantile(0.5), 200.0, delta=2.0)
+        self.assertEqual(buckets[1].summary()['max'], 50.0)
+        self.assertEqual(buckets[2].count, 0)
+
+    def test_for_export_bucket_sizes(self):
+        sizes = {time_range: BucketWindow.for_export(
+            time_range, end_time=self.end).bucket_minutes
+            for time_range in ('1h', '24h', '7d', '30d')}
+
+        self.assertEqual(sizes, {'1h': 5, '24h': 5, '7d': 5, '30d': 60})
+
+    def test_iter_bucket_stats(self):
+        start = self.window.start
+        _metric(start + timedelta(minutes=1), response_time_ms=300.0)
+        _metric(start + timedelta(minutes=2), status_code=503,
+                response_time_ms=100.0)
+        _metric(start + timedelta(minutes=12), response_time_ms=50.0)
+
+        with self.assertNumQueries(1):
+            stats = list(iter_bucket_stats(
+                self.window, RequestMetric.objects.all()))
+
+        self.assertEqual(len(stats), 12)
+        self.assertEqual(stats[0][:3], (start, 2, 1))
+        self.assertEqual(stats[0][3].mean, 200.0)
+        self.assertEqual(stats[1][1:3], (0, 0))
+        self.assertEqual(stats[1][3].count, 0)
+        self.assertEqual(stats[2][3].max, 50.0)
+
+
+class MetricAPIQueryCountTest(TestCase):
+    """Test that the metric APIs do not query per bucket."""
+
+    def setUp(self):
+        User.objects.create_user(
+            username='admin', password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username='admin', password=TEST_PASSWORD)
+        now = timezone.now()
+        _metric(now - timedelta(seconds=30), status_code=500,
+                response_time_ms=250.0)
+        _metric(now - timedelta(seconds=40), response_time_ms=150.0)
+
+    def _get(self, name, time_range, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse(name), {'time_range': time_range, **params})
+        return json.loads(response.content), len(queries)
+
+    def test_query_count_independent_of_range(self):
+        for name in ('api_metrics_rps', 'api_metrics_latency',
+                     'api_metrics_errors'):
+            _, short = self._get(name, '1h')
+            _, long = self._get(name, '30d')
+
+            self.assertEqual(short, long, name)
+
+    def test_latest_bucket_values(self):
+        # The API requests themselves are recorded too, so filter to the
+        # seeded endpoint
+        errors, _ = self._get('api_metrics_errors', '1h',
+                              endpoint='/api/test/')
+        latency, _ = self._get('api_metrics_latency', '1h',
+                               endpoint='/api/test/')
+
+        self.assertEqual(len(errors['data']), 60)
+        self.assertEqual(errors['data'][-1]['total_requests'], 2)
+        self.assertEqual(errors['data'][-1]['error_rate'], 50.0)
+        self.assertEqual(latency['data'][-1]['mean'], 200.0)
+
+
+class ExportMetricsStreamTest(TestCase):
+    """Test the streaming CSV export."""
+
+    def setUp(self):
+        User.objects.create_user(
+            username='admin', password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username='admin', password=TEST_PASSWORD)
+        self.now = timezone.now()
+        for minutes in (2, 3, 60 * 24 * 20):
+            _metric(self.now - timedelta(minutes=minutes),
+                    status_code=500 if minutes == 2 else 200)
+
+    def _export(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('api_export_metrics'), params)
+            content = b''.join(response.streaming_content).decode('utf-8')
+        return list(csv.reader(io.StringIO(content))), len(queries)
+
+    def test_single_pass_for_long_range(self):
+        _, short = self._export(time_range='1h')
+        rows, long = self._export(time_range='30d')
+
+        self.assertEqual(short, long)
+        self.assertEqual(len(rows), 1 + 30 * 24)
+
+    def test_bucket_values(self):
+        rows, _ = self._export(time_range='1h')
+
+        header, data = rows[0], rows[1:]
+        self.assertEqual(header, ['timestamp', 'rps', 'p50_latency',
+                                  'p95_latency', 'error_rate',
+                                  'error_count'])
+        self.assertEqual(sum(int(row[5]) for row in data), 1)
+        self.assertIn('50.0', [row[4] for row in data])
+
+    def test_daily_costs(self):
+        for service, cost in (('gpt-4o', '1.00'), ('gpt-4o-mini', '0.25')):
+            ProviderCostDaily.objects.create(
+                date=self.now.date(), provider='openai', service=service,
+                total_cost_usd=Decimal(cost))
+
+        rows, _ = self._export(time_range='1h', metrics='costs')
+
+        self.assertEqual(rows[0], ['timestamp', 'total_cost'])
+        for timestamp, cost in rows[1:]:
+            today = datetime.fromisoformat(timestamp).date() == self.now.date()
+            self.assertEqual(cost, '1.25' if today else '0.0')
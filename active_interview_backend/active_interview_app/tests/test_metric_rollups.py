@@ -0,0 +1,206 @@
+"""
+Tests for minute-level request metric rollups.
+
+Covers:
+- record_samples: grouping and merging into stored rows
+- MetricsMiddleware keeps rollups up to date
+- compact_rollups: minute -> hour -> day folding, idempotence
+- Observability APIs read rollups for ranges longer than an hour
+- aggregate_daily_metrics / cleanup_old_metrics with rollups
+"""
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.metric_rollups import (
+    compact_rollups,
+    record_samples,
+    truncate,
+)
+from active_interview_app.middleware import MetricsMiddleware
+from active_interview_app.observability_models import (
+    DailyMetricsSummary,
+    RequestMetricRollup,
+)
+from .test_credentials import TEST_PASSWORD
+
+MINUTE = RequestMetricRollup.MINUTE
+HOUR = RequestMetricRollup.HOUR
+DAY = RequestMetricRollup.DAY
+
+
+class RecordSamplesTest(TestCase):
+    """Test merging requests into minute rollups."""
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def test_groups_by_minute_endpoint_method(self):
+        minute = truncate(self.now, MINUTE)
+        written = record_samples([
+            (minute, '/a/', 'GET', 200, 100.0),
+            (minute + timedelta(seconds=30), '/a/', 'GET', 404, 300.0),
+            (minute, '/a/', 'POST', 500, 50.0),
+        ])
+
+        self.assertEqual(written, 2)
+        rollup = RequestMetricRollup.objects.get(endpoint='/a/', method='GET')
+        self.assertEqual(rollup.minute, minute)
+        self.assertEqual(rollup.resolution, MINUTE)
+        self.assertEqual((rollup.count, rollup.error_4xx, rollup.error_5xx),
+                         (2, 1, 0))
+        self.assertEqual(rollup.mean_ms, 200.0)
+        self.assertEqual(rollup.max_ms, 300.0)
+        self.assertEqual(rollup.sketch.count, 2)
+        self.assertEqual(rollup.histogram['hi'], 300.0)
+
+    def test_merges_into_stored_row(self):
+        record_samples([(self.now, '/a/', 'GET', 200, 100.0)])
+        record_samples([(self.now, '/a/', 'GET', 503, 400.0)])
+
+        rollup = RequestMetricRollup.objects.get()
+        self.assertEqual(rollup.count, 2)
+        self.assertEqual(rollup.error_5xx, 1)
+        self.assertEqual(rollup.sum_ms, 500.0)
+        self.assertAlmostEqual(rollup.sketch.quantile(1.0), 400.0, delta=4.0)
+
+    def test_middleware_records_rollup(self):
+        middleware = MetricsMiddleware(lambda request: HttpResponse('OK'))
+        request = RequestFactory().get('/api/rollup/')
+        request.user = AnonymousUser()
+
+        middleware(request)
+        middleware(request)
+
+        self.assertEqual(
+            RequestMetricRollup.objects.get(endpoint='/api/rollup/').count, 2)
+
+
+class CompactRollupsTest(TestCase):
+    """Test folding aged rollups."""
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def _minutes(self, start, count, endpoint='/a/'):
+        record_samples(
+            (start + timedelta(minutes=offset), endpoint, 'GET', 200, 100.0)
+            for offset in range(count)
+        )
+
+    def test_minutes_fold_into_hour(self):
+        hour = truncate(self.now - timedelta(days=10), HOUR)
+        self._minutes(hour, 30)
+        self._minutes(truncate(self.now, MINUTE), 1)
+
+        folded = compact_rollups(now=self.now)
+
+        self.assertEqual(folded[HOUR], 30)
+        rollup = RequestMetricRollup.objects.get(resolution=HOUR)
+        self.assertEqual(rollup.minute, hour)
+        self.assertEqual(rollup.count, 30)
+        self.assertEqual(rollup.sketch.count, 30)
+        self.assertEqual(
+            RequestMetricRollup.objects.filter(resolution=MINUTE).count(), 1)
+
+    def test_hours_fold_into_day(self):
+        day = truncate(self.now - timedelta(days=40), DAY)
+        for hour in (1, 5):
+            self._minutes(day + timedelta(hours=hour), 2)
+
+        compact_rollups(now=self.now)
+
+        rollup = RequestMetricRollup.objects.get()
+        self.assertEqual((rollup.resolution, rollup.minute, rollup.count),
+                         (DAY, day, 4))
+
+    def test_idempotent(self):
+        self._minutes(truncate(self.now - timedelta(days=10), HOUR), 3)
+
+        compact_rollups(now=self.now)
+        folded = compact_rollups(now=self.now)
+
+        self.assertEqual(folded, {HOUR: 0, DAY: 0})
+        self.assertEqual(RequestMetricRollup.objects.get().count, 3)
+
+
+class RollupAPITest(TestCase):
+    """Test that long dashboard ranges read rollups."""
+
+    def setUp(self):
+        User.objects.create_user(
+            username='admin', password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username='admin', password=TEST_PASSWORD)
+        now = timezone.now()
+        record_samples([
+            (now - timedelta(hours=3), '/a/', 'GET', 200, 100.0),
+            (now - timedelta(hours=3), '/a/', 'GET', 500, 300.0),
+            (now - timedelta(hours=3), '/b/', 'GET', 200, 100.0),
+        ])
+
+    def _data(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        return json.loads(response.content)['data']
+
+    def test_errors_from_rollups(self):
+        data = self._data('api_metrics_errors', time_range='24h',
+                          endpoint='/a/')
+
+        self.assertEqual(sum(point['total_requests'] for point in data), 2)
+        self.assertIn(50.0, [point['error_rate'] for point in data])
+
+    def test_latency_from_rollups(self):
+        data = self._data('api_metrics_latency', time_range='7d')
+
+        means = [point['mean'] for point in data if point['mean']]
+        self.assertEqual(len(means), 1)
+        self.assertAlmostEqual(means[0], 500.0 / 3, places=2)
+
+    def test_one_hour_reads_raw_rows(self):
+        data = self._data('api_metrics_rps', time_range='1h')
+
+        self.assertFalse(any(point['value'] for point in data))
+
+
+class RollupCommandsTest(TestCase):
+    """Test the daily aggregation and cleanup commands with rollups."""
+
+    def setUp(self):
+        self.yesterday = timezone.now() - timedelta(days=1)
+
+    def test_aggregate_daily_from_rollups(self):
+        record_samples([
+            (self.yesterday, '/a/', 'GET', 200, 100.0),
+            (self.yesterday, '/a/', 'GET', 404, 100.0),
+            (self.yesterday, '/b/', 'POST', 502, 400.0),
+        ])
+
+        call_command('aggregate_daily_metrics',
+                     '--date', self.yesterday.strftime('%Y-%m-%d'),
+                     stdout=StringIO())
+
+        summary = DailyMetricsSummary.objects.get(date=self.yesterday.date())
+        self.assertEqual(summary.total_requests, 3)
+        self.assertEqual((summary.client_errors, summary.server_errors),
+                         (1, 1))
+        self.assertEqual(summary.avg_response_time, 200.0)
+        self.assertEqual(summary.max_response_time, 400.0)
+        self.assertEqual(summary.endpoint_stats['/b/']['errors'], 1)
+
+    def test_cleanup_keeps_rollups_longer(self):
+        now = timezone.now()
+        record_samples([
+            (now - timedelta(days=40), '/a/', 'GET', 200, 100.0),
+            (now - timedelta(days=400), '/a/', 'GET', 200, 100.0),
+        ])
+
+        call_command('cleanup_old_metrics', stdout=StringIO())
+
+        self.assertEqual(RequestMetricRollup.objects.count(), 1)
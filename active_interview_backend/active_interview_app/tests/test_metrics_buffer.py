@@ -0,0 +1,114 @@
+"""
+Tests for the buffered request metrics writer.
+
+Covers:
+- MetricsMiddleware does no database writes while buffering
+- flush_metrics: batched raw rows, error logs and rollups
+- Bounded buffer: oldest samples dropped and counted
+- Failed writes counted, buffer metrics API
+"""
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.http import HttpResponse, HttpResponseNotFound
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from active_interview_app import metrics_buffer
+from active_interview_app.metrics_buffer import (
+    flush_metrics,
+    get_metrics_buffer_stats,
+    reset_metrics_buffer,
+)
+from active_interview_app.middleware import MetricsMiddleware
+from active_interview_app.observability_models import (
+    ErrorLog,
+    RequestMetric,
+    RequestMetricRollup,
+)
+from .test_credentials import TEST_PASSWORD
+
+
+@override_settings(METRICS_FLUSH_INTERVAL=5, METRICS_BUFFER_SIZE=3,
+                   METRICS_FLUSH_BATCH_SIZE=2)
+@patch.object(metrics_buffer, '_ensure_flusher')
+class MetricsBufferTest(TestCase):
+    """Test buffering and flushing without the background thread."""
+
+    def setUp(self):
+        reset_metrics_buffer()
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        reset_metrics_buffer()
+
+    def _request(self, path, view=None):
+        middleware = MetricsMiddleware(
+            view or (lambda request: HttpResponse('OK')))
+        request = self.factory.get(path)
+        request.user = AnonymousUser()
+        middleware(request)
+
+    def test_request_path_does_not_write(self, mock_flusher):
+        with self.assertNumQueries(0):
+            self._request('/api/buffered/')
+
+        self.assertFalse(RequestMetric.objects.exists())
+        self.assertEqual(get_metrics_buffer_stats()['pending'], 1)
+        mock_flusher.assert_called_once_with()
+
+    def test_flush_writes_batches(self, mock_flusher):
+        self._request('/api/a/')
+        self._request('/api/a/')
+        self._request('/api/missing/', lambda request: HttpResponseNotFound())
+
+        self.assertEqual(flush_metrics(), 3)
+
+        self.assertEqual(RequestMetric.objects.count(), 3)
+        self.assertEqual(ErrorLog.objects.get().status_code, 404)
+        self.assertEqual(
+            RequestMetricRollup.objects.get(endpoint='/api/a/').count, 2)
+        stats = get_metrics_buffer_stats()
+        self.assertEqual((stats['pending'], stats['flushed']), (0, 3))
+
+    def test_full_buffer_drops_oldest(self, mock_flusher):
+        for index in range(5):
+            self._request(f'/api/{index}/')
+
+        flush_metrics()
+
+        self.assertEqual(
+            sorted(RequestMetric.objects.values_list('endpoint', flat=True)),
+            ['/api/2/', '/api/3/', '/api/4/'])
+        stats = get_metrics_buffer_stats()
+        self.assertEqual((stats['recorded'], stats['dropped']), (5, 2))
+
+    def test_failed_batch_counted(self, mock_flusher):
+        self._request('/api/a/')
+
+        with patch.object(RequestMetric.objects, 'bulk_create',
+                          side_effect=Exception('Database error')):
+            self.assertEqual(flush_metrics(), 0)
+
+        stats = get_metrics_buffer_stats()
+        self.assertEqual((stats['pending'], stats['failed']), (0, 1))
+
+
+class MetricsBufferAPITest(TestCase):
+    """Test the buffer counters API."""
+
+    def setUp(self):
+        reset_metrics_buffer()
+        User.objects.create_user(
+            username='admin', password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username='admin', password=TEST_PASSWORD)
+
+    def test_buffer_api(self):
+        response = self.client.get(reverse('api_metrics_buffer'))
+        data = json.loads(response.content)
+
+        self.assertEqual(data['metric'], 'metrics_buffer')
+        for key in ('pending', 'capacity', 'recorded', 'flushed',
+                    'dropped', 'failed'):
+            self.assertIn(key, data['data'])
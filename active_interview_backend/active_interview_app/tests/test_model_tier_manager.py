@@ -127,6 +127,26 @@ class GetActiveTierTest(TestCase):
             self.assertEqual(tier, 'premium')
 
 
+class GetTierForSpendingTest(TestCase):
+    """Test get_tier_for_spending() function."""
+
+    def test_no_cap_returns_premium(self):
+        """Test that without a cap the tier is premium."""
+        self.assertEqual(model_tier_manager.get_tier_for_spending(500, None), 'premium')
+
+    def test_thresholds_match_get_active_tier(self):
+        """Test the 85% and over-cap thresholds."""
+        self.assertEqual(model_tier_manager.get_tier_for_spending(84, 100.0), 'premium')
+        self.assertEqual(model_tier_manager.get_tier_for_spending(85, 100.0), 'standard')
+        self.assertEqual(model_tier_manager.get_tier_for_spending(100, 100.0), 'standard')
+        self.assertEqual(model_tier_manager.get_tier_for_spending(Decimal('100.01'), 100.0), 'fallback')
+
+    def test_zero_cap(self):
+        """Test that a zero cap only allows zero spending at premium."""
+        self.assertEqual(model_tier_manager.get_tier_for_spending(0, 0), 'premium')
+        self.assertEqual(model_tier_manager.get_tier_for_spending(1, 0), 'fallback')
+
+
 class GetModelForTierTest(TestCase):
     """Test get_model_for_tier() function."""
 
@@ -254,6 +254,31 @@ class CostMetricsAPITests(TestCase):
             self.assertIn('by_service', point)
 
 
+class ClientPoolMetricsAPITests(TestCase):
+    """Test OpenAI client pool metrics API endpoint."""
+
+    def setUp(self):
+        """Log in as staff."""
+        self.client = Client()
+        self.staff_user = User.objects.create_user(
+            username='admin',
+            password=TEST_PASSWORD,
+            is_staff=True
+        )
+        self.client.login(username='admin', password=TEST_PASSWORD)
+
+    def test_client_pool_api_returns_counters(self):
+        """Test that client pool API returns sync and async counters."""
+        response = self.client.get(reverse('api_metrics_clients'))
+        data = json.loads(response.content)
+
+        self.assertEqual(data['metric'], 'client_pool')
+        for pool in ('sync', 'async'):
+            self.assertIn('hits', data['data'][pool])
+            self.assertIn('misses', data['data'][pool])
+            self.assertIn('evictions', data['data'][pool])
+
+
 class ExportMetricsAPITests(TestCase):
     """Test metrics export API endpoint."""
 
@@ -294,7 +319,7 @@ class ExportMetricsAPITests(TestCase):
     def test_export_api_includes_headers(self):
         """Test that export CSV includes headers."""
         response = self.client.get(reverse('api_export_metrics') + '?metrics=rps,latency,errors')
-        content = response.content.decode('utf-8')
+        content = b''.join(response.streaming_content).decode('utf-8')
 
         self.assertIn('timestamp', content)
         self.assertIn('rps', content)
@@ -306,7 +331,7 @@ class ExportMetricsAPITests(TestCase):
         """Test that export API can filter specific metrics."""
         # Export only RPS
         response = self.client.get(reverse('api_export_metrics') + '?metrics=rps')
-        content = response.content.decode('utf-8')
+        content = b''.join(response.streaming_content).decode('utf-8')
 
         self.assertIn('timestamp', content)
         self.assertIn('rps', content)
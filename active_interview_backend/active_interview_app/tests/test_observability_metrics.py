@@ -600,8 +600,8 @@ class MetricsMiddlewareTests(TransactionTestCase):
         request = self.factory.get('/api/test-db-error/')
         request.user = self.user
 
-        # Mock RequestMetric.objects.create to raise an exception
-        with patch('active_interview_app.observability_models.RequestMetric.objects.create',
+        # Mock RequestMetric.objects.bulk_create to raise an exception
+        with patch('active_interview_app.observability_models.RequestMetric.objects.bulk_create',
                    side_effect=Exception('Database error')):
             # Should not raise exception - middleware should handle it gracefully
             response = middleware(request)
@@ -618,8 +618,8 @@ class MetricsMiddlewareTests(TransactionTestCase):
         request = self.factory.get('/api/error-log-failure/')
         request.user = self.user
 
-        # Mock ErrorLog.objects.create to fail
-        with patch('active_interview_app.observability_models.ErrorLog.objects.create',
+        # Mock ErrorLog.objects.bulk_create to fail
+        with patch('active_interview_app.observability_models.ErrorLog.objects.bulk_create',
                    side_effect=Exception('ErrorLog creation failed')):
             # Should still raise the original exception, not the ErrorLog failure
             with self.assertRaises(RuntimeError):
@@ -8,12 +8,13 @@ Updated for Issue #13 to include tests for API key pool integration.
 import pytest
 from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
-from unittest.mock import patch, MagicMock  # noqa: F401
+from unittest.mock import ANY, patch, MagicMock  # noqa: F401
 from active_interview_app.openai_utils import (
     get_openai_client,
     ai_available,
     get_api_key_from_pool,
-    get_current_api_key_info
+    get_current_api_key_info,
+    get_client_pool_stats
 )
 
 
@@ -23,12 +24,12 @@ class OpenAIUtilsTest(TestCase):
     def setUp(self):
         """Reset the global OpenAI client before each test"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     def tearDown(self):
         """Reset the global OpenAI client after each test"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     @override_settings(OPENAI_API_KEY='test-key-123')
     @patch('active_interview_app.openai_utils.OpenAI')
@@ -40,7 +41,8 @@ class OpenAIUtilsTest(TestCase):
         client = get_openai_client()
 
         # Verify OpenAI was called with the API key
-        mock_openai.assert_called_once_with(api_key='test-key-123')
+        mock_openai.assert_called_once_with(
+            api_key='test-key-123', http_client=ANY, max_retries=0)
         self.assertEqual(client, mock_client)
 
     @override_settings(OPENAI_API_KEY='test-key-123')
@@ -138,7 +140,7 @@ class OpenAIUtilsTest(TestCase):
             get_openai_client()
 
         # Reset client
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         # Second call succeeds
         mock_client = MagicMock()
@@ -176,7 +178,7 @@ class OpenAIUtilsPytestTest(TestCase):
     def test_get_openai_client_with_valid_key(self):
         """Test client initialization with valid API key"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         with patch('active_interview_app.openai_utils.OpenAI') as mock_openai:
             mock_client = MagicMock()
@@ -186,26 +188,26 @@ class OpenAIUtilsPytestTest(TestCase):
             self.assertEqual(client, mock_client)
 
         # Cleanup
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     @override_settings(OPENAI_API_KEY='')
     def testai_available_graceful_degradation(self):
         """Test graceful degradation when OpenAI is not available"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         # Should not raise, just return False
         result = ai_available()
         self.assertFalse(result)
 
         # Cleanup
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
     @override_settings(OPENAI_API_KEY='')
     def test_error_message_includes_configuration_hint(self):
         """Test that error messages provide helpful configuration hints"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         with self.assertRaises(ValueError) as exc_info:
             get_openai_client()
@@ -214,7 +216,172 @@ class OpenAIUtilsPytestTest(TestCase):
         self.assertIn('environment variables', str(exc_info.exception))
 
         # Cleanup
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
+
+
+class ClientPoolTest(TestCase):
+    """Test the OpenAI client pool (keyed by provider, tier and API key)"""
+
+    def setUp(self):
+        """Start from an empty pool"""
+        import active_interview_app.openai_utils as openai_utils
+        openai_utils.reset_client_pools()
+
+    @override_settings(OPENAI_API_KEY='test-key-123')
+    @patch('active_interview_app.openai_utils.OpenAI')
+    def test_same_tier_and_key_reuses_client(self, mock_openai):
+        """Test that repeated lookups hit the pool"""
+        first = get_openai_client()
+        second = get_openai_client()
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_openai.call_count, 1)
+        stats = get_client_pool_stats()['sync']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    @override_settings(OPENAI_API_KEY='test-key-123',
+                       OPENAI_API_FALLBACK_KEY='test-fallback-key')
+    @patch('active_interview_app.openai_utils.OpenAI')
+    def test_alternating_tiers_reuse_clients(self, mock_openai):
+        """Test that switching tiers back and forth does not rebuild clients"""
+        mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+        premium = get_openai_client(model_tier='premium')
+        fallback = get_openai_client(model_tier='fallback')
+
+        self.assertIs(get_openai_client(model_tier='premium'), premium)
+        self.assertIs(get_openai_client(model_tier='fallback'), fallback)
+        self.assertEqual(mock_openai.call_count, 2)
+
+    @override_settings(OPENAI_API_KEY='test-key-123')
+    @patch('active_interview_app.openai_utils.OpenAI')
+    def test_clients_share_http_client(self, mock_openai):
+        """Test that pooled clients share one httpx connection pool"""
+        get_openai_client(model_tier='premium')
+        get_openai_client(model_tier='standard')
+
+        http_clients = [call.kwargs['http_client']
+                        for call in mock_openai.call_args_list]
+        self.assertIs(http_clients[0], http_clients[1])
+
+    @override_settings(OPENAI_API_KEY='test-key-123')
+    @patch('active_interview_app.openai_utils.OpenAI')
+    def test_least_recently_used_client_evicted(self, mock_openai):
+        """Test that the pool is bounded with LRU eviction"""
+        import active_interview_app.openai_utils as openai_utils
+        mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+        with patch.object(openai_utils._client_pool, 'max_size', 2):
+            premium = get_openai_client(model_tier='premium')
+            get_openai_client(model_tier='standard')
+            get_openai_client(model_tier='premium')
+            get_openai_client(model_tier='fallback')
+
+            stats = get_client_pool_stats()['sync']
+            self.assertEqual(stats['size'], 2)
+            self.assertEqual(stats['evictions'], 1)
+            # 'standard' was least recently used, so 'premium' survived
+            self.assertIs(get_openai_client(model_tier='premium'), premium)
+
+
+@override_settings(OPENAI_API_KEY='sk-fallback', OPENAI_RESOLVER_CACHE_TTL=30)
+class ResolverCacheTest(TestCase):
+    """Test the TTL cache for tier and API key resolution"""
+
+    def setUp(self):
+        """Create test user and start from an empty cache"""
+        import active_interview_app.openai_utils as openai_utils
+        openai_utils.reset_resolver_cache()
+        self.addCleanup(openai_utils.reset_resolver_cache)
+
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            password='testpass123',
+            is_staff=True
+        )
+
+    def _add_active_key(self, name, api_key):
+        from active_interview_app.api_key_rotation_models import APIKeyPool
+
+        key = APIKeyPool.objects.create(
+            provider='openai',
+            key_name=name,
+            status=APIKeyPool.PENDING,
+            added_by=self.admin_user
+        )
+        key.set_key(api_key)
+        key.save()
+        key.activate()
+        return key
+
+    def test_cached_key_skips_lookup_but_counts_usage(self):
+        """Test that a cached key costs one usage update and no decrypt"""
+        key = self._add_active_key('Key 1', 'sk-key1')
+        get_api_key_from_pool()
+
+        with patch('active_interview_app.api_key_rotation_models.APIKeyPool.get_key') as mock_decrypt:
+            with self.assertNumQueries(1):
+                self.assertEqual(get_api_key_from_pool(), 'sk-key1')
+            mock_decrypt.assert_not_called()
+
+        key.refresh_from_db()
+        self.assertEqual(key.usage_count, 2)
+
+    def test_key_pool_change_invalidates_cache(self):
+        """Test that activating another key is picked up immediately"""
+        self._add_active_key('Key 1', 'sk-key1')
+        self.assertEqual(get_api_key_from_pool(), 'sk-key1')
+
+        self._add_active_key('Key 2', 'sk-key2')
+
+        self.assertEqual(get_api_key_from_pool(), 'sk-key2')
+
+    @override_settings(OPENAI_RESOLVER_CACHE_TTL=0)
+    def test_zero_ttl_disables_cache(self):
+        """Test that OPENAI_RESOLVER_CACHE_TTL=0 turns caching off"""
+        from active_interview_app.openai_utils import _resolve_tier
+
+        with patch('active_interview_app.model_tier_manager.get_tier_info',
+                   return_value={'active_tier': 'premium'}) as mock_info:
+            _resolve_tier()
+            _resolve_tier()
+
+        self.assertEqual(mock_info.call_count, 2)
+
+    def test_tier_cached_until_spending_crosses_threshold(self):
+        """Test tier caching and threshold-based invalidation"""
+        from active_interview_app.openai_utils import _resolve_tier
+        from active_interview_app.spending_tracker_models import (
+            MonthlySpending, MonthlySpendingCap
+        )
+
+        MonthlySpendingCap.objects.create(cap_amount_usd=100, is_active=True)
+        spending = MonthlySpending.get_current_month()
+        self.assertEqual(_resolve_tier()[0], 'premium')
+
+        # 50%: same tier, answered from the cache
+        spending.add_llm_cost(50.00)
+        with self.assertNumQueries(0):
+            self.assertEqual(_resolve_tier()[0], 'premium')
+
+        # 90%: crosses the standard threshold, cache dropped
+        spending.add_llm_cost(40.00)
+        self.assertEqual(_resolve_tier()[0], 'standard')
+
+    def test_cap_change_invalidates_tier_cache(self):
+        """Test that changing the spending cap is picked up immediately"""
+        from active_interview_app.openai_utils import _resolve_tier
+        from active_interview_app.spending_tracker_models import (
+            MonthlySpending, MonthlySpendingCap
+        )
+
+        MonthlySpending.get_current_month().add_llm_cost(50.00)
+        self.assertEqual(_resolve_tier()[0], 'premium')
+
+        MonthlySpendingCap.objects.create(cap_amount_usd=40, is_active=True)
+
+        self.assertEqual(_resolve_tier()[0], 'fallback')
 
 
 class APIKeyPoolIntegrationTest(TestCase):
@@ -223,8 +390,7 @@ class APIKeyPoolIntegrationTest(TestCase):
     def setUp(self):
         """Create test user and reset OpenAI client"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
         self.admin_user = User.objects.create_user(
             username='admin',
@@ -236,8 +402,7 @@ class APIKeyPoolIntegrationTest(TestCase):
     def tearDown(self):
         """Reset OpenAI client after tests"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
     @override_settings(OPENAI_API_KEY='sk-fallback-key')
     def test_get_api_key_from_pool_with_active_key(self):
@@ -324,7 +489,8 @@ class APIKeyPoolIntegrationTest(TestCase):
         # Get client (should use key1)
         client1 = get_openai_client()  # noqa: F841
         self.assertEqual(mock_openai.call_count, 1)
-        mock_openai.assert_called_with(api_key='sk-key1')
+        mock_openai.assert_called_with(
+            api_key='sk-key1', http_client=ANY, max_retries=0)
 
         # Create second key and activate (simulating rotation)
         key2 = APIKeyPool.objects.create(
@@ -340,7 +506,8 @@ class APIKeyPoolIntegrationTest(TestCase):
         # Get client again (should refresh with key2)
         client2 = get_openai_client()  # noqa: F841
         self.assertEqual(mock_openai.call_count, 2)
-        mock_openai.assert_called_with(api_key='sk-key2')
+        mock_openai.assert_called_with(
+            api_key='sk-key2', http_client=ANY, max_retries=0)
 
     @override_settings(OPENAI_API_KEY='sk-fallback')
     @patch('active_interview_app.openai_utils.OpenAI')
@@ -520,8 +687,7 @@ class TestAPIKeyPoolPytest:
         import active_interview_app.openai_utils as openai_utils
         from active_interview_app.api_key_rotation_models import APIKeyPool
 
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
         settings.OPENAI_API_KEY = 'sk-fallback'
 
@@ -546,16 +712,14 @@ class TestAPIKeyPoolPytest:
         assert api_key == 'sk-pytest-key'
 
         # Cleanup
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
     def test_get_current_api_key_info_structure(self, settings):
         """Test that get_current_api_key_info returns correct structure"""
         import active_interview_app.openai_utils as openai_utils
         from active_interview_app.api_key_rotation_models import APIKeyPool
 
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
         settings.OPENAI_API_KEY = 'sk-fallback'
 
@@ -590,15 +754,13 @@ class TestAPIKeyPoolPytest:
         assert isinstance(info['usage_count'], int)
 
         # Cleanup
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
     def test_error_message_mentions_key_pool(self, settings):
         """Test that error message mentions key pool option"""
         import active_interview_app.openai_utils as openai_utils
 
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
 
         settings.OPENAI_API_KEY = ''
 
@@ -610,5 +772,4 @@ class TestAPIKeyPoolPytest:
         assert 'OPENAI_API_KEY' in error_message
 
         # Cleanup
-        openai_utils._openai_client = None
-        openai_utils._current_api_key = None
+        openai_utils.reset_client_pools()
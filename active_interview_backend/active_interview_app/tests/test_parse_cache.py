@@ -0,0 +1,184 @@
+"""
+Tests for the deduplicating resume / job listing parse store.
+
+Covers:
+- cached_parse: hits across whitespace changes, prompt versions, failures
+- evict_parse_cache: least recently hit rows go first
+- parse_resume_with_ai / parse_job_listing_with_ai wiring
+- admin hit-rate report
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from active_interview_app.job_listing_parser import parse_job_listing_with_ai
+from active_interview_app.models import ParseResultCache
+from active_interview_app.parse_cache import (
+    cached_parse,
+    evict_parse_cache,
+    get_parse_cache_stats,
+    parse_cache_key
+)
+from active_interview_app.resume_parser import (
+    PROMPT_VERSION as RESUME_PROMPT_VERSION,
+    parse_resume_with_ai,
+)
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+class CachedParseTest(TestCase):
+    """Test cached_parse."""
+
+    def setUp(self):
+        self.parse = MagicMock(return_value={'skills': ['Python']})
+
+    def test_identical_text_served_from_store(self):
+        first = cached_parse('resume', '1', 'Jane Doe\nPython', self.parse)
+        second = cached_parse('resume', '1', 'Jane Doe\nPython', self.parse)
+
+        self.assertEqual(first, {'skills': ['Python']})
+        self.assertEqual(second, {'skills': ['Python']})
+        self.parse.assert_called_once()
+        self.assertEqual(ParseResultCache.objects.get().hit_count, 1)
+
+    def test_whitespace_differences_hit(self):
+        cached_parse('resume', '1', 'Jane Doe\nPython', self.parse)
+        cached_parse('resume', '1', '  Jane   Doe\r\n\nPython  ', self.parse)
+
+        self.parse.assert_called_once()
+
+    def test_prompt_version_and_kind_are_part_of_key(self):
+        key = parse_cache_key('resume', '1', 'Python')
+
+        self.assertNotEqual(key, parse_cache_key('resume', '2', 'Python'))
+        self.assertNotEqual(key, parse_cache_key('job_listing', '1', 'Python'))
+
+    def test_failed_parse_not_stored(self):
+        self.parse.side_effect = ValueError('Resume parsing failed: boom')
+
+        with self.assertRaises(ValueError):
+            cached_parse('resume', '1', 'Jane Doe', self.parse)
+
+        self.assertFalse(ParseResultCache.objects.exists())
+
+    @override_settings(PARSE_CACHE_MAX_ENTRIES=2)
+    def test_insert_evicts_beyond_max_entries(self):
+        for text in ('one', 'two', 'three'):
+            cached_parse('resume', '1', text, self.parse)
+
+        self.assertEqual(ParseResultCache.objects.count(), 2)
+        self.assertFalse(ParseResultCache.objects.filter(
+            content_hash=parse_cache_key('resume', '1', 'one')).exists())
+
+
+class EvictParseCacheTest(TestCase):
+    """Test evict_parse_cache."""
+
+    def _entry(self, text, hours_ago):
+        return ParseResultCache.objects.create(
+            kind=ParseResultCache.KIND_RESUME,
+            content_hash=parse_cache_key('resume', '1', text),
+            prompt_version='1',
+            result={},
+            last_hit_at=timezone.now() - timedelta(hours=hours_ago)
+        )
+
+    def test_keeps_most_recently_hit(self):
+        old = self._entry('old', 10)
+        recent = self._entry('recent', 1)
+        middle = self._entry('middle', 5)
+
+        deleted = evict_parse_cache(max_entries=2)
+
+        self.assertEqual(deleted, 1)
+        remaining = set(ParseResultCache.objects.values_list('pk', flat=True))
+        self.assertEqual(remaining, {recent.pk, middle.pk})
+        self.assertNotIn(old.pk, remaining)
+
+    def test_under_limit_deletes_nothing(self):
+        self._entry('only', 1)
+
+        self.assertEqual(evict_parse_cache(max_entries=5), 0)
+
+
+class ParserCacheWiringTest(TestCase):
+    """Test that both AI parsers go through the store."""
+
+    @patch('active_interview_app.resume_parser.get_client_and_model')
+    @patch('active_interview_app.resume_parser.ai_available',
+           return_value=True)
+    def test_resume_reupload_skips_api(self, mock_ai, mock_gcm):
+        client = MagicMock()
+        client.chat.completions.create.return_value = (
+            create_mock_openai_response(
+                '{"skills": ["Django"], "experience": [], "education": []}'))
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        parse_resume_with_ai('Jane Doe\nDjango developer')
+        result = parse_resume_with_ai('Jane Doe\nDjango developer')
+
+        self.assertEqual(result['skills'], ['Django'])
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+
+    @patch('active_interview_app.resume_parser.ai_available',
+           return_value=False)
+    def test_resume_hit_does_not_need_ai(self, mock_ai):
+        parsed = {'skills': ['Go'], 'experience': [], 'education': []}
+        cached_parse(ParseResultCache.KIND_RESUME, RESUME_PROMPT_VERSION,
+                     'Go dev', MagicMock(return_value=parsed))
+
+        self.assertEqual(parse_resume_with_ai('Go dev'), parsed)
+
+    @patch('active_interview_app.job_listing_parser.get_client_and_model')
+    @patch('active_interview_app.job_listing_parser.ai_available',
+           return_value=True)
+    def test_job_listing_reanalyze_skips_api(self, mock_ai, mock_gcm):
+        client = MagicMock()
+        client.chat.completions.create.return_value = (
+            create_mock_openai_response(
+                '{"required_skills": ["Python"], "seniority_level": "mid",'
+                ' "requirements": {}}'))
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        parse_job_listing_with_ai('Mid-level Python engineer')
+        result = parse_job_listing_with_ai('Mid-level Python engineer')
+
+        self.assertEqual(result['seniority_level'], 'mid')
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+
+
+class ParseCacheAdminReportTest(TestCase):
+    """Test the admin hit-rate report."""
+
+    def setUp(self):
+        parse = MagicMock(return_value={})
+        cached_parse(ParseResultCache.KIND_RESUME, '1', 'a', parse)
+        cached_parse(ParseResultCache.KIND_RESUME, '1', 'a', parse)
+        cached_parse(ParseResultCache.KIND_RESUME, '1', 'a', parse)
+        cached_parse(ParseResultCache.KIND_JOB_LISTING, '1', 'b', parse)
+
+    def test_stats_per_kind(self):
+        stats = {row['kind']: row for row in get_parse_cache_stats()}
+
+        self.assertEqual(stats['resume']['entries'], 1)
+        self.assertEqual(stats['resume']['hits'], 2)
+        self.assertEqual(stats['resume']['hit_rate'], 66.7)
+        self.assertEqual(stats['job_listing']['hit_rate'], 0.0)
+
+    def test_changelist_shows_report(self):
+        User.objects.create_superuser(
+            username='cacheadmin', password=TEST_PASSWORD,
+            email='cacheadmin@example.com')
+        self.client.login(username='cacheadmin', password=TEST_PASSWORD)
+
+        response = self.client.get(
+            reverse('admin:active_interview_app_parseresultcache_changelist'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Hit Rate')
+        self.assertContains(response, '66.7%')
@@ -0,0 +1,120 @@
+"""
+Tests for the prompt registry.
+
+Covers:
+- PromptTemplate: dedent, placeholders, version, static prefix
+- register / get_prompt / version_for_endpoint
+- Practice interview prompts: resume variant, fixed prefix before
+  per-chat content
+- Cached prompt tokens and prompt version recorded on TokenUsage
+"""
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from active_interview_app import prompts
+from active_interview_app.prompts import (
+    PromptTemplate,
+    render_interview_prompt,
+)
+from active_interview_app.token_tracking import record_openai_usage
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+
+
+def _render(prompt, resume=None, **values):
+    return render_interview_prompt(
+        prompt, listing='LISTING', resume=resume,
+        interview_type='Technical', difficulty=7, **values)
+
+
+class PromptTemplateTest(SimpleTestCase):
+    """Test the template class and registry."""
+
+    def test_dedent_and_fields(self):
+        prompt = PromptTemplate('test', """\
+            Hello {{literal}}
+            Name: {name}
+        """)
+
+        self.assertEqual(prompt.text, 'Hello {{literal}}\nName: {name}\n')
+        self.assertEqual(prompt.fields, {'name'})
+        self.assertEqual(prompt.static_prefix, 'Hello {literal}\nName: ')
+        self.assertEqual(prompt.render(name='Ada'),
+                         'Hello {literal}\nName: Ada\n')
+
+    def test_version_follows_text(self):
+        first = PromptTemplate('a', 'Say {x}')
+
+        self.assertEqual(first.version, PromptTemplate('b', 'Say {x}').version)
+        self.assertNotEqual(first.version,
+                            PromptTemplate('a', 'Say {x}!').version)
+        self.assertEqual(len(first.version), prompts.VERSION_LENGTH)
+
+    def test_duplicate_name_rejected(self):
+        with self.assertRaises(ValueError):
+            prompts.register('interview_greeting', 'Duplicate')
+
+    def test_version_for_endpoint(self):
+        self.assertEqual(prompts.version_for_endpoint('create_chat'),
+                         prompts.INTERVIEW_GREETING.version)
+        self.assertEqual(prompts.version_for_endpoint('chat_view'), '')
+        self.assertIs(prompts.get_prompt('report'), prompts.REPORT)
+
+    def test_interview_prompt_variants(self):
+        with_resume = _render(prompts.INTERVIEW_GREETING, resume='RESUME')
+        without_resume = _render(prompts.INTERVIEW_GREETING)
+
+        self.assertIn('"""RESUME"""', with_resume)
+        self.assertNotIn('Candidate Resume:', without_resume)
+        self.assertIn('<<7>>', without_resume)
+        self.assertNotIn('json', without_resume.lower())
+
+    def test_static_prefix_before_chat_content(self):
+        for prompt in (prompts.INTERVIEW_GREETING,
+                       prompts.INTERVIEW_KEY_QUESTIONS,
+                       prompts.QUESTION_FEEDBACK):
+            rendered = _render(prompt, resume='RESUME',
+                               question='Q', answer='A')
+
+            self.assertTrue(rendered.startswith(prompt.static_prefix))
+            self.assertNotIn('LISTING', prompt.static_prefix)
+            self.assertGreater(rendered.index('<<7>>'),
+                               rendered.index('RESUME'))
+
+
+class CachedPromptTokensTest(TestCase):
+    """Test the prompt cache details recorded on TokenUsage."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+
+    def _response(self, **usage):
+        return SimpleNamespace(model='gpt-4o', usage=SimpleNamespace(
+            prompt_tokens=1000, completion_tokens=50, **usage))
+
+    def test_openai_cached_tokens_and_version(self):
+        response = self._response(
+            prompt_tokens_details=SimpleNamespace(cached_tokens=768))
+
+        record_openai_usage(self.user, 'create_chat', response)
+
+        usage = TokenUsage.objects.get()
+        self.assertEqual(usage.cached_prompt_tokens, 768)
+        self.assertEqual(usage.prompt_version,
+                         prompts.INTERVIEW_GREETING.version)
+
+    def test_claude_cache_read_tokens(self):
+        record_openai_usage(self.user, 'chat_view',
+                            self._response(cache_read_input_tokens=512))
+
+        usage = TokenUsage.objects.get()
+        self.assertEqual(usage.cached_prompt_tokens, 512)
+        self.assertEqual(usage.prompt_version, '')
+
+    def test_no_cache_details(self):
+        record_openai_usage(self.user, 'chat_view', self._response())
+
+        self.assertEqual(TokenUsage.objects.get().cached_prompt_tokens, 0)
@@ -301,7 +301,7 @@ class RateLimitMiddlewareTest(TestCase):
         self.assertIsNone(violation.user)
         self.assertEqual(violation.ip_address, '10.0.0.1')
 
-    @patch('django.core.mail.mail_admins')
+    @patch('active_interview_app.email_outbox.queue_mail_admins')
     def test_send_threshold_alert(self, mock_mail_admins):
         """Test sending alert when threshold exceeded."""
         # Create violations to exceed threshold
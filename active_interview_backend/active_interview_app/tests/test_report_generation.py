@@ -0,0 +1,200 @@
+"""
+Tests for single-call structured report generation in report_utils.
+
+Covers:
+- One JSON-schema call producing scores, feedback and rationales
+- JSON mode for models without json_schema support
+- Fallback to separate calls on invalid JSON, out-of-range scores or errors
+- Default report when AI is unavailable
+- No report row until its content is generated
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from active_interview_app.models import Chat, ExportableReport
+from active_interview_app.report_utils import (
+    REPORT_RESPONSE_FORMAT,
+    generate_and_save_report
+)
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+def _report_json(**overrides):
+    report = {
+        "scores": {
+            "professionalism": 82,
+            "subject_knowledge": 75,
+            "clarity": 90,
+            "overall": 80
+        },
+        "feedback": "Clear answers with good examples.",
+        "rationales": {
+            "professionalism": "Polite and focused.",
+            "subject_knowledge": "Solid Django basics.",
+            "clarity": "Well structured answers.",
+            "overall": "A strong interview."
+        }
+    }
+    report.update(overrides)
+    return json.dumps(report)
+
+
+@patch('active_interview_app.report_utils.ai_available', return_value=True)
+@patch('active_interview_app.report_utils.get_client_and_model')
+class GenerateReportTest(TestCase):
+    """Test generate_and_save_report."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='reportuser', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user,
+            title='Report Interview',
+            messages=[
+                {"role": "system", "content": "You are an interviewer."},
+                {"role": "assistant", "content": "Tell me about Django."},
+                {"role": "user", "content": "It is a web framework."}
+            ]
+        )
+
+    def _mock_client(self, *responses, **kwargs):
+        client = MagicMock()
+        client.chat.completions.create.side_effect = (
+            kwargs.get('side_effect') or list(responses))
+        return client
+
+    def test_single_structured_call(self, mock_gcm, mock_ai):
+        client = self._mock_client(create_mock_openai_response(_report_json()))
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        report = generate_and_save_report(self.chat)
+
+        client.chat.completions.create.assert_called_once()
+        call_kwargs = client.chat.completions.create.call_args.kwargs
+        self.assertEqual(call_kwargs['response_format'], REPORT_RESPONSE_FORMAT)
+        self.assertEqual(call_kwargs['messages'][:3], self.chat.messages)
+        self.assertEqual(report.professionalism_score, 82)
+        self.assertEqual(report.subject_knowledge_score, 75)
+        self.assertEqual(report.clarity_score, 90)
+        self.assertEqual(report.overall_score, 80)
+        self.assertEqual(report.feedback_text,
+                         'Clear answers with good examples.')
+        self.assertEqual(report.subject_knowledge_rationale,
+                         'Solid Django basics.')
+        self.assertEqual(
+            list(TokenUsage.objects.values_list('endpoint', flat=True)),
+            ['generate_report'])
+
+    def test_json_mode_for_older_models(self, mock_gcm, mock_ai):
+        for model in ('gpt-4-turbo', 'gpt-3.5-turbo'):
+            client = self._mock_client(
+                create_mock_openai_response(_report_json()))
+            mock_gcm.return_value = (client, model, {})
+
+            report = generate_and_save_report(self.chat)
+            report.delete()
+
+            client.chat.completions.create.assert_called_once()
+            call_kwargs = client.chat.completions.create.call_args.kwargs
+            self.assertEqual(call_kwargs['response_format'],
+                             {"type": "json_object"})
+            self.assertIn('JSON object', call_kwargs['messages'][-1]['content'])
+            self.assertEqual(report.overall_score, 80)
+
+    def test_rushed_qualifier_in_prompt(self, mock_gcm, mock_ai):
+        client = self._mock_client(create_mock_openai_response(_report_json()))
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        generate_and_save_report(self.chat, include_rushed_qualifier=True)
+
+        prompt = client.chat.completions.create.call_args.kwargs[
+            'messages'][-1]['content']
+        self.assertIn('could be rushed or incomplete', prompt)
+
+    def test_invalid_json_falls_back_to_separate_calls(self, mock_gcm, mock_ai):
+        client = self._mock_client(
+            create_mock_openai_response('not json'),
+            create_mock_openai_response('70\n60\n50\n65'),
+            create_mock_openai_response('Some feedback.'),
+            create_mock_openai_response(
+                'Professionalism: Good.\nSubject Knowledge: Fair.\n'
+                'Clarity: Okay.\nOverall: Average.'),
+        )
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        report = generate_and_save_report(self.chat)
+
+        self.assertEqual(client.chat.completions.create.call_count, 4)
+        self.assertEqual(report.professionalism_score, 70)
+        self.assertEqual(report.overall_score, 65)
+        self.assertEqual(report.feedback_text, 'Some feedback.')
+        self.assertEqual(report.clarity_rationale, 'Okay.')
+
+    def test_out_of_range_score_falls_back(self, mock_gcm, mock_ai):
+        bad_scores = {"professionalism": 120, "subject_knowledge": 75,
+                      "clarity": 90, "overall": 80}
+        client = self._mock_client(
+            create_mock_openai_response(_report_json(scores=bad_scores)),
+            create_mock_openai_response('70\n60\n50\n65'),
+            create_mock_openai_response('Some feedback.'),
+            create_mock_openai_response('Overall: Average.'),
+        )
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        report = generate_and_save_report(self.chat)
+
+        self.assertEqual(client.chat.completions.create.call_count, 4)
+        self.assertEqual(report.professionalism_score, 70)
+
+    def test_api_error_falls_back(self, mock_gcm, mock_ai):
+        client = self._mock_client(side_effect=[
+            Exception('response_format not supported'),
+            create_mock_openai_response('70\n60\n50\n65'),
+            create_mock_openai_response('Some feedback.'),
+            create_mock_openai_response('Overall: Average.'),
+        ])
+        mock_gcm.return_value = (client, 'gpt-3.5-turbo', {})
+
+        report = generate_and_save_report(self.chat)
+
+        self.assertEqual(report.overall_score, 65)
+        self.assertEqual(report.overall_rationale, 'Average.')
+
+    def test_ai_unavailable_saves_defaults(self, mock_gcm, mock_ai):
+        mock_ai.return_value = False
+
+        report = generate_and_save_report(self.chat)
+
+        mock_gcm.assert_not_called()
+        self.assertEqual(report.overall_score, 0)
+        self.assertEqual(report.feedback_text, 'AI features are currently unavailable.')
+
+    def test_report_saved_only_after_generation(self, mock_gcm, mock_ai):
+        def respond(**kwargs):
+            self.assertFalse(
+                ExportableReport.objects.filter(chat=self.chat).exists())
+            return create_mock_openai_response(_report_json())
+
+        client = self._mock_client(side_effect=respond)
+        mock_gcm.return_value = (client, 'gpt-4o', {})
+
+        report = generate_and_save_report(self.chat)
+
+        self.assertEqual(ExportableReport.objects.get(chat=self.chat), report)
+
+    @patch('active_interview_app.report_utils._extract_rationales_from_chat',
+           side_effect=RuntimeError('worker crashed'))
+    def test_crash_leaves_no_blank_report(self, mock_rationales, mock_gcm,
+                                          mock_ai):
+        mock_ai.return_value = False
+
+        with self.assertRaises(RuntimeError):
+            generate_and_save_report(self.chat)
+
+        self.assertFalse(
+            ExportableReport.objects.filter(chat=self.chat).exists())
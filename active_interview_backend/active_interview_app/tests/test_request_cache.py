@@ -0,0 +1,135 @@
+"""
+Tests for the request-scoped object cache.
+
+Covers:
+- RequestObjectCache: memoized hits, pk aliasing, memoized misses, 404
+- RequestCacheMixin / with_request_cache
+- Chat views load the chat once per request
+- MetricsMiddleware query_count / queries_saved
+"""
+from django.contrib.auth.models import User
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.urls import reverse
+
+from active_interview_app.decorators import with_request_cache
+from active_interview_app.middleware import MetricsMiddleware
+from active_interview_app.models import Chat, InvitedInterview
+from active_interview_app.observability_models import RequestMetric
+from active_interview_app.request_cache import (
+    RequestObjectCache,
+    get_request_cache,
+)
+from .test_credentials import TEST_PASSWORD
+
+
+class RequestObjectCacheTest(TestCase):
+    """Test the identity map."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(owner=self.user, title='Interview')
+        self.cache = RequestObjectCache()
+
+    def test_lookup_loaded_once(self):
+        first = self.cache.get(Chat, id=self.chat.id)
+
+        with self.assertNumQueries(0):
+            second = self.cache.get(Chat, pk=str(self.chat.id))
+
+        self.assertIs(first, second)
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 1))
+
+    def test_unique_key_lookup_registered_under_pk(self):
+        owner_chat = self.cache.get(Chat, owner=self.user)
+
+        with self.assertNumQueries(0):
+            self.assertIs(self.cache.get(Chat, id=self.chat.id), owner_chat)
+
+    def test_miss_memoized(self):
+        with self.assertRaises(InvitedInterview.DoesNotExist):
+            self.cache.get(InvitedInterview, chat=self.chat)
+
+        with self.assertNumQueries(0):
+            with self.assertRaises(InvitedInterview.DoesNotExist):
+                self.cache.get(InvitedInterview, chat=self.chat)
+
+    def test_get_or_404(self):
+        with self.assertRaises(Http404):
+            self.cache.get_or_404(Chat, id=self.chat.id + 1)
+
+    def test_add_and_clear(self):
+        self.cache.add(self.chat)
+        with self.assertNumQueries(0):
+            self.assertIs(self.cache.get(Chat, id=self.chat.id), self.chat)
+
+        self.cache.clear()
+        with self.assertNumQueries(1):
+            self.cache.get(Chat, id=self.chat.id)
+
+    def test_cache_per_request(self):
+        request = RequestFactory().get('/')
+
+        self.assertIs(get_request_cache(request), request.object_cache)
+        self.assertIsNot(get_request_cache(None), get_request_cache(None))
+
+    def test_decorator_attaches_cache(self):
+        @with_request_cache
+        def view(request):
+            request.object_cache.get(Chat, id=self.chat.id)
+            return HttpResponse('OK')
+
+        request = RequestFactory().get('/')
+        view(request)
+
+        self.assertEqual(request.object_cache.misses, 1)
+
+
+class ChatViewRequestCacheTest(TestCase):
+    """Test that the chat views share one Chat per request."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(owner=self.user, title='Interview')
+        self.client.login(username='candidate', password=TEST_PASSWORD)
+
+    def test_test_func_and_handler_share_chat(self):
+        response = self.client.get(
+            reverse('chat-edit', kwargs={'chat_id': self.chat.id}))
+
+        self.assertEqual(response.status_code, 200)
+        cache = response.wsgi_request.object_cache
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+    def test_missing_chat_404(self):
+        response = self.client.get(
+            reverse('export_report', kwargs={'chat_id': self.chat.id + 1}))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class MetricsMiddlewareQueryCountTest(TransactionTestCase):
+    """Test the per-request query counts recorded by MetricsMiddleware."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='candidate', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(owner=self.user, title='Interview')
+
+    def test_query_count_and_queries_saved(self):
+        def view(request):
+            cache = get_request_cache(request)
+            cache.get(Chat, id=self.chat.id)
+            cache.get(Chat, id=self.chat.id)
+            User.objects.count()
+            return HttpResponse('OK')
+
+        request = RequestFactory().get('/api/test/')
+        request.user = self.user
+        MetricsMiddleware(view)(request)
+
+        metric = RequestMetric.objects.get(endpoint='/api/test/')
+        self.assertEqual(metric.query_count, 2)
+        self.assertEqual(metric.queries_saved, 1)
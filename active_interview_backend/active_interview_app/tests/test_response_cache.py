@@ -0,0 +1,199 @@
+"""
+Tests for the content-addressed AI response cache.
+
+Covers:
+- cached_completion: hits, misses on new messages or models, usage tracking
+- Hits need no client (served while the circuit breaker is open)
+- ResultsChat / ResultCharts: cached replies and finalized report reuse
+"""
+from unittest.mock import MagicMock, patch
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from active_interview_app import views
+from active_interview_app.circuit_breaker import CircuitOpenError
+from active_interview_app.models import AIResponseCache, Chat, ExportableReport
+from active_interview_app.response_cache import (
+    acached_completion,
+    cached_completion,
+    response_cache_key
+)
+from active_interview_app.token_usage_models import TokenUsage
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+def _transcript():
+    return [
+        {"role": "system", "content": "You are an interviewer."},
+        {"role": "assistant", "content": "Tell me about yourself."},
+        {"role": "user", "content": "I build Django apps."},
+    ]
+
+
+@patch('active_interview_app.response_cache.get_model_name',
+       return_value='gpt-4o')
+@patch('active_interview_app.response_cache.get_client_and_model')
+class CachedCompletionTest(TestCase):
+    """Test cached_completion."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='cacheuser', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Cached Interview', messages=_transcript())
+        self.client_mock = MagicMock()
+        self.client_mock.chat.completions.create.return_value = (
+            create_mock_openai_response('Great answers.'))
+
+    def _messages(self, extra=None):
+        messages = _transcript() + (extra or [])
+        return messages + [{"role": "user", "content": "Give me feedback."}]
+
+    def test_identical_request_served_from_cache(self, mock_gcm, mock_model):
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+
+        first = cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+        second = cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        self.assertEqual(first, 'Great answers.')
+        self.assertEqual(second, 'Great answers.')
+        self.assertEqual(self.client_mock.chat.completions.create.call_count, 1)
+        self.assertEqual(TokenUsage.objects.count(), 1)
+
+    def test_new_message_misses_and_replaces_entry(self, mock_gcm, mock_model):
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+        cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        cached_completion(
+            self.user, self.chat, 'results_chat',
+            self._messages([{"role": "user", "content": "One more thing."}]))
+
+        self.assertEqual(self.client_mock.chat.completions.create.call_count, 2)
+        self.assertEqual(
+            AIResponseCache.objects.filter(chat=self.chat).count(), 1)
+
+    def test_different_model_misses(self, mock_gcm, mock_model):
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+        cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        mock_model.return_value = 'gpt-3.5-turbo'
+        mock_gcm.return_value = (self.client_mock, 'gpt-3.5-turbo', {})
+        cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        self.assertEqual(self.client_mock.chat.completions.create.call_count, 2)
+
+    def test_hit_needs_no_client(self, mock_gcm, mock_model):
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+        cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        mock_gcm.reset_mock()
+        mock_gcm.side_effect = CircuitOpenError('circuit breaker open')
+        content = cached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        self.assertEqual(content, 'Great answers.')
+        mock_gcm.assert_not_called()
+
+    @patch('active_interview_app.response_cache.aget_client_and_model')
+    async def test_async_hit_needs_no_client(self, mock_agcm, mock_gcm,
+                                             mock_model):
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+        await sync_to_async(cached_completion)(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        content = await acached_completion(
+            self.user, self.chat, 'results_chat', self._messages())
+
+        self.assertEqual(content, 'Great answers.')
+        mock_agcm.assert_not_called()
+
+    def test_key_depends_on_endpoint_model_and_messages(self, mock_gcm, mock_model):
+        messages = self._messages()
+        key = response_cache_key('results_chat', 'gpt-4o', messages)
+
+        self.assertEqual(key, response_cache_key('results_chat', 'gpt-4o', self._messages()))
+        self.assertNotEqual(key, response_cache_key('result_charts_scores', 'gpt-4o', messages))
+        self.assertNotEqual(key, response_cache_key('results_chat', 'gpt-4', messages))
+
+
+@patch('active_interview_app.response_cache.get_model_name',
+       return_value='gpt-4o')
+@patch('active_interview_app.views.render', return_value=HttpResponse())
+@patch('active_interview_app.views.ai_available', return_value=True)
+@patch('active_interview_app.response_cache.get_client_and_model')
+class ResultsViewsCacheTest(TestCase):
+    """Test ResultsChat and ResultCharts with the response cache."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(
+            username='resultsuser', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user, title='Results Interview', messages=_transcript())
+        self.client_mock = MagicMock()
+
+    def _get(self, view_class):
+        request = self.factory.get('/')
+        request.user = self.user
+        return view_class.as_view()(request, chat_id=self.chat.id)
+
+    def test_results_chat_reload_uses_cache(self, mock_gcm, mock_ai, mock_render, mock_model):
+        self.client_mock.chat.completions.create.return_value = (
+            create_mock_openai_response('Solid interview.'))
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+
+        self._get(views.ResultsChat)
+        self._get(views.ResultsChat)
+
+        self.assertEqual(self.client_mock.chat.completions.create.call_count, 1)
+        context = mock_render.call_args.args[2]
+        self.assertEqual(context['feedback'], 'Solid interview.')
+
+    def test_result_charts_reload_uses_cache(self, mock_gcm, mock_ai, mock_render, mock_model):
+        self.client_mock.chat.completions.create.side_effect = [
+            create_mock_openai_response('80\n70\n90\n85'),
+            create_mock_openai_response('Clear and professional.'),
+        ]
+        mock_gcm.return_value = (self.client_mock, 'gpt-4o', {})
+
+        self._get(views.ResultCharts)
+        self._get(views.ResultCharts)
+
+        self.assertEqual(self.client_mock.chat.completions.create.call_count, 2)
+        context = mock_render.call_args.args[2]
+        self.assertEqual(context['scores']['Overall'], 85)
+        self.assertEqual(context['feedback'], 'Clear and professional.')
+
+    def test_finalized_chat_reuses_report(self, mock_gcm, mock_ai, mock_render, mock_model):
+        self.chat.is_finalized = True
+        self.chat.save()
+        ExportableReport.objects.create(
+            chat=self.chat,
+            professionalism_score=81,
+            subject_knowledge_score=72,
+            clarity_score=93,
+            overall_score=84,
+            feedback_text='Report feedback.',
+            overall_rationale='Strong overall.'
+        )
+
+        self._get(views.ResultsChat)
+        self.assertEqual(mock_render.call_args.args[2]['feedback'],
+                         'Report feedback.')
+
+        self._get(views.ResultCharts)
+        context = mock_render.call_args.args[2]
+        self.assertEqual(context['scores']['Clarity'], 93)
+        self.assertEqual(context['feedback'], 'Overall: Strong overall.')
+
+        mock_gcm.assert_not_called()
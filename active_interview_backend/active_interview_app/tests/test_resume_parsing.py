@@ -9,7 +9,7 @@ Tests cover:
 
 import json
 from io import BytesIO
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 from django.contrib.auth.models import User
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -91,13 +91,18 @@ def create_sample_parsed_data():
 class OpenAIUtilsTests(TestCase):
     """Test OpenAI utility functions."""
 
+    def tearDown(self):
+        # Don't leave a client built by a mocked OpenAI in the pool
+        import active_interview_app.openai_utils as utils
+        utils.reset_client_pools()
+
     @override_settings(OPENAI_API_KEY="test-key-12345")
     @patch('active_interview_app.openai_utils.OpenAI')
     def test_get_openai_client_success(self, mock_openai):
         """Test successful OpenAI client initialization."""
         # Reset the global client
         import active_interview_app.openai_utils as utils
-        utils._openai_client = None
+        utils.reset_client_pools()
 
         # Mock OpenAI client
         mock_client = MagicMock()
@@ -108,14 +113,15 @@ class OpenAIUtilsTests(TestCase):
 
         # Verify
         self.assertIsNotNone(client)
-        mock_openai.assert_called_once_with(api_key="test-key-12345")
+        mock_openai.assert_called_once_with(
+            api_key="test-key-12345", http_client=ANY, max_retries=0)
 
     @override_settings(OPENAI_API_KEY="")
     def test_get_openai_client_no_api_key(self):
         """Test OpenAI client initialization fails without API key."""
         # Reset the global client
         import active_interview_app.openai_utils as utils
-        utils._openai_client = None
+        utils.reset_client_pools()
 
         # Attempt to get client without API key
         with self.assertRaises(ValueError) as context:
@@ -129,7 +135,7 @@ class OpenAIUtilsTests(TestCase):
         """Test OpenAI client initialization handles errors."""
         # Reset the global client
         import active_interview_app.openai_utils as utils
-        utils._openai_client = None
+        utils.reset_client_pools()
 
         # Mock initialization failure
         mock_openai.side_effect = Exception("Connection error")
@@ -147,7 +153,7 @@ class OpenAIUtilsTests(TestCase):
         """Test ai_available returns True when client initializes."""
         # Reset the global client
         import active_interview_app.openai_utils as utils
-        utils._openai_client = None
+        utils.reset_client_pools()
 
         mock_openai.return_value = MagicMock()
 
@@ -159,7 +165,7 @@ class OpenAIUtilsTests(TestCase):
         """Test ai_available returns False when client fails."""
         # Reset the global client
         import active_interview_app.openai_utils as utils
-        utils._openai_client = None
+        utils.reset_client_pools()
 
         result = ai_available()
         self.assertFalse(result)
@@ -339,7 +345,7 @@ class ResumeUploadParsingIntegrationTests(TestCase):
 
     @override_settings(OPENAI_API_KEY="test-key")
     @patch('active_interview_app.views.ai_available')
-    @patch('active_interview_app.views.parse_resume_with_ai')
+    @patch('active_interview_app.resume_parser.parse_resume_with_ai')
     @patch('filetype.guess')
     @patch('pymupdf4llm.to_markdown')
     def test_resume_upload_with_successful_parsing(
@@ -382,7 +388,7 @@ class ResumeUploadParsingIntegrationTests(TestCase):
 
     @override_settings(OPENAI_API_KEY="test-key")
     @patch('active_interview_app.views.ai_available')
-    @patch('active_interview_app.views.parse_resume_with_ai')
+    @patch('active_interview_app.resume_parser.parse_resume_with_ai')
     @patch('filetype.guess')
     @patch('pymupdf4llm.to_markdown')
     def test_resume_upload_with_parsing_error(
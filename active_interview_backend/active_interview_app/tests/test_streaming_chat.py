@@ -0,0 +1,237 @@
+"""
+Tests for streamed (Server-Sent Events) interviewer replies in ChatView.
+
+Covers:
+- Opt-in streaming via stream=1 or Accept: text/event-stream
+- Delta events followed by a single done event
+- Full reply saved to Chat.messages after the stream completes
+- Time-to-first-token recorded next to total response time
+- Token usage recorded from the final usage chunk
+- In-band error event when the AI call fails
+- Chat page requests and reads the streamed reply
+"""
+import json
+from unittest.mock import patch, MagicMock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from active_interview_app.models import Chat
+from active_interview_app.observability_models import InterviewResponseLatency
+from active_interview_app.token_usage_models import TokenUsage
+from active_interview_app.latency_utils import LatencyTracker
+from .test_credentials import TEST_PASSWORD
+from .test_utils import create_mock_openai_response
+
+
+def _make_chunk(content=None, usage=None):
+    """Build a mock streaming chunk with optional content and usage."""
+    chunk = MagicMock()
+    if content is None:
+        chunk.choices = []
+    else:
+        choice = MagicMock()
+        choice.delta.content = content
+        chunk.choices = [choice]
+    chunk.usage = usage
+    chunk.model = 'gpt-4o'
+    return chunk
+
+
+def _usage(prompt_tokens=120, completion_tokens=30):
+    usage = MagicMock()
+    usage.prompt_tokens = prompt_tokens
+    usage.completion_tokens = completion_tokens
+    return usage
+
+
+def _parse_events(response):
+    """Collect (event, data) tuples from a streamed SSE response."""
+    body = b''.join(response.streaming_content).decode()
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.splitlines())
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+class StreamingChatViewTest(TestCase):
+    """Test the streaming mode of ChatView.post."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='streamer',
+            password=TEST_PASSWORD
+        )
+        self.client.login(username='streamer', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(
+            owner=self.user,
+            title='Streaming Interview',
+            messages=[
+                {"role": "system", "content": "You are an interviewer."},
+                {"role": "assistant", "content": "Hello! Let's begin."}
+            ]
+        )
+        self.url = reverse('chat-view', kwargs={'chat_id': self.chat.id})
+
+    def _mock_stream(self, mock_get_client_and_model, chunks):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = iter(chunks)
+        mock_get_client_and_model.return_value = (mock_client, 'gpt-4o', {})
+        return mock_client
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_stream_sends_deltas_then_done(self, mock_gcm, mock_ai):
+        """Deltas are emitted in order, followed by one done event."""
+        mock_client = self._mock_stream(mock_gcm, [
+            _make_chunk('Tell me '),
+            _make_chunk(''),
+            _make_chunk('about yourself.'),
+            _make_chunk(usage=_usage()),
+        ])
+
+        response = self.client.post(self.url, {'message': 'Hi', 'stream': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertTrue(response.streaming)
+
+        events = _parse_events(response)
+        self.assertEqual(
+            [e for e, _ in events], ['delta', 'delta', 'done'])
+        self.assertEqual(events[0][1], {'content': 'Tell me '})
+        self.assertEqual(
+            events[-1][1], {'message': 'Tell me about yourself.'})
+
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertTrue(kwargs['stream'])
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_stream_saves_full_reply(self, mock_gcm, mock_ai):
+        """The assembled reply is persisted once the stream completes."""
+        self._mock_stream(mock_gcm, [
+            _make_chunk('Part one, '),
+            _make_chunk('part two.'),
+        ])
+
+        response = self.client.post(self.url, {'message': 'Answer', 'stream': 'true'})
+        _parse_events(response)
+
+        self.chat.refresh_from_db()
+        self.assertEqual(self.chat.messages[-2],
+                         {"role": "user", "content": "Answer"})
+        self.assertEqual(self.chat.messages[-1],
+                         {"role": "assistant", "content": "Part one, part two."})
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_accept_header_enables_streaming(self, mock_gcm, mock_ai):
+        """Accept: text/event-stream selects streaming mode."""
+        self._mock_stream(mock_gcm, [_make_chunk('Hi')])
+
+        response = self.client.post(
+            self.url, {'message': 'Hello'},
+            HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(_parse_events(response)[-1][0], 'done')
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_stream_records_time_to_first_token(self, mock_gcm, mock_ai):
+        """Latency record stores time-to-first-token next to total time."""
+        self._mock_stream(mock_gcm, [_make_chunk('A'), _make_chunk('B')])
+
+        response = self.client.post(self.url, {'message': 'Go', 'stream': '1'})
+        _parse_events(response)
+
+        record = InterviewResponseLatency.objects.get(chat=self.chat)
+        self.assertIsNotNone(record.time_to_first_token_ms)
+        self.assertLessEqual(
+            record.time_to_first_token_ms, record.response_time_ms)
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_stream_records_token_usage(self, mock_gcm, mock_ai):
+        """Usage from the final chunk is recorded against chat_view."""
+        self._mock_stream(mock_gcm, [
+            _make_chunk('Done'),
+            _make_chunk(usage=_usage(200, 40)),
+        ])
+
+        response = self.client.post(self.url, {'message': 'Go', 'stream': '1'})
+        _parse_events(response)
+
+        usage = TokenUsage.objects.get(endpoint='chat_view')
+        self.assertEqual(usage.prompt_tokens, 200)
+        self.assertEqual(usage.completion_tokens, 40)
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_stream_error_event(self, mock_gcm, mock_ai):
+        """AI failures are reported as an error event, not a 503."""
+        mock_gcm.side_effect = Exception('upstream down')
+
+        response = self.client.post(self.url, {'message': 'Go', 'stream': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        events = _parse_events(response)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0][0], 'error')
+        self.assertEqual(events[0][1]['message'], 'upstream down')
+
+    @patch('active_interview_app.views.ai_available', return_value=True)
+    @patch('active_interview_app.views.get_client_and_model')
+    def test_json_mode_unchanged(self, mock_gcm, mock_ai):
+        """Without the opt-in the view still returns a JSON response."""
+        mock_response = create_mock_openai_response('Plain reply')
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_gcm.return_value = (mock_client, 'gpt-4o', {})
+
+        response = self.client.post(self.url, {'message': 'Hello'})
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.json(), {'message': 'Plain reply'})
+        self.assertNotIn(
+            'stream', mock_client.chat.completions.create.call_args.kwargs)
+
+    def test_chat_page_reads_event_stream(self):
+        """The chat page asks for SSE and renders delta events."""
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "'Accept': 'text/event-stream")
+        self.assertContains(response, 'response.body.getReader()')
+        self.assertContains(response, "event === 'delta'")
+
+
+class LatencyTrackerFirstTokenTest(TestCase):
+    """Test LatencyTracker.mark_first_token."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='ttft', password=TEST_PASSWORD)
+        self.chat = Chat.objects.create(owner=self.user, title='TTFT')
+
+    def test_first_call_wins(self):
+        """Only the first mark is kept."""
+        with LatencyTracker(self.chat) as tracker:
+            tracker.mark_first_token()
+            first = tracker.time_to_first_token_ms
+            tracker.mark_first_token()
+
+        self.assertEqual(tracker.time_to_first_token_ms, first)
+        self.assertEqual(
+            tracker.latency_record.time_to_first_token_ms, first)
+
+    def test_not_marked_for_non_streamed_responses(self):
+        """Non-streamed responses leave time-to-first-token empty."""
+        with LatencyTracker(self.chat) as tracker:
+            pass
+
+        self.assertIsNone(tracker.latency_record.time_to_first_token_ms)
@@ -281,7 +281,7 @@ class DataExportViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'user_data/request_export.html')
 
-    @patch('active_interview_app.views.process_export_request')
+    @patch('active_interview_app.user_data_utils.process_export_request')
     def test_request_data_export_post(self, mock_process):
         """Test POST request to create export"""
         response = self.client.post(reverse('request_data_export'))
@@ -683,9 +683,9 @@ class EmailErrorHandlingTest(TestCase):
             password=TEST_PASSWORD
         )
 
-    @patch('active_interview_app.user_data_utils.send_mail')
+    @patch('active_interview_app.user_data_utils.queue_email')
     @patch('active_interview_app.user_data_utils.logger')
-    def test_export_email_failure_logging(self, mock_logger, mock_send_mail):
+    def test_export_email_failure_logging(self, mock_logger, mock_queue_email):
         """Test that email failures are logged properly"""
         from active_interview_app.user_data_utils import send_export_ready_email
 
@@ -696,7 +696,7 @@ class EmailErrorHandlingTest(TestCase):
         export.save()
 
         # Mock email failure
-        mock_send_mail.side_effect = Exception("SMTP connection failed")
+        mock_queue_email.side_effect = Exception("SMTP connection failed")
 
         # Send email (should not raise exception)
         send_export_ready_email(export)
@@ -706,14 +706,14 @@ class EmailErrorHandlingTest(TestCase):
         self.assertIn("Failed to send export notification email",
                       str(mock_logger.warning.call_args))
 
-    @patch('active_interview_app.user_data_utils.send_mail')
+    @patch('active_interview_app.user_data_utils.queue_email')
     @patch('active_interview_app.user_data_utils.logger')
-    def test_deletion_email_failure_logging(self, mock_logger, mock_send_mail):
+    def test_deletion_email_failure_logging(self, mock_logger, mock_queue_email):
         """Test that deletion email failures are logged properly"""
         from active_interview_app.user_data_utils import send_deletion_confirmation_email
 
         # Mock email failure
-        mock_send_mail.side_effect = Exception("Email server unreachable")
+        mock_queue_email.side_effect = Exception("Email server unreachable")
 
         # Send email (should not raise exception)
         send_deletion_confirmation_email('testuser', 'test@example.com')
@@ -28,7 +28,7 @@ class OpenAIClientTest(TestCase):
     def test_get_openai_client_no_api_key(self, mock_settings):
         """Test get_openai_client when API key is not set"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         mock_settings.OPENAI_API_KEY = None
 
@@ -43,7 +43,7 @@ class OpenAIClientTest(TestCase):
             self, mock_settings, mock_openai):
         """Test get_openai_client when OpenAI initialization fails"""
         import active_interview_app.openai_utils as openai_utils
-        openai_utils._openai_client = None
+        openai_utils.reset_client_pools()
 
         mock_settings.OPENAI_API_KEY = 'test-key'
         mock_openai.side_effect = Exception("OpenAI init failed")
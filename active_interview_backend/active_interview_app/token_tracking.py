@@ -31,6 +31,23 @@ def get_current_git_branch():
         return 'unknown'
 
 
+def get_cached_prompt_tokens(usage):
+    """
+    Get the prompt tokens the provider served from its prompt cache.
+
+    Args:
+        usage: The .usage attribute of an OpenAI or Claude response
+
+    Returns:
+        int: Cached prompt tokens (0 if the response does not report them)
+    """
+    details = getattr(usage, 'prompt_tokens_details', None)
+    cached = getattr(details, 'cached_tokens', None)
+    if cached is None:
+        cached = getattr(usage, 'cache_read_input_tokens', None)
+    return cached if isinstance(cached, int) else 0
+
+
 def record_token_usage(user, endpoint, model_name, response):
     """
     Record token usage from an OpenAI or Claude API response.
@@ -45,7 +62,13 @@ def record_token_usage(user, endpoint, model_name, response):
         - prompt_tokens (int)
         - completion_tokens (int)
         - total_tokens (int, optional - will be calculated if not present)
+        - prompt_tokens_details.cached_tokens (OpenAI) or
+          cache_read_input_tokens (Claude) (int, optional)
+
+    The version of the endpoint's registered prompt (see prompts.py) is
+    recorded alongside, to compare prompt revisions.
     """
+    from .prompts import version_for_endpoint
     from .token_usage_models import TokenUsage
 
     # Skip if token tracking is disabled
@@ -60,6 +83,7 @@ def record_token_usage(user, endpoint, model_name, response):
         usage = response.usage
         prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
         completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+        cached_prompt_tokens = get_cached_prompt_tokens(usage)
 
         # Create token usage record
         TokenUsage.objects.create(
@@ -68,7 +92,9 @@ def record_token_usage(user, endpoint, model_name, response):
             model_name=model_name,
             endpoint=endpoint,
             prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens
+            completion_tokens=completion_tokens,
+            cached_prompt_tokens=cached_prompt_tokens,
+            prompt_version=version_for_endpoint(endpoint)
         )
     except AttributeError as e:
         # Log error but don't break the application
@@ -47,6 +47,16 @@ class TokenUsage(models.Model):
         default=0,
         help_text="Total tokens used (prompt + completion)"
     )
+    cached_prompt_tokens = models.IntegerField(
+        default=0,
+        help_text="Prompt tokens served from the provider's prompt cache"
+    )
+    prompt_version = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+        help_text="Version of the registered prompt sent (see prompts.py)"
+    )
 
     class Meta:
         ordering = ['-created_at']
@@ -5,6 +5,7 @@ from django.conf.urls.static import static
 from rest_framework import routers
 
 from . import views
+from . import async_views
 from . import question_bank_views
 from . import observability_views
 from .admin_views import (
@@ -35,6 +36,20 @@ router.register(
     basename='interview-template')
 
 
+# AI-bound views: async versions await OpenAI on the event loop when served
+# by an ASGI server (settings.ASYNC_VIEWS, see start.sh)
+if settings.ASYNC_VIEWS:
+    create_chat_view = async_views.create_chat
+    chat_view = async_views.chat_view
+    key_questions_view = async_views.key_questions_view
+    start_invited_interview_view = async_views.start_invited_interview
+else:
+    create_chat_view = views.CreateChat.as_view()
+    chat_view = views.ChatView.as_view()
+    key_questions_view = views.KeyQuestionsView.as_view()
+    start_invited_interview_view = views.start_invited_interview
+
+
 urlpatterns = [
     # Misc. urls
     path('', views.index, name='index'),
@@ -54,8 +69,8 @@ urlpatterns = [
 
     # Chat url
     path('chat/', views.chat_list, name='chat-list'),
-    path('chat/create/', views.CreateChat.as_view(), name='chat-create'),
-    path('chat/<int:chat_id>/', views.ChatView.as_view(), name='chat-view'),
+    path('chat/create/', create_chat_view, name='chat-create'),
+    path('chat/<int:chat_id>/', chat_view, name='chat-view'),
     path('chat/<int:chat_id>/edit/', views.EditChat.as_view(),
          name='chat-edit'),
     path('chat/<int:chat_id>/delete/', views.DeleteChat.as_view(),
@@ -63,7 +78,7 @@ urlpatterns = [
     path('chat/<int:chat_id>/restart/', views.RestartChat.as_view(),
          name='chat-restart'),
     path('chat/<int:chat_id>/key-questions/<int:question_id>/',
-         views.KeyQuestionsView.as_view(), name='key-questions'),
+         key_questions_view, name='key-questions'),
 
     # Demo urls
     # path('demo/', views.demo, name='demo'),
@@ -191,7 +206,7 @@ urlpatterns = [
     path('interview/invited/<uuid:invitation_id>/',
          views.invited_interview_detail, name='invited_interview_detail'),
     path('interview/invited/<uuid:invitation_id>/start/',
-         views.start_invited_interview, name='start_invited_interview'),
+         start_invited_interview_view, name='start_invited_interview'),
     path('my-invitations/', views.candidate_invitations,
          name='candidate_invitations'),
 
@@ -206,6 +221,13 @@ urlpatterns = [
          observability_views.api_metrics_errors, name='api_metrics_errors'),
     path('observability/api/metrics/costs/',
          observability_views.api_metrics_costs, name='api_metrics_costs'),
+    path('observability/api/metrics/clients/',
+         observability_views.api_metrics_clients, name='api_metrics_clients'),
+    path('observability/api/metrics/breakers/',
+         observability_views.api_metrics_breakers,
+         name='api_metrics_breakers'),
+    path('observability/api/metrics/buffer/',
+         observability_views.api_metrics_buffer, name='api_metrics_buffer'),
     path('observability/api/export/',
          observability_views.api_export_metrics, name='api_export_metrics'),
 
@@ -16,16 +16,15 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.core.files.base import ContentFile
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.html import strip_tags
 
 from .constants import (
     EXPORT_EXPIRATION_DAYS,
-    EXPORT_FILE_PREFIX,
-    EMAIL_FAIL_SILENTLY
+    EXPORT_FILE_PREFIX
 )
+from .email_outbox import queue_email
 from .models import (
     Chat,
     DataExportRequest,
@@ -112,7 +111,8 @@ def export_user_data_to_dict(user):
 
     # Interview chats
     interviews = []
-    for chat in Chat.objects.filter(owner=user):
+    for chat in Chat.objects.filter(owner=user).prefetch_related(
+            'chat_messages'):
         interview_data = {
             'id': chat.id,
             'title': chat.title,
@@ -387,16 +387,14 @@ def send_export_ready_email(export_request):
 
         plain_message = strip_tags(html_message)
 
-        send_mail(
+        queue_email(
             subject,
             plain_message,
-            settings.DEFAULT_FROM_EMAIL,
             [user.email],
-            html_message=html_message,
-            fail_silently=EMAIL_FAIL_SILENTLY,
+            html_body=html_message
         )
         logger.info(
-            f"Export notification email sent to {user.email} for request {export_request.id}")
+            f"Export notification email queued for {user.email} for request {export_request.id}")
     except Exception as e:
         # Log error but don't fail the export process
         logger.warning(
@@ -418,7 +416,8 @@ def anonymize_user_interviews(user):
     _anonymized_id = generate_anonymized_id(user)  # noqa: F841
     count = 0
 
-    for chat in Chat.objects.filter(owner=user):
+    for chat in Chat.objects.filter(owner=user).prefetch_related(
+            'chat_messages'):
         # Clear personally identifiable message content
         if chat.messages:
             chat.messages = []
@@ -564,15 +563,9 @@ The AIS Team
 """
 
     try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=EMAIL_FAIL_SILENTLY,
-        )
+        queue_email(subject, message, [email])
         logger.info(
-            f"Deletion confirmation email sent to {email} for user {username}")
+            f"Deletion confirmation email queued for {email} for user {username}")
     except Exception as e:
         logger.warning(
             f"Failed to send deletion confirmation email to {email} for user {username}: {e}",
@@ -15,7 +15,7 @@ from .models import (
     UploadedResume, UploadedJobListing, Chat,
     ExportableReport, UserProfile, RoleChangeRequest,
     InterviewTemplate, DataExportRequest, DeletionRequest,
-    InvitedInterview
+    InvitedInterview, ChatContextSummary
 )
 from .forms import (
     CreateUserForm,
@@ -32,15 +32,20 @@ from .serializers import (
     UploadedJobListingSerializer
 )
 from .pdf_export import generate_pdf_report, get_score_rating
-from .resume_parser import parse_resume_with_ai
 from .job_listing_parser import parse_job_listing_with_ai
 from .user_data_utils import (
-    process_export_request,
     delete_user_account,
     generate_anonymized_id
 )
 from .invitation_utils import send_invitation_email
 from .bias_detection import BiasDetectionService
+from .context_utils import build_context_messages
+from .circuit_breaker import CircuitOpenError
+from .response_cache import cached_completion
+from .job_queue import enqueue, PRIORITY_INTERACTIVE
+from . import prompts
+from .prompts import render_interview_prompt
+from .request_cache import get_request_cache
 
 
 from django.conf import settings
@@ -50,7 +55,9 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.contrib.auth.models import Group, User
 from django.forms.models import model_to_dict
-from django.http import JsonResponse, HttpResponse, FileResponse
+from django.http import (
+    JsonResponse, HttpResponse, FileResponse, StreamingHttpResponse
+)
 from django.shortcuts import render, redirect, get_object_or_404
 from django.utils.text import slugify
 from django.utils.timezone import now
@@ -66,10 +73,14 @@ from rest_framework.views import APIView
 
 # Import OpenAI utilities (moved to separate module to prevent circular imports)
 # Updated for Issue #14: Multi-tier model selection with automatic fallback
-from .openai_utils import get_openai_client, get_client_and_model, ai_available, MAX_TOKENS  # noqa: F401
+from .openai_utils import (  # noqa: F401
+    get_openai_client, get_client_and_model, ai_available, MAX_TOKENS,
+    create_completion, run_completions_concurrently
+)
 
 # Import rate limiting decorators
 from .decorators import ratelimit_api
+from .mixins import RequestCacheMixin
 
 # Import token tracking (Issue #15.10)
 from .token_tracking import record_openai_usage
@@ -87,6 +98,40 @@ def _ai_unavailable_json():
         {'error': 'AI features are disabled on this server.'}, status=503)
 
 
+def _ai_service_error_json(error):
+    """
+    Return the 503 JSON response for a failed AI call.
+
+    When every circuit breaker is open, Retry-After tells the client when
+    the provider will be tried again.
+    """
+    response = JsonResponse({
+        'error': 'AI service unavailable',
+        'message': str(error)
+    }, status=503)
+    if isinstance(error, CircuitOpenError) and error.retry_after:
+        response['Retry-After'] = str(error.retry_after)
+    return response
+
+
+def _wants_event_stream(request):
+    """
+    Return True if the client asked for a streamed (SSE) reply.
+
+    Streaming is opt-in, either with an ``Accept: text/event-stream``
+    header or a ``stream=1`` form field, so existing JSON clients are
+    unaffected.
+    """
+    if 'text/event-stream' in request.META.get('HTTP_ACCEPT', ''):
+        return True
+    return request.POST.get('stream', '').lower() in ('1', 'true', 'yes')
+
+
+def _sse_event(event, data):
+    """Format a single Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 # Create your views here.
 def index(request):
     return render(request, 'index.html')
@@ -136,7 +181,7 @@ def results(request):
 #
 #     elif request.method == 'POST':
 #         chat_id = request.session.get('chat_id')
-#         chat = Chat.objects.get(id=chat_id)
+#         chat = self.get_cached_object(Chat, id=chat_id)
 #
 #         user_message = request.POST.get('message', '')
 #
@@ -159,22 +204,103 @@ def results(request):
 
 @login_required
 def chat_list(request):
-    owner_chats = Chat.objects.filter(
-        owner=request.user
-    ).order_by('-modified_date')
+    # The chats come from the sidebar_chats context processor
+    return render(request, os.path.join('chat', 'chat-list.html'))
 
-    context = {}
-    context['owner_chats'] = owner_chats
 
-    return render(request, os.path.join('chat', 'chat-list.html'), context)
+def _interview_prompt_values(chat):
+    """Per-chat values for the practice interview prompts."""
+    return {
+        'listing': chat.job_listing.content,
+        'resume': chat.resume.content if chat.resume else None,
+        'interview_type': chat.get_type_display(),
+        'difficulty': chat.difficulty,
+    }
+
+
+def _build_interview_prompt(chat):
+    """
+    Build the interviewer system prompt for a practice chat.
+
+    Includes the resume section when the chat has a resume attached.
+    """
+    return render_interview_prompt(
+        prompts.INTERVIEW_GREETING, **_interview_prompt_values(chat))
+
+
+def _build_key_questions_prompt(chat):
+    """Build the system prompt asking for the chat's timed key questions."""
+    return render_interview_prompt(
+        prompts.INTERVIEW_KEY_QUESTIONS, **_interview_prompt_values(chat))
+
+
+def _extract_key_questions(ai_message):
+    """
+    Extract the JSON array of key questions from an AI reply.
+
+    Returns:
+        list: Parsed questions, or None if the reply has no JSON array
+    """
+    match = re.search(r"(\[[\s\S]+\])", ai_message)
+    if match:
+        return json.loads(match.group(0).strip())
+    return None
+
+
+def _build_question_feedback_prompt(chat, question, user_message):
+    """Build the system prompt for feedback on a single key question."""
+    return render_interview_prompt(
+        prompts.QUESTION_FEEDBACK,
+        question=question["content"],
+        answer=user_message,
+        **_interview_prompt_values(chat)
+    )
+
+
+# Prompt appended to the transcript to request results-page feedback
+_RESULTS_FEEDBACK_PROMPT = prompts.RESULTS_FEEDBACK.render()
+
+
+def _generate_concurrently(request, chat, requests):
+    """
+    Run independent completions at once and record their token usage.
+
+    The calls share one tier selection and are timed together as the
+    chat's opening latency (question 0), which is what the user waits for.
+
+    Args:
+        request: Current request (usage is recorded against its user)
+        chat: Chat the completions belong to
+        requests (list): (endpoint, messages) pairs; each endpoint is
+            also the call's generation profile
+
+    Returns:
+        list: Reply content per request, or None where the call failed
+    """
+    from .latency_utils import LatencyTracker
+
+    # Track latency for initial greeting (Issues #20, #54)
+    with LatencyTracker(chat, question_number=0):
+        # Auto-select model tier based on spending cap (Issue #14)
+        client, model, tier_info = get_client_and_model()
+        results = run_completions_concurrently(
+            client, model, [messages for _, messages in requests],
+            profiles=[endpoint for endpoint, _ in requests])
+
+    contents = []
+    for (endpoint, _), (response, error) in zip(requests, results):
+        if error is not None:
+            print(f"Failed to generate {endpoint}: {error}")
+            contents.append(None)
+            continue
+        # Track token usage for spending cap (Issue #15.10)
+        record_openai_usage(request.user, endpoint, response)
+        contents.append(response.choices[0].message.content)
+    return contents
 
 
 class CreateChat(LoginRequiredMixin, View):
     def get(self, request):
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
-
         # Pre-populate form from URL parameters (Issue #53)
         job_id = request.GET.get('job_id')
         template_id = request.GET.get('template_id')
@@ -204,7 +330,6 @@ class CreateChat(LoginRequiredMixin, View):
         form = CreateChatForm(user=request.user, initial=initial_data)
 
         context = {
-            'owner_chats': owner_chats,
             'form': form,
             'suggested_template': suggested_template,  # Issue #53
             'from_job_analysis': bool(job_id)  # Flag for UI
@@ -226,91 +351,7 @@ class CreateChat(LoginRequiredMixin, View):
                 chat.type = form.cleaned_data["type"]
                 chat.owner = request.user
 
-                # Prompts are edited by ChatGPT after being written by a human
-                # developer
-                # Default message. Should only show up if something went wrong.
-                system_prompt = (
-                    "An error has occurred.  Please notify the user about "
-                    "this."
-                )
-                if chat.resume:  # if resume is present
-                    system_prompt = textwrap.dedent("""\
-                        You are a professional interviewer for a company
-                        preparing for a candidate's interview. You will act as
-                        the interviewer and engage in a roleplaying session
-                        with the candidate.
-
-                        Please review the job listing, resume and misc.
-                        interview details below:
-
-                        # Type of Interview
-                        This interview will be of the following type: {type}
-
-                        # Difficulty
-                        - **Scale:** 1 to 10
-                        - **1** = extremely easygoing interview, no curveballs
-                        - **10** = very challenging, for top‑tier candidates
-                          only
-                        - **Selected level:** <<{difficulty}>>
-
-                        # Job Listing:
-                        \"\"\"{listing}\"\"\"
-
-                        # Candidate Resume:
-                        \"\"\"{resume}\"\"\"
-
-                        Ignore any formatting issues in the resume, and focus
-                        on its content.
-                        Begin the session by greeting the candidate and asking
-                        an introductory question about their background, then
-                        move on to deeper, role-related questions based on the
-                        job listing and resume.
-
-                        Respond critically to any responses that are off-topic
-                        or ignore the fact that the user is in an interview.
-                        For example, the user may not ask questions that are
-                        normally accpetable for AI like recipes or book
-                        reviews.
-                    """).format(listing=chat.job_listing.content,
-                                resume=chat.resume.content,
-                                difficulty=chat.difficulty,
-                                type=chat.get_type_display())
-                else:  # if no resume
-                    system_prompt = textwrap.dedent("""\
-                        You are a professional interviewer for a company
-                        preparing for a candidate's interview. You will act as
-                        the interviewer and engage in a roleplaying session
-                        with the candidate.
-
-                        Please review the job listing and misc. interview
-                        details below:
-
-                        # Type of Interview
-                        This interview will be of the following type: {type}
-
-                        # Difficulty
-                        - **Scale:** 1 to 10
-                        - **1** = extremely easygoing interview, no curveballs
-                        - **10** = very challenging, for top‑tier candidates
-                          only
-                        - **Selected level:** <<{difficulty}>>
-
-                        # Job Listing:
-                        \"\"\"{listing}\"\"\"
-
-                        Begin the session by greeting the candidate and asking
-                        an introductory question about their background, then
-                        move on to role-specific questions based on the job
-                        listing.
-
-                        Respond critically to any responses that are off-topic
-                        or ignore the fact that the user is in an interview.
-                        For example, the user may not ask questions that are
-                        normally accpetable for AI like recipes or book
-                        reviews.
-                    """).format(listing=chat.job_listing.content,
-                                difficulty=chat.difficulty,
-                                type=chat.get_type_display())
+                system_prompt = _build_interview_prompt(chat)
 
                 chat.messages = [
                     {
@@ -319,140 +360,11 @@ class CreateChat(LoginRequiredMixin, View):
                     },
                 ]
 
-                # Make ai speak first
-                if not ai_available():
-                    messages.error(
-                        request, "AI features are disabled on this server.")
-                    ai_message = ""
-                else:
-                    # Track latency for initial greeting (Issues #20, #54)
-                    from .latency_utils import LatencyTracker
-                    with LatencyTracker(chat, question_number=0):
-                        # Auto-select model tier based on spending cap (Issue #14)
-                        client, model, tier_info = get_client_and_model()
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=chat.messages,
-                            max_tokens=MAX_TOKENS
-                        )
-                        # Track token usage for spending cap (Issue #15.10)
-                        record_openai_usage(request.user, 'create_chat', response)
-                        ai_message = response.choices[0].message.content
-                chat.messages.append(
-                    {
-                        "role": "assistant",
-                        "content": ai_message
-                    }
-                )
-
                 # ===== Get AI timed questions =====
-                if chat.resume:  # if resume is present
-                    system_prompt = textwrap.dedent("""\
-                        You are a professional interviewer for a company
-                        preparing for a candidate's interview. You will act as
-                        the interviewer and engage in a roleplaying session
-                        with the candidate.
-
-                        Please review the job listing, resume and misc.
-                        interview details below:
-
-                        # Type of Interview
-                        This interview will be of the following type: {type}
-
-                        # Difficulty
-                        - **Scale:** 1 to 10
-                        - **1** = extremely easygoing interview, no curveballs
-                        - **10** = very challenging, for top‑tier candidates
-                          only
-                        - **Selected level:** <<{difficulty}>>
-
-                        # Job Listing:
-                        \"\"\"{listing}\"\"\"
-
-                        # Candidate Resume:
-                        \"\"\"{resume}\"\"\"
-
-                        Ignore any formatting issues in the resume, and focus
-                        on its content.
-                        Please provide a json formatted list of 10 key
-                        interview questions you wish to ask the user and the
-                        duration of time they should have to answer each
-                        question in seconds.  For example:
-
-                        \"\"\"
-                        [
-                            {{
-                                "id": 0,
-                                "title": "Merge Conflicts",
-                                "duration": 60,
-                                "content": "How would you handle a merge \
-                                            conflict?"
-                            }}
-                        ]
-                        \"\"\"
-
-                        Respond critically to any responses that are off-topic
-                        or ignore the fact that the user is in an interview.
-                        For example, the user may not ask questions that are
-                        normally accpetable for AI like recipes or book
-                        reviews.
-                    """).format(listing=chat.job_listing.content,
-                                resume=chat.resume.content,
-                                difficulty=chat.difficulty,
-                                type=chat.get_type_display())
-                else:  # if no resume"
-                    system_prompt = textwrap.dedent("""\
-                        You are a professional interviewer for a company
-                        preparing for a candidate's interview. You will act as
-                        the interviewer and engage in a roleplaying session
-                        with the candidate.
-
-                        Please review the job listing and misc. interview
-                        details below:
-
-                        # Type of Interview
-                        This interview will be of the following type: {type}
-
-                        # Difficulty
-                        - **Scale:** 1 to 10
-                        - **1** = extremely easygoing interview, no curveballs
-                        - **10** = very challenging, for top‑tier candidates
-                          only
-                        - **Selected level:** <<{difficulty}>>
-
-                        # Job Listing:
-                        \"\"\"{listing}\"\"\"
-
-                        Please provide a json formatted list of 10 key
-                        interview questions you wish to ask the user and the
-                        duration of time they should have to answer each
-                        question in seconds.  For example:
-
-                        \"\"\"
-                        [
-                            {{
-                                "id": 0,
-                                "title": "Merge Conflicts",
-                                "duration": 60,
-                                "content": "How would you handle a merge \
-                                            conflict?"
-                            }}
-                        ]
-                        \"\"\"
-
-                        Respond critically to any responses that are off-topic
-                        or ignore the fact that the user is in an interview.
-                        For example, the user may not ask questions that are
-                        normally accpetable for AI like recipes or book
-                        reviews.
-                    """).format(listing=chat.job_listing.content,
-                                difficulty=chat.difficulty,
-                                type=chat.get_type_display())
-
                 timed_question_messages = [
                     {
                         "role": "system",
-                        "content": system_prompt
+                        "content": _build_key_questions_prompt(chat)
                     },
                 ]
 
@@ -460,24 +372,33 @@ class CreateChat(LoginRequiredMixin, View):
                 if not ai_available():
                     messages.error(
                         request, "AI features are disabled on this server.")
-                    ai_message = "[]"
+                    ai_message = ""
+                    key_questions_message = "[]"
                 else:
-                    # Auto-select model tier based on spending cap (Issue #14)
-                    client, model, tier_info = get_client_and_model()
-                    response = client.chat.completions.create(
-                        model=model,
-                        messages=timed_question_messages,
-                        max_tokens=MAX_TOKENS
-                    )
-                    # Track token usage for spending cap (Issue #15.10)
-                    record_openai_usage(request.user, 'create_chat_timed_questions', response)
-                    ai_message = response.choices[0].message.content
+                    # Greeting and key questions are independent, so both
+                    # are requested at once
+                    ai_message, key_questions_message = \
+                        _generate_concurrently(request, chat, [
+                            ('create_chat', chat.messages),
+                            ('create_chat_timed_questions',
+                             timed_question_messages),
+                        ])
+                    if ai_message is None:
+                        messages.error(
+                            request,
+                            "Failed to generate the interviewer greeting.")
+                        ai_message = ""
+                chat.messages.append(
+                    {
+                        "role": "assistant",
+                        "content": ai_message
+                    }
+                )
 
                 # Extract JSON array from the AI response
-                match = re.search(r"(\[[\s\S]+\])", ai_message)
-                if match:
-                    cleaned_message = match.group(0).strip()
-                    chat.key_questions = json.loads(cleaned_message)
+                key_questions = _extract_key_questions(key_questions_message or "")
+                if key_questions is not None:
+                    chat.key_questions = key_questions
                 else:
                     # Fallback if regex doesn't match
                     messages.error(
@@ -489,29 +410,198 @@ class CreateChat(LoginRequiredMixin, View):
                 return redirect("chat-view", chat_id=chat.id)
             else:
                 # Form is invalid, render the form again with errors
-                owner_chats = Chat.objects.filter(
-                    owner=request.user).order_by('-modified_date')
                 return render(request, os.path.join('chat', 'chat-create.html'), {
-                    'form': form,
-                    'owner_chats': owner_chats
+                    'form': form
                 })
         else:
             # 'create' not in POST, redirect to chat list
             return redirect('chat-list')
 
 
-class ChatView(LoginRequiredMixin, UserPassesTestMixin, View):
+# Payload returned when a message is posted after the time window closed
+_TIME_EXPIRED_PAYLOAD = {
+    'error': 'Interview time has expired',
+    'time_expired': True
+}
+
+
+def _complete_invitation(chat, request=None):
+    """
+    Mark the invitation linked to a chat as completed (Issue #138).
+
+    Sends the completion notification to the interviewer the first time
+    the invitation is completed. Chats without an invitation are ignored.
+    The invitation is looked up through the request's object cache.
+    """
+    try:
+        invitation = get_request_cache(request).get(
+            InvitedInterview, chat=chat)
+    except InvitedInterview.DoesNotExist:
+        return
+
+    if invitation.status != InvitedInterview.COMPLETED:
+        invitation.status = InvitedInterview.COMPLETED
+        invitation.completed_at = timezone.now()
+        invitation.save()
+
+        # Send completion notification to interviewer
+        from .invitation_utils import send_completion_notification_email
+        send_completion_notification_email(invitation)
+
+
+def _should_end_interview(chat):
+    """
+    Return True when an invited interview should stop asking questions.
+
+    No new questions are asked after T-5 minutes (Phase 6-7 graceful ending).
+    """
+    if chat.interview_type != Chat.INVITED:
+        return False
+    time_remaining = chat.time_remaining()
+    return bool(time_remaining and time_remaining.total_seconds() < 300)
+
+
+def _end_interview_gracefully(request, chat, new_messages):
+    """
+    Thank the candidate, save the transcript and auto-finalize (Phase 6-7).
+
+    Returns:
+        dict: Response payload for the client
+    """
+    # Don't ask new questions - thank candidate and end
+    ai_message = textwrap.dedent("""\
+        Thank you for your response.
+
+        The interview time window is ending, so this concludes our interview.
+        Your responses will be reviewed and you'll receive feedback soon.
+
+        Thank you for your time!
+    """)
+
+    # Add final message
+    new_messages.append({"role": "assistant", "content": ai_message})
+    chat.messages = new_messages
+    chat.last_question_at = timezone.now()
+    chat.save()
+
+    # Auto-finalize
+    if not chat.is_finalized:
+        from .report_utils import generate_and_save_report
+        from .audit_utils import create_audit_log
+        try:
+            generate_and_save_report(chat, include_rushed_qualifier=True)
+            chat.is_finalized = True
+            chat.finalized_at = timezone.now()
+            chat.save()
+
+            # Audit log: Interview finalized
+            create_audit_log(
+                user=request.user,
+                action_type='INTERVIEW_FINALIZED',
+                resource_type='Chat',
+                resource_id=str(chat.id),
+                description=f"Interview '{chat.title}' auto-finalized due to time window ending",
+                extra_data={
+                    'interview_type': chat.interview_type,
+                    'auto_finalized': True,
+                    'reason': 'time_window_ended'
+                }
+            )
+
+            # Phase 7: Update invitation status
+            _complete_invitation(chat, request)
+        except Exception:
+            # If report generation fails, still mark as finalized
+            chat.is_finalized = True
+            chat.finalized_at = timezone.now()
+            chat.save()
+
+    return {
+        'role': 'assistant',
+        'content': ai_message,
+        'interview_ended': True,
+        'time_expired': True
+    }
+
+
+def _complete_chat_turn(request, chat, new_messages, ai_message):
+    """
+    Save the assistant reply and auto-finalize the interview if needed.
+
+    Shared by the JSON and streaming paths of ``ChatView.post`` and by
+    the async chat view.
+
+    Returns:
+        dict: Response payload for the client
+    """
+    new_messages.append({"role": "assistant", "content": ai_message})
+
+    # Update last question time for invited interviews
+    if chat.interview_type == Chat.INVITED:
+        chat.last_question_at = timezone.now()
+
+    chat.messages = new_messages
+    chat.save()
+
+    # Phase 8: Check if all questions answered and auto-finalize
+    if chat.all_questions_answered() and not chat.is_finalized:
+        # Auto-finalize the interview
+        from .report_utils import generate_and_save_report
+
+        if chat.interview_type == Chat.INVITED:
+            # For invited interviews: auto-finalize with report and notification
+            try:
+                # Generate report (no rushed qualifier - they completed all questions)
+                generate_and_save_report(chat, include_rushed_qualifier=False)
+
+                # Mark chat as finalized
+                chat.is_finalized = True
+                chat.finalized_at = timezone.now()
+                chat.save()
+
+                # Update invitation status and send notification
+                _complete_invitation(chat, request)
+
+                # Return with completion flag
+                return {
+                    'message': ai_message,
+                    'all_questions_answered': True,
+                    'interview_completed': True,
+                    'redirect_to_report': True
+                }
+            except Exception:
+                # If report generation fails, still mark as completed but continue normally
+                chat.is_finalized = True
+                chat.finalized_at = timezone.now()
+                chat.save()
+
+                return {
+                    'message': ai_message,
+                    'all_questions_answered': True,
+                    'error': 'Report generation failed, but interview marked as complete'
+                }
+
+        elif chat.interview_type == Chat.PRACTICE:
+            # For practice interviews: just signal completion, let user finalize manually
+            return {
+                'message': ai_message,
+                'all_questions_answered': True,
+                'show_completion_message': True
+            }
+
+    return {'message': ai_message}
+
+
+class ChatView(LoginRequiredMixin, UserPassesTestMixin,
+               RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def get(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         # Check if invited interview time has expired (Issue #138)
         time_expired = False
@@ -519,22 +609,10 @@ class ChatView(LoginRequiredMixin, UserPassesTestMixin, View):
             time_expired = chat.is_time_expired()
             if time_expired:
                 # Mark invitation as completed if not already
-                try:
-                    invitation = InvitedInterview.objects.get(chat=chat)
-                    if invitation.status != InvitedInterview.COMPLETED:
-                        invitation.status = InvitedInterview.COMPLETED
-                        invitation.completed_at = timezone.now()
-                        invitation.save()
-
-                        # Send completion notification to interviewer
-                        from .invitation_utils import send_completion_notification_email
-                        send_completion_notification_email(invitation)
-                except InvitedInterview.DoesNotExist:
-                    pass
+                _complete_invitation(chat, request)
 
         context = {}
         context['chat'] = chat
-        context['owner_chats'] = owner_chats
         context['time_expired'] = time_expired
         context['time_remaining'] = chat.time_remaining()
 
@@ -543,28 +621,14 @@ class ChatView(LoginRequiredMixin, UserPassesTestMixin, View):
     def post(self, request, chat_id):
         from .latency_utils import LatencyTracker
 
-        chat = Chat.objects.get(id=chat_id)
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         # Check if invited interview time has expired (Issue #138)
         if chat.interview_type == Chat.INVITED and chat.is_time_expired():
             # Mark invitation as completed if not already
-            try:
-                invitation = InvitedInterview.objects.get(chat=chat)
-                if invitation.status != InvitedInterview.COMPLETED:
-                    invitation.status = InvitedInterview.COMPLETED
-                    invitation.completed_at = timezone.now()
-                    invitation.save()
+            _complete_invitation(chat, request)
 
-                    # Send completion notification to interviewer
-                    from .invitation_utils import send_completion_notification_email
-                    send_completion_notification_email(invitation)
-            except InvitedInterview.DoesNotExist:
-                pass
-
-            return JsonResponse({
-                'error': 'Interview time has expired',
-                'time_expired': True
-            }, status=403)
+            return JsonResponse(_TIME_EXPIRED_PAYLOAD, status=403)
 
         user_message = request.POST.get('message', '')
 
@@ -575,192 +639,123 @@ class ChatView(LoginRequiredMixin, UserPassesTestMixin, View):
             return _ai_unavailable_json()
         # Phase 6-7: For invited interviews, check if we should ask another question
         # No new questions after T-5 minutes (graceful ending)
-        should_end_interview = False
-        if chat.interview_type == Chat.INVITED:
-            time_remaining = chat.time_remaining()
-            if time_remaining and time_remaining.total_seconds() < 300:  # Less than 5 mins
-                should_end_interview = True
-
-        if should_end_interview:
-            # Don't ask new questions - thank candidate and end
-            import textwrap
-            ai_message = textwrap.dedent("""\
-                Thank you for your response.
-
-                The interview time window is ending, so this concludes our interview.
-                Your responses will be reviewed and you'll receive feedback soon.
-
-                Thank you for your time!
-            """)
-
-            # Add final message
-            new_messages.append({"role": "assistant", "content": ai_message})
-            chat.messages = new_messages
-            chat.last_question_at = timezone.now()
-            chat.save()
-
-            # Auto-finalize
-            if not chat.is_finalized:
-                from .report_utils import generate_and_save_report
-                from .audit_utils import create_audit_log
-                try:
-                    generate_and_save_report(chat, include_rushed_qualifier=True)
-                    chat.is_finalized = True
-                    chat.finalized_at = timezone.now()
-                    chat.save()
-
-                    # Audit log: Interview finalized
-                    create_audit_log(
-                        user=request.user,
-                        action_type='INTERVIEW_FINALIZED',
-                        resource_type='Chat',
-                        resource_id=str(chat.id),
-                        description=f"Interview '{chat.title}' auto-finalized due to time window ending",
-                        extra_data={
-                            'interview_type': chat.interview_type,
-                            'auto_finalized': True,
-                            'reason': 'time_window_ended'
-                        }
-                    )
-
-                    # Phase 7: Update invitation status
-                    try:
-                        invitation = InvitedInterview.objects.get(chat=chat)
-                        if invitation.status != InvitedInterview.COMPLETED:
-                            invitation.status = InvitedInterview.COMPLETED
-                            invitation.completed_at = timezone.now()
-                            invitation.save()
-
-                            from .invitation_utils import send_completion_notification_email
-                            send_completion_notification_email(invitation)
-                    except InvitedInterview.DoesNotExist:
-                        pass
-                except Exception:
-                    # If report generation fails, still mark as finalized
-                    chat.is_finalized = True
-                    chat.finalized_at = timezone.now()
-                    chat.save()
-
-            return JsonResponse({
-                'role': 'assistant',
-                'content': ai_message,
-                'interview_ended': True,
-                'time_expired': True
-            })
+        if _should_end_interview(chat):
+            return JsonResponse(
+                _end_interview_gracefully(request, chat, new_messages))
+
+        # Streaming mode: send deltas as Server-Sent Events while the full
+        # reply is collected and saved once the stream completes
+        if _wants_event_stream(request):
+            response = StreamingHttpResponse(
+                self._stream_reply(request, chat, new_messages),
+                content_type='text/event-stream'
+            )
+            response['Cache-Control'] = 'no-cache'
+            response['X-Accel-Buffering'] = 'no'  # Disable nginx buffering
+            return response
 
         # Normal flow - get AI response
         # Track latency for this response (Issues #20, #54)
         with LatencyTracker(chat):
             try:
                 # Auto-select model tier based on spending cap (Issue #14)
-                client, model, tier_info = get_client_and_model()
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=new_messages,
-                    max_tokens=MAX_TOKENS
+                client, model, tier_info = get_client_and_model(
+                    profile='chat_view')
+                # Long interviews: system prompt + summary + recent turns
+                context_messages = build_context_messages(
+                    chat, new_messages, tier_info.get('active_tier'))
+                response = create_completion(
+                    client, model, context_messages, 'chat_view'
                 )
                 # Track token usage for spending cap (Issue #15.10)
                 record_openai_usage(request.user, 'chat_view', response)
                 ai_message = response.choices[0].message.content
-                new_messages.append({"role": "assistant", "content": ai_message})
 
-                # Update last question time for invited interviews
-                if chat.interview_type == Chat.INVITED:
-                    chat.last_question_at = timezone.now()
+                return JsonResponse(
+                    _complete_chat_turn(request, chat, new_messages, ai_message)
+                )
+            except Exception as e:
+                # Handle AI service exceptions gracefully
+                return _ai_service_error_json(e)
+
+    def _stream_reply(self, request, chat, new_messages):
+        """
+        Generate Server-Sent Events for a streamed interviewer reply.
+
+        Emits one ``delta`` event per content chunk, then a single ``done``
+        event carrying the same payload the JSON response would have
+        returned. The assembled reply is saved to ``Chat.messages`` only
+        after the stream finishes. Time-to-first-token is recorded on the
+        latency record next to the total response time.
+        """
+        from .latency_utils import LatencyTracker
 
-                chat.messages = new_messages
-                chat.save()
+        with LatencyTracker(chat) as tracker:
+            try:
+                # Auto-select model tier based on spending cap (Issue #14)
+                client, model, tier_info = get_client_and_model(
+                    profile='chat_view')
+                # Long interviews: system prompt + summary + recent turns
+                context_messages = build_context_messages(
+                    chat, new_messages, tier_info.get('active_tier'))
+                stream = create_completion(
+                    client, model, context_messages, 'chat_view',
+                    stream=True, stream_options={'include_usage': True}
+                )
 
-                # Phase 8: Check if all questions answered and auto-finalize
-                if chat.all_questions_answered() and not chat.is_finalized:
-                    # Auto-finalize the interview
-                    from .report_utils import generate_and_save_report
-
-                    if chat.interview_type == Chat.INVITED:
-                        # For invited interviews: auto-finalize with report and notification
-                        try:
-                            # Generate report (no rushed qualifier - they completed all questions)
-                            generate_and_save_report(chat, include_rushed_qualifier=False)
-
-                            # Mark chat as finalized
-                            chat.is_finalized = True
-                            chat.finalized_at = timezone.now()
-                            chat.save()
-
-                            # Update invitation status and send notification
-                            try:
-                                invitation = InvitedInterview.objects.get(chat=chat)
-                                if invitation.status != InvitedInterview.COMPLETED:
-                                    invitation.status = InvitedInterview.COMPLETED
-                                    invitation.completed_at = timezone.now()
-                                    invitation.save()
-
-                                    # Send completion notification to interviewer
-                                    from .invitation_utils import send_completion_notification_email
-                                    send_completion_notification_email(invitation)
-                            except InvitedInterview.DoesNotExist:
-                                pass
-
-                            # Return with completion flag
-                            return JsonResponse({
-                                'message': ai_message,
-                                'all_questions_answered': True,
-                                'interview_completed': True,
-                                'redirect_to_report': True
-                            })
-                        except Exception:
-                            # If report generation fails, still mark as completed but continue normally
-                            chat.is_finalized = True
-                            chat.finalized_at = timezone.now()
-                            chat.save()
-
-                            return JsonResponse({
-                                'message': ai_message,
-                                'all_questions_answered': True,
-                                'error': 'Report generation failed, but interview marked as complete'
-                            })
-
-                    elif chat.interview_type == Chat.PRACTICE:
-                        # For practice interviews: just signal completion, let user finalize manually
-                        return JsonResponse({
-                            'message': ai_message,
-                            'all_questions_answered': True,
-                            'show_completion_message': True
-                        })
-
-                return JsonResponse({'message': ai_message})
+                parts = []
+                usage_chunk = None
+                for chunk in stream:
+                    # The final chunk carries usage and has no choices
+                    if getattr(chunk, 'usage', None):
+                        usage_chunk = chunk
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    tracker.mark_first_token()
+                    parts.append(delta)
+                    yield _sse_event('delta', {'content': delta})
+
+                # Track token usage for spending cap (Issue #15.10)
+                if usage_chunk is not None:
+                    record_openai_usage(request.user, 'chat_view', usage_chunk)
+
+                ai_message = ''.join(parts)
+                yield _sse_event(
+                    'done',
+                    _complete_chat_turn(request, chat, new_messages, ai_message)
+                )
             except Exception as e:
-                # Handle AI service exceptions gracefully
-                return JsonResponse({
+                # Headers are already sent, so report the failure in-band
+                yield _sse_event('error', {
                     'error': 'AI service unavailable',
                     'message': str(e)
-                }, status=503)
+                })
 
 
-class EditChat(LoginRequiredMixin, UserPassesTestMixin, View):
+class EditChat(LoginRequiredMixin, UserPassesTestMixin,
+               RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def get(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         form = EditChatForm(initial=model_to_dict(chat), instance=chat)
 
         context = {}
         context['chat'] = chat
-        context['owner_chats'] = owner_chats
         context['form'] = form
 
         return render(request, os.path.join('chat', 'chat-edit.html'), context)
 
     def post(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         if 'update' in request.POST:
             form = EditChatForm(request.POST, instance=chat)
@@ -789,15 +784,16 @@ class EditChat(LoginRequiredMixin, UserPassesTestMixin, View):
 
 
 # Note: this class has no template.  it is technically built into base-sidebar
-class DeleteChat(LoginRequiredMixin, UserPassesTestMixin, View):
+class DeleteChat(LoginRequiredMixin, UserPassesTestMixin,
+                 RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def post(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         if 'delete' in request.POST:
             chat.delete()
@@ -808,21 +804,24 @@ class DeleteChat(LoginRequiredMixin, UserPassesTestMixin, View):
 
 
 # Note: this class has no template.  it is technically built into base-sidebar
-class RestartChat(LoginRequiredMixin, UserPassesTestMixin, View):
+class RestartChat(LoginRequiredMixin, UserPassesTestMixin,
+                  RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def post(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
+        chat = self.get_cached_object(Chat, id=chat_id)
 
         if 'restart' in request.POST:
             # slice messages to only the very first 2 messages
             chat.messages = chat.messages[:2]
 
             chat.save()
+            # Summary of the discarded turns no longer applies
+            ChatContextSummary.objects.filter(chat=chat).delete()
 
             return redirect("chat-view", chat_id=chat.id)
         # else:
@@ -830,137 +829,34 @@ class RestartChat(LoginRequiredMixin, UserPassesTestMixin, View):
         #     return redirect("chat-view", chat_id=chat.id)
 
 
-class KeyQuestionsView(LoginRequiredMixin, UserPassesTestMixin, View):
+class KeyQuestionsView(LoginRequiredMixin, UserPassesTestMixin,
+                       RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def get(self, request, chat_id, question_id):
-        chat = Chat.objects.get(id=chat_id)
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
+        chat = self.get_cached_object(Chat, id=chat_id)
         question = chat.key_questions[question_id]
 
         context = {}
         context['chat'] = chat
         context['question'] = question
         context['question_id'] = question_id
-        context['owner_chats'] = owner_chats
 
         return render(request, 'key-questions.html', context)
 
     def post(self, request, chat_id, question_id):
-        chat = Chat.objects.get(id=chat_id)
+        chat = self.get_cached_object(Chat, id=chat_id)
         question = chat.key_questions[question_id]
 
         user_message = request.POST.get('message', '')
         print(user_message)
 
-        system_prompt = ""
-
-        if chat.resume:  # if resume is present
-            system_prompt = textwrap.dedent(f"""\
-                You are a professional interviewer for a company
-                preparing for a candidate's interview. You will act as
-                the interviewer and engage in a roleplaying session
-                with the candidate.
-
-                Please review the job listing, resume and misc.
-                interview details below:
-
-                # Type of Interview
-                This interview will be of the following type:
-                {chat.get_type_display()}
-
-                # Difficulty
-                - **Scale:** 1 to 10
-                - **1** = extremely easygoing interview, no curveballs
-                - **10** = very challenging, for top‑tier candidates
-                only
-                - **Selected level:** <<{chat.difficulty}>>
-
-                # Job Listing:
-                \"\"\"{chat.job_listing.content}\"\"\"
-
-                # Candidate Resume:
-                \"\"\"{chat.resume.content}\"\"\"
-
-                Ignore any formatting issues in the resume, and focus
-                on its content.
-
-                Please review the answer to an interviewer question below and
-                provide constructive feedback about the user's answer,
-                including a rating of the answer from 1-10 like so: "6/10".
-
-                \"\"\"
-                [
-                    {{
-                        "role": "interviewer",
-                        "content": "{question["content"]}"
-                    }},
-                    {{
-                        "role": "user",
-                        "content": "{user_message}"
-                    }}
-                ]
-                \"\"\"
-
-                Respond critically to any responses that are off-topic
-                or ignore the fact that the user is in an interview.
-                For example, the user may not ask questions that are
-                normally accpetable for AI like recipes or book
-                reviews.
-            """)
-        else:  # if no resume"
-            system_prompt = textwrap.dedent(f"""\
-                You are a professional interviewer for a company
-                preparing for a candidate's interview. You will act as
-                the interviewer and engage in a roleplaying session
-                with the candidate.
-
-                Please review the job listing and misc. interview
-                details below:
-
-                # Type of Interview
-                This interview will be of the following type:
-                {chat.get_type_display()}
-
-                # Difficulty
-                - **Scale:** 1 to 10
-                - **1** = extremely easygoing interview, no curveballs
-                - **10** = very challenging, for top‑tier candidates
-                    only
-                - **Selected level:** <<{chat.difficulty}>>
-
-                # Job Listing:
-                \"\"\"{chat.job_listing.content}\"\"\"
-
-                Please review the answer to an interviewer question below and
-                provide constructive feedback about the user's answer,
-                including a rating of the answer from 1-10 like so: "6/10".
-
-                \"\"\"
-                [
-                    {{
-                        "role": "interviewer",
-                        "content": "{question["content"]}"
-                    }},
-                    {{
-                        "role": "user",
-                        "content": "{user_message}"
-                    }}
-                ]
-                \"\"\"
-
-                Respond critically to any responses that are off-topic
-                or ignore the fact that the user is in an interview.
-                For example, the user may not ask questions that are
-                normally accpetable for AI like recipes or book
-                reviews.
-            """)
+        system_prompt = _build_question_feedback_prompt(
+            chat, question, user_message)
         ai_input = [
             {
                 "role": "system",
@@ -972,11 +868,10 @@ class KeyQuestionsView(LoginRequiredMixin, UserPassesTestMixin, View):
             return _ai_unavailable_json()
 
         # Auto-select model tier based on spending cap (Issue #14)
-        client, model, tier_info = get_client_and_model()
-        response = client.chat.completions.create(
-            model=model,
-            messages=ai_input,
-            max_tokens=MAX_TOKENS
+        client, model, tier_info = get_client_and_model(
+            profile='single_question')
+        response = create_completion(
+            client, model, ai_input, 'single_question'
         )
         # Track token usage for spending cap (Issue #15.10)
         record_openai_usage(request.user, 'single_question', response)
@@ -989,51 +884,63 @@ class KeyQuestionsView(LoginRequiredMixin, UserPassesTestMixin, View):
         return JsonResponse({'message': ai_message})
 
 
-class ResultsChat(LoginRequiredMixin, UserPassesTestMixin, View):
+def _finalized_report(chat):
+    """Return the chat's ExportableReport if the chat is finalized, else None."""
+    if not chat.is_finalized:
+        return None
+    return ExportableReport.objects.filter(chat=chat).first()
+
+
+def _report_rationales_text(report):
+    """Format a report's score rationales as the results-page explanation."""
+    rationales = [
+        ('Professionalism', report.professionalism_rationale),
+        ('Subject Knowledge', report.subject_knowledge_rationale),
+        ('Clarity', report.clarity_rationale),
+        ('Overall', report.overall_rationale),
+    ]
+    return "\n\n".join(
+        f"{label}: {rationale}" for label, rationale in rationales if rationale
+    ) or report.feedback_text
+
+
+class ResultsChat(LoginRequiredMixin, UserPassesTestMixin,
+                  RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def get(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
-
-        feedback_prompt = textwrap.dedent("""\
-            Please provide constructive feedback to me about the
-            interview so far.
-        """)
+        chat = self.get_cached_object(Chat, id=chat_id)
+
+        feedback_prompt = _RESULTS_FEEDBACK_PROMPT
         input_messages = chat.messages
         input_messages.append({"role": "user", "content": feedback_prompt})
 
-        if not ai_available():
+        report = _finalized_report(chat)
+        if report is not None and report.feedback_text:
+            # Finalized: reuse the persisted report instead of the model
+            ai_message = report.feedback_text
+        elif not ai_available():
             ai_message = "AI features are currently unavailable."
         else:
-            # Auto-select model tier based on spending cap (Issue #14)
-            client, model, tier_info = get_client_and_model()
-            response = client.chat.completions.create(
-                model=model,
-                messages=input_messages,
-                max_tokens=MAX_TOKENS
-            )
-            # Track token usage for spending cap (Issue #15.10)
-            record_openai_usage(request.user, 'results_chat', response)
-            ai_message = response.choices[0].message.content
+            # Unchanged transcript: served from the response cache
+            ai_message = cached_completion(
+                request.user, chat, 'results_chat', input_messages)
 
         # Check if this is an invited interview and get invitation details
         invitation = None
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
             except InvitedInterview.DoesNotExist:
                 pass
 
         context = {}
         context['chat'] = chat
-        context['owner_chats'] = owner_chats
         context['feedback'] = ai_message
         context['invitation'] = invitation
 
@@ -1041,53 +948,37 @@ class ResultsChat(LoginRequiredMixin, UserPassesTestMixin, View):
                       context)
 
 
-class ResultCharts(LoginRequiredMixin, UserPassesTestMixin, View):
+class ResultCharts(LoginRequiredMixin, UserPassesTestMixin,
+                   RequestCacheMixin, View):
     def test_func(self):
         # manually grab chat id from kwargs and process it
-        chat = Chat.objects.get(id=self.kwargs['chat_id'])
+        chat = self.get_cached_object(Chat, id=self.kwargs['chat_id'])
 
         return self.request.user == chat.owner
 
     def get(self, request, chat_id):
-        chat = Chat.objects.get(id=chat_id)
-        owner_chats = Chat.objects.filter(
-            owner=request.user
-        ).order_by('-modified_date')
-
-        scores_prompt = textwrap.dedent("""\
-            Based on the interview so far, please rate the interviewee in the
-            following categories from 0 to 100, and return the result as a JSON
-            object with integers only, in the following order that list only
-            the integers:
-
-            - Professionalism
-            - Subject Knowledge
-            - Clarity
-            - Overall
-
-            Example format:
-                8
-                7
-                9
-                6
-        """)
+        chat = self.get_cached_object(Chat, id=chat_id)
+
+        scores_prompt = prompts.RESULT_CHARTS_SCORES.render()
         input_messages = chat.messages
 
         input_messages.append({"role": "user", "content": scores_prompt})
 
-        if not ai_available():
+        report = _finalized_report(chat)
+        if report is not None:
+            # Finalized: reuse the persisted report instead of the model
+            professionalism, subject_knowledge, clarity, overall = [
+                report.professionalism_score or 0,
+                report.subject_knowledge_score or 0,
+                report.clarity_score or 0,
+                report.overall_score or 0]
+        elif not ai_available():
             professionalism, subject_knowledge, clarity, overall = [0, 0, 0, 0]
         else:
-            # Auto-select model tier based on spending cap (Issue #14)
-            client, model, tier_info = get_client_and_model()
-            response = client.chat.completions.create(
-                model=model,
-                messages=input_messages,
-                max_tokens=MAX_TOKENS
-            )
-            # Track token usage for spending cap (Issue #15.10)
-            record_openai_usage(request.user, 'result_charts_scores', response)
-            ai_message = response.choices[0].message.content.strip()
+            # Unchanged transcript: served from the response cache
+            ai_message = cached_completion(
+                request.user, chat, 'result_charts_scores',
+                input_messages).strip()
             scores = [int(line.strip())
                       for line in ai_message.splitlines() if line.strip()
                       .isdigit()]
@@ -1099,7 +990,6 @@ class ResultCharts(LoginRequiredMixin, UserPassesTestMixin, View):
 
         context = {}
         context['chat'] = chat
-        context['owner_chats'] = owner_chats
 
         context['scores'] = {
             'Professionalism': professionalism,
@@ -1107,33 +997,23 @@ class ResultCharts(LoginRequiredMixin, UserPassesTestMixin, View):
             'Clarity': clarity,
             'Overall': overall
         }
-        explain = textwrap.dedent("""\
-            Explain the reason for the following scores so that the user can
-            understand, do not include json object for scores IF NO response
-            was given since start of interview please tell them to start
-            interview
-        """)
+        explain = prompts.RESULT_CHARTS_EXPLAIN.render()
         input_messages.append({"role": "user", "content": explain})
-        if not ai_available():
+        if report is not None:
+            ai_message = _report_rationales_text(report)
+        elif not ai_available():
             ai_message = "AI features are currently unavailable."
         else:
-            # Auto-select model tier based on spending cap (Issue #14)
-            client, model, tier_info = get_client_and_model()
-            response = client.chat.completions.create(
-                model=model,
-                messages=input_messages,
-                max_tokens=MAX_TOKENS
-            )
-            # Track token usage for spending cap (Issue #15.10)
-            record_openai_usage(request.user, 'result_charts_feedback', response)
-            ai_message = response.choices[0].message.content
+            ai_message = cached_completion(
+                request.user, chat, 'result_charts_feedback', input_messages)
         context['feedback'] = ai_message
 
         # Check if this is an invited interview and get invitation details
         invitation = None
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
             except InvitedInterview.DoesNotExist:
                 pass
         context['invitation'] = invitation
@@ -1403,42 +1283,24 @@ def upload_file(request):
                     instance.save()
 
                     # Trigger AI parsing for resumes (Issue #48: "upload
-                    # triggers parsing")
+                    # triggers parsing"). Parsing runs on the job queue;
+                    # parsing_status reports progress.
                     if instance.__class__.__name__ == 'UploadedResume':
                         if ai_available():
-                            try:
-                                # Set status to in_progress
-                                instance.parsing_status = 'in_progress'
-                                instance.save()
-
-                                # Parse the resume
-                                parsed_data = parse_resume_with_ai(
-                                    instance.content)
-
-                                # Save parsed data
-                                instance.skills = parsed_data.get('skills', [])
-                                instance.experience = parsed_data.get(
-                                    'experience', [])
-                                instance.education = parsed_data.get(
-                                    'education', [])
-                                instance.parsing_status = 'success'
-                                instance.parsed_at = now()
-                                instance.save()
+                            enqueue('parse_resume',
+                                    {'resume_id': instance.id},
+                                    priority=PRIORITY_INTERACTIVE)
+                            instance.refresh_from_db()
 
+                            if instance.parsing_status == 'success':
                                 messages.success(
                                     request, "Resume uploaded and parsed successfully!")
-                            except Exception as e:
-                                # Save error (sanitize to prevent API key
-                                # exposure)
-                                error_msg = str(e)
-                                # Sanitize any potential API key references
-                                if "api" in error_msg.lower() and "key" in error_msg.lower():
-                                    error_msg = "OpenAI authentication error"
-                                instance.parsing_status = 'error'
-                                instance.parsing_error = error_msg
-                                instance.save()
+                            elif instance.parsing_status == 'error':
                                 messages.warning(
-                                    request, f"Resume uploaded but parsing failed: {error_msg}")
+                                    request, f"Resume uploaded but parsing failed: {instance.parsing_error}")
+                            else:
+                                messages.success(
+                                    request, "Resume uploaded! Parsing will finish in a moment.")
                         else:
                             # AI unavailable
                             instance.parsing_status = 'error'
@@ -1818,7 +1680,8 @@ class DocumentList(LoginRequiredMixin, View):
 
 # Exportable Report Views
 
-class FinalizeInterviewView(LoginRequiredMixin, UserPassesTestMixin, View):
+class FinalizeInterviewView(LoginRequiredMixin, UserPassesTestMixin,
+                            RequestCacheMixin, View):
     """
     View to finalize an interview and generate its ExportableReport.
 
@@ -1834,12 +1697,13 @@ class FinalizeInterviewView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def test_func(self):
         """Verify that the user owns the chat"""
-        chat = get_object_or_404(Chat, id=self.kwargs['chat_id'])
+        chat = self.get_cached_object_or_404(
+            Chat, id=self.kwargs['chat_id'])
         return self.request.user == chat.owner
 
     def post(self, request, chat_id):
         """Finalize the interview and generate the report"""
-        chat = get_object_or_404(Chat, id=chat_id)
+        chat = self.get_cached_object_or_404(Chat, id=chat_id)
 
         # Check if already finalized
         if chat.is_finalized:
@@ -1852,35 +1716,41 @@ class FinalizeInterviewView(LoginRequiredMixin, UserPassesTestMixin, View):
             messages.info(request, 'A report already exists for this interview.')
             return redirect('export_report', chat_id=chat_id)
 
-        # Generate report using shared utility (makes 4 AI calls)
-        from .report_utils import generate_and_save_report
-        generate_and_save_report(chat)
-
         # Mark chat as finalized
         chat.is_finalized = True
         chat.finalized_at = timezone.now()
         chat.save()
 
-        # For invited interviews: Update invitation status and send notification
+        # For invited interviews: Update invitation status; the interviewer
+        # is notified once the report exists
+        notify_interviewer = False
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
                 if invitation.status != InvitedInterview.COMPLETED:
                     invitation.status = InvitedInterview.COMPLETED
                     invitation.completed_at = timezone.now()
                     invitation.save()
-
-                    # Send completion notification to interviewer
-                    from .invitation_utils import send_completion_notification_email
-                    send_completion_notification_email(invitation)
+                    notify_interviewer = True
             except InvitedInterview.DoesNotExist:
                 pass
 
-        messages.success(request, 'Interview finalized and report generated successfully!')
+        # Generate report on the job queue (makes the report AI calls)
+        enqueue('generate_interview_report',
+                {'chat_id': chat.id,
+                 'notify_interviewer': notify_interviewer},
+                priority=PRIORITY_INTERACTIVE)
+
+        if ExportableReport.objects.filter(chat=chat).exists():
+            messages.success(request, 'Interview finalized and report generated successfully!')
+        else:
+            messages.success(request, 'Interview finalized. Your report is being generated.')
         return redirect('export_report', chat_id=chat_id)
 
 
-class ExportReportView(LoginRequiredMixin, UserPassesTestMixin, View):
+class ExportReportView(LoginRequiredMixin, UserPassesTestMixin,
+                       RequestCacheMixin, View):
     """
     View to display and allow exporting of a generated report.
     Shows report details and provides download options.
@@ -1888,7 +1758,8 @@ class ExportReportView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def test_func(self):
         """Verify that the user owns the chat or is the interviewer"""
-        chat = get_object_or_404(Chat, id=self.kwargs['chat_id'])
+        chat = self.get_cached_object_or_404(
+            Chat, id=self.kwargs['chat_id'])
 
         # Allow chat owner (candidate)
         if self.request.user == chat.owner:
@@ -1897,7 +1768,8 @@ class ExportReportView(LoginRequiredMixin, UserPassesTestMixin, View):
         # Allow interviewer for invited interviews
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
                 return self.request.user == invitation.interviewer
             except InvitedInterview.DoesNotExist:
                 pass
@@ -1906,11 +1778,17 @@ class ExportReportView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def get(self, request, chat_id):
         """Display the exportable report"""
-        chat = get_object_or_404(Chat, id=chat_id)
+        chat = self.get_cached_object_or_404(Chat, id=chat_id)
 
         try:
             report = ExportableReport.objects.get(chat=chat)
         except ExportableReport.DoesNotExist:
+            if chat.is_finalized:
+                # Report job has not finished yet
+                messages.info(request,
+                              'Your report is still being generated. '
+                              'Please check back in a moment.')
+                return redirect('chat-view', chat_id=chat_id)
             messages.warning(request,
                              'No report exists yet. Please finalize the interview first.')
             return redirect('finalize_interview', chat_id=chat_id)
@@ -1919,32 +1797,29 @@ class ExportReportView(LoginRequiredMixin, UserPassesTestMixin, View):
         invitation = None
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
             except InvitedInterview.DoesNotExist:
                 pass
 
-        # Get user's chats for sidebar
-        owner_chats = Chat.objects.filter(owner=request.user).order_by(
-            '-modified_date'
-        )
-
         context = {
             'chat': chat,
             'report': report,
             'invitation': invitation,
-            'owner_chats': owner_chats,
         }
         return render(request, 'reports/export-report.html', context)
 
 
-class DownloadPDFReportView(LoginRequiredMixin, UserPassesTestMixin, View):
+class DownloadPDFReportView(LoginRequiredMixin, UserPassesTestMixin,
+                            RequestCacheMixin, View):
     """
     View to download a PDF version of the exportable report.
     """
 
     def test_func(self):
         """Verify that the user owns the chat or is the interviewer"""
-        chat = get_object_or_404(Chat, id=self.kwargs['chat_id'])
+        chat = self.get_cached_object_or_404(
+            Chat, id=self.kwargs['chat_id'])
 
         # Allow chat owner (candidate)
         if self.request.user == chat.owner:
@@ -1953,7 +1828,8 @@ class DownloadPDFReportView(LoginRequiredMixin, UserPassesTestMixin, View):
         # Allow interviewer for invited interviews
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
                 return self.request.user == invitation.interviewer
             except InvitedInterview.DoesNotExist:
                 pass
@@ -1962,7 +1838,7 @@ class DownloadPDFReportView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def get(self, request, chat_id):
         """Generate and download PDF report"""
-        chat = get_object_or_404(Chat, id=chat_id)
+        chat = self.get_cached_object_or_404(Chat, id=chat_id)
 
         try:
             report = ExportableReport.objects.get(chat=chat)
@@ -2001,14 +1877,16 @@ class DownloadPDFReportView(LoginRequiredMixin, UserPassesTestMixin, View):
         return response
 
 
-class DownloadCSVReportView(LoginRequiredMixin, UserPassesTestMixin, View):
+class DownloadCSVReportView(LoginRequiredMixin, UserPassesTestMixin,
+                            RequestCacheMixin, View):
     """
     View to download a CSV version of the exportable report.
     """
 
     def test_func(self):
         """Verify that the user owns the chat or is the interviewer"""
-        chat = get_object_or_404(Chat, id=self.kwargs['chat_id'])
+        chat = self.get_cached_object_or_404(
+            Chat, id=self.kwargs['chat_id'])
 
         # Allow chat owner (candidate)
         if self.request.user == chat.owner:
@@ -2017,7 +1895,8 @@ class DownloadCSVReportView(LoginRequiredMixin, UserPassesTestMixin, View):
         # Allow interviewer for invited interviews
         if chat.interview_type == Chat.INVITED:
             try:
-                invitation = InvitedInterview.objects.get(chat=chat)
+                invitation = self.get_cached_object(
+                    InvitedInterview, chat=chat)
                 return self.request.user == invitation.interviewer
             except InvitedInterview.DoesNotExist:
                 pass
@@ -2026,7 +1905,7 @@ class DownloadCSVReportView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def get(self, request, chat_id):
         """Generate and download CSV report"""
-        chat = get_object_or_404(Chat, id=chat_id)
+        chat = self.get_cached_object_or_404(Chat, id=chat_id)
 
         try:
             report = ExportableReport.objects.get(chat=chat)
@@ -2681,9 +2560,10 @@ def request_data_export(request):
         # Create new export request
         export_request = DataExportRequest.objects.create(user=request.user)
 
-        # Process the request (in production, this would be async with Celery)
-        # For now, process synchronously
-        process_export_request(export_request)
+        # Build the export on the job queue; status shows progress
+        enqueue('process_data_export',
+                {'export_request_id': export_request.id},
+                max_attempts=1)
 
         messages.success(
             request,
@@ -3398,6 +3278,57 @@ def candidate_invitations(request):
     return render(request, 'invitations/candidate_invitations.html', context)
 
 
+# Greeting used when the invited interview greeting call fails
+_FALLBACK_INVITED_GREETING = (
+    "Hello! I'm your interviewer today. Thank you for joining - to get "
+    "started, please tell me a little about yourself and your background."
+)
+
+
+def _placeholder_key_questions(sections):
+    """Return placeholder key questions, one per template section."""
+    return [f"Question {i+1}" for i in range(len(sections))] if sections else []
+
+
+def _build_invited_interview_prompts(invitation):
+    """
+    Build the prompts for an invited interview from its template.
+
+    Returns:
+        tuple: (system_prompt, key_questions_prompt)
+    """
+    template = invitation.template
+    sections = template.sections if template.sections else []
+
+    # Build system prompt from template sections
+    sections_content = ""
+    if sections:
+        # Sort sections by order
+        sorted_sections = sorted(sections, key=lambda s: s.get('order', 0))
+        for section in sorted_sections:
+            title = section.get('title', 'Untitled Section')
+            content = section.get('content', '')
+            weight = section.get('weight', 0)
+            sections_content += f"\n## {title} (Weight: {weight}%)\n{content}\n"
+
+    system_prompt = prompts.INVITED_INTERVIEW.render(
+        template_name=template.name,
+        template_description=f"\n{template.description}" if template.description else "",
+        duration=invitation.duration_minutes,
+        sections_content=sections_content if sections_content else "\n(No specific sections defined)"
+    )
+
+    # Build prompt to extract key questions from template
+    key_questions_prompt = prompts.INVITED_KEY_QUESTIONS.render(
+        template_name=template.name,
+        template_description=template.description if template.description else "",
+        sections_content=sections_content if sections_content else "(No sections)",
+        question_count=max(5, len(sections)) if sections else 5
+    )
+
+    return system_prompt, key_questions_prompt
+
+
 @login_required
 def start_invited_interview(request, invitation_id):
     """
@@ -3454,56 +3385,8 @@ def start_invited_interview(request, invitation_id):
     template = invitation.template
     sections = template.sections if template.sections else []
 
-    # Build system prompt from template sections
-    sections_content = ""
-    if sections:
-        # Sort sections by order
-        sorted_sections = sorted(sections, key=lambda s: s.get('order', 0))
-        for section in sorted_sections:
-            title = section.get('title', 'Untitled Section')
-            content = section.get('content', '')
-            weight = section.get('weight', 0)
-            sections_content += f"\n## {title} (Weight: {weight}%)\n{content}\n"
-
-    system_prompt = textwrap.dedent("""\
-        You are a professional interviewer conducting a structured interview.
-
-        # Interview Template: {template_name}
-        {template_description}
-
-        # Interview Duration
-        This interview has a time limit of {duration} minutes.
-
-        # Interview Structure
-        The interview is organized into the following sections:
-        {sections_content}
-
-        # CRITICAL INSTRUCTIONS - READ CAREFULLY
-        - ONLY greet the candidate briefly and ask ONE question at a time
-        - DO NOT list all the sections or questions upfront
-        - DO NOT provide an agenda or overview of the interview
-        - Start with a brief greeting, then immediately ask your first question from the first section
-        - Wait for the candidate's response before asking the next question
-        - Ask questions one at a time, conversationally
-        - Progress through sections naturally based on their order and weight
-        - Keep your responses concise - this is an interview, not a lecture
-        - Be professional and encouraging in your tone
-        - At the very end (after all sections), thank the candidate briefly
-
-        IMPORTANT: This is a conversational interview. Ask questions one by one,
-        listen to responses, and follow up naturally. Do NOT dump all questions
-        at once or provide a roadmap of the interview.
-
-        Respond critically to any responses that are off-topic or ignore
-        the fact that the user is in an interview. The candidate should
-        focus on answering interview questions, not asking for general
-        AI assistance.
-    """).format(
-        template_name=template.name,
-        template_description=f"\n{template.description}" if template.description else "",
-        duration=invitation.duration_minutes,
-        sections_content=sections_content if sections_content else "\n(No specific sections defined)"
-    )
+    system_prompt, key_questions_prompt = _build_invited_interview_prompts(
+        invitation)
 
     chat.messages = [
         {
@@ -3512,84 +3395,45 @@ def start_invited_interview(request, invitation_id):
         },
     ]
 
-    # Get AI's initial greeting
+    # Get AI's initial greeting and key questions for tracking completion
     if not ai_available():
         messages.error(request, "AI features are disabled on this server.")
         ai_message = (
             "Hello! I'm your interviewer today. Unfortunately, AI "
             "features are currently disabled. Please contact support."
         )
+        # AI not available, use placeholder questions
+        chat.key_questions = _placeholder_key_questions(sections)
     else:
-        # Track latency for initial greeting (Issues #20, #54)
-        from .latency_utils import LatencyTracker
-        with LatencyTracker(chat, question_number=0):
-            # Auto-select model tier based on spending cap (Issue #14)
-            client, model, tier_info = get_client_and_model()
-            response = client.chat.completions.create(
-                model=model,
-                messages=chat.messages,
-                max_tokens=MAX_TOKENS
-            )
-            # Track token usage for spending cap (Issue #15.10)
-            record_openai_usage(request.user, 'start_invited_interview', response)
-            ai_message = response.choices[0].message.content
-
-    chat.messages.append(
-        {
-            "role": "assistant",
-            "content": ai_message
-        }
-    )
+        # Greeting and key questions are independent, so both are
+        # requested at once
+        ai_message, ai_response = _generate_concurrently(request, chat, [
+            ('start_invited_interview', chat.messages),
+            ('generate_key_questions',
+             [{"role": "user", "content": key_questions_prompt}]),
+        ])
+        if ai_message is None:
+            ai_message = _FALLBACK_INVITED_GREETING
 
-    # Generate key questions for tracking completion
-    if ai_available():
         try:
-            # Build prompt to extract key questions from template
-            key_questions_prompt = textwrap.dedent("""\
-                Based on the following interview template, generate a list of key questions
-                that should be asked during this interview.
-
-                Template: {template_name}
-                {template_description}
-
-                Sections:
-                {sections_content}
-
-                Generate {question_count} key questions that cover all sections proportionally
-                based on their weight. Return ONLY a JSON array of question strings.
-
-                Example format: ["Question 1?", "Question 2?", "Question 3?"]
-            """).format(
-                template_name=template.name,
-                template_description=template.description if template.description else "",
-                sections_content=sections_content if sections_content else "(No sections)",
-                question_count=max(5, len(sections)) if sections else 5
-            )
-
-            # Auto-select model tier based on spending cap
-            client, model, tier_info = get_client_and_model()
-            response = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": key_questions_prompt}],
-                max_tokens=MAX_TOKENS
-            )
-            record_openai_usage(request.user, 'generate_key_questions', response)
-            ai_response = response.choices[0].message.content
-
             # Extract JSON array from response
-            match = re.search(r"(\[[\s\S]+\])", ai_response)
-            if match:
-                chat.key_questions = json.loads(match.group(0).strip())
+            key_questions = _extract_key_questions(ai_response or "")
+            if key_questions is not None:
+                chat.key_questions = key_questions
             else:
                 # Fallback: use section count as question count
-                chat.key_questions = [f"Question {i+1}" for i in range(len(sections))] if sections else []
+                chat.key_questions = _placeholder_key_questions(sections)
         except Exception as e:
             print(f"Failed to generate key questions: {e}")
             # Fallback: estimate based on sections
-            chat.key_questions = [f"Question {i+1}" for i in range(len(sections))] if sections else []
-    else:
-        # AI not available, use placeholder questions
-        chat.key_questions = [f"Question {i+1}" for i in range(len(sections))] if sections else []
+            chat.key_questions = _placeholder_key_questions(sections)
+
+    chat.messages.append(
+        {
+            "role": "assistant",
+            "content": ai_message
+        }
+    )
 
     chat.save()
 
@@ -41,11 +41,33 @@ SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY") or get_random_secret_key()
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
+# Per call site overrides of the AI generation profiles (token budget,
+# temperature, response format, timeout, preferred tier), e.g.
+# {'chat_view': {'max_tokens': 2048}}. See
+# active_interview_app.model_tier_manager.GENERATION_PROFILES
+OPENAI_GENERATION_PROFILES = {}
+
 
 # SECURITY WARNING: don't run with debug turned on in production!
 PROD = os.environ.get("PROD", "true").lower() == "true"
 DEBUG = not PROD
 
+# Serve the AI-bound views (chat create/turns, key questions, invited
+# interview start) as async views. Only useful under an ASGI server;
+# start.sh switches to uvicorn workers when this is enabled.
+ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS", "false").lower() == "true"
+
+# Run background jobs (resume parsing, data exports, report generation)
+# inline at enqueue time instead of on `manage.py run_workers`. Only for
+# setups that do not run a worker; start.sh starts one.
+JOB_QUEUE_EAGER = os.environ.get("JOB_QUEUE_EAGER", "false").lower() == "true"
+
+# Send queued email (see email_outbox) at queue time instead of on
+# `manage.py send_outbound_email`. Only for setups that do not run the
+# sender; start.sh starts one.
+EMAIL_OUTBOX_EAGER = (
+    os.environ.get("EMAIL_OUTBOX_EAGER", "false").lower() == "true")
+
 ALLOWED_HOSTS = [
     'activeinterviewservice.app',
     'www.activeinterviewservice.app',
@@ -122,6 +144,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'active_interview_app.context_processors.sidebar_chats',
             ],
         },
     },
@@ -282,6 +305,20 @@ import sys  # noqa: E402
 if 'test' in sys.argv or 'pytest' in sys.modules:
     STATICFILES_STORAGE = (
         'django.contrib.staticfiles.storage.StaticFilesStorage')
+    # Tests roll back the database between cases, which the tier/API key
+    # resolver cache cannot see, so it is disabled unless a test opts in
+    OPENAI_RESOLVER_CACHE_TTL = 0
+    # Write API key usage counts immediately so tests can assert on them
+    API_KEY_USAGE_FLUSH_INTERVAL = 0
+    # Write request metrics immediately so tests can assert on them
+    METRICS_FLUSH_INTERVAL = 0
+    # Run background jobs inline so tests see their results
+    JOB_QUEUE_EAGER = True
+    # Send queued email inline so tests can inspect mail.outbox
+    EMAIL_OUTBOX_EAGER = True
+    # The cache outlives each test's rolled back database, so the sidebar
+    # index is not cached unless a test opts in
+    SIDEBAR_CACHE_TTL = 0
 else:
     STATICFILES_STORAGE = (
         'whitenoise.storage.CompressedManifestStaticFilesStorage')
@@ -19,3 +19,20 @@ def enable_db_access_for_all_tests(db):
     Give all tests access to the database.
     """
     pass
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_client_pools():
+    """
+    Start every test with empty OpenAI client pools and resolver cache so
+    pooled mock clients and cached tier/key decisions from one test never
+    leak into another.
+    """
+    from active_interview_app.openai_utils import (
+        reset_client_pools, reset_resolver_cache
+    )
+    reset_client_pools()
+    reset_resolver_cache()
+    yield
+    reset_client_pools()
+    reset_resolver_cache()
@@ -7,4 +7,16 @@ python3 manage.py migrate;
 # Seed bias terms if not already loaded (idempotent - won't duplicate)
 python3 manage.py seed_bias_terms;
 
-gunicorn active_interview_project.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 3
+# Background job worker (resume parsing, data exports, report generation)
+python3 manage.py run_workers &
+
+# Outgoing email sender (drains the email outbox)
+python3 manage.py send_outbound_email &
+
+# ASYNC_VIEWS=true serves the AI-bound views as async views under uvicorn
+# workers, so each worker can hold many in-flight OpenAI calls
+if [ "${ASYNC_VIEWS:-false}" = "true" ]; then
+    gunicorn active_interview_project.asgi:application --bind 0.0.0.0:${PORT:-8000} --workers 3 -k uvicorn.workers.UvicornWorker
+else
+    gunicorn active_interview_project.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 3
+fi